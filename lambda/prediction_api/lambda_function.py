@@ -4,100 +4,245 @@ AWS Lambda function for NBA game predictions
 Loads model from S3 and returns predictions via API Gateway
 """
 
+import glob
 import json
-import boto3
+import os
+import time
 import pickle
+import boto3
+import joblib
 import numpy as np
-from io import BytesIO
+from botocore.exceptions import ClientError
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 # S3 configuration
 S3_BUCKET = 'nba-sim-raw-data-lake'
 S3_MODELS_PREFIX = 'ml-models'
 
+# Artifacts in load-preference order: joblib (memory-mapped), then pickle
+MODEL_KEYS = ['logistic_regression.joblib', 'logistic_regression.pkl']
+SCALER_KEYS = ['scaler.joblib', 'scaler.pkl']
+
+# Seconds between S3 ETag checks; artifacts reload only when an ETag changes
+MODEL_CHECK_SECONDS = float(os.environ.get('MODEL_CHECK_SECONDS', '60'))
+MODEL_CACHE_DIR = os.environ.get('MODEL_CACHE_DIR', '/tmp/ml-models')
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', '1000'))
+
+FEATURE_NAMES = [
+    'home_rolling_win_pct', 'home_rolling_ppg', 'home_rolling_papg',
+    'home_rolling_margin', 'home_rest_days', 'home_back_to_back',
+    'away_rolling_win_pct', 'away_rolling_ppg', 'away_rolling_papg',
+    'away_rolling_margin', 'away_rest_days', 'away_back_to_back',
+    'month', 'day_of_week', 'is_weekend', 'season_phase'
+]
+
+CORS_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+
 # Global variables for model caching (Lambda keeps these between invocations)
 model = None
 scaler = None
-model_loaded_at = None
+model_etags = None
+model_checked_at = None
+model_pinned = False
+# Scaler folded into the logistic regression: P(home) = sigmoid(X @ w + b)
+linear_weights = None
+linear_bias = None
 
-def load_model_from_s3():
-    """Load trained model and scaler from S3 (with caching)"""
-    global model, scaler, model_loaded_at
 
-    # Cache model for 5 minutes to reduce S3 calls
-    if model is not None and model_loaded_at is not None:
-        age_seconds = (datetime.now() - model_loaded_at).total_seconds()
-        if age_seconds < 300:  # 5 minutes
-            return model, scaler
+def _find_artifact(s3, names):
+    """(key, etag) of the first artifact that exists in S3"""
+    for name in names:
+        key = f'{S3_MODELS_PREFIX}/{name}'
+        try:
+            head = s3.head_object(Bucket=S3_BUCKET, Key=key)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                continue
+            raise
+        return key, head['ETag'].strip('"')
+    raise FileNotFoundError(f"No artifact found in s3://{S3_BUCKET}/{S3_MODELS_PREFIX}: {names}")
 
-    s3 = boto3.client('s3')
 
-    # Load best model (Logistic Regression - 63% accuracy)
-    model_key = f'{S3_MODELS_PREFIX}/logistic_regression.pkl'
-    model_obj = s3.get_object(Bucket=S3_BUCKET, Key=model_key)
-    model = pickle.load(BytesIO(model_obj['Body'].read()))
+def _load_artifact(s3, key, etag):
+    """
+    Download an artifact once per ETag and load it (joblib memory-mapped).
+
+    Copies cached under older ETags of the same key are removed so /tmp
+    holds at most one file per artifact (an already memory-mapped model
+    keeps its pages until it is released).
+    """
+    os.makedirs(MODEL_CACHE_DIR, exist_ok=True)
+    name = os.path.basename(key)
+    path = os.path.join(MODEL_CACHE_DIR, f'{etag}-{name}')
+    if not os.path.exists(path):
+        s3.download_file(S3_BUCKET, key, path + '.part')
+        os.replace(path + '.part', path)
+        for stale in glob.glob(os.path.join(MODEL_CACHE_DIR, f'*-{glob.escape(name)}')):
+            if stale != path:
+                os.remove(stale)
+
+    if key.endswith('.joblib'):
+        return joblib.load(path, mmap_mode='r')
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def export_linear_model(model, scaler):
+    """
+    Fold StandardScaler into binary logistic regression coefficients.
+
+    Returns (weights, bias) so that P(home win) = sigmoid(X @ weights + bias)
+    on unscaled features, or (None, None) if the model is not linear.
+    """
+    coef = getattr(model, 'coef_', None)
+    classes = getattr(model, 'classes_', None)
+    if coef is None or coef.shape[0] != 1 or classes is None or list(classes) != [0, 1]:
+        return None, None
+
+    mean = getattr(scaler, 'mean_', None)
+    scale = getattr(scaler, 'scale_', None)
+    mean = np.zeros(coef.shape[1]) if mean is None else np.asarray(mean, dtype=float)
+    scale = np.ones(coef.shape[1]) if scale is None else np.asarray(scale, dtype=float)
+
+    weights = np.asarray(coef[0], dtype=float) / scale
+    bias = float(model.intercept_[0]) - float(weights @ mean)
+    return weights, bias
 
-    # Load scaler
-    scaler_key = f'{S3_MODELS_PREFIX}/scaler.pkl'
-    scaler_obj = s3.get_object(Bucket=S3_BUCKET, Key=scaler_key)
-    scaler = pickle.load(BytesIO(scaler_obj['Body'].read()))
 
-    model_loaded_at = datetime.now()
+def use_model(new_model, new_scaler):
+    """Serve a local model and scaler, skipping S3 (local server, tests)"""
+    global model, scaler, model_etags, model_checked_at, model_pinned
+    global linear_weights, linear_bias
 
+    model, scaler = new_model, new_scaler
+    linear_weights, linear_bias = export_linear_model(model, scaler)
+    model_etags = None
+    model_checked_at = time.monotonic()
+    model_pinned = True
+
+
+def load_model_from_s3():
+    """
+    Load trained model and scaler from S3 (with caching).
+
+    Checks S3 ETags at most every MODEL_CHECK_SECONDS and downloads only
+    artifacts whose ETag changed; warm invocations use the loaded model.
+    """
+    global model, scaler, model_etags, model_checked_at
+    global linear_weights, linear_bias
+
+    if model is not None and (
+        model_pinned or time.monotonic() - model_checked_at < MODEL_CHECK_SECONDS
+    ):
+        return model, scaler
+
+    s3 = boto3.client('s3')
+    model_key, model_etag = _find_artifact(s3, MODEL_KEYS)
+    scaler_key, scaler_etag = _find_artifact(s3, SCALER_KEYS)
+    etags = (model_etag, scaler_etag)
+
+    if model is None or etags != model_etags:
+        # Best model (Logistic Regression - 63% accuracy)
+        model = _load_artifact(s3, model_key, model_etag)
+        scaler = _load_artifact(s3, scaler_key, scaler_etag)
+        linear_weights, linear_bias = export_linear_model(model, scaler)
+        model_etags = etags
+        print(f"Loaded model {model_key} (etag {model_etag})")
+
+    model_checked_at = time.monotonic()
     return model, scaler
 
+
 def validate_features(features):
     """Validate that all required features are present"""
-    required_features = [
-        'home_rolling_win_pct', 'home_rolling_ppg', 'home_rolling_papg',
-        'home_rolling_margin', 'home_rest_days', 'home_back_to_back',
-        'away_rolling_win_pct', 'away_rolling_ppg', 'away_rolling_papg',
-        'away_rolling_margin', 'away_rest_days', 'away_back_to_back',
-        'month', 'day_of_week', 'is_weekend', 'season_phase'
-    ]
-
-    missing = [f for f in required_features if f not in features]
+    missing = [f for f in FEATURE_NAMES if f not in features]
     if missing:
         return False, f"Missing required features: {', '.join(missing)}"
 
     return True, None
 
-def predict(features_dict):
-    """Generate prediction from feature dictionary"""
+
+def build_feature_matrix(features_list):
+    """Feature dicts to an (n_games, n_features) array in FEATURE_NAMES order"""
+    for i, features in enumerate(features_list):
+        valid, error = validate_features(features)
+        if not valid:
+            raise ValueError(error if len(features_list) == 1 else f"Game {i}: {error}")
+
+    try:
+        return np.array(
+            [[features[f] for f in FEATURE_NAMES] for features in features_list],
+            dtype=float
+        )
+    except (TypeError, ValueError):
+        raise ValueError("Features must be numeric")
+
+
+def predict_batch(features_list):
+    """Generate predictions for many games in one vectorized call"""
     # Load model
     model, scaler = load_model_from_s3()
 
-    # Validate features
-    valid, error = validate_features(features_dict)
-    if not valid:
-        raise ValueError(error)
-
-    # Convert to numpy array (preserve feature order)
-    feature_names = [
-        'home_rolling_win_pct', 'home_rolling_ppg', 'home_rolling_papg',
-        'home_rolling_margin', 'home_rest_days', 'home_back_to_back',
-        'away_rolling_win_pct', 'away_rolling_ppg', 'away_rolling_papg',
-        'away_rolling_margin', 'away_rest_days', 'away_back_to_back',
-        'month', 'day_of_week', 'is_weekend', 'season_phase'
+    features_array = build_feature_matrix(features_list)
+
+    if linear_weights is not None:
+        logits = features_array @ linear_weights + linear_bias
+        probabilities = 1.0 / (1.0 + np.exp(-logits))
+        home_wins = logits > 0
+    else:
+        # Scale and predict
+        proba = model.predict_proba(scaler.transform(features_array))
+        probabilities = proba[:, 1]  # Probability home wins
+        home_wins = model.classes_[proba.argmax(axis=1)] == 1
+
+    timestamp = datetime.now().isoformat()
+    return [
+        {
+            'home_win_probability': float(probability),
+            'away_win_probability': float(1 - probability),
+            'predicted_winner': 'home' if home_win else 'away',
+            'confidence': float(max(probability, 1 - probability)),
+            'model_used': 'logistic_regression',
+            'model_accuracy': 0.630,
+            'prediction_timestamp': timestamp
+        }
+        for probability, home_win in zip(probabilities, home_wins)
     ]
 
-    features_array = np.array([[features_dict[f] for f in feature_names]])
 
-    # Scale and predict
-    features_scaled = scaler.transform(features_array)
-    probability = model.predict_proba(features_scaled)[0, 1]  # Probability home wins
-    prediction = model.predict(features_scaled)[0]
+def predict(features_dict):
+    """Generate prediction from feature dictionary"""
+    return predict_batch([features_dict])[0]
+
 
+def _response(status_code, body):
     return {
-        'home_win_probability': float(probability),
-        'away_win_probability': float(1 - probability),
-        'predicted_winner': 'home' if prediction == 1 else 'away',
-        'confidence': float(max(probability, 1 - probability)),
-        'model_used': 'logistic_regression',
-        'model_accuracy': 0.630,
-        'prediction_timestamp': datetime.now().isoformat()
+        'statusCode': status_code,
+        'headers': CORS_HEADERS,
+        'body': json.dumps(body)
     }
 
+
+def predict_games(games):
+    """Batch endpoint: score a list of {home_team, away_team, features}"""
+    if not isinstance(games, list) or not games:
+        raise ValueError('games must be a non-empty list')
+    if len(games) > MAX_BATCH_SIZE:
+        raise ValueError(f'Batch too large: {len(games)} games (max {MAX_BATCH_SIZE})')
+    if not all(isinstance(game, dict) and 'features' in game for game in games):
+        raise ValueError('Every game requires a features field')
+
+    predictions = predict_batch([game['features'] for game in games])
+    for game, prediction in zip(games, predictions):
+        prediction['home_team'] = game.get('home_team', 'Unknown')
+        prediction['away_team'] = game.get('away_team', 'Unknown')
+    return {'predictions': predictions, 'count': len(predictions)}
+
+
 def lambda_handler(event, context):
     """
     AWS Lambda handler for API Gateway requests
@@ -112,6 +257,14 @@ def lambda_handler(event, context):
             ... (all 16 features)
         }
     }
+
+    Batch input (POST /predict/batch), scored in one vectorized call:
+    {
+        "games": [
+            {"home_team": "LAL", "away_team": "BOS", "features": {...}},
+            ...
+        ]
+    }
     """
 
     try:
@@ -121,40 +274,37 @@ def lambda_handler(event, context):
         else:
             body = event
 
+        # Batch request
+        if 'games' in body:
+            return _response(200, predict_games(body['games']))
+
         # Extract features
         if 'features' not in body:
-            return {
-                'statusCode': 400,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': 'Missing required field: features',
-                    'example': {
-                        'home_team': 'LAL',
-                        'away_team': 'BOS',
-                        'features': {
-                            'home_rolling_win_pct': 0.65,
-                            'home_rolling_ppg': 110.5,
-                            'home_rolling_papg': 105.2,
-                            'home_rolling_margin': 5.3,
-                            'home_rest_days': 2,
-                            'home_back_to_back': 0,
-                            'away_rolling_win_pct': 0.58,
-                            'away_rolling_ppg': 108.3,
-                            'away_rolling_papg': 107.1,
-                            'away_rolling_margin': 1.2,
-                            'away_rest_days': 1,
-                            'away_back_to_back': 0,
-                            'month': 11,
-                            'day_of_week': 3,
-                            'is_weekend': 0,
-                            'season_phase': 0
-                        }
+            return _response(400, {
+                'error': 'Missing required field: features',
+                'example': {
+                    'home_team': 'LAL',
+                    'away_team': 'BOS',
+                    'features': {
+                        'home_rolling_win_pct': 0.65,
+                        'home_rolling_ppg': 110.5,
+                        'home_rolling_papg': 105.2,
+                        'home_rolling_margin': 5.3,
+                        'home_rest_days': 2,
+                        'home_back_to_back': 0,
+                        'away_rolling_win_pct': 0.58,
+                        'away_rolling_ppg': 108.3,
+                        'away_rolling_papg': 107.1,
+                        'away_rolling_margin': 1.2,
+                        'away_rest_days': 1,
+                        'away_back_to_back': 0,
+                        'month': 11,
+                        'day_of_week': 3,
+                        'is_weekend': 0,
+                        'season_phase': 0
                     }
-                })
-            }
+                }
+            })
 
         # Generate prediction
         prediction_result = predict(body['features'])
@@ -164,41 +314,76 @@ def lambda_handler(event, context):
         prediction_result['away_team'] = body.get('away_team', 'Unknown')
 
         # Return success response
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps(prediction_result)
-        }
+        return _response(200, prediction_result)
 
     except ValueError as e:
-        return {
-            'statusCode': 400,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({'error': str(e)})
-        }
+        return _response(400, {'error': str(e)})
 
     except Exception as e:
         print(f"Error: {str(e)}")  # CloudWatch logs
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'error': 'Internal server error',
-                'message': str(e)
-            })
-        }
+        return _response(500, {
+            'error': 'Internal server error',
+            'message': str(e)
+        })
+
+
+class LocalRequestHandler(BaseHTTPRequestHandler):
+    """Local HTTP front end: POST /predict or /predict/batch -> lambda_handler"""
+
+    protocol_version = 'HTTP/1.1'  # keep-alive for benchmarking
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send(200, json.dumps({'status': 'ok', 'model_loaded': model is not None}))
+        else:
+            self._send(404, json.dumps({'error': 'Not found'}))
+
+    def do_POST(self):
+        if self.path not in ('/predict', '/predict/batch'):
+            self._send(404, json.dumps({'error': 'Not found'}))
+            return
+        length = int(self.headers.get('Content-Length', 0))
+        result = lambda_handler({'body': self.rfile.read(length).decode('utf-8')}, None)
+        self._send(result['statusCode'], result['body'])
+
+    def _send(self, status_code, body):
+        payload = body.encode('utf-8')
+        self.send_response(status_code)
+        for name, value in CORS_HEADERS.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def create_local_server(host='127.0.0.1', port=8080):
+    """HTTP server wrapping lambda_handler (call serve_forever() to run)"""
+    return ThreadingHTTPServer((host, port), LocalRequestHandler)
 
 # For local testing
 if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='NBA prediction Lambda (local)')
+    parser.add_argument('--serve', action='store_true', help='Run local HTTP server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--model', help='Local model file (joblib/pickle) instead of S3')
+    parser.add_argument('--scaler', help='Local scaler file (joblib/pickle) instead of S3')
+    args = parser.parse_args()
+
+    if args.model and args.scaler:
+        use_model(joblib.load(args.model, mmap_mode='r'), joblib.load(args.scaler, mmap_mode='r'))
+
+    if args.serve:
+        server = create_local_server(args.host, args.port)
+        print(f"Serving on http://{args.host}:{args.port} (POST /predict, /predict/batch)")
+        server.serve_forever()
+
     # Test event
     test_event = {
         'home_team': 'LAL',
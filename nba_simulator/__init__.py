@@ -17,10 +17,23 @@ Refactored: October 2025
 __version__ = "2.0.0-alpha"
 __author__ = "Ryan Ranft"
 
+from .utils.lazy import lazy_exports
+
+# Subpackages load on first access: `import nba_simulator` stays cheap and
+# `nba_simulator.monitoring` does not pull in ETL, agents or workflows
+_EXPORTS = {
+    "config": ".config",
+    "database": ".database",
+    "utils": ".utils",
+    "adce": ".adce",
+    "agents": ".agents",
+    "etl": ".etl",
+    "monitoring": ".monitoring",
+    "simulation": ".simulation",
+    "workflows": ".workflows",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
 # Package metadata
 __all__ = ["config", "database", "utils"]
-
-# Import submodules for convenient access
-from . import config
-from . import database
-from . import utils
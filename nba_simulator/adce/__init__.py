@@ -13,6 +13,7 @@ Components:
 - AutonomousLoop: Master controller for 24/7 operation
 - GapDetector: Identifies and prioritizes data gaps
 - ReconciliationDaemon: Automated reconciliation scheduler
+- ReconciliationEngine: In-process, incremental reconciliation cycle
 
 Usage:
     from nba_simulator.adce import AutonomousLoop, GapDetector, ReconciliationDaemon
@@ -26,13 +27,16 @@ Usage:
     gaps = detector.detect_gaps()
 """
 
-from .autonomous_loop import AutonomousLoop
-from .gap_detector import GapDetector, Priority
-from .reconciliation import ReconciliationDaemon
+from ..utils.lazy import lazy_exports
 
-__all__ = [
-    'AutonomousLoop',
-    'GapDetector',
-    'Priority',
-    'ReconciliationDaemon',
-]
+_EXPORTS = {
+    'AutonomousLoop': '.autonomous_loop',
+    'GapDetector': '.gap_detector',
+    'Priority': '.gap_detector',
+    'ReconciliationDaemon': '.reconciliation',
+    'ReconciliationEngine': '.reconciliation_engine',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -0,0 +1,451 @@
+"""
+Coverage - ADCE Phase 2A/2B
+Shared S3 path parsing and coverage rules for reconciliation
+
+Used by the resident ReconciliationEngine and by the standalone
+scripts/reconciliation/ tools (scan_s3_inventory.py, analyze_coverage.py),
+so a saved inventory and an in-process cycle are analyzed with the same
+code:
+
+- parse_s3_path: source/season/data type/IDs from an S3 key
+- CoverageIndex: parsed keys grouped by source, season and data type
+- CoverageAnalyzer: expected (data_inventory.yaml) vs. actual coverage
+
+Standard library only, so the scripts can import it without boto3/yaml.
+"""
+
+import re
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+SEASON_PATTERN = re.compile(r"(20\d{2}-\d{2})")
+GAME_ID_PATTERN = re.compile(r"(\d{9,}|20\d{6}[A-Z]{3})")
+PLAYER_ID_PATTERN = re.compile(r"player_?(\d+)")
+TEAM_ID_PATTERN = re.compile(r"team_?(\d+)")
+
+
+def parse_s3_path(s3_key):
+    """
+    Extract source/season/data type/IDs from an S3 key
+
+    Handles various path patterns:
+    - nba_pbp/espn/2023-24/play_by_play_401579404.json
+    - nba_box_score/espn/2023-24/box_score_401579404.json
+    - basketball_ref/2022-23/advanced_202212010LAL.html
+    - hoopr_parquet/2023-24_pbp.parquet
+    - nba_schedule_json/2024-25/schedule.json
+
+    Args:
+        s3_key: S3 object key (path)
+
+    Returns:
+        dict: Extracted metadata
+    """
+    filename = s3_key.split("/")[-1]
+
+    metadata = {
+        "source": None,
+        "season": None,
+        "data_type": None,
+        "game_id": None,
+        "player_id": None,
+        "team_id": None,
+    }
+
+    # Identify source from path
+    path_lower = s3_key.lower()
+    if "espn" in path_lower:
+        metadata["source"] = "espn"
+    elif "basketball_ref" in path_lower or "bbref" in path_lower:
+        metadata["source"] = "basketball_reference"
+    elif "nba_api" in path_lower or "nba_stats" in path_lower:
+        metadata["source"] = "nba_api"
+    elif "hoopr" in path_lower:
+        metadata["source"] = "hoopr"
+    elif "kaggle" in path_lower:
+        metadata["source"] = "kaggle"
+
+    # Extract season (YYYY-YY pattern like 2023-24)
+    season_match = SEASON_PATTERN.search(s3_key)
+    if season_match:
+        metadata["season"] = season_match.group(1)
+
+    # Extract data type from path/filename
+    if "play_by_play" in path_lower or "pbp" in path_lower:
+        metadata["data_type"] = "play_by_play"
+    elif "box_score" in path_lower or "boxscore" in path_lower:
+        metadata["data_type"] = "box_scores"
+    elif "schedule" in path_lower:
+        metadata["data_type"] = "schedule"
+    elif "player" in path_lower:
+        metadata["data_type"] = "player_stats"
+    elif "team" in path_lower:
+        metadata["data_type"] = "team_stats"
+    elif "advanced" in path_lower:
+        metadata["data_type"] = "advanced_stats"
+    elif "tracking" in path_lower:
+        metadata["data_type"] = "player_tracking"
+    elif "dashboard" in path_lower:
+        metadata["data_type"] = "team_dashboards"
+
+    # Extract IDs from filename
+    game_id_match = GAME_ID_PATTERN.search(filename)
+    if game_id_match:
+        metadata["game_id"] = game_id_match.group(1)
+
+    player_id_match = PLAYER_ID_PATTERN.search(filename)
+    if player_id_match:
+        metadata["player_id"] = player_id_match.group(1)
+
+    team_id_match = TEAM_ID_PATTERN.search(filename)
+    if team_id_match:
+        metadata["team_id"] = team_id_match.group(1)
+
+    return metadata
+
+
+class CoverageIndex:
+    """
+    Resident index of parsed S3 keys
+
+    Keys are grouped by source, (source, season) and (source, data_type) so
+    coverage analysis never has to filter the full file list.
+    """
+
+    def __init__(self):
+        self.files = {}  # s3_key -> scanner-style metadata dict
+        self._modified = {}  # s3_key -> aware datetime (None if unparseable)
+        self.by_source = defaultdict(set)
+        self.by_season = defaultdict(set)  # (source, season) -> keys
+        self.by_type = defaultdict(set)  # (source, data_type) -> keys
+        self.source_sizes = defaultdict(int)
+        self.total_size = 0
+
+    def __len__(self):
+        return len(self.files)
+
+    def __contains__(self, key):
+        return key in self.files
+
+    def upsert(self, info):
+        """
+        Parse and index one listed object (replacing any previous entry)
+
+        Args:
+            info: S3ObjectInfo from the inventory
+        """
+        metadata = parse_s3_path(info.key)
+        metadata["size_bytes"] = info.size
+        metadata["last_modified"] = info.last_modified.isoformat()
+        metadata["s3_key"] = info.key
+        self.add(metadata)
+
+    def add(self, metadata):
+        """
+        Index one scanner-style file entry (replacing any previous entry)
+
+        Args:
+            metadata: Entry from current_inventory.json "files"
+        """
+        key = metadata["s3_key"]
+        self.remove(key)
+
+        self.files[key] = metadata
+        self._modified[key] = _parse_timestamp(metadata.get("last_modified"))
+        self.total_size += metadata.get("size_bytes", 0)
+
+        source = metadata.get("source")
+        if source:
+            self.by_source[source].add(key)
+            self.source_sizes[source] += metadata.get("size_bytes", 0)
+            if metadata.get("season"):
+                self.by_season[(source, metadata["season"])].add(key)
+            if metadata.get("data_type"):
+                self.by_type[(source, metadata["data_type"])].add(key)
+
+    @classmethod
+    def from_inventory(cls, inventory):
+        """
+        Index a saved scanner inventory (current_inventory.json)
+
+        Args:
+            inventory: Inventory dict with a "files" list
+
+        Returns:
+            CoverageIndex
+        """
+        index = cls()
+        for metadata in inventory.get("files", []):
+            index.add(metadata)
+        return index
+
+    def remove(self, key):
+        """Drop a key from the index (no-op if absent)"""
+        metadata = self.files.pop(key, None)
+        if metadata is None:
+            return
+
+        del self._modified[key]
+        self.total_size -= metadata.get("size_bytes", 0)
+
+        source = metadata.get("source")
+        if source:
+            self.by_source[source].discard(key)
+            self.source_sizes[source] -= metadata.get("size_bytes", 0)
+            if metadata.get("season"):
+                self.by_season[(source, metadata["season"])].discard(key)
+            if metadata.get("data_type"):
+                self.by_type[(source, metadata["data_type"])].discard(key)
+
+    def clear(self):
+        """Drop every entry"""
+        self.__init__()
+
+    def count_stale(self, keys, freshness_days):
+        """Count keys last modified before the freshness cutoff"""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=freshness_days)
+        modified = self._modified
+        return sum(
+            1 for key in keys if modified[key] is not None and modified[key] < cutoff
+        )
+
+    def to_inventory(self, metadata):
+        """
+        Scanner-compatible inventory dict (current_inventory.json layout)
+
+        Args:
+            metadata: Inventory metadata block
+
+        Returns:
+            dict: Inventory with by_source / by_season / by_type / files
+        """
+        inventory = {
+            "metadata": metadata,
+            "by_source": {},
+            "by_season": {},
+            "by_type": {},
+            "files": [self.files[key] for key in sorted(self.files)],
+        }
+
+        for file_meta in inventory["files"]:
+            for index_name, field in (
+                ("by_source", "source"),
+                ("by_season", "season"),
+                ("by_type", "data_type"),
+            ):
+                value = file_meta[field]
+                if not value:
+                    continue
+                entry = inventory[index_name].setdefault(
+                    value, {"count": 0, "total_size": 0, "files": []}
+                )
+                entry["count"] += 1
+                entry["total_size"] += file_meta["size_bytes"]
+                entry["files"].append(file_meta)
+
+        return inventory
+
+
+def _parse_timestamp(value):
+    """Aware datetime from an ISO string or datetime (None if unparseable)"""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def current_season(now=None):
+    """Current NBA season (Oct-Jun), e.g. '2024-25'"""
+    now = now or datetime.now()
+    if now.month >= 10:
+        return f"{now.year}-{str(now.year + 1)[-2:]}"
+    return f"{now.year - 1}-{str(now.year)[-2:]}"
+
+
+class CoverageAnalyzer:
+    """
+    Expected vs. actual coverage over a CoverageIndex
+
+    Answers the question: Do we have the data we should have?
+    """
+
+    def __init__(self, expected, index, expected_file=None):
+        """
+        Initialize coverage analyzer
+
+        Args:
+            expected: Parsed data_inventory.yaml (SHOULD have)
+            index: CoverageIndex of the listed objects (HAVE)
+            expected_file: Path recorded in the analysis output
+        """
+        self.expected = expected
+        self.index = index
+        self.expected_file = expected_file
+
+        self.expected_game_counts = expected.get("expected_game_counts", {})
+        self.quality_requirements = expected.get("quality_requirements", {})
+        self.priority_rules = expected.get("priority_rules", {})
+
+    def analyze(self, inventory_file="in-process", inventory_metadata=None):
+        """
+        Compare expected vs. actual coverage
+
+        Args:
+            inventory_file: Inventory source recorded in the analysis
+            inventory_metadata: Metadata block copied into the analysis
+
+        Returns:
+            dict: Complete coverage analysis
+        """
+        start_time = datetime.now()
+
+        analysis = {
+            "timestamp": start_time.isoformat(),
+            "expected_file": str(self.expected_file),
+            "inventory_file": str(inventory_file),
+            "inventory_metadata": inventory_metadata or {},
+            "summary": {
+                "total_sources": 0,
+                "sources_complete": 0,
+                "sources_incomplete": 0,
+                "critical_gaps": 0,
+                "total_missing_files": 0,
+                "total_stale_files": 0,
+                "overall_completeness_pct": 0.0,
+            },
+            "by_source": {},
+        }
+
+        for source, config in self.expected["expected_coverage"].items():
+            source_analysis = self.analyze_source(source, config)
+            analysis["by_source"][source] = source_analysis
+            analysis["summary"]["total_sources"] += 1
+
+            if source_analysis["completeness_pct"] >= 95:
+                analysis["summary"]["sources_complete"] += 1
+            else:
+                analysis["summary"]["sources_incomplete"] += 1
+
+            analysis["summary"]["critical_gaps"] += source_analysis["critical_gaps"]
+            analysis["summary"]["total_missing_files"] += source_analysis[
+                "missing_files"
+            ]
+            analysis["summary"]["total_stale_files"] += source_analysis["stale_files"]
+
+        total_expected = sum(
+            s["expected_files"] for s in analysis["by_source"].values()
+        )
+        total_actual = sum(s["actual_files"] for s in analysis["by_source"].values())
+        if total_expected > 0:
+            analysis["summary"]["overall_completeness_pct"] = (
+                total_actual / total_expected
+            ) * 100
+
+        analysis["analysis_duration_seconds"] = (
+            datetime.now() - start_time
+        ).total_seconds()
+
+        return analysis
+
+    def analyze_source(self, source, config):
+        """Coverage for one source"""
+        analysis = {
+            "expected_files": 0,
+            "actual_files": len(self.index.by_source.get(source, ())),
+            "missing_files": 0,
+            "stale_files": 0,
+            "critical_gaps": 0,
+            "completeness_pct": 0.0,
+            "total_size_bytes": self.index.source_sizes.get(source, 0),
+            "by_season": {},
+            "by_type": {},
+        }
+
+        for season in config.get("seasons", []):
+            season_analysis = self.analyze_season(source, season, config)
+            analysis["by_season"][season] = season_analysis
+
+            analysis["expected_files"] += season_analysis["expected_files"]
+            analysis["missing_files"] += season_analysis["missing_files"]
+            analysis["stale_files"] += season_analysis["stale_files"]
+
+            if season_analysis["is_critical"]:
+                analysis["critical_gaps"] += 1
+
+        for data_type, type_config in config.get("data_types", {}).items():
+            analysis["by_type"][data_type] = self.analyze_data_type(
+                source, data_type, type_config
+            )
+
+        if analysis["expected_files"] > 0:
+            actual_good = analysis["actual_files"] - analysis["missing_files"]
+            analysis["completeness_pct"] = (
+                actual_good / analysis["expected_files"]
+            ) * 100
+
+        return analysis
+
+    def analyze_season(self, source, season, config):
+        """Coverage for one source season"""
+        season_files = self.index.by_season.get((source, season), ())
+
+        expected_count = 0
+        for type_config in config.get("data_types", {}).values():
+            if type_config.get("required"):
+                expected_count += self.expected_game_counts.get("total_max", 1320)
+
+        is_current = season == current_season()
+        analysis = {
+            "expected_files": expected_count,
+            "actual_files": len(season_files),
+            "missing_files": max(0, expected_count - len(season_files)),
+            "stale_files": 0,
+            "completeness_pct": 0.0,
+            "is_critical": is_current,
+        }
+
+        if is_current:
+            analysis["stale_files"] = self.index.count_stale(
+                season_files, freshness_days=7
+            )
+
+        if analysis["expected_files"] > 0:
+            analysis["completeness_pct"] = (
+                analysis["actual_files"] / analysis["expected_files"]
+            ) * 100
+
+        return analysis
+
+    def analyze_data_type(self, source, data_type, type_config):
+        """Coverage for one source data type"""
+        type_files = self.index.by_type.get((source, data_type), ())
+
+        analysis = {
+            "required": type_config.get("required", False),
+            "actual_files": len(type_files),
+            "completeness_threshold": type_config.get("completeness_threshold", 0.95),
+            "freshness_days": type_config.get("freshness_days", 30),
+            "path_patterns": type_config.get("path_patterns", []),
+            "stale_files": 0,
+            "small_files": 0,
+            "issues": [],
+        }
+
+        min_size = self.quality_requirements.get("min_file_size_bytes", 100)
+        small = sorted(
+            key for key in type_files if self.index.files[key]["size_bytes"] < min_size
+        )
+        analysis["small_files"] = len(small)
+        analysis["issues"] = [f"Small file: {key}" for key in small]
+
+        analysis["stale_files"] = self.index.count_stale(
+            type_files, type_config.get("freshness_days", 30)
+        )
+
+        return analysis
@@ -53,18 +53,27 @@ class GapDetector:
     Converts coverage analysis into actionable gap report
     """
 
-    def __init__(self, coverage_analysis_file):
+    def __init__(self, coverage_analysis_file=None, analysis=None):
         """
         Initialize gap detector
 
         Args:
             coverage_analysis_file: Path to coverage analysis JSON
+            analysis: Coverage analysis dict (in-process callers, skips the file)
         """
-        self.analysis_file = Path(coverage_analysis_file)
+        if analysis is None and coverage_analysis_file is None:
+            raise ValueError("coverage_analysis_file or analysis is required")
 
-        logger.info(f"Loading coverage analysis from: {coverage_analysis_file}")
-        with open(self.analysis_file, "r") as f:
-            self.analysis = json.load(f)
+        self.analysis_file = (
+            Path(coverage_analysis_file) if coverage_analysis_file else None
+        )
+
+        if analysis is not None:
+            self.analysis = analysis
+        else:
+            logger.info(f"Loading coverage analysis from: {coverage_analysis_file}")
+            with open(self.analysis_file, "r") as f:
+                self.analysis = json.load(f)
 
         self.current_season = self._get_current_season()
         logger.info(f"Current season: {self.current_season}")
@@ -81,7 +90,7 @@ class GapDetector:
 
         gap_report = {
             "timestamp": start_time.isoformat(),
-            "analysis_file": str(self.analysis_file),
+            "analysis_file": str(self.analysis_file) if self.analysis_file else None,
             "current_season": self.current_season,
             "summary": {
                 "total_gaps": 0,
@@ -11,10 +11,12 @@ Features:
 - Graceful shutdown on SIGINT/SIGTERM
 - Health checks and monitoring
 - DIMS integration for metrics tracking
+- In-process ReconciliationEngine kept resident between cycles (the
+  legacy subprocess-per-cycle pipeline remains available)
 
 Usage:
     from nba_simulator.adce import ReconciliationDaemon
-    
+
     daemon = ReconciliationDaemon(interval_hours=1)
     daemon.run()
 """
@@ -28,6 +30,7 @@ import subprocess  # nosec B404 - Used for calling internal scripts only
 import json
 
 from ..utils import setup_logging
+from .reconciliation_engine import ReconciliationEngine
 
 logger = setup_logging(__name__)
 
@@ -39,7 +42,15 @@ class ReconciliationDaemon:
     Runs reconciliation on schedule and responds to events
     """
 
-    def __init__(self, interval_hours=1, dry_run=False, use_aws_inventory=False):
+    def __init__(
+        self,
+        interval_hours=1,
+        dry_run=False,
+        use_aws_inventory=False,
+        in_process=True,
+        engine=None,
+        dims=None,
+    ):
         """
         Initialize reconciliation daemon
 
@@ -47,10 +58,34 @@ class ReconciliationDaemon:
             interval_hours: How often to run reconciliation (default: 1 hour)
             dry_run: If True, don't generate task queue (just report)
             use_aws_inventory: If True, use AWS S3 Inventory instead of sampling
+                (subprocess mode only; the engine lists the bucket itself)
+            in_process: Run cycles on a resident ReconciliationEngine instead
+                of a run_reconciliation.py subprocess
+            engine: Pre-built ReconciliationEngine (created lazily if None)
+            dims: DIMSCore instance for metrics (created lazily if None)
+
+        Raises:
+            ValueError: If both engine and use_aws_inventory are given
         """
+        if use_aws_inventory and engine is not None:
+            raise ValueError(
+                "use_aws_inventory requires subprocess mode; "
+                "ReconciliationEngine cannot read AWS S3 Inventory reports"
+            )
+        if use_aws_inventory and in_process:
+            logger.warning(
+                "use_aws_inventory is not supported by the in-process "
+                "ReconciliationEngine - falling back to run_reconciliation.py "
+                "subprocess cycles"
+            )
+            in_process = False
+
         self.interval_seconds = interval_hours * 3600
         self.dry_run = dry_run
         self.use_aws_inventory = use_aws_inventory
+        self.in_process = in_process or engine is not None
+        self.engine = engine
+        self.dims = dims
         self.running = False
         self.last_run_time = None
         self.total_runs = 0
@@ -67,6 +102,7 @@ class ReconciliationDaemon:
         logger.info(f"Interval: {interval_hours} hour(s)")
         logger.info(f"Dry run: {dry_run}")
         logger.info(f"AWS Inventory: {use_aws_inventory}")
+        logger.info(f"Mode: {'in-process' if self.in_process else 'subprocess'}")
         logger.info(f"Next run: Immediate")
         logger.info("=" * 80)
 
@@ -88,6 +124,9 @@ class ReconciliationDaemon:
         logger.info(f"Started: {cycle_start.isoformat()}")
         logger.info("=" * 80)
 
+        if self.in_process:
+            return self._run_engine_cycle(cycle_start)
+
         try:
             # Build command
             cmd = [sys.executable, "scripts/reconciliation/run_reconciliation.py"]
@@ -102,6 +141,9 @@ class ReconciliationDaemon:
                     cmd.append("--use-cache")
                     logger.info("Using cached S3 inventory (< 1 hour old)")
 
+            if self.use_aws_inventory:
+                cmd.append("--use-aws-inventory")
+
             if self.dry_run:
                 cmd.append("--dry-run")
 
@@ -149,6 +191,53 @@ class ReconciliationDaemon:
             self.total_runs += 1
             self.last_run_time = datetime.now()
 
+    def _run_engine_cycle(self, cycle_start):
+        """
+        Run a cycle on the resident ReconciliationEngine
+
+        The engine (S3 listing + coverage index) is built on the first cycle
+        and reused afterwards, so later cycles only process changed keys.
+        """
+        try:
+            if self.engine is None:
+                self.engine = ReconciliationEngine()
+
+            result = self.engine.run_cycle(dry_run=self.dry_run)
+
+            if result["success"]:
+                self.successful_runs += 1
+                logger.info(
+                    f"\n✅ CYCLE COMPLETE - Duration: {result['duration']:.1f}s"
+                )
+                logger.info(f"  Key changes: {result['diff']}")
+                logger.info(f"  Objects indexed: {result['objects_indexed']:,}")
+                logger.info(
+                    f"  Overall completeness: {result['overall_completeness_pct']:.1f}%"
+                )
+                logger.info(
+                    f"  Total gaps: {result['total_gaps']} "
+                    f"(Critical: {result['critical_gaps']})"
+                )
+            else:
+                self.failed_runs += 1
+                logger.error(f"\n❌ CYCLE FAILED - Duration: {result['duration']:.1f}s")
+                logger.error(f"Error: {result.get('error')}")
+
+            return result
+
+        except Exception as e:
+            self.failed_runs += 1
+            logger.error(f"\n❌ CYCLE EXCEPTION: {e}", exc_info=True)
+            return {
+                "success": False,
+                "timestamp": cycle_start.isoformat(),
+                "error": str(e),
+            }
+
+        finally:
+            self.total_runs += 1
+            self.last_run_time = datetime.now()
+
     def _log_cycle_summary(self, output):
         """Parse and log key metrics from reconciliation output"""
         try:
@@ -176,41 +265,77 @@ class ReconciliationDaemon:
         """
         Update DIMS with reconciliation metrics
 
+        In-process cycles report step timings and key diff sizes alongside
+        the gap counts; subprocess cycles fall back to inventory/gaps.json.
+
         Args:
             cycle_result: Results from reconciliation cycle
         """
         try:
-            # Load gaps file if exists
-            gaps_file = Path("inventory/gaps.json")
-            if gaps_file.exists():
-                with open(gaps_file, "r") as f:
-                    gaps = json.load(f)
-
-                # Update DIMS metrics (if DIMS CLI is available)
-                dims_cli = Path("scripts/monitoring/dims_cli.py")
-                if dims_cli.exists():
-                    logger.info("Updating DIMS metrics...")
-
-                    metrics = {
-                        "reconciliation_last_run": datetime.now().isoformat(),
-                        "reconciliation_total_gaps": gaps.get("total_tasks", 0),
-                        "reconciliation_critical_gaps": gaps.get("by_priority", {}).get(
-                            "critical", 0
-                        ),
-                        "reconciliation_task_queue_size": gaps.get("total_tasks", 0),
-                    }
-
-                    for key, value in metrics.items():
-                        subprocess.run(
-                            [sys.executable, str(dims_cli), "set", key, str(value)],
-                            capture_output=True,
-                        )  # nosec B603
-
-                    logger.info("✅ DIMS metrics updated")
+            metrics = self._collect_dims_metrics(cycle_result)
+            if not metrics:
+                return
+
+            if self.dims is None:
+                from ..monitoring.dims import DIMSCore
+
+                self.dims = DIMSCore()
+
+            logger.info("Updating DIMS metrics...")
+            for name, value in metrics.items():
+                self.dims.update_metric(
+                    "reconciliation", name, value, verified_by="reconciliation_daemon"
+                )
+            self.dims.save_metrics()
+            logger.info("✅ DIMS metrics updated")
 
         except Exception as e:
             logger.warning(f"Could not update DIMS metrics: {e}")
 
+    def _collect_dims_metrics(self, cycle_result):
+        """
+        Build the DIMS 'reconciliation' metrics for a cycle
+
+        Args:
+            cycle_result: Results from reconciliation cycle
+
+        Returns:
+            dict: metric name -> value (empty if nothing to report)
+        """
+        metrics = {
+            "last_run": datetime.now().isoformat(),
+            "last_run_success": bool(cycle_result.get("success")),
+        }
+        if cycle_result.get("duration") is not None:
+            metrics["cycle_duration_seconds"] = round(cycle_result["duration"], 3)
+
+        if "timings" in cycle_result:
+            for step, seconds in cycle_result["timings"].items():
+                metrics[f"{step}_seconds"] = round(seconds, 3)
+
+        if cycle_result.get("success") and "diff" in cycle_result:
+            for kind, count in cycle_result["diff"].items():
+                metrics[f"keys_{kind}"] = count
+            metrics["objects_indexed"] = cycle_result["objects_indexed"]
+            metrics["total_gaps"] = cycle_result["total_gaps"]
+            metrics["critical_gaps"] = cycle_result["critical_gaps"]
+            if cycle_result.get("total_tasks") is not None:
+                metrics["task_queue_size"] = cycle_result["total_tasks"]
+            return metrics
+
+        # Subprocess cycle: read the task queue it wrote
+        gaps_file = Path("inventory/gaps.json")
+        if not gaps_file.exists():
+            return metrics
+
+        with open(gaps_file, "r") as f:
+            gaps = json.load(f)
+
+        metrics["total_gaps"] = gaps.get("total_tasks", 0)
+        metrics["critical_gaps"] = gaps.get("by_priority", {}).get("critical", 0)
+        metrics["task_queue_size"] = gaps.get("total_tasks", 0)
+        return metrics
+
     def run(self, run_once=False):
         """
         Run daemon loop
@@ -299,6 +424,9 @@ Examples:
 
   # Use AWS S3 Inventory instead of sampling
   python -m nba_simulator.adce.reconciliation --use-aws-inventory
+
+  # Legacy mode: one run_reconciliation.py subprocess per cycle
+  python -m nba_simulator.adce.reconciliation --subprocess
         """,
     )
 
@@ -327,6 +455,11 @@ Examples:
         action="store_true",
         help="Use AWS S3 Inventory instead of sampling",
     )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run each cycle as a run_reconciliation.py subprocess (legacy)",
+    )
 
     args = parser.parse_args()
 
@@ -345,6 +478,7 @@ Examples:
         interval_hours=interval_hours,
         dry_run=args.dry_run,
         use_aws_inventory=args.use_aws_inventory,
+        in_process=not args.subprocess,
     )
 
     # Run daemon
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Reconciliation Engine - ADCE Phase 2B
+In-process reconciliation cycle: Scan → Analyze → Detect → Generate
+
+Importable replacement for running scripts/reconciliation/run_reconciliation.py
+as a subprocess every daemon cycle. The engine stays resident between cycles:
+
+- The S3 listing (S3Inventory) is re-listed in parallel and diffed by
+  ETag/LastModified, so each cycle knows exactly which keys are new,
+  changed or removed
+- The coverage index (parsed path metadata grouped by source, season and
+  data type) is updated from that diff only - unchanged keys are never
+  re-parsed
+- Coverage analysis, gap detection and task generation run on the resident
+  index instead of round-tripping through JSON files and fresh interpreters
+
+Path parsing and coverage rules live in nba_simulator.adce.coverage, shared
+with scripts/reconciliation/analyze_coverage.py, so GapDetector and the task
+queue generator consume the output unchanged.
+
+Usage:
+    from nba_simulator.adce import ReconciliationEngine
+
+    engine = ReconciliationEngine()
+    result = engine.run_cycle()      # first cycle: full listing + index build
+    result = engine.run_cycle()      # later cycles: incremental
+    print(result["timings"], result["diff"])
+"""
+
+import importlib.util
+import json
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+import yaml
+
+from ..monitoring.quality.s3_inventory import S3Inventory
+from ..utils import setup_logging
+from .coverage import CoverageAnalyzer, CoverageIndex
+from .gap_detector import GapDetector
+
+logger = setup_logging(__name__)
+
+
+class ReconciliationEngine:
+    """
+    Resident, incremental reconciliation engine
+
+    One instance is meant to live for the lifetime of ReconciliationDaemon;
+    every run_cycle() after the first only parses changed keys.
+    """
+
+    def __init__(
+        self,
+        config_file="config/reconciliation_config.yaml",
+        expected_file="inventory/data_inventory.yaml",
+        s3_client=None,
+        output_dir="inventory/cache",
+        task_queue_file="inventory/gaps.json",
+        task_generator_script="scripts/reconciliation/generate_task_queue.py",
+        save_inventory=False,
+    ):
+        """
+        Initialize reconciliation engine
+
+        Args:
+            config_file: Path to reconciliation config
+            expected_file: Path to data_inventory.yaml (SHOULD have)
+            s3_client: S3 client (defaults to boto3.client("s3"))
+            output_dir: Where coverage analysis / detected gaps are written
+            task_queue_file: Task queue output (read by the orchestrator)
+            task_generator_script: TaskQueueGenerator module (loaded in-process)
+            save_inventory: Also write current_inventory.json each cycle
+        """
+        self.config = self._load_config(Path(config_file))
+        self.expected_file = Path(expected_file)
+        with open(self.expected_file, "r") as f:
+            self.expected = yaml.safe_load(f)
+
+        self.output_dir = Path(output_dir)
+        self.task_queue_file = Path(task_queue_file)
+        self.task_generator_script = Path(task_generator_script)
+        self.save_inventory = save_inventory
+
+        s3_config = self.config.get("s3", {})
+        self.bucket = s3_config.get("bucket", "nba-sim-raw-data-lake")
+        self.sample_rate = s3_config.get("sample_rate")
+
+        if s3_client is None:
+            import boto3
+
+            s3_client = boto3.client("s3")
+
+        # Refreshed explicitly once per cycle, never implicitly
+        self.inventory = S3Inventory(
+            s3_client,
+            self.bucket,
+            max_workers=s3_config.get("parallel_workers", 16),
+            ttl_seconds=float("inf"),
+        )
+        self.index = CoverageIndex()
+        self.analyzer = CoverageAnalyzer(
+            self.expected, self.index, expected_file=self.expected_file
+        )
+
+        self.cycles = 0
+        self.last_result = None
+        self._task_generator = None
+
+    def _load_config(self, config_file):
+        """Reconciliation config, or run_reconciliation.py's defaults"""
+        if not config_file.exists():
+            logger.warning(f"Config file not found: {config_file}, using defaults")
+            return {
+                "s3": {"bucket": "nba-sim-raw-data-lake", "sample_rate": 0.1},
+            }
+
+        with open(config_file, "r") as f:
+            return yaml.safe_load(f) or {}
+
+    def _sampled(self, key):
+        """
+        Deterministic sampling by key hash
+
+        A key is either always or never in the sample, so cycle-to-cycle
+        diffs stay meaningful (random sampling would churn the index).
+        """
+        if not self.sample_rate:
+            return True
+        return zlib.crc32(key.encode("utf-8")) < self.sample_rate * 2**32
+
+    # =========================================================================
+    # Cycle
+    # =========================================================================
+
+    def run_cycle(self, dry_run=False, full_rebuild=False):
+        """
+        Run one reconciliation cycle
+
+        Args:
+            dry_run: Generate the task queue but don't save it
+            full_rebuild: Drop the resident index and re-parse every key
+
+        Returns:
+            dict: success, duration, timings per step, diff sizes, gap and
+            task counts
+        """
+        cycle_start = datetime.now()
+        started = time.perf_counter()
+        timings = {}
+
+        try:
+            # Step 1: Re-list S3 and diff against the resident listing
+            t0 = time.perf_counter()
+            changes = self.inventory.refresh(force=True)
+            timings["scan"] = time.perf_counter() - t0
+
+            # Step 2: Apply the diff to the coverage index
+            t0 = time.perf_counter()
+            if full_rebuild:
+                self.index.clear()
+                upserts = [info.key for info in self.inventory.objects()]
+            else:
+                upserts = changes.added_keys + changes.modified_keys
+            for key in changes.removed_keys:
+                self.index.remove(key)
+            for key in upserts:
+                if self._sampled(key):
+                    self.index.upsert(self.inventory.get(key))
+            timings["index"] = time.perf_counter() - t0
+
+            inventory_metadata = self._inventory_metadata(cycle_start, timings)
+            if self.save_inventory:
+                self._save_json(
+                    self.output_dir / "current_inventory.json",
+                    self.index.to_inventory(inventory_metadata),
+                )
+
+            # Step 3: Coverage analysis
+            t0 = time.perf_counter()
+            analysis = self.analyze_coverage(inventory_metadata)
+            self._save_json(self.output_dir / "coverage_analysis.json", analysis)
+            timings["analyze"] = time.perf_counter() - t0
+
+            # Step 4: Gap detection
+            t0 = time.perf_counter()
+            gap_report = GapDetector(analysis=analysis).detect_gaps()
+            gaps_file = self.output_dir / "detected_gaps.json"
+            self._save_json(gaps_file, gap_report)
+            timings["detect"] = time.perf_counter() - t0
+
+            # Step 5: Task queue
+            t0 = time.perf_counter()
+            task_queue = self._generate_tasks(gaps_file, gap_report, dry_run=dry_run)
+            timings["generate"] = time.perf_counter() - t0
+
+            result = {
+                "success": True,
+                "timestamp": cycle_start.isoformat(),
+                "cycle": self.cycles + 1,
+                "timings": timings,
+                "diff": {
+                    "added": changes.added,
+                    "modified": changes.modified,
+                    "removed": changes.removed,
+                    "unchanged": changes.unchanged,
+                },
+                "objects_listed": len(self.inventory),
+                "objects_indexed": len(self.index),
+                "overall_completeness_pct": analysis["summary"][
+                    "overall_completeness_pct"
+                ],
+                "total_gaps": gap_report["summary"]["total_gaps"],
+                "critical_gaps": gap_report["summary"]["by_priority"]["critical"],
+                "total_tasks": task_queue["total_tasks"] if task_queue else None,
+            }
+
+        except Exception as e:
+            logger.error(f"Reconciliation cycle failed: {e}", exc_info=True)
+            result = {
+                "success": False,
+                "timestamp": cycle_start.isoformat(),
+                "cycle": self.cycles + 1,
+                "timings": timings,
+                "error": str(e),
+            }
+
+        result["duration"] = time.perf_counter() - started
+        self.cycles += 1
+        self.last_result = result
+
+        if result["success"]:
+            logger.info(
+                f"Cycle {result['cycle']} in {result['duration']:.2f}s: "
+                f"+{changes.added} ~{changes.modified} -{changes.removed} keys, "
+                f"{result['total_gaps']} gaps"
+            )
+
+        return result
+
+    def _inventory_metadata(self, cycle_start, timings):
+        """Metadata block in the scanner's layout"""
+        return {
+            "scan_timestamp": cycle_start.isoformat(),
+            "bucket": self.bucket,
+            "scan_mode": "sample" if self.sample_rate else "full",
+            "sample_rate": self.sample_rate,
+            "prefix": None,
+            "total_objects_scanned": len(self.inventory),
+            "total_objects_kept": len(self.index),
+            "total_size_bytes": self.index.total_size,
+            "scan_duration_seconds": timings.get("scan", 0.0),
+        }
+
+    def _generate_tasks(self, gaps_file, gap_report, dry_run=False):
+        """
+        Run TaskQueueGenerator in-process (None if unavailable)
+
+        The generator (and the scraper config it parses) is kept between
+        cycles; later cycles just hand it the new gap report.
+        """
+        if self._task_generator is None:
+            generator_class = self._load_task_generator()
+            if generator_class is None:
+                return None
+            self._task_generator = generator_class(str(gaps_file))
+        else:
+            self._task_generator.gaps_file = Path(gaps_file)
+            self._task_generator.gaps = gap_report
+            self._task_generator.task_counter = 0
+
+        generator = self._task_generator
+        task_queue = generator.generate_tasks()
+
+        if not dry_run:
+            generator.save_task_queue(task_queue, str(self.task_queue_file))
+        else:
+            logger.info("Dry run mode - task queue not saved")
+
+        return task_queue
+
+    def _load_task_generator(self):
+        """Import TaskQueueGenerator from task_generator_script"""
+        if not self.task_generator_script.exists():
+            logger.warning(f"Task generator not found: {self.task_generator_script}")
+            return None
+
+        spec = importlib.util.spec_from_file_location(
+            "generate_task_queue", self.task_generator_script
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.TaskQueueGenerator
+
+    def _save_json(self, path, payload):
+        """Write a JSON output file"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(payload, f, indent=2, default=str)
+
+    # =========================================================================
+    # Coverage analysis (shared with analyze_coverage.py)
+    # =========================================================================
+
+    def analyze_coverage(self, inventory_metadata=None):
+        """
+        Compare expected vs. actual coverage from the resident index
+
+        Args:
+            inventory_metadata: Metadata block copied into the analysis
+
+        Returns:
+            dict: Coverage analysis
+        """
+        return self.analyzer.analyze(inventory_metadata=inventory_metadata)
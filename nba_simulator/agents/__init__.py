@@ -8,8 +8,10 @@ Available Agents:
 - MasterAgent: Main orchestration coordinator
 - QualityAgent: Data quality validation
 - IntegrationAgent: Cross-source validation
+- GameComparisonEngine: Set-based season comparison across sources
 - NBAStatsAgent: NBA API coordination
 - DeduplicationAgent: Duplicate detection and resolution
+- DedupEngine: Blocking-based duplicate detection for full tables
 - HistoricalAgent: Historical data management
 - HooprAgent: hoopR data integration
 - BasketballReferenceAgent: Basketball-Reference.com 13-tier collection
@@ -32,38 +34,38 @@ Usage:
     report = master.generate_report()
 """
 
-from .base_agent import BaseAgent, AgentState, AgentPriority, AgentMetrics
+from ..utils.lazy import lazy_exports
 
-from .master import MasterAgent, ExecutionPhase
-from .quality import QualityAgent, QualityCheck
-from .integration import IntegrationAgent, IntegrationMatch, ConflictResolution
-from .nba_stats import NBAStatsAgent
-from .deduplication import DeduplicationAgent
-from .historical import HistoricalAgent
-from .hoopr import HooprAgent
-from .bbref import BasketballReferenceAgent, BBRefTier
-
-__all__ = [
+# Public name -> defining module, imported on first access
+_EXPORTS = {
     # Base classes
-    "BaseAgent",
-    "AgentState",
-    "AgentPriority",
-    "AgentMetrics",
+    "BaseAgent": ".base_agent",
+    "AgentState": ".base_agent",
+    "AgentPriority": ".base_agent",
+    "AgentMetrics": ".base_agent",
     # Concrete agents
-    "MasterAgent",
-    "QualityAgent",
-    "IntegrationAgent",
-    "NBAStatsAgent",
-    "DeduplicationAgent",
-    "HistoricalAgent",
-    "HooprAgent",
-    "BasketballReferenceAgent",
+    "MasterAgent": ".master",
+    "QualityAgent": ".quality",
+    "IntegrationAgent": ".integration",
+    "NBAStatsAgent": ".nba_stats",
+    "DeduplicationAgent": ".deduplication",
+    "HistoricalAgent": ".historical",
+    "HooprAgent": ".hoopr",
+    "BasketballReferenceAgent": ".bbref",
     # Additional exports
-    "ExecutionPhase",
-    "QualityCheck",
-    "IntegrationMatch",
-    "ConflictResolution",
-    "BBRefTier",
-]
+    "ExecutionPhase": ".master",
+    "QualityCheck": ".quality",
+    "IntegrationMatch": ".integration",
+    "ConflictResolution": ".integration",
+    "BBRefTier": ".bbref",
+    "DedupEngine": ".dedup_engine",
+    "MinHashLSH": ".dedup_engine",
+    "GameComparisonEngine": ".integration_engine",
+    "SeasonComparison": ".integration_engine",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
 
 __version__ = "1.0.0"
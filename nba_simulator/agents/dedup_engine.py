@@ -0,0 +1,685 @@
+"""
+Dedup Engine - Blocking-Based Duplicate Detection
+
+Scales duplicate detection to full tables by never comparing every record
+with every other record:
+
+- Players: MinHash signatures over character shingles of normalized names,
+  banded into LSH buckets; only records sharing a bucket become candidates
+- Games: sorted neighborhood over (unordered team pair, date) blocks, so
+  home/away swaps and timezone-shifted dates from different sources still
+  meet
+- Candidate pairs are scored in vectorized batches, clustered with
+  connected components and turned into merge/review decisions that are
+  written in bulk
+
+Usage:
+    engine = DedupEngine(similarity_threshold=95.0, merge_strategy="merge")
+
+    players = engine.load_frame(conn, "SELECT player_id, player_name FROM players")
+    pairs = engine.find_player_duplicates(players)
+    decisions = engine.merge_decisions(players, pairs, id_column="player_id")
+    engine.write_decisions(conn, "players", decisions)
+"""
+
+import logging
+import re
+import unicodedata
+import zlib
+from datetime import datetime, timezone
+from typing import Any, Callable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+logger = logging.getLogger(__name__)
+
+# Abbreviations that differ between ESPN, NBA API and Basketball Reference
+TEAM_ALIASES = {
+    "BRK": "BKN",
+    "CHO": "CHA",
+    "GS": "GSW",
+    "NO": "NOP",
+    "NOR": "NOP",
+    "NY": "NYK",
+    "PHO": "PHX",
+    "SA": "SAS",
+    "UTAH": "UTA",
+    "WSH": "WAS",
+}
+
+# Team names (hoopR display names, odds feeds) by nickname
+TEAM_NICKNAMES = {
+    "hawks": "ATL",
+    "celtics": "BOS",
+    "nets": "BKN",
+    "hornets": "CHA",
+    "bobcats": "CHA",
+    "bulls": "CHI",
+    "cavaliers": "CLE",
+    "mavericks": "DAL",
+    "nuggets": "DEN",
+    "pistons": "DET",
+    "warriors": "GSW",
+    "rockets": "HOU",
+    "pacers": "IND",
+    "clippers": "LAC",
+    "lakers": "LAL",
+    "grizzlies": "MEM",
+    "heat": "MIA",
+    "bucks": "MIL",
+    "timberwolves": "MIN",
+    "pelicans": "NOP",
+    "knicks": "NYK",
+    "thunder": "OKC",
+    "supersonics": "SEA",
+    "magic": "ORL",
+    "76ers": "PHI",
+    "suns": "PHX",
+    "blazers": "POR",
+    "kings": "SAC",
+    "spurs": "SAS",
+    "raptors": "TOR",
+    "jazz": "UTA",
+    "wizards": "WAS",
+    "bullets": "WAS",
+}
+
+# Full names whose nickname moved between franchises
+TEAM_FULL_NAMES = {
+    "new orleans hornets": "NOP",
+    "new orleans/oklahoma city hornets": "NOP",
+}
+
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+
+PAIR_COLUMNS = ["id1", "id2", "score"]
+DECISION_COLUMNS = ["keep_id", "duplicate_id", "score", "action", "strategy"]
+
+DECISIONS_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        decision_id SERIAL PRIMARY KEY,
+        table_name VARCHAR(100) NOT NULL,
+        keep_id VARCHAR(100) NOT NULL,
+        duplicate_id VARCHAR(100) NOT NULL,
+        score NUMERIC(5, 2),
+        action VARCHAR(20) NOT NULL,
+        strategy VARCHAR(20) NOT NULL,
+        decided_at TIMESTAMP WITH TIME ZONE NOT NULL
+    )
+"""
+
+
+def normalize_player_name(name: Optional[str]) -> str:
+    """
+    Normalize a player name for matching.
+
+    Strips accents, punctuation and generational suffixes and lowercases:
+    "Nikola Jokić" -> "nikola jokic", "Gary Payton II" -> "gary payton",
+    "Shaquille O'Neal" -> "shaquille oneal".
+    """
+    if not name or not isinstance(name, str):
+        return ""
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(ch for ch in name if not unicodedata.combining(ch))
+    name = re.sub(r"[.'\u2019]", "", name.lower())
+    tokens = re.sub(r"[^a-z0-9 ]", " ", name).split()
+    while len(tokens) > 1 and tokens[-1] in NAME_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def normalize_team_code(code: Any) -> str:
+    """
+    Canonical team code.
+
+    Accepts abbreviations from any source ("GS", "BRK") and team names
+    ("Boston Celtics", "Trail Blazers"); unknown values are uppercased.
+    """
+    if code is None or (isinstance(code, float) and np.isnan(code)):
+        return ""
+    text = str(code).strip()
+    upper = text.upper()
+    if " " in text or upper.lower() in TEAM_NICKNAMES:
+        lower = text.lower()
+        if lower in TEAM_FULL_NAMES:
+            return TEAM_FULL_NAMES[lower]
+        nickname = lower.split()[-1]
+        if nickname in TEAM_NICKNAMES:
+            return TEAM_NICKNAMES[nickname]
+    return TEAM_ALIASES.get(upper, upper)
+
+
+def neighbor_pairs(
+    order: np.ndarray,
+    same_block: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    max_distance: int,
+) -> np.ndarray:
+    """
+    Pair every record with its neighbors in a sorted order.
+
+    Args:
+        order: Record indices in sorted order
+        same_block: f(left_sorted_positions, right_sorted_positions) -> bool
+            mask; pairs must stay inside one block
+        max_distance: Largest distance (in sorted positions) to pair
+
+    Returns:
+        (n_pairs, 2) array of record indices with the smaller index first
+    """
+    pairs = []
+    positions = np.arange(len(order))
+    for distance in range(1, max_distance + 1):
+        if distance >= len(order):
+            break
+        left = positions[:-distance]
+        mask = same_block(left, left + distance)
+        if not mask.any():
+            break
+        pairs.append(np.column_stack([order[:-distance][mask], order[distance:][mask]]))
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = np.sort(np.concatenate(pairs), axis=1)
+    return np.unique(pairs, axis=0)
+
+
+class MinHashLSH:
+    """
+    MinHash signatures and banded LSH candidate generation.
+
+    Records whose shingle sets have Jaccard similarity J share at least one
+    band bucket with probability 1 - (1 - J**rows)**bands.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 3,
+        max_bucket_size: int = 50,
+        chunk_size: int = 5000,
+        seed: int = 1,
+    ):
+        """
+        Initialize MinHash LSH.
+
+        Args:
+            num_perm: Signature length (hash functions)
+            bands: LSH bands (must divide num_perm)
+            shingle_size: Characters per shingle
+            max_bucket_size: Neighbors paired within one bucket (bounds
+                the cost of very common names)
+            chunk_size: Records hashed per vectorized batch
+            seed: Hash function seed
+        """
+        if num_perm % bands:
+            raise ValueError(f"bands ({bands}) must divide num_perm ({num_perm})")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_bucket_size = max_bucket_size
+        self.chunk_size = chunk_size
+
+        rng = np.random.default_rng(seed)
+        # Multiply-shift hashing: ((a * x + b) mod 2**64) >> 32, a odd
+        self._a = rng.integers(1, 2**63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+        self._band_weights = rng.integers(
+            1, 2**63, self.rows, dtype=np.uint64
+        ) | np.uint64(1)
+
+    def shingles(self, text: str) -> List[int]:
+        """32-bit hashes of the padded character shingles of text"""
+        padded = f" {text} "
+        k = self.shingle_size
+        grams = {padded[i : i + k] for i in range(max(len(padded) - k + 1, 1))}
+        return [zlib.crc32(gram.encode("utf-8")) for gram in grams]
+
+    def signatures(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        MinHash signatures.
+
+        Returns:
+            (len(texts), num_perm) uint64 array of 32-bit hash minima
+        """
+        signatures = np.empty((len(texts), self.num_perm), dtype=np.uint64)
+        for start in range(0, len(texts), self.chunk_size):
+            chunk = texts[start : start + self.chunk_size]
+            hashed = [self.shingles(text) for text in chunk]
+            lengths = np.fromiter((len(h) for h in hashed), dtype=np.int64)
+            values = np.fromiter(
+                (v for h in hashed for v in h), dtype=np.uint64, count=lengths.sum()
+            )
+            permuted = (values[:, None] * self._a + self._b) >> np.uint64(32)
+            offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+            signatures[start : start + len(chunk)] = np.minimum.reduceat(
+                permuted, offsets, axis=0
+            )
+        return signatures
+
+    def candidate_pairs(self, signatures: np.ndarray) -> np.ndarray:
+        """
+        Pairs of records sharing at least one band bucket.
+
+        Returns:
+            (n_pairs, 2) array of record indices with the smaller index first
+        """
+        n = len(signatures)
+        banded = signatures.reshape(n, self.bands, self.rows)
+        band_keys = (banded * self._band_weights).sum(axis=2)
+
+        pairs = []
+        for band in range(self.bands):
+            keys = band_keys[:, band]
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            pairs.append(
+                neighbor_pairs(
+                    order,
+                    lambda i, j: sorted_keys[i] == sorted_keys[j],
+                    self.max_bucket_size - 1,
+                )
+            )
+        pairs = np.concatenate(pairs) if pairs else np.empty((0, 2), np.int64)
+        return np.unique(pairs, axis=0) if len(pairs) else pairs
+
+
+class DedupEngine:
+    """
+    Candidate generation, vectorized scoring and bulk merge decisions.
+
+    Scores are 0-100. Pairs scoring at least min_score are reported;
+    pairs at or above similarity_threshold are merged (or flagged for
+    review under the 'manual' strategy), the rest are flagged for review.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 95.0,
+        min_score: float = 80.0,
+        merge_strategy: str = "merge",
+        date_window_days: int = 1,
+        max_neighbors: int = 8,
+        lsh: Optional[MinHashLSH] = None,
+    ):
+        """
+        Initialize dedup engine.
+
+        Args:
+            similarity_threshold: Score at which pairs are merged
+            min_score: Lowest score reported as a candidate duplicate
+            merge_strategy: 'latest', 'complete', 'merge' or 'manual'
+            date_window_days: Max date difference for game duplicates
+            max_neighbors: Sorted-neighborhood window for games
+            lsh: MinHash LSH for player names (default: MinHashLSH())
+        """
+        self.similarity_threshold = similarity_threshold
+        self.min_score = min_score
+        self.merge_strategy = merge_strategy
+        self.date_window_days = date_window_days
+        self.max_neighbors = max_neighbors
+        self.lsh = lsh or MinHashLSH()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def load_frame(
+        conn, query: str, params: Optional[tuple] = None, chunk_size: int = 50000
+    ) -> pd.DataFrame:
+        """
+        Stream a query into a DataFrame through a server-side cursor.
+
+        Args:
+            conn: psycopg2 connection
+            query: SELECT statement
+            params: Query parameters
+            chunk_size: Rows fetched per round trip
+
+        Returns:
+            DataFrame with one column per selected column
+        """
+        with conn.cursor(name="dedup_scan") as cur:
+            cur.itersize = chunk_size
+            cur.execute(query, params)
+            chunks = []
+            columns = None
+            while True:
+                rows = cur.fetchmany(chunk_size)
+                if columns is None and cur.description:
+                    columns = [desc[0] for desc in cur.description]
+                if not rows:
+                    break
+                chunks.append(pd.DataFrame.from_records(rows, columns=columns))
+        if not chunks:
+            return pd.DataFrame(columns=columns or [])
+        return pd.concat(chunks, ignore_index=True)
+
+    # ------------------------------------------------------------------
+    # Detection
+    # ------------------------------------------------------------------
+
+    def find_player_duplicates(
+        self,
+        players: pd.DataFrame,
+        id_column: str = "player_id",
+        name_column: str = "player_name",
+        attribute_columns: Sequence[str] = ("position", "team_id"),
+    ) -> pd.DataFrame:
+        """
+        Find duplicate players with MinHash LSH over normalized names.
+
+        The score is 90 points of name similarity (estimated Jaccard over
+        shingles) plus 10 points of agreement on the attribute columns
+        both records have (5 if none are comparable).
+
+        Returns:
+            DataFrame with id1, id2, score (id1 < id2)
+        """
+        names = players[name_column].map(normalize_player_name).to_numpy()
+        valid = np.flatnonzero(names != "")
+        if len(valid) < 2:
+            return pd.DataFrame(columns=PAIR_COLUMNS)
+
+        signatures = self.lsh.signatures(list(names[valid]))
+        pairs = self.lsh.candidate_pairs(signatures)
+        if not len(pairs):
+            return pd.DataFrame(columns=PAIR_COLUMNS)
+
+        left, right = pairs[:, 0], pairs[:, 1]
+        name_similarity = (signatures[left] == signatures[right]).mean(axis=1)
+
+        rows = players.iloc[valid]
+        comparable = np.zeros(len(pairs))
+        agree = np.zeros(len(pairs))
+        for column in attribute_columns:
+            if column not in rows.columns:
+                continue
+            values = rows[column].to_numpy(dtype=object)
+            both = pd.notna(values[left]) & pd.notna(values[right])
+            comparable += both
+            agree += both & (values[left] == values[right])
+        attribute_similarity = np.divide(
+            agree, comparable, out=np.full(len(pairs), 0.5), where=comparable > 0
+        )
+
+        scores = 90.0 * name_similarity + 10.0 * attribute_similarity
+        ids = rows[id_column].to_numpy()
+        return self._pair_frame(ids[left], ids[right], scores)
+
+    def find_game_duplicates(
+        self, games: pd.DataFrame, id_column: str = "game_id"
+    ) -> pd.DataFrame:
+        """
+        Find duplicate games with a sorted neighborhood over team-pair blocks.
+
+        Expects game_date, home_team, away_team and optionally home_score,
+        away_score columns. Score: 40 for the same date (20 within
+        date_window_days), 20 for the same home/away orientation (10 if
+        swapped), 40 for matching final scores (20 if either is missing).
+
+        Returns:
+            DataFrame with id1, id2, score (id1 < id2)
+        """
+        if len(games) < 2:
+            return pd.DataFrame(columns=PAIR_COLUMNS)
+
+        home = games["home_team"].map(normalize_team_code).to_numpy(dtype=object)
+        away = games["away_team"].map(normalize_team_code).to_numpy(dtype=object)
+        days = (
+            pd.to_datetime(games["game_date"], utc=True, format="mixed")
+            .dt.tz_localize(None)
+            .to_numpy(dtype="datetime64[D]")
+            .astype(np.int64)
+        )
+        block, _ = pd.factorize(
+            pd.Series(np.where(home < away, home + "|" + away, away + "|" + home))
+        )
+
+        order = np.lexsort((days, block))
+        sorted_block, sorted_days = block[order], days[order]
+        pairs = neighbor_pairs(
+            order,
+            lambda i, j: (sorted_block[i] == sorted_block[j])
+            & (sorted_days[j] - sorted_days[i] <= self.date_window_days),
+            self.max_neighbors,
+        )
+        if not len(pairs):
+            return pd.DataFrame(columns=PAIR_COLUMNS)
+
+        left, right = pairs[:, 0], pairs[:, 1]
+        same_day = days[left] == days[right]
+        same_orientation = home[left] == home[right]
+        score = np.where(same_day, 40.0, 20.0)
+        score += np.where(same_orientation, 20.0, 10.0)
+
+        if {"home_score", "away_score"} <= set(games.columns):
+            home_score = games["home_score"].to_numpy(dtype=float)
+            away_score = games["away_score"].to_numpy(dtype=float)
+            # Compare the right-hand game in the left-hand orientation
+            right_home = np.where(
+                same_orientation, home_score[right], away_score[right]
+            )
+            right_away = np.where(
+                same_orientation, away_score[right], home_score[right]
+            )
+            missing = np.isnan(
+                home_score[left] + away_score[left] + right_home + right_away
+            )
+            matches = (home_score[left] == right_home) & (
+                away_score[left] == right_away
+            )
+            score += np.where(missing, 20.0, np.where(matches, 40.0, 0.0))
+        else:
+            score += 20.0
+
+        ids = games[id_column].to_numpy()
+        return self._pair_frame(ids[left], ids[right], score)
+
+    def _pair_frame(
+        self, ids1: np.ndarray, ids2: np.ndarray, scores: np.ndarray
+    ) -> pd.DataFrame:
+        """Pairs at or above min_score, ordered so that id1 < id2"""
+        ids1, ids2 = ids1.astype(str), ids2.astype(str)
+        swap = ids1 > ids2
+        pairs = pd.DataFrame(
+            {
+                "id1": np.where(swap, ids2, ids1),
+                "id2": np.where(swap, ids1, ids2),
+                "score": np.round(scores, 2),
+            }
+        )
+        pairs = pairs[
+            (pairs["score"] >= self.min_score) & (pairs["id1"] != pairs["id2"])
+        ]
+        return (
+            pairs.sort_values("score", ascending=False)
+            .drop_duplicates(["id1", "id2"])
+            .sort_values(["id1", "id2"])
+            .reset_index(drop=True)
+        )
+
+    # ------------------------------------------------------------------
+    # Resolution
+    # ------------------------------------------------------------------
+
+    def _priority(self, records: pd.DataFrame, id_column: str) -> pd.Series:
+        """
+        Rank records as merge survivors (higher is better).
+
+        'latest' prefers the most recently updated record, the other
+        strategies the most complete one; ties go to the smaller ID.
+        """
+        completeness = records.notna().sum(axis=1)
+        if "updated_at" in records.columns:
+            updated = pd.to_datetime(records["updated_at"], utc=True)
+        else:
+            updated = pd.Series(
+                pd.NaT, index=records.index, dtype="datetime64[ns, UTC]"
+            )
+        keys = pd.DataFrame(
+            {
+                "completeness": completeness,
+                "updated": updated,
+                "id": records[id_column].astype(str),
+            }
+        )
+        by = ["completeness", "updated"]
+        if self.merge_strategy == "latest":
+            by = by[::-1]
+        ranked = keys.sort_values(
+            by + ["id"], ascending=[True, True, False], na_position="first"
+        )
+        priority = pd.Series(np.arange(len(ranked)), index=ranked["id"].to_numpy())
+        return priority[~priority.index.duplicated(keep="last")]
+
+    def merge_decisions(
+        self, records: pd.DataFrame, pairs: pd.DataFrame, id_column: str
+    ) -> pd.DataFrame:
+        """
+        Turn scored pairs into one decision per duplicate record.
+
+        Pairs at or above similarity_threshold are clustered (connected
+        components) and every record but the cluster's survivor becomes a
+        'merge' decision ('review' under the manual strategy). Weaker pairs
+        become 'review' decisions against the cluster survivors.
+
+        Returns:
+            DataFrame with keep_id, duplicate_id, score, action, strategy
+        """
+        if pairs.empty:
+            return pd.DataFrame(columns=DECISION_COLUMNS)
+
+        priority = self._priority(records, id_column)
+        strong = pairs[pairs["score"] >= self.similarity_threshold]
+        weak = pairs[pairs["score"] < self.similarity_threshold]
+        decisions = []
+
+        survivor = pd.Series(dtype=object)
+        if not strong.empty:
+            nodes, codes = np.unique(
+                np.concatenate([strong["id1"], strong["id2"]]), return_inverse=True
+            )
+            edges = codes.reshape(2, -1)
+            graph = coo_matrix(
+                (np.ones(edges.shape[1]), (edges[0], edges[1])),
+                shape=(len(nodes), len(nodes)),
+            )
+            _, labels = connected_components(graph, directed=False)
+
+            best_score = (
+                pd.concat(
+                    [
+                        strong[["id1", "score"]].rename(columns={"id1": "id"}),
+                        strong[["id2", "score"]].rename(columns={"id2": "id"}),
+                    ]
+                )
+                .groupby("id")["score"]
+                .max()
+            )
+            members = pd.DataFrame(
+                {
+                    "id": nodes,
+                    "cluster": labels,
+                    "priority": priority.reindex(nodes, fill_value=-1).to_numpy(),
+                }
+            )
+            keepers = members.loc[members.groupby("cluster")["priority"].idxmax()]
+            keep_by_cluster = keepers.set_index("cluster")["id"]
+            survivor = pd.Series(keep_by_cluster.loc[labels].to_numpy(), index=nodes)
+            merged = members[~members["id"].isin(keepers["id"])]
+            decisions.append(
+                pd.DataFrame(
+                    {
+                        "keep_id": keep_by_cluster.loc[merged["cluster"]].to_numpy(),
+                        "duplicate_id": merged["id"].to_numpy(),
+                        "score": best_score.loc[merged["id"]].to_numpy(),
+                        "action": (
+                            "review" if self.merge_strategy == "manual" else "merge"
+                        ),
+                    }
+                )
+            )
+
+        if not weak.empty:
+            # Compare clustered records through their survivor only
+            ids = weak[["id1", "id2"]].to_numpy()
+            mapped = survivor.reindex(ids.ravel()).to_numpy().reshape(ids.shape)
+            ids = np.sort(np.where(pd.isna(mapped), ids, mapped), axis=1)
+            weak = pd.DataFrame(
+                {"id1": ids[:, 0], "id2": ids[:, 1], "score": weak["score"].to_numpy()}
+            )
+            weak = (
+                weak[weak["id1"] != weak["id2"]]
+                .groupby(["id1", "id2"], as_index=False)["score"]
+                .max()
+            )
+            first_wins = (
+                priority.reindex(weak["id1"], fill_value=-1).to_numpy()
+                >= priority.reindex(weak["id2"], fill_value=-1).to_numpy()
+            )
+            decisions.append(
+                pd.DataFrame(
+                    {
+                        "keep_id": np.where(first_wins, weak["id1"], weak["id2"]),
+                        "duplicate_id": np.where(first_wins, weak["id2"], weak["id1"]),
+                        "score": weak["score"].to_numpy(),
+                        "action": "review",
+                    }
+                )
+            )
+
+        result = pd.concat(decisions, ignore_index=True)
+        result["strategy"] = self.merge_strategy
+        return result[DECISION_COLUMNS]
+
+    def write_decisions(
+        self,
+        conn,
+        table: str,
+        decisions: pd.DataFrame,
+        decisions_table: str = "dedup_decisions",
+        page_size: int = 5000,
+    ) -> int:
+        """
+        Write merge decisions in bulk (multi-row INSERT pages).
+
+        Args:
+            conn: psycopg2 connection (caller commits)
+            table: Deduplicated table name
+            decisions: Output of merge_decisions
+            decisions_table: Destination table (created if missing)
+            page_size: Rows per INSERT statement
+
+        Returns:
+            Number of decisions written
+        """
+        if decisions.empty:
+            return 0
+        decided_at = datetime.now(timezone.utc)
+        rows = [
+            (table, keep_id, duplicate_id, float(score), action, strategy, decided_at)
+            for keep_id, duplicate_id, score, action, strategy in decisions[
+                DECISION_COLUMNS
+            ].itertuples(index=False)
+        ]
+        with conn.cursor() as cur:
+            target = sql.Identifier(decisions_table)
+            cur.execute(sql.SQL(DECISIONS_TABLE_DDL).format(table=target))
+            execute_values(
+                cur,
+                sql.SQL(
+                    "INSERT INTO {table} (table_name, keep_id, duplicate_id, "
+                    "score, action, strategy, decided_at) VALUES %s"
+                ).format(table=target),
+                rows,
+                page_size=page_size,
+            )
+        logger.info(f"Wrote {len(rows)} dedup decisions for {table}")
+        return len(rows)
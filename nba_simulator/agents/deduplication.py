@@ -10,15 +10,45 @@ Responsibilities:
 - Conflict resolution
 - Provenance tracking
 - Deduplication reporting
+
+Detection methods:
+- 'exact': Bounded SQL self-joins on exact key equality (recent games,
+  identical player names)
+- 'blocking': Full-table scan with MinHash LSH (players) and sorted
+  neighborhood (games) candidate generation, vectorized scoring and bulk
+  decision writes (see dedup_engine)
 """
 
 from typing import Dict, Any, List, Optional, Tuple, Set
 from datetime import datetime, timezone
 from collections import defaultdict
 
+import pandas as pd
+
 from .base_agent import BaseAgent, AgentPriority
+from .dedup_engine import DedupEngine, MinHashLSH
 from ..database import execute_query
 
+# Canonical column -> table column for the blocking engine
+DEFAULT_COLUMN_MAP = {
+    "games": {
+        "game_id": "game_id",
+        "game_date": "game_date",
+        "home_team": "home_team_id",
+        "away_team": "away_team_id",
+        "home_score": "home_score",
+        "away_score": "away_score",
+        "updated_at": "updated_at",
+    },
+    "players": {
+        "player_id": "player_id",
+        "player_name": "player_name",
+        "position": "position",
+        "team_id": "team_id",
+        "updated_at": "updated_at",
+    },
+}
+
 
 class DeduplicationAgent(BaseAgent):
     """
@@ -46,6 +76,16 @@ class DeduplicationAgent(BaseAgent):
                 - merge_strategy: 'latest', 'complete', 'merge', 'manual' (default: 'merge')
                 - tables_to_check: List of tables (default: ['games', 'players'])
                 - auto_merge: Automatically merge duplicates (default: False)
+                - detection_method: 'exact' or 'blocking' (default: 'exact')
+                - review_threshold: Lowest score reported by the blocking
+                  engine (default: 80.0)
+                - date_window_days: Max date difference for duplicate
+                  games (default: 1)
+                - lsh_num_perm / lsh_bands: MinHash LSH shape
+                  (default: 64 / 16)
+                - column_map: Per-table overrides of DEFAULT_COLUMN_MAP
+                - decisions_table: Table receiving merge decisions
+                  (default: 'dedup_decisions')
         """
         super().__init__(
             agent_name="deduplication", config=config, priority=AgentPriority.NORMAL
@@ -56,12 +96,22 @@ class DeduplicationAgent(BaseAgent):
         self.merge_strategy = self.config.get("merge_strategy", "merge")
         self.tables_to_check = self.config.get("tables_to_check", ["games", "players"])
         self.auto_merge = self.config.get("auto_merge", False)
+        self.detection_method = self.config.get("detection_method", "exact")
+        self.review_threshold = self.config.get("review_threshold", 80.0)
+        self.decisions_table = self.config.get("decisions_table", "dedup_decisions")
+        self.column_map = {
+            table: {**columns, **self.config.get("column_map", {}).get(table, {})}
+            for table, columns in DEFAULT_COLUMN_MAP.items()
+        }
 
         # Results
         self.duplicates_found: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
         self.duplicates_merged: Dict[str, int] = defaultdict(int)
         self.duplicates_flagged: Dict[str, int] = defaultdict(int)
 
+        # Blocking engine state: table -> (records, scored pairs)
+        self._candidates: Dict[str, Tuple[pd.DataFrame, pd.DataFrame]] = {}
+
     def _validate_config(self) -> bool:
         """Validate deduplication agent configuration"""
         try:
@@ -78,6 +128,11 @@ class DeduplicationAgent(BaseAgent):
                 self.log_error("tables_to_check must be a list")
                 return False
 
+            valid_methods = ["exact", "blocking"]
+            if self.detection_method not in valid_methods:
+                self.log_error(f"detection_method must be one of {valid_methods}")
+                return False
+
             self.logger.info("Deduplication agent configuration validated")
             return True
 
@@ -145,7 +200,9 @@ class DeduplicationAgent(BaseAgent):
         try:
             duplicates = []
 
-            if table == "games":
+            if self.detection_method == "blocking" and table in self.column_map:
+                duplicates = self._find_duplicates_blocking(table)
+            elif table == "games":
                 duplicates = self._find_duplicate_games()
             elif table == "players":
                 duplicates = self._find_duplicate_players()
@@ -211,6 +268,67 @@ class DeduplicationAgent(BaseAgent):
             self.log_error(f"Error finding duplicate players: {e}")
             return []
 
+    def _create_engine(self) -> DedupEngine:
+        """Dedup engine configured from agent config"""
+        return DedupEngine(
+            similarity_threshold=self.similarity_threshold,
+            min_score=min(self.review_threshold, self.similarity_threshold),
+            merge_strategy=self.merge_strategy,
+            date_window_days=self.config.get("date_window_days", 1),
+            lsh=MinHashLSH(
+                num_perm=self.config.get("lsh_num_perm", 64),
+                bands=self.config.get("lsh_bands", 16),
+            ),
+        )
+
+    def _find_duplicates_blocking(self, table: str) -> List[Tuple[str, str]]:
+        """
+        Find duplicates across the full table with the blocking engine.
+
+        Scored pairs are kept for _resolve_duplicates.
+        """
+        try:
+            columns = self.column_map[table]
+            select = ", ".join(
+                f"{source} AS {canonical}" for canonical, source in columns.items()
+            )
+            engine = self._create_engine()
+
+            with self.db.get_connection() as conn:
+                records = engine.load_frame(conn, f"SELECT {select} FROM {table}")
+
+            if table == "games":
+                pairs = engine.find_game_duplicates(records)
+            else:
+                pairs = engine.find_player_duplicates(records)
+
+            self.logger.info(
+                f"Scanned {len(records)} {table} records, "
+                f"{len(pairs)} candidate pairs scored >= {engine.min_score}"
+            )
+            self._candidates[table] = (records, pairs)
+            return list(zip(pairs["id1"], pairs["id2"]))
+
+        except Exception as e:
+            self.log_error(f"Error finding duplicates in {table} (blocking): {e}")
+            return []
+
+    def _resolve_duplicates_blocking(self, table: str) -> None:
+        """Cluster scored pairs into decisions and write them in bulk"""
+        records, pairs = self._candidates[table]
+        id_column = "game_id" if table == "games" else "player_id"
+        engine = self._create_engine()
+        decisions = engine.merge_decisions(records, pairs, id_column=id_column)
+
+        with self.db.get_connection() as conn:
+            engine.write_decisions(
+                conn, table, decisions, decisions_table=self.decisions_table
+            )
+
+        actions = decisions["action"]
+        self.duplicates_merged[table] += int((actions == "merge").sum())
+        self.duplicates_flagged[table] += int((actions == "review").sum())
+
     def _resolve_duplicates(
         self, table: str, duplicates: List[Tuple[str, str]]
     ) -> None:
@@ -222,6 +340,10 @@ class DeduplicationAgent(BaseAgent):
             duplicates: List of duplicate pairs
         """
         try:
+            if table in self._candidates:
+                self._resolve_duplicates_blocking(table)
+                return
+
             for id1, id2 in duplicates:
                 success = self._merge_records(table, id1, id2)
 
@@ -280,6 +402,7 @@ class DeduplicationAgent(BaseAgent):
             "merge_strategy": self.merge_strategy,
             "similarity_threshold": self.similarity_threshold,
             "auto_merge": self.auto_merge,
+            "detection_method": self.detection_method,
         }
 
     def get_deduplication_report(self) -> Dict[str, Any]:
@@ -10,6 +10,11 @@ Responsibilities:
 - Conflict detection and resolution
 - Integration quality scoring
 - Reconciliation reporting
+
+Comparison modes:
+- 'sample': Recent games from the common games table
+- 'bulk': Whole seasons from every source, aligned and diffed set-based
+  (see integration_engine); seasons run in parallel
 """
 
 from typing import Dict, Any, List, Optional, Tuple, Set
@@ -18,7 +23,8 @@ from dataclasses import dataclass
 from collections import defaultdict
 
 from .base_agent import BaseAgent, AgentPriority
-from ..database import execute_query
+from .integration_engine import GameComparisonEngine, SeasonComparison
+from ..database import execute_query, get_database_connection
 
 
 @dataclass
@@ -66,6 +72,16 @@ class IntegrationAgent(BaseAgent):
                 - conflict_resolution: Strategy ('latest', 'majority', 'manual')
                 - match_threshold: Confidence threshold for matches (default: 80.0)
                 - validate_all_sources: Check all source pairs (default: False)
+                - comparison_mode: 'sample' or 'bulk' (default: 'sample')
+                - seasons: Seasons to compare in bulk mode
+                - max_workers: Seasons compared in parallel (default: 4)
+                - date_tolerance_days: Max date shift when aligning games
+                  (default: 1)
+                - compare_fields: Fields diffed between sources
+                - source_queries / source_names: Per-source SQL and stored
+                  source names (see integration_engine)
+                - conflicts_table: Bulk conflict destination, None to skip
+                  writing (default: 'integration_conflicts')
         """
         super().__init__(
             agent_name="integration_validator",
@@ -78,11 +94,18 @@ class IntegrationAgent(BaseAgent):
         self.conflict_resolution = self.config.get("conflict_resolution", "latest")
         self.match_threshold = self.config.get("match_threshold", 80.0)
         self.validate_all_sources = self.config.get("validate_all_sources", False)
+        self.comparison_mode = self.config.get("comparison_mode", "sample")
+        self.seasons = list(self.config.get("seasons", []))
+        self.max_workers = self.config.get("max_workers", 4)
+        self.conflicts_table = self.config.get(
+            "conflicts_table", "integration_conflicts"
+        )
 
         # Results
         self.matches: List[IntegrationMatch] = []
         self.conflicts: List[ConflictResolution] = []
         self.integration_score: float = 0.0
+        self.unmatched_games: Dict[str, int] = defaultdict(int)
 
         # Source pairs to validate
         self.source_pairs = [
@@ -113,6 +136,15 @@ class IntegrationAgent(BaseAgent):
                 self.log_error(f"conflict_resolution must be one of {valid_strategies}")
                 return False
 
+            valid_modes = ["sample", "bulk"]
+            if self.comparison_mode not in valid_modes:
+                self.log_error(f"comparison_mode must be one of {valid_modes}")
+                return False
+
+            if self.comparison_mode == "bulk" and not self.seasons:
+                self.log_error("seasons must be set for bulk comparison")
+                return False
+
             self.logger.info("Integration agent configuration validated")
             return True
 
@@ -132,9 +164,12 @@ class IntegrationAgent(BaseAgent):
                 # Only check primary pairs for efficiency
                 pairs_to_check = [("espn", "basketball_reference"), ("espn", "hoopr")]
 
-            for source1, source2 in pairs_to_check:
-                self.logger.info(f"Validating integration: {source1} <-> {source2}")
-                self._validate_source_pair(source1, source2)
+            if self.comparison_mode == "bulk":
+                self._validate_seasons_bulk(pairs_to_check)
+            else:
+                for source1, source2 in pairs_to_check:
+                    self.logger.info(f"Validating integration: {source1} <-> {source2}")
+                    self._validate_source_pair(source1, source2)
 
             # Calculate integration score
             self._calculate_integration_score()
@@ -205,6 +240,72 @@ class IntegrationAgent(BaseAgent):
         except Exception as e:
             self.log_error(f"Error validating {source1} <-> {source2}: {e}")
 
+    def _validate_seasons_bulk(self, pairs: List[Tuple[str, str]]) -> None:
+        """
+        Compare whole seasons across source pairs set-based.
+
+        Each source is queried once per season, seasons run in parallel on
+        dedicated connections, and conflicts are written in bulk.
+
+        Args:
+            pairs: Source pairs to compare
+        """
+        try:
+            engine = GameComparisonEngine(
+                source_queries=self.config.get("source_queries"),
+                source_names=self.config.get("source_names"),
+                compare_fields=self.config.get("compare_fields"),
+                date_tolerance_days=self.config.get("date_tolerance_days", 1),
+                conflict_resolution=self.conflict_resolution,
+            )
+            self.logger.info(
+                f"Comparing {len(self.seasons)} seasons across {len(pairs)} "
+                f"source pairs ({self.max_workers} workers)"
+            )
+            results = engine.compare_seasons(
+                self.seasons,
+                pairs,
+                connect=get_database_connection,
+                max_workers=self.max_workers,
+                conflicts_table=self.conflicts_table,
+            )
+            for result in results:
+                self._record_comparison(result)
+
+        except Exception as e:
+            self.log_error(f"Error in bulk integration validation: {e}")
+
+    def _record_comparison(self, result: SeasonComparison) -> None:
+        """Add one season/pair comparison to matches and conflicts"""
+        sources = [result.source1, result.source2]
+        conflict_fields = result.conflict_fields
+        for game_key in result.aligned["game_key"]:
+            conflicts = conflict_fields.get(game_key, [])
+            self.matches.append(
+                IntegrationMatch(
+                    game_id=game_key,
+                    sources=sources,
+                    conflicts=conflicts,
+                    confidence_score=self._calculate_match_confidence(conflicts),
+                )
+            )
+
+        for row in result.conflicts.itertuples(index=False):
+            self.conflicts.append(
+                ConflictResolution(
+                    field=row.field,
+                    source_values={
+                        result.source1: row.value1,
+                        result.source2: row.value2,
+                    },
+                    resolved_value=row.resolved_value,
+                    resolution_method=row.resolution_method,
+                )
+            )
+
+        for source, count in result.unmatched.items():
+            self.unmatched_games[source] += count
+
     def _find_matching_games(self, source1: str, source2: str) -> List[Dict[str, Any]]:
         """
         Find games present in both sources.
@@ -410,6 +511,7 @@ class IntegrationAgent(BaseAgent):
                 1 for m in self.matches if m.confidence_score >= self.match_threshold
             ),
             "total_conflicts": len(self.conflicts),
+            "unmatched_games": dict(self.unmatched_games),
             "unresolved_conflicts": sum(
                 1
                 for c in self.conflicts
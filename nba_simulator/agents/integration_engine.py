@@ -0,0 +1,433 @@
+"""
+Integration Engine - Set-Based Cross-Source Game Comparison
+
+Reconciles game-level facts between ESPN, hoopR, NBA API and Basketball
+Reference one season at a time:
+
+- One query per source per season (raw_data.games_summary by default)
+- Rows aligned on a canonical game key (date + normalized home/away team
+  codes) with a hash join; leftovers are matched to the nearest game of
+  the same matchup within date_tolerance_days (timezone-shifted dates)
+- Field-level conflicts computed as columnar diffs over the aligned frame
+- Conflict records resolved vectorized and written in bulk
+- Seasons run in parallel, each on its own database connection
+
+Usage:
+    engine = GameComparisonEngine()
+
+    results = engine.compare_season(conn, 2024, [("espn", "hoopr")])
+
+    results = engine.compare_seasons(
+        range(1947, 2026), pairs, connect=get_database_connection, max_workers=4
+    )
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+
+from .dedup_engine import normalize_team_code
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOURCE_QUERY = """
+    SELECT game_id, game_date, home_team, away_team, home_score, away_score,
+           collected_at
+    FROM raw_data.games_summary
+    WHERE source = %(source)s AND season = %(season)s
+"""
+
+# Agent source name -> value stored in raw_data.games_summary.source
+DEFAULT_SOURCE_NAMES = {
+    "espn": "espn",
+    "hoopr": "hoopr",
+    "nba_api": "nba_api",
+    "basketball_reference": "basketball_reference",
+}
+
+DEFAULT_COMPARE_FIELDS = ["home_score", "away_score", "game_date"]
+
+CONFLICT_COLUMNS = [
+    "season",
+    "game_key",
+    "field",
+    "source1",
+    "source2",
+    "value1",
+    "value2",
+    "resolved_value",
+    "resolution_method",
+]
+
+CONFLICTS_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        conflict_id SERIAL PRIMARY KEY,
+        season INTEGER,
+        game_key VARCHAR(50) NOT NULL,
+        field VARCHAR(50) NOT NULL,
+        source1 VARCHAR(50) NOT NULL,
+        source2 VARCHAR(50) NOT NULL,
+        value1 TEXT,
+        value2 TEXT,
+        resolved_value TEXT,
+        resolution_method VARCHAR(50) NOT NULL,
+        detected_at TIMESTAMP WITH TIME ZONE NOT NULL
+    )
+"""
+
+
+@dataclass
+class SeasonComparison:
+    """Aligned games and conflicts for one season and source pair"""
+
+    season: int
+    source1: str
+    source2: str
+    aligned: pd.DataFrame
+    conflicts: pd.DataFrame
+    unmatched: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def conflict_fields(self) -> pd.Series:
+        """Conflicting field names per game key"""
+        if self.conflicts.empty:
+            return pd.Series(dtype=object)
+        return self.conflicts.groupby("game_key")["field"].agg(list)
+
+
+def canonicalize(games: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add normalized team codes, calendar day and canonical game key.
+
+    Key format: YYYYMMDD_HOME_AWAY (e.g. 20240115_BOS_NYK). Rows whose home
+    or away team does not normalize to a code are dropped rather than keyed
+    as e.g. "20240116__LAL".
+    """
+    games = games.copy()
+    if games.empty:
+        for column in ("home_code", "away_code", "game_key"):
+            games[column] = pd.Series(dtype=str)
+        games["game_day"] = pd.Series(dtype="datetime64[ns]")
+        return games
+
+    games["home_code"] = games["home_team"].map(normalize_team_code).astype(str)
+    games["away_code"] = games["away_team"].map(normalize_team_code).astype(str)
+    games = games[(games["home_code"] != "") & (games["away_code"] != "")].copy()
+    games["game_day"] = (
+        pd.to_datetime(games["game_date"], utc=True, format="mixed")
+        .dt.tz_localize(None)
+        .dt.normalize()
+    )
+    games["game_key"] = (
+        games["game_day"]
+        .dt.strftime("%Y%m%d")
+        .astype(str)
+        .str.cat([games["home_code"], games["away_code"]], sep="_")
+    )
+    return games.drop_duplicates("game_key")
+
+
+def align_sources(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    date_tolerance_days: int = 1,
+) -> Tuple[pd.DataFrame, int, int]:
+    """
+    Align two canonicalized sources.
+
+    Exact game keys are hash-joined; unmatched rows are then matched to the
+    nearest game of the same home/away teams within date_tolerance_days.
+
+    Returns:
+        (aligned frame with _1/_2 column suffixes and match_type,
+        unmatched left rows, unmatched right rows)
+    """
+    exact = left.merge(right, on="game_key", suffixes=("_1", "_2"))
+    exact["match_type"] = "exact"
+
+    rest_left = left[~left["game_key"].isin(exact["game_key"])]
+    rest_right = right[~right["game_key"].isin(exact["game_key"])]
+    nearest = pd.DataFrame()
+    if date_tolerance_days > 0 and len(rest_left) and len(rest_right):
+        candidate = rest_right.rename(
+            columns={
+                c: f"{c}_2"
+                for c in rest_right.columns
+                if c not in ("home_code", "away_code")
+            }
+        )
+        nearest = pd.merge_asof(
+            rest_left.rename(
+                columns={
+                    c: f"{c}_1"
+                    for c in rest_left.columns
+                    if c not in ("home_code", "away_code")
+                }
+            ).sort_values("game_day_1"),
+            candidate.sort_values("game_day_2"),
+            left_on="game_day_1",
+            right_on="game_day_2",
+            by=["home_code", "away_code"],
+            tolerance=pd.Timedelta(days=date_tolerance_days),
+            direction="nearest",
+        ).dropna(subset=["game_key_2"])
+        # Each right-hand game matches at most once
+        nearest = nearest.drop_duplicates("game_key_2")
+        nearest["game_key"] = nearest["game_key_1"]
+        nearest["match_type"] = "nearest_date"
+
+    aligned = pd.concat([exact, nearest], ignore_index=True)
+    matched_right = set(exact["game_key"]) | set(
+        nearest.get("game_key_2", pd.Series(dtype=object))
+    )
+    unmatched_left = len(left) - len(aligned)
+    unmatched_right = len(right) - len(matched_right)
+    return aligned, unmatched_left, unmatched_right
+
+
+def _as_text(values: pd.Series) -> pd.Series:
+    """Conflict values as text (whole-number floats without '.0')"""
+    if pd.api.types.is_float_dtype(values) and (values % 1 == 0).all():
+        values = values.astype("Int64")
+    return values.astype(str)
+
+
+def field_conflicts(aligned: pd.DataFrame, fields: Sequence[str]) -> pd.DataFrame:
+    """
+    Columnar diff of aligned sources.
+
+    A field conflicts when both sources have a value and the values differ
+    (game_date compares calendar days).
+
+    Returns:
+        Long frame with game_key, field, value1, value2 (+ collected_at_1/2
+        when available)
+    """
+    frames = []
+    for name in fields:
+        if name == "game_date":
+            left, right = aligned["game_day_1"], aligned["game_day_2"]
+        elif f"{name}_1" in aligned.columns and f"{name}_2" in aligned.columns:
+            left, right = aligned[f"{name}_1"], aligned[f"{name}_2"]
+        else:
+            continue
+        differs = left.notna() & right.notna() & (left != right)
+        if not differs.any():
+            continue
+        conflict = pd.DataFrame(
+            {
+                "game_key": aligned.loc[differs, "game_key"],
+                "field": name,
+                "value1": _as_text(left[differs]),
+                "value2": _as_text(right[differs]),
+            }
+        )
+        for column in ("collected_at_1", "collected_at_2"):
+            if column in aligned.columns:
+                conflict[column] = aligned.loc[differs, column]
+        frames.append(conflict)
+    if not frames:
+        return pd.DataFrame(columns=["game_key", "field", "value1", "value2"])
+    return pd.concat(frames, ignore_index=True)
+
+
+class GameComparisonEngine:
+    """
+    Season-at-a-time cross-source comparison of game-level facts.
+
+    Source data comes from one query per source per season; queries take
+    %(source)s and %(season)s parameters.
+    """
+
+    def __init__(
+        self,
+        source_queries: Optional[Dict[str, str]] = None,
+        source_names: Optional[Dict[str, str]] = None,
+        compare_fields: Optional[List[str]] = None,
+        date_tolerance_days: int = 1,
+        conflict_resolution: str = "latest",
+    ):
+        """
+        Initialize comparison engine.
+
+        Args:
+            source_queries: Per-source SQL overriding DEFAULT_SOURCE_QUERY
+            source_names: Agent source name -> stored source value
+            compare_fields: Fields diffed between sources
+            date_tolerance_days: Max date shift for nearest-date matches
+            conflict_resolution: 'latest', 'majority' or 'manual'
+        """
+        self.source_queries = source_queries or {}
+        self.source_names = {**DEFAULT_SOURCE_NAMES, **(source_names or {})}
+        self.compare_fields = compare_fields or list(DEFAULT_COMPARE_FIELDS)
+        self.date_tolerance_days = date_tolerance_days
+        self.conflict_resolution = conflict_resolution
+
+    def load_source(self, conn, source: str, season: int) -> pd.DataFrame:
+        """Fetch one source's games for a season in a single query"""
+        query = self.source_queries.get(source, DEFAULT_SOURCE_QUERY)
+        params = {"source": self.source_names.get(source, source), "season": season}
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+            columns = [desc[0] for desc in cur.description]
+            rows = cur.fetchall()
+        return canonicalize(pd.DataFrame.from_records(rows, columns=columns))
+
+    def resolve(self, conflicts: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add resolved_value and resolution_method columns.
+
+        'latest' takes the value from the most recently collected source
+        (source2 when collection times are unknown), 'majority' keeps
+        source1 (the primary source of the pair), 'manual' leaves the value
+        unresolved for review.
+        """
+        conflicts = conflicts.copy()
+        if self.conflict_resolution == "latest":
+            if {"collected_at_1", "collected_at_2"} <= set(conflicts.columns):
+                first_newer = pd.to_datetime(
+                    conflicts["collected_at_1"], utc=True
+                ) > pd.to_datetime(conflicts["collected_at_2"], utc=True)
+            else:
+                first_newer = pd.Series(False, index=conflicts.index)
+            conflicts["resolved_value"] = np.where(
+                first_newer, conflicts["value1"], conflicts["value2"]
+            )
+            conflicts["resolution_method"] = "latest"
+        elif self.conflict_resolution == "majority":
+            conflicts["resolved_value"] = conflicts["value1"]
+            conflicts["resolution_method"] = "majority"
+        else:
+            conflicts["resolved_value"] = None
+            conflicts["resolution_method"] = "manual_review_required"
+        return conflicts
+
+    def compare(
+        self,
+        season: int,
+        frames: Dict[str, pd.DataFrame],
+        source1: str,
+        source2: str,
+    ) -> SeasonComparison:
+        """Align two loaded sources and diff their fields"""
+        aligned, unmatched1, unmatched2 = align_sources(
+            frames[source1], frames[source2], self.date_tolerance_days
+        )
+        conflicts = self.resolve(field_conflicts(aligned, self.compare_fields))
+        conflicts["season"] = season
+        conflicts["source1"] = source1
+        conflicts["source2"] = source2
+        return SeasonComparison(
+            season=season,
+            source1=source1,
+            source2=source2,
+            aligned=aligned,
+            conflicts=conflicts[CONFLICT_COLUMNS],
+            unmatched={source1: unmatched1, source2: unmatched2},
+        )
+
+    def compare_season(
+        self, conn, season: int, pairs: Iterable[Tuple[str, str]]
+    ) -> List[SeasonComparison]:
+        """
+        Compare every source pair for one season.
+
+        Each source is queried once, however many pairs it appears in.
+        """
+        pairs = list(pairs)
+        sources = sorted({source for pair in pairs for source in pair})
+        frames = {source: self.load_source(conn, source, season) for source in sources}
+        logger.info(
+            f"Season {season}: " + ", ".join(f"{s}={len(frames[s])}" for s in sources)
+        )
+        return [self.compare(season, frames, s1, s2) for s1, s2 in pairs]
+
+    def compare_seasons(
+        self,
+        seasons: Iterable[int],
+        pairs: Iterable[Tuple[str, str]],
+        connect: Callable,
+        max_workers: int = 4,
+        conflicts_table: Optional[str] = None,
+    ) -> List[SeasonComparison]:
+        """
+        Compare many seasons in parallel, one connection per season.
+
+        Args:
+            seasons: Seasons to compare
+            pairs: Source pairs
+            connect: Returns a new psycopg2 connection (closed after use)
+            max_workers: Seasons compared concurrently
+            conflicts_table: Write each season's conflicts here if set
+
+        Returns:
+            Comparisons ordered by season, then pair
+        """
+        pairs = list(pairs)
+
+        def run(season: int) -> List[SeasonComparison]:
+            conn = connect()
+            try:
+                results = self.compare_season(conn, season, pairs)
+                if conflicts_table:
+                    self.write_conflicts(
+                        conn,
+                        pd.concat([r.conflicts for r in results], ignore_index=True),
+                        conflicts_table,
+                    )
+                    conn.commit()
+                return results
+            finally:
+                conn.close()
+
+        results = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run, season) for season in seasons]
+            for future in as_completed(futures):
+                results.extend(future.result())
+        return sorted(results, key=lambda r: r.season)
+
+    def write_conflicts(
+        self,
+        conn,
+        conflicts: pd.DataFrame,
+        table: str = "integration_conflicts",
+        page_size: int = 5000,
+    ) -> int:
+        """
+        Write conflict records in bulk (multi-row INSERT pages).
+
+        Returns:
+            Number of conflicts written
+        """
+        if conflicts.empty:
+            return 0
+        detected_at = datetime.now(timezone.utc)
+        records = conflicts[CONFLICT_COLUMNS].astype(object)
+        records = records.where(records.notna(), None)
+        rows = [
+            (*row, detected_at) for row in records.itertuples(index=False, name=None)
+        ]
+        with conn.cursor() as cur:
+            target = sql.Identifier(table)
+            cur.execute(sql.SQL(CONFLICTS_TABLE_DDL).format(table=target))
+            execute_values(
+                cur,
+                sql.SQL("INSERT INTO {table} ({columns}) VALUES %s").format(
+                    table=target,
+                    columns=sql.SQL(", ").join(
+                        map(sql.Identifier, [*CONFLICT_COLUMNS, "detected_at"])
+                    ),
+                ),
+                rows,
+                page_size=page_size,
+            )
+        logger.info(f"Wrote {len(rows)} integration conflicts to {table}")
+        return len(rows)
@@ -9,6 +9,6 @@ Provides centralized configuration loading for:
 Backward compatible with legacy .env format.
 """
 
-from .loader import ConfigLoader, config
+from .loader import ConfigLoader, ResolvedConfig, config
 
-__all__ = ["ConfigLoader", "config"]
+__all__ = ["ConfigLoader", "ResolvedConfig", "config"]
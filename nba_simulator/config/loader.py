@@ -6,13 +6,112 @@ Ensures existing scripts continue working during migration.
 """
 
 import os
+import sys
 import json
+import threading
+import time
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import logging
 
+try:
+    from dotenv import dotenv_values
+except ImportError:  # python-dotenv is optional
+    dotenv_values = None
+
 logger = logging.getLogger(__name__)
 
+# Environment variables checked for each database setting, in priority order
+DB_ENV_KEYS = {
+    "host": (
+        "RDS_HOST_NBA_SIMULATOR_AWS_WORKFLOW",
+        "RDS_HOST_NBA_SIMULATOR_AWS_DEVELOPMENT",
+        "POSTGRES_HOST_NBA_SIMULATOR_AWS_DEVELOPMENT",
+        "POSTGRES_HOST_NBA_SIMULATOR_AWS_TEST",
+        "DB_HOST",
+        "RDS_HOST",
+        "POSTGRES_HOST",
+    ),
+    "port": (
+        "RDS_PORT_NBA_SIMULATOR_AWS_WORKFLOW",
+        "RDS_PORT_NBA_SIMULATOR_AWS_DEVELOPMENT",
+        "POSTGRES_PORT_NBA_SIMULATOR_AWS_DEVELOPMENT",
+        "POSTGRES_PORT_NBA_SIMULATOR_AWS_TEST",
+        "DB_PORT",
+        "RDS_PORT",
+        "POSTGRES_PORT",
+    ),
+    "database": (
+        "RDS_DATABASE_NBA_SIMULATOR_AWS_WORKFLOW",
+        "RDS_DATABASE_NBA_SIMULATOR_AWS_DEVELOPMENT",
+        "POSTGRES_DB_NBA_SIMULATOR_AWS_DEVELOPMENT",
+        "POSTGRES_DB_NBA_SIMULATOR_AWS_TEST",
+        "DB_NAME",
+        "RDS_DB_NAME",
+        "POSTGRES_DB",
+    ),
+    "user": (
+        "RDS_USERNAME_NBA_SIMULATOR_AWS_WORKFLOW",
+        "RDS_USERNAME_NBA_SIMULATOR_AWS_DEVELOPMENT",
+        "POSTGRES_USER_NBA_SIMULATOR_AWS_DEVELOPMENT",
+        "POSTGRES_USER_NBA_SIMULATOR_AWS_TEST",
+        "DB_USER",
+        "RDS_USERNAME",
+        "POSTGRES_USER",
+    ),
+    "password": (
+        "RDS_PASSWORD_NBA_SIMULATOR_AWS_WORKFLOW",
+        "RDS_PASSWORD_NBA_SIMULATOR_AWS_DEVELOPMENT",
+        "POSTGRES_PASSWORD_NBA_SIMULATOR_AWS_DEVELOPMENT",
+        "POSTGRES_PASSWORD_NBA_SIMULATOR_AWS_TEST",
+        "DB_PASSWORD",
+        "RDS_PASSWORD",
+        "POSTGRES_PASSWORD",
+    ),
+}
+
+
+def _file_mtime(path: Path) -> Optional[float]:
+    """File modification time, or None if it does not exist"""
+    try:
+        return path.stat().st_mtime
+    except (OSError, ValueError):
+        return None
+
+
+class ResolvedConfig:
+    """
+    Snapshot of resolved configuration.
+
+    Sections resolve lazily on first access and are then fixed; take a new
+    snapshot (ConfigLoader.snapshot after refresh) to pick up changes.
+
+    Usage:
+        settings = config.snapshot()
+        settings.database["host"]
+        settings.s3["bucket"]
+    """
+
+    def __init__(self, loader: "ConfigLoader"):
+        self._loader = loader
+        self.created_at = time.time()
+
+    @cached_property
+    def database(self) -> Dict[str, Any]:
+        """Database config (host, port, database, user, password)"""
+        return self._loader.load_database_config()
+
+    @cached_property
+    def s3(self) -> Dict[str, str]:
+        """S3 config (bucket, region, prefix)"""
+        return self._loader.load_s3_config()
+
+    @cached_property
+    def aws(self) -> Dict[str, str]:
+        """AWS config (region, profile)"""
+        return self._loader.load_aws_config()
+
 
 class ConfigLoader:
     """
@@ -21,8 +120,23 @@ class ConfigLoader:
     Supports:
     - Legacy .env file format (existing scripts)
     - New YAML config format (future)
+
+    Hierarchical secrets and .env are resolved once per process, shared by
+    all loaders, and re-read only on refresh() or when .env changes on disk.
     """
 
+    # Process-wide resolution state (guarded by _lock)
+    _lock = threading.RLock()
+    _environment: Dict[str, Optional[float]] = {}
+    _dotenv_values: Dict[str, Dict[str, str]] = {}
+    _secrets_loaded = False
+    _timings: Dict[str, float] = {}
+    _stats: Dict[str, int] = {
+        "environment_loads": 0,
+        "database_loads": 0,
+        "database_cache_hits": 0,
+    }
+
     def __init__(self, legacy_mode: bool = True):
         """
         Initialize configuration loader.
@@ -33,6 +147,8 @@ class ConfigLoader:
         self.legacy_mode = legacy_mode
         self.project_root = Path(__file__).parent.parent.parent
         self.config_dir = self.project_root / "config"
+        self._db_cache: Optional[Tuple[tuple, Dict[str, Any]]] = None
+        self._snapshot: Optional[ResolvedConfig] = None
 
     def load_database_config(self) -> Dict[str, Any]:
         """
@@ -53,54 +169,28 @@ class ConfigLoader:
         2. Legacy .env file
         3. Environment variables
         4. Default values
-        """
-        # Try to load hierarchical secrets first
-        try:
-            # Check if UnifiedSecretsManager exists
-            mcp_server_path = self.project_root / "mcp_server"
-            if mcp_server_path.exists():
-                import sys
-
-                sys.path.insert(0, str(mcp_server_path))
-
-                try:
-                    from unified_secrets_manager import load_secrets_hierarchical
 
-                    # Auto-detect context: DEVELOPMENT for local, WORKFLOW for production
-                    context = (
-                        "DEVELOPMENT"
-                        if os.getenv("ENVIRONMENT", "development").lower()
-                        in ["development", "dev", "local"]
-                        else "WORKFLOW"
-                    )
-                    load_secrets_hierarchical("nba-simulator-aws", "NBA", context)
-                    logger.info(f"Loaded hierarchical secrets for context: {context}")
-                except Exception as e:
-                    logger.debug(f"Could not load hierarchical secrets: {e}")
-        except Exception as e:
-            logger.debug(f"UnifiedSecretsManager not available: {e}")
-
-        # Try loading from .env file
-        try:
-            from dotenv import load_dotenv
-
-            env_file = self.project_root / ".env"
-            if env_file.exists():
-                load_dotenv(env_file)
-                logger.info(f"Loaded config from {env_file}")
-            else:
-                logger.debug("No .env file found. Using environment variables only.")
-        except ImportError:
-            logger.debug(
-                "python-dotenv not installed. Using environment variables only."
-            )
+        Secrets and .env are resolved once per process (see
+        _ensure_environment); the resolved dict is reused until one of the
+        environment variables it reads changes.
+        """
+        self._ensure_environment()
 
-        # Priority order for each setting:
+        # Priority order for each setting (see DB_ENV_KEYS):
         # 1. Hierarchical names (context-specific)
         # 2. Legacy DB_* names
         # 3. Legacy RDS_* names
         # 4. POSTGRES_* names (for local development)
         # 5. Default values
+        fingerprint = tuple(
+            os.getenv(key) for keys in DB_ENV_KEYS.values() for key in keys
+        )
+        with self._lock:
+            if self._db_cache is not None and self._db_cache[0] == fingerprint:
+                ConfigLoader._stats["database_cache_hits"] += 1
+                return dict(self._db_cache[1])
+
+        started = time.perf_counter()
 
         def get_with_fallback(*keys, default=None):
             """Try each key in order, return first non-None value"""
@@ -110,60 +200,12 @@ class ConfigLoader:
                     return value
             return default
 
-        host = get_with_fallback(
-            "RDS_HOST_NBA_SIMULATOR_AWS_WORKFLOW",
-            "RDS_HOST_NBA_SIMULATOR_AWS_DEVELOPMENT",
-            "POSTGRES_HOST_NBA_SIMULATOR_AWS_DEVELOPMENT",
-            "POSTGRES_HOST_NBA_SIMULATOR_AWS_TEST",
-            "DB_HOST",
-            "RDS_HOST",
-            "POSTGRES_HOST",
-            default="localhost",
-        )
-
-        port_str = get_with_fallback(
-            "RDS_PORT_NBA_SIMULATOR_AWS_WORKFLOW",
-            "RDS_PORT_NBA_SIMULATOR_AWS_DEVELOPMENT",
-            "POSTGRES_PORT_NBA_SIMULATOR_AWS_DEVELOPMENT",
-            "POSTGRES_PORT_NBA_SIMULATOR_AWS_TEST",
-            "DB_PORT",
-            "RDS_PORT",
-            "POSTGRES_PORT",
-            default="5432",
-        )
+        host = get_with_fallback(*DB_ENV_KEYS["host"], default="localhost")
+        port_str = get_with_fallback(*DB_ENV_KEYS["port"], default="5432")
         port = int(port_str) if port_str else 5432
-
-        database = get_with_fallback(
-            "RDS_DATABASE_NBA_SIMULATOR_AWS_WORKFLOW",
-            "RDS_DATABASE_NBA_SIMULATOR_AWS_DEVELOPMENT",
-            "POSTGRES_DB_NBA_SIMULATOR_AWS_DEVELOPMENT",
-            "POSTGRES_DB_NBA_SIMULATOR_AWS_TEST",
-            "DB_NAME",
-            "RDS_DB_NAME",
-            "POSTGRES_DB",
-            default="nba_simulator",
-        )
-
-        user = get_with_fallback(
-            "RDS_USERNAME_NBA_SIMULATOR_AWS_WORKFLOW",
-            "RDS_USERNAME_NBA_SIMULATOR_AWS_DEVELOPMENT",
-            "POSTGRES_USER_NBA_SIMULATOR_AWS_DEVELOPMENT",
-            "POSTGRES_USER_NBA_SIMULATOR_AWS_TEST",
-            "DB_USER",
-            "RDS_USERNAME",
-            "POSTGRES_USER",
-        )
-
-        password = get_with_fallback(
-            "RDS_PASSWORD_NBA_SIMULATOR_AWS_WORKFLOW",
-            "RDS_PASSWORD_NBA_SIMULATOR_AWS_DEVELOPMENT",
-            "POSTGRES_PASSWORD_NBA_SIMULATOR_AWS_DEVELOPMENT",
-            "POSTGRES_PASSWORD_NBA_SIMULATOR_AWS_TEST",
-            "DB_PASSWORD",
-            "RDS_PASSWORD",
-            "POSTGRES_PASSWORD",
-            default="",
-        )
+        database = get_with_fallback(*DB_ENV_KEYS["database"], default="nba_simulator")
+        user = get_with_fallback(*DB_ENV_KEYS["user"])
+        password = get_with_fallback(*DB_ENV_KEYS["password"], default="")
 
         config = {
             "host": host,
@@ -176,7 +218,102 @@ class ConfigLoader:
         logger.info(
             f"Database config: host={host}, port={port}, database={database}, user={user}"
         )
-        return config
+        with self._lock:
+            self._db_cache = (fingerprint, config)
+            ConfigLoader._stats["database_loads"] += 1
+            ConfigLoader._timings["database"] = time.perf_counter() - started
+        return dict(config)
+
+    def _ensure_environment(self) -> None:
+        """
+        Resolve hierarchical secrets and .env into os.environ once per process.
+
+        Runs again only after refresh() or when the .env file's mtime
+        changes. Thread-safe: concurrent first calls resolve once.
+        """
+        env_file = self.project_root / ".env"
+        mtime = _file_mtime(env_file)
+        key = str(env_file)
+        state = ConfigLoader._environment
+        if key in state and state[key] == mtime:
+            return
+
+        with self._lock:
+            if key in state and state[key] == mtime:
+                return
+            started = time.perf_counter()
+            if not ConfigLoader._secrets_loaded:
+                self._load_hierarchical_secrets()
+                ConfigLoader._secrets_loaded = True
+                ConfigLoader._timings["secrets"] = time.perf_counter() - started
+
+            dotenv_started = time.perf_counter()
+            self._load_dotenv(env_file)
+            ConfigLoader._timings["dotenv"] = time.perf_counter() - dotenv_started
+            ConfigLoader._stats["environment_loads"] += 1
+            state[key] = mtime
+
+    def _load_hierarchical_secrets(self) -> None:
+        """Load secrets through UnifiedSecretsManager if it is available"""
+        try:
+            # Check if UnifiedSecretsManager exists
+            mcp_server_path = self.project_root / "mcp_server"
+            if mcp_server_path.exists():
+                if str(mcp_server_path) not in sys.path:
+                    sys.path.insert(0, str(mcp_server_path))
+
+                try:
+                    from unified_secrets_manager import load_secrets_hierarchical
+
+                    # Auto-detect context: DEVELOPMENT for local, WORKFLOW for production
+                    context = (
+                        "DEVELOPMENT"
+                        if os.getenv("ENVIRONMENT", "development").lower()
+                        in ["development", "dev", "local"]
+                        else "WORKFLOW"
+                    )
+                    load_secrets_hierarchical("nba-simulator-aws", "NBA", context)
+                    logger.info(f"Loaded hierarchical secrets for context: {context}")
+                except Exception as e:
+                    logger.debug(f"Could not load hierarchical secrets: {e}")
+        except Exception as e:
+            logger.debug(f"UnifiedSecretsManager not available: {e}")
+
+    def _load_dotenv(self, env_file: Path) -> None:
+        """
+        Apply .env values to os.environ without overriding real environment
+        variables.
+
+        The values applied last time are kept per file (across refresh()),
+        so a later load updates or removes the variables that came from the
+        previous .env while leaving real environment variables alone.
+        """
+        if dotenv_values is None:
+            logger.debug(
+                "python-dotenv not installed. Using environment variables only."
+            )
+            return
+
+        key = str(env_file)
+        previous = ConfigLoader._dotenv_values.get(key, {})
+        if env_file.exists():
+            values = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+        else:
+            logger.debug("No .env file found. Using environment variables only.")
+            values = {}
+
+        for name, value in values.items():
+            if name not in os.environ or os.environ[name] == previous.get(name):
+                os.environ[name] = value
+        for name, value in previous.items():
+            if name not in values and os.environ.get(name) == value:
+                del os.environ[name]
+
+        ConfigLoader._dotenv_values[key] = values
+        if values:
+            logger.info(
+                f"{'Reloaded' if previous else 'Loaded'} config from {env_file}"
+            )
 
     def _load_new_db_config(self) -> Dict[str, Any]:
         """Load from new config/database.yaml (future)"""
@@ -195,6 +332,45 @@ class ConfigLoader:
             logger.warning("PyYAML not installed, falling back to legacy")
             return self._load_legacy_db_config()
 
+    def snapshot(self) -> ResolvedConfig:
+        """
+        Resolved configuration for this loader, with lazy sections.
+
+        Returns the same snapshot until refresh() is called on this loader.
+        """
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = ResolvedConfig(self)
+            return self._snapshot
+
+    def refresh(self) -> None:
+        """
+        Re-resolve secrets and .env on next access and drop this loader's
+        snapshot and database cache.
+
+        The last applied .env values are kept, so the next load still
+        replaces variables that came from the previous .env.
+        """
+        with self._lock:
+            ConfigLoader._environment.clear()
+            ConfigLoader._secrets_loaded = False
+            self._db_cache = None
+            self._snapshot = None
+
+    @classmethod
+    def timing_report(cls) -> Dict[str, Any]:
+        """
+        Startup timing: seconds spent resolving secrets, .env and the
+        database config, plus how often each was (re)computed.
+        """
+        with cls._lock:
+            return {
+                "secrets_seconds": cls._timings.get("secrets", 0.0),
+                "dotenv_seconds": cls._timings.get("dotenv", 0.0),
+                "database_seconds": cls._timings.get("database", 0.0),
+                **cls._stats,
+            }
+
     def load_s3_config(self) -> Dict[str, str]:
         """
         Get S3 bucket configuration.
@@ -4,6 +4,16 @@ Database Module
 Provides connection pooling and query management for PostgreSQL.
 """
 
-from .connection import DatabaseConnection, get_db_connection, execute_query
+from ..utils.lazy import lazy_exports
 
-__all__ = ["DatabaseConnection", "get_db_connection", "execute_query"]
+# psycopg2 loads with .connection on first use
+_EXPORTS = {
+    "DatabaseConnection": ".connection",
+    "get_db_connection": ".connection",
+    "get_database_connection": ".connection",
+    "execute_query": ".connection",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
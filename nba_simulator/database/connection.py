@@ -141,6 +141,23 @@ def get_db_connection():
     return DatabaseConnection()
 
 
+def get_database_connection():
+    """
+    Open a dedicated psycopg2 connection (not drawn from the pool).
+
+    Used by long-lived monitors that hold a connection for their lifetime.
+    The caller owns the connection and is responsible for closing it.
+    """
+    db_config = config.load_database_config()
+    return psycopg2.connect(
+        host=db_config["host"],
+        port=db_config["port"],
+        database=db_config["database"],
+        user=db_config["user"],
+        password=db_config["password"],
+    )
+
+
 def execute_query(query: str, params: Optional[Tuple] = None) -> List[Dict[str, Any]]:
     """Execute query using shared connection pool"""
     db = get_db_connection()
@@ -14,11 +14,17 @@ Phase: 2 - ETL Pipeline Migration
 
 __version__ = "2.0.0-alpha"
 
-__all__ = ["base", "extractors", "transformers", "loaders", "validation"]
+from ..utils.lazy import lazy_exports
 
-# Import submodules for convenient access
-from . import base
-from . import extractors
-from . import transformers
-from . import loaders
-from . import validation
+# Submodules load on first access (e.g. nba_simulator.etl.loaders)
+_EXPORTS = {
+    "base": ".base",
+    "extractors": ".extractors",
+    "transformers": ".transformers",
+    "loaders": ".loaders",
+    "validation": ".validation",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -7,6 +7,7 @@ Provides base classes and utilities for all NBA data scrapers:
 - ScraperStats: Statistics tracking
 - RateLimiter: Token bucket rate limiter
 - ScraperFactory: Factory for creating scrapers
+- S3KeyManifest: Prefetched per-prefix S3 key index for existence checks
 - ScraperErrorHandler: Comprehensive error handling with retry logic
 - Error classification and severity levels
 
@@ -23,6 +24,8 @@ from .async_scraper import (
     ScraperFactory,
 )
 
+from .key_manifest import S3KeyManifest
+
 from .error_handler import (
     ScraperErrorHandler,
     ErrorCategory,
@@ -48,6 +51,7 @@ __all__ = [
     "ScraperStats",
     "RateLimiter",
     "ScraperFactory",
+    "S3KeyManifest",
     # Error handling
     "ScraperErrorHandler",
     "ErrorCategory",
@@ -0,0 +1,224 @@
+"""
+S3 Key Manifest - Prefetched Existence Index for Scrapers
+
+Answers "is this key already in S3?" from memory instead of one HEAD
+request per key:
+- Each prefix (e.g. 'espn_play_by_play/') is listed once, on first use
+- Keys uploaded by the scraper are added as they are written
+- Optional on-disk cache: the next run lists only keys after the last
+  known key (StartAfter), with a full re-list once the cache is older
+  than full_refresh_seconds
+
+A season backfill therefore costs one paginated listing per prefix
+(~1 request per 1000 keys) rather than one HEAD request per game.
+
+Keys written out of lexicographic order by other processes are only seen
+on the next full re-list; until then they read as missing, so a scraper
+re-uploads them (safe) rather than skipping data.
+
+Usage:
+    manifest = S3KeyManifest(s3_client, "nba-sim-raw-data-lake",
+                             cache_path="/tmp/scraper_output/s3_keys.manifest")
+    if not manifest.contains("espn_play_by_play/401810037.json"):
+        upload(...)
+        manifest.add("espn_play_by_play/401810037.json")
+    manifest.save()
+
+Created: November 2025
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+def key_prefix(key: str) -> str:
+    """Directory part of a key, with trailing slash ('' for top-level keys)"""
+    return key.rsplit("/", 1)[0] + "/" if "/" in key else ""
+
+
+class S3KeyManifest:
+    """
+    Per-prefix key sets for one bucket.
+
+    Thread-safe; concurrent callers needing the same unloaded prefix wait
+    for a single listing.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket: str,
+        cache_path: Optional[str] = None,
+        full_refresh_seconds: float = 86400.0,
+    ):
+        """
+        Initialize manifest.
+
+        Args:
+            s3_client: boto3 S3 client
+            bucket: Bucket name
+            cache_path: Optional JSON file persisting keys across runs
+            full_refresh_seconds: Cache age after which a prefix is fully re-listed
+        """
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.full_refresh_seconds = full_refresh_seconds
+
+        self._keys: Dict[str, Set[str]] = {}
+        self._last_key: Dict[str, str] = {}
+        self._listed_at: Dict[str, float] = {}
+        self._loaded: Set[str] = set()
+        self._lock = threading.Lock()
+        self._prefix_locks: Dict[str, threading.Lock] = {}
+
+        # list_objects_v2 pages requested
+        self.list_requests = 0
+
+        if self.cache_path:
+            self._load_cache()
+
+    # =========================================================================
+    # Listing
+    # =========================================================================
+
+    def is_loaded(self, prefix: str) -> bool:
+        """True once prefix has been listed (fully or incrementally) this run"""
+        return prefix in self._loaded
+
+    def load(self, prefix: str) -> int:
+        """
+        List a prefix if not yet loaded this run.
+
+        Cached prefixes younger than full_refresh_seconds are refreshed with
+        StartAfter=<last known key>; others are listed in full.
+
+        Args:
+            prefix: Key prefix ending in '/'
+
+        Returns:
+            Number of keys found that were not already known
+        """
+        with self._lock:
+            if prefix in self._loaded:
+                return 0
+            prefix_lock = self._prefix_locks.setdefault(prefix, threading.Lock())
+
+        with prefix_lock:
+            if prefix in self._loaded:
+                return 0
+
+            started = time.perf_counter()
+            listed_at = self._listed_at.get(prefix)
+            incremental = (
+                listed_at is not None
+                and time.time() - listed_at <= self.full_refresh_seconds
+            )
+            kwargs = {"Prefix": prefix}
+            if incremental and self._last_key.get(prefix):
+                kwargs["StartAfter"] = self._last_key[prefix]
+
+            found: Set[str] = set()
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=self.bucket, **kwargs):
+                with self._lock:
+                    self.list_requests += 1
+                found.update(obj["Key"] for obj in page.get("Contents", []))
+
+            with self._lock:
+                known = self._keys.get(prefix, set()) if incremental else set()
+                new_keys = found - known
+                keys = known | found
+                self._keys[prefix] = keys
+                if keys:
+                    self._last_key[prefix] = max(keys)
+                if not incremental:
+                    self._listed_at[prefix] = time.time()
+                self._loaded.add(prefix)
+
+            logger.info(
+                f"Key manifest s3://{self.bucket}/{prefix}: {len(keys)} keys "
+                f"({'incremental' if incremental else 'full'} listing, "
+                f"+{len(new_keys)}) in {time.perf_counter() - started:.2f}s"
+            )
+            return len(new_keys)
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def contains(self, key: str) -> bool:
+        """True if key exists, listing its prefix first if needed"""
+        prefix = key_prefix(key)
+        self.load(prefix)
+        return key in self._keys.get(prefix, ())
+
+    def add(self, key: str) -> None:
+        """Record a key written by this process"""
+        prefix = key_prefix(key)
+        with self._lock:
+            keys = self._keys.setdefault(prefix, set())
+            keys.add(key)
+            if key > self._last_key.get(prefix, ""):
+                self._last_key[prefix] = key
+
+    def keys(self, prefix: str) -> List[str]:
+        """Known keys under a prefix, sorted (does not list)"""
+        return sorted(self._keys.get(prefix, ()))
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def save(self) -> None:
+        """Write loaded prefixes to cache_path (atomic replace)"""
+        if not self.cache_path:
+            return
+
+        with self._lock:
+            payload = {
+                "bucket": self.bucket,
+                "prefixes": {
+                    prefix: {
+                        "listed_at": self._listed_at.get(prefix),
+                        "keys": sorted(keys),
+                    }
+                    for prefix, keys in self._keys.items()
+                    if prefix in self._listed_at
+                },
+            }
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def _load_cache(self) -> None:
+        """Load a persisted manifest, ignoring missing or mismatched caches"""
+        if not self.cache_path.exists():
+            return
+
+        try:
+            with open(self.cache_path) as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable key manifest cache: {e}")
+            return
+
+        if payload.get("bucket") != self.bucket:
+            return
+
+        for prefix, entry in payload.get("prefixes", {}).items():
+            keys = set(entry.get("keys", []))
+            self._keys[prefix] = keys
+            self._listed_at[prefix] = entry.get("listed_at")
+            if keys:
+                self._last_key[prefix] = max(keys)
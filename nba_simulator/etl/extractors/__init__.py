@@ -38,34 +38,27 @@ Day 3 Implementation: NBA API and hoopR scrapers complete!
 All major data sources now available!
 """
 
-from . import espn
-from . import basketball_reference
-from . import nba_api
-from . import hoopr
+from ...utils.lazy import lazy_exports
 
-# Import scraper classes for convenience
-from .espn import ESPNScraper, scrape_espn_games
-from .basketball_reference import (
-    BasketballReferenceScraper,
-    scrape_basketball_reference_season,
-)
-from .nba_api import NBAAPIScraper, scrape_nba_api_season
-from .hoopr import HoopRScraper, scrape_hoopr_season
-
-__all__ = [
+# Scrapers (and their HTTP/R dependencies) load on first access
+_EXPORTS = {
     # Modules
-    "espn",
-    "basketball_reference",
-    "nba_api",
-    "hoopr",
+    "espn": ".espn",
+    "basketball_reference": ".basketball_reference",
+    "nba_api": ".nba_api",
+    "hoopr": ".hoopr",
     # Scraper classes
-    "ESPNScraper",
-    "BasketballReferenceScraper",
-    "NBAAPIScraper",
-    "HoopRScraper",
+    "ESPNScraper": ".espn",
+    "BasketballReferenceScraper": ".basketball_reference",
+    "NBAAPIScraper": ".nba_api",
+    "HoopRScraper": ".hoopr",
     # Convenience functions
-    "scrape_espn_games",
-    "scrape_basketball_reference_season",
-    "scrape_nba_api_season",
-    "scrape_hoopr_season",
-]
+    "scrape_espn_games": ".espn",
+    "scrape_basketball_reference_season": ".basketball_reference",
+    "scrape_nba_api_season": ".nba_api",
+    "scrape_hoopr_season": ".hoopr",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -7,6 +7,7 @@ Components:
 - ESPNScraper: Main scraper class for ESPN data
 - ESPNFeatureExtractor: Complete 58-feature extraction from S3 JSON files
 - ESPNJSONReader: S3 JSON reader with caching
+- GameCache: Compressed, ETag-keyed, size-bounded local cache tier
 - scrape_espn_games: Convenience function for quick scraping
 - extract_espn_features: Convenience function for feature extraction
 
@@ -30,11 +31,13 @@ from .feature_extractor import (
     ESPNJSONReader,
     extract_espn_features,
 )
+from .game_cache import GameCache
 
 __all__ = [
     "ESPNScraper",
     "scrape_espn_games",
     "ESPNFeatureExtractor",
     "ESPNJSONReader",
+    "GameCache",
     "extract_espn_features",
 ]
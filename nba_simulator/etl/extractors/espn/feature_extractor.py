@@ -16,16 +16,24 @@ Usage:
 
     # Or batch extraction
     features_batch = extractor.batch_extract_games(game_ids=["401468003", "401468004"])
+
+    # Or streaming: I/O threads feed a process pool, results arrive as they complete
+    for game_id, features in extractor.stream_extract_games(season_game_ids):
+        ...
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+import hashlib
 import json
 import logging
+import os
+import queue
+import threading
 import boto3
 from botocore.exceptions import ClientError
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import math
 
 # Relative imports
@@ -34,33 +42,58 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
 
 from nba_simulator.config import config
+from nba_simulator.etl.extractors.espn.game_cache import GameCache
+
+# Sentinel: object is not in S3
+_NOT_FOUND = object()
 
 
 class ESPNJSONReader:
     """
     Reads ESPN JSON files from S3 with caching and parallel loading support.
+
+    Two local cache options:
+    - cache_dir: plain {game_id}.json copies (unbounded, never invalidated)
+    - game_cache: GameCache tier - compressed, keyed by S3 ETag, LRU-bounded,
+      with a parsed-object form so warm reads skip JSON parsing
     """
 
-    def __init__(self, bucket: str = None, cache_dir: str = None):
+    def __init__(
+        self,
+        bucket: str = None,
+        cache_dir: str = None,
+        s3_client=None,
+        game_cache: Optional[GameCache] = None,
+        revalidate: bool = True,
+    ):
         """
         Initialize ESPN JSON reader.
 
         Args:
             bucket: S3 bucket name (defaults to config)
             cache_dir: Local cache directory (optional)
+            s3_client: S3 client to read with (defaults to a boto3 client)
+            game_cache: Compressed ETag-keyed cache tier (takes precedence
+                over cache_dir)
+            revalidate: With game_cache, HEAD each object and only serve a
+                cached copy whose ETag still matches (False trusts the cache)
         """
         s3_config = config.load_s3_config()
         self.bucket = bucket or s3_config["bucket"]
         self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.game_cache = game_cache
+        self.revalidate = revalidate
 
         # Initialize S3 client
-        aws_config = config.load_aws_config()
-        self.s3_client = boto3.client(
-            "s3",
-            region_name=s3_config["region"],
-            aws_access_key_id=aws_config.get("access_key_id"),
-            aws_secret_access_key=aws_config.get("secret_access_key"),
-        )
+        if s3_client is None:
+            aws_config = config.load_aws_config()
+            s3_client = boto3.client(
+                "s3",
+                region_name=s3_config["region"],
+                aws_access_key_id=aws_config.get("access_key_id"),
+                aws_secret_access_key=aws_config.get("secret_access_key"),
+            )
+        self.s3_client = s3_client
 
         self.logger = logging.getLogger(__name__)
 
@@ -79,6 +112,9 @@ class ESPNJSONReader:
         Returns:
             Parsed JSON dict, or None if not found
         """
+        if self.game_cache:
+            return self._read_game_cached(game_id, s3_prefix, parse=True)
+
         # Check cache first
         if self.cache_dir:
             cache_file = self.cache_dir / f"{game_id}.json"
@@ -114,6 +150,195 @@ class ESPNJSONReader:
             self.logger.error(f"Error reading {game_id}: {e}")
             return None
 
+    def read_game_bytes(
+        self, game_id: str, s3_prefix: str = "box_scores"
+    ) -> Optional[bytes]:
+        """
+        Read the raw (unparsed) ESPN JSON for a single game.
+
+        Leaves JSON parsing to the caller, e.g. a worker process.
+
+        Args:
+            game_id: ESPN game ID
+            s3_prefix: S3 key prefix (default: "box_scores")
+
+        Returns:
+            JSON bytes, or None if not found
+        """
+        if self.game_cache:
+            return self._read_game_cached(game_id, s3_prefix, parse=False)
+
+        # Check cache first
+        if self.cache_dir:
+            cache_file = self.cache_dir / f"{game_id}.json"
+            if cache_file.exists():
+                try:
+                    return cache_file.read_bytes()
+                except Exception as e:
+                    self.logger.warning(f"Cache read failed for {game_id}: {e}")
+
+        # Read from S3
+        s3_key = f"{s3_prefix}/{game_id}.json"
+
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=s3_key)
+            body = response["Body"].read()
+
+            # Cache for next time
+            if self.cache_dir:
+                (self.cache_dir / f"{game_id}.json").write_bytes(body)
+
+            return body
+
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchKey":
+                self.logger.warning(f"Game {game_id} not found in S3")
+            else:
+                self.logger.error(f"S3 error reading {game_id}: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error reading {game_id}: {e}")
+            return None
+
+    def _read_game_cached(
+        self, game_id: str, s3_prefix: str, parse: bool, etag: Optional[str] = None
+    ):
+        """
+        Read a game through the GameCache tier.
+
+        Order: parsed form → compressed payload → S3 GET (then cached).
+        A known ETag (e.g. from a listing) skips the revalidation HEAD.
+        """
+        s3_key = f"{s3_prefix}/{game_id}.json"
+
+        try:
+            if etag is None and self.revalidate:
+                etag = self._object_etag(s3_key)
+            if etag is _NOT_FOUND:
+                self.logger.warning(f"Game {game_id} not found in S3")
+                return None
+
+            if parse:
+                game_data = self.game_cache.get_parsed(s3_key, etag)
+                if game_data is not None:
+                    return game_data
+
+            payload = self.game_cache.get(s3_key, etag)
+            if payload is None:
+                response = self.s3_client.get_object(Bucket=self.bucket, Key=s3_key)
+                payload = response["Body"].read()
+                self.game_cache.put(
+                    s3_key,
+                    response.get("ETag") or etag or self._digest(payload),
+                    payload,
+                )
+
+            if not parse:
+                return payload
+
+            game_data = json.loads(payload)
+            self.game_cache.put_parsed(s3_key, None, game_data)
+            return game_data
+
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchKey":
+                self.logger.warning(f"Game {game_id} not found in S3")
+            else:
+                self.logger.error(f"S3 error reading {game_id}: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error reading {game_id}: {e}")
+            return None
+
+    def _object_etag(self, s3_key: str):
+        """Current S3 ETag of a key (HEAD), or _NOT_FOUND"""
+        try:
+            response = self.s3_client.head_object(Bucket=self.bucket, Key=s3_key)
+            return response["ETag"]
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return _NOT_FOUND
+            # Can't revalidate: serve whatever is cached
+            self.logger.warning(f"HEAD failed for {s3_key}, trusting cache: {e}")
+            return None
+        except FileNotFoundError:
+            return _NOT_FOUND
+
+    @staticmethod
+    def _digest(payload: bytes) -> str:
+        """Content ETag for payloads fetched without one"""
+        return hashlib.md5(payload, usedforsecurity=False).hexdigest()
+
+    def prewarm(
+        self,
+        game_ids: Optional[List[str]] = None,
+        game_id_prefix: Optional[str] = None,
+        s3_prefix: str = "box_scores",
+        max_workers: int = 16,
+    ) -> Dict[str, int]:
+        """
+        Fill the GameCache tier ahead of a batch run (e.g. a season).
+
+        Games come from game_ids, or from one S3 listing of every key under
+        s3_prefix whose game ID starts with game_id_prefix; listed ETags
+        skip the per-game HEAD.
+
+        Args:
+            game_ids: ESPN game IDs to warm
+            game_id_prefix: Warm every listed game whose ID starts with this
+            s3_prefix: S3 key prefix (default: "box_scores")
+            max_workers: Download threads
+
+        Returns:
+            Dict with fetched / cached / failed counts
+        """
+        if self.game_cache is None:
+            raise ValueError("prewarm requires a game_cache")
+        if game_ids is None and game_id_prefix is None:
+            raise ValueError("Must provide either game_ids or game_id_prefix")
+
+        # (game_id, known ETag or None)
+        if game_ids is not None:
+            targets = [(game_id, None) for game_id in dict.fromkeys(game_ids)]
+        else:
+            targets = []
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(
+                Bucket=self.bucket, Prefix=f"{s3_prefix}/{game_id_prefix}"
+            ):
+                for obj in page.get("Contents", []):
+                    name = obj["Key"].rsplit("/", 1)[-1]
+                    if name.endswith(".json"):
+                        targets.append((name[: -len(".json")], obj.get("ETag")))
+
+        def warm(target):
+            game_id, etag = target
+            s3_key = f"{s3_prefix}/{game_id}.json"
+            if etag is None and self.revalidate:
+                etag = self._object_etag(s3_key)
+                if etag is _NOT_FOUND:
+                    return "failed"
+            cached_etag = self.game_cache.current_etag(s3_key)
+            if cached_etag is not None and (
+                etag is None or cached_etag == etag.strip('"')
+            ):
+                return "cached"
+            game_data = self._read_game_cached(
+                game_id, s3_prefix, parse=self.game_cache.keep_parsed, etag=etag
+            )
+            return "fetched" if game_data is not None else "failed"
+
+        summary = {"fetched": 0, "cached": 0, "failed": 0}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for outcome in executor.map(warm, targets):
+                summary[outcome] += 1
+
+        self.logger.info(
+            f"Pre-warmed {len(targets):,} games: {summary['fetched']:,} fetched, "
+            f"{summary['cached']:,} already cached, {summary['failed']:,} failed"
+        )
+        return summary
+
     def batch_read_games(
         self, game_ids: List[str], max_workers: int = 10
     ) -> Dict[str, Optional[Dict]]:
@@ -161,11 +386,18 @@ class ESPNFeatureExtractor:
         Initialize feature extractor.
 
         Args:
-            reader: ESPNJSONReader instance (creates new if None)
+            reader: ESPNJSONReader instance (created on first use if None)
         """
-        self.reader = reader or ESPNJSONReader()
+        self._reader = reader
         self.logger = logging.getLogger(__name__)
 
+    @property
+    def reader(self) -> ESPNJSONReader:
+        """JSON reader (extracting from pre-loaded JSON never needs one)"""
+        if self._reader is None:
+            self._reader = ESPNJSONReader()
+        return self._reader
+
     def _detect_format(self, raw_json: Dict) -> int:
         """
         Detect ESPN JSON format.
@@ -940,16 +1172,23 @@ class ESPNFeatureExtractor:
         except Exception:
             return None
 
-    def batch_extract_games(self, game_ids: List[str]) -> Dict[str, Dict]:
+    def batch_extract_games(
+        self, game_ids: List[str], processes: Optional[int] = None
+    ) -> Dict[str, Dict]:
         """
         Extract features for multiple games in parallel.
 
         Args:
             game_ids: List of ESPN game IDs
+            processes: Extract in this many worker processes via
+                stream_extract_games (default: read all, extract in this thread)
 
         Returns:
             Dict mapping game_id → features
         """
+        if processes:
+            return dict(self.stream_extract_games(game_ids, processes=processes))
+
         # Read all games in parallel
         raw_jsons = self.reader.batch_read_games(game_ids)
 
@@ -966,6 +1205,102 @@ class ESPNFeatureExtractor:
 
         return results
 
+    def stream_extract_games(
+        self,
+        game_ids: List[str],
+        io_workers: int = 10,
+        processes: Optional[int] = None,
+        max_pending: Optional[int] = None,
+    ) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """
+        Extract features for many games, yielding each as it completes.
+
+        I/O threads read raw JSON bytes and hand them to a process pool
+        that parses and extracts. At most max_pending games are held
+        between read and extraction, so memory stays bounded by the
+        in-flight window rather than the full batch, and extraction uses
+        every core.
+
+        Args:
+            game_ids: ESPN game IDs (duplicates are extracted once)
+            io_workers: Threads reading from S3
+            processes: Extractor processes (default: CPU count)
+            max_pending: Games read but not yet extracted (default: 2x processes)
+
+        Yields:
+            (game_id, features) in completion order; features is None if
+            the game could not be read or extracted
+        """
+        game_ids = list(dict.fromkeys(game_ids))
+        if not game_ids:
+            return
+
+        processes = processes or os.cpu_count() or 1
+        max_pending = max_pending or 2 * processes
+        slots = threading.BoundedSemaphore(max_pending)
+        completed = queue.Queue()
+        stopped = threading.Event()
+
+        def on_extracted(game_id, future):
+            slots.release()
+            completed.put((game_id, future))
+
+        def read_and_submit(game_id):
+            # Block until the in-flight window has room
+            slots.acquire()
+            if stopped.is_set():
+                # Consumer closed the stream
+                slots.release()
+                return
+            try:
+                raw = self.reader.read_game_bytes(game_id)
+                if raw is None:
+                    slots.release()
+                    completed.put((game_id, None))
+                    return
+                future = extract_pool.submit(_extract_game_bytes, game_id, raw)
+            except Exception as e:
+                self.logger.error(f"Error reading {game_id}: {e}")
+                slots.release()
+                completed.put((game_id, None))
+                return
+            future.add_done_callback(lambda f: on_extracted(game_id, f))
+
+        extract_pool = ProcessPoolExecutor(max_workers=processes)
+        io_pool = ThreadPoolExecutor(max_workers=io_workers)
+        try:
+            for game_id in game_ids:
+                io_pool.submit(read_and_submit, game_id)
+
+            for _ in range(len(game_ids)):
+                game_id, future = completed.get()
+                if future is None:
+                    yield game_id, None
+                    continue
+                try:
+                    yield game_id, future.result()
+                except Exception as e:
+                    self.logger.error(f"Error extracting {game_id}: {e}")
+                    yield game_id, None
+        finally:
+            stopped.set()
+            io_pool.shutdown(wait=False, cancel_futures=True)
+            extract_pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _extract_game_bytes(game_id: str, raw: bytes) -> Optional[Dict]:
+    """Process-pool task: parse raw ESPN JSON and extract its features"""
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = ESPNFeatureExtractor()
+    return _worker_extractor.extract_game_features(
+        game_id=game_id, raw_json=json.loads(raw)
+    )
+
+
+# Per-process extractor for _extract_game_bytes (no reader is ever created)
+_worker_extractor: Optional[ESPNFeatureExtractor] = None
+
 
 # Convenience function
 def extract_espn_features(game_id: str) -> Optional[Dict]:
@@ -0,0 +1,519 @@
+"""
+ESPN Game Cache - Compressed, Content-Addressed Local Cache Tier
+
+Local cache for raw ESPN game JSON read from S3:
+- Payloads stored compressed (zstd, zlib fallback), addressed by S3 ETag,
+  so a re-scraped object never serves a stale copy
+- Optional parsed-object form (msgpack, pickle fallback): warm reads skip
+  JSON parsing entirely
+- LRU size budget across compressed and parsed forms
+- Hit/miss/bytes metrics
+- Pre-warm a season's games ahead of a batch run
+
+Layout:
+    <cache_dir>/index.sqlite          key → ETag, blob sizes, last access
+    <cache_dir>/objects/ab/<digest>.zst|.zz    compressed JSON payload
+    <cache_dir>/objects/ab/<digest>.mpk|.pkl   parsed object
+
+Usage:
+    from nba_simulator.etl.extractors.espn import ESPNJSONReader, GameCache
+
+    cache = GameCache("/mnt/cache/espn", max_bytes=20 * 1024**3)
+    reader = ESPNJSONReader(game_cache=cache)
+    reader.prewarm(season_game_ids)
+    game = reader.read_game("401468003")
+    print(cache.stats())
+
+    # Pre-warm from the command line
+    python -m nba_simulator.etl.extractors.espn.game_cache prewarm \\
+        --cache-dir /mnt/cache/espn --game-ids-file season_2023.txt
+"""
+
+import argparse
+import hashlib
+import logging
+import pickle  # nosec B403 - local cache serialization
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS keys (
+        key TEXT PRIMARY KEY,
+        etag TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS blobs (
+        etag TEXT PRIMARY KEY,
+        codec TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        parsed_format TEXT,
+        parsed_size INTEGER NOT NULL DEFAULT 0,
+        last_access REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_blobs_last_access ON blobs (last_access);
+"""
+
+
+class GameCache:
+    """
+    Size-bounded local cache of S3 payloads keyed by ETag.
+
+    Thread-safe: ESPNJSONReader reads games from a thread pool.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = 10 * 1024**3,
+        keep_parsed: bool = True,
+        compression_level: int = 3,
+    ):
+        """
+        Initialize game cache.
+
+        Args:
+            cache_dir: Cache directory (created if missing)
+            max_bytes: LRU budget for compressed + parsed files on disk
+            keep_parsed: Also store the parsed object for warm reads
+            compression_level: zstd level (zlib level when zstd is missing)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.keep_parsed = keep_parsed
+        self.compression_level = compression_level
+
+        self.codec = "zstd" if ZSTD_AVAILABLE else "zlib"
+        self.parsed_format = "msgpack" if MSGPACK_AVAILABLE else "pickle"
+
+        (self.cache_dir / "objects").mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(self.cache_dir / "index.sqlite"), check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+        self.total_bytes = self._db.execute(
+            "SELECT COALESCE(SUM(size + parsed_size), 0) FROM blobs"
+        ).fetchone()[0]
+
+        self.metrics = {
+            "hits": 0,
+            "parsed_hits": 0,
+            "misses": 0,
+            "bytes_read": 0,
+            "bytes_written": 0,
+            "bytes_compressed": 0,
+            "bytes_uncompressed": 0,
+            "evictions": 0,
+        }
+
+        logger.info(
+            f"Game cache at {self.cache_dir} ({self.codec}/{self.parsed_format}, "
+            f"{self.total_bytes / 1e6:,.0f} MB of {self.max_bytes / 1e6:,.0f} MB)"
+        )
+
+    # ========================================================================
+    # Reads
+    # ========================================================================
+
+    def current_etag(self, key: str) -> Optional[str]:
+        """ETag of the cached copy of an S3 key, if any"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag FROM keys WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get(self, key: str, etag: Optional[str] = None) -> Optional[bytes]:
+        """
+        Cached payload (decompressed bytes) for an S3 key.
+
+        Args:
+            key: S3 key
+            etag: Current S3 ETag; None trusts whatever copy is cached
+
+        Returns:
+            Payload bytes, or None on a miss
+        """
+        blob = self._lookup(key, etag)
+        if blob is None:
+            return None
+        etag, codec = blob[0], blob[1]
+
+        path = self._blob_path(etag, codec)
+        try:
+            compressed = path.read_bytes()
+            payload = self._decompress(compressed, codec)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable cache entry for {key}: {e}")
+            self._evict(etag)
+            self._count(misses=1)
+            return None
+
+        self._count(hits=1, bytes_read=len(compressed))
+        return payload
+
+    def get_parsed(self, key: str, etag: Optional[str] = None) -> Optional[Any]:
+        """
+        Cached parsed object for an S3 key (skips decompression and parsing).
+
+        Returns:
+            Parsed object, or None if no parsed form is cached
+        """
+        if not self.keep_parsed:
+            return None
+        blob = self._lookup(key, etag, count_miss=False)
+        if blob is None or blob[2] is None:
+            return None
+        etag, parsed_format = blob[0], blob[2]
+
+        try:
+            data = self._parsed_path(etag, parsed_format).read_bytes()
+            obj = self._unpack(data, parsed_format)
+        except Exception as e:
+            logger.warning(f"Dropping unreadable parsed entry for {key}: {e}")
+            return None
+
+        self._count(parsed_hits=1, bytes_read=len(data))
+        return obj
+
+    # ========================================================================
+    # Writes
+    # ========================================================================
+
+    def put(self, key: str, etag: str, payload: bytes) -> None:
+        """
+        Store a payload under its ETag and point the key at it.
+
+        Args:
+            key: S3 key
+            etag: S3 ETag of the payload
+            payload: Raw object bytes
+        """
+        etag = etag.strip('"')
+        with self._lock:
+            previous = self._db.execute(
+                "SELECT etag FROM keys WHERE key = ?", (key,)
+            ).fetchone()
+            exists = self._db.execute(
+                "SELECT 1 FROM blobs WHERE etag = ?", (etag,)
+            ).fetchone()
+            if exists:
+                # Same content already cached (possibly under another key)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO keys (key, etag) VALUES (?, ?)",
+                    (key, etag),
+                )
+                self._db.commit()
+
+        if not exists:
+            compressed = self._compress(payload)
+            self._write_atomic(self._blob_path(etag, self.codec), compressed)
+
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO blobs (etag, codec, size, last_access) "
+                    "VALUES (?, ?, ?, ?)",
+                    (etag, self.codec, len(compressed), time.time()),
+                )
+                self._db.execute(
+                    "INSERT OR REPLACE INTO keys (key, etag) VALUES (?, ?)",
+                    (key, etag),
+                )
+                self._db.commit()
+                self.total_bytes += len(compressed)
+                self.metrics["bytes_written"] += len(compressed)
+                self.metrics["bytes_compressed"] += len(compressed)
+                self.metrics["bytes_uncompressed"] += len(payload)
+
+        # Drop the superseded version once nothing points at it
+        if previous and previous[0] != etag:
+            with self._lock:
+                referenced = self._db.execute(
+                    "SELECT 1 FROM keys WHERE etag = ?", (previous[0],)
+                ).fetchone()
+            if not referenced:
+                self._evict(previous[0])
+
+        self._enforce_budget()
+
+    def put_parsed(self, key: str, etag: Optional[str], obj: Any) -> None:
+        """Store the parsed form next to a cached payload"""
+        if not self.keep_parsed:
+            return
+        blob = self._lookup(key, etag, count_miss=False, touch=False)
+        if blob is None:
+            return
+        etag = blob[0]
+
+        data = self._pack(obj)
+        self._write_atomic(self._parsed_path(etag, self.parsed_format), data)
+
+        with self._lock:
+            old_size = self._db.execute(
+                "SELECT parsed_size FROM blobs WHERE etag = ?", (etag,)
+            ).fetchone()
+            if old_size is None:
+                return
+            self._db.execute(
+                "UPDATE blobs SET parsed_format = ?, parsed_size = ? WHERE etag = ?",
+                (self.parsed_format, len(data), etag),
+            )
+            self._db.commit()
+            self.total_bytes += len(data) - old_size[0]
+            self.metrics["bytes_written"] += len(data)
+
+        self._enforce_budget()
+
+    # ========================================================================
+    # Metrics / maintenance
+    # ========================================================================
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/bytes metrics and current size"""
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+            stats = dict(self.metrics)
+        lookups = stats["hits"] + stats["parsed_hits"] + stats["misses"]
+        stats.update(
+            {
+                "hit_rate": (
+                    (stats["hits"] + stats["parsed_hits"]) / lookups if lookups else 0.0
+                ),
+                "compression_ratio": (
+                    stats["bytes_uncompressed"] / stats["bytes_compressed"]
+                    if stats["bytes_compressed"]
+                    else 0.0
+                ),
+                "entries": entries,
+                "total_bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "codec": self.codec,
+                "parsed_format": self.parsed_format if self.keep_parsed else None,
+            }
+        )
+        return stats
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        with self._lock:
+            etags = [row[0] for row in self._db.execute("SELECT etag FROM blobs")]
+        for etag in etags:
+            self._evict(etag)
+        with self._lock:
+            self._db.execute("DELETE FROM keys")
+            self._db.commit()
+
+    def close(self) -> None:
+        """Close the index database"""
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+
+    def _enforce_budget(self) -> None:
+        """Evict least recently used blobs until under max_bytes"""
+        while self.total_bytes > self.max_bytes:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT etag FROM blobs ORDER BY last_access LIMIT 1"
+                ).fetchone()
+            if row is None:
+                break
+            self._evict(row[0])
+            self._count(evictions=1)
+
+    def _evict(self, etag: str) -> None:
+        """Delete a blob's files and index rows"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT codec, size, parsed_format, parsed_size FROM blobs "
+                "WHERE etag = ?",
+                (etag,),
+            ).fetchone()
+            if row is None:
+                return
+            codec, size, parsed_format, parsed_size = row
+            self._db.execute("DELETE FROM blobs WHERE etag = ?", (etag,))
+            self._db.execute("DELETE FROM keys WHERE etag = ?", (etag,))
+            self._db.commit()
+            self.total_bytes -= size + parsed_size
+
+        self._blob_path(etag, codec).unlink(missing_ok=True)
+        if parsed_format:
+            self._parsed_path(etag, parsed_format).unlink(missing_ok=True)
+
+    # ========================================================================
+    # Helpers
+    # ========================================================================
+
+    def _lookup(
+        self,
+        key: str,
+        etag: Optional[str],
+        count_miss: bool = True,
+        touch: bool = True,
+    ) -> Optional[tuple]:
+        """(etag, codec, parsed_format) of the blob serving key, or None"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT b.etag, b.codec, b.parsed_format FROM keys k "
+                "JOIN blobs b ON b.etag = k.etag WHERE k.key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None and etag is not None and row[0] != etag.strip('"'):
+                # Object changed in S3 since it was cached
+                row = None
+            if row is None:
+                if count_miss:
+                    self.metrics["misses"] += 1
+                return None
+            if touch:
+                self._db.execute(
+                    "UPDATE blobs SET last_access = ? WHERE etag = ?",
+                    (time.time(), row[0]),
+                )
+        return row
+
+    def _count(self, **increments: int) -> None:
+        with self._lock:
+            for name, value in increments.items():
+                self.metrics[name] += value
+
+    def _blob_path(self, etag: str, codec: str) -> Path:
+        digest = hashlib.sha1(etag.encode("utf-8"), usedforsecurity=False).hexdigest()
+        suffix = ".zst" if codec == "zstd" else ".zz"
+        return self.cache_dir / "objects" / digest[:2] / f"{digest}{suffix}"
+
+    def _parsed_path(self, etag: str, parsed_format: str) -> Path:
+        digest = hashlib.sha1(etag.encode("utf-8"), usedforsecurity=False).hexdigest()
+        suffix = ".mpk" if parsed_format == "msgpack" else ".pkl"
+        return self.cache_dir / "objects" / digest[:2] / f"{digest}{suffix}"
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=self.compression_level).compress(
+                payload
+            )
+        return zlib.compress(payload, min(self.compression_level, 9))
+
+    @staticmethod
+    def _decompress(data: bytes, codec: str) -> bytes:
+        """Decompress a blob; any codec error is raised as ValueError"""
+        if codec == "zstd":
+            if not ZSTD_AVAILABLE:
+                raise ValueError("entry is zstd-compressed but zstandard is missing")
+            try:
+                return zstandard.ZstdDecompressor().decompress(data)
+            except zstandard.ZstdError as e:
+                raise ValueError(f"corrupt zstd entry: {e}") from e
+        try:
+            return zlib.decompress(data)
+        except zlib.error as e:
+            raise ValueError(f"corrupt zlib entry: {e}") from e
+
+    def _pack(self, obj: Any) -> bytes:
+        if self.parsed_format == "msgpack":
+            return msgpack.packb(obj, use_bin_type=True)
+        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _unpack(data: bytes, parsed_format: str) -> Any:
+        if parsed_format == "msgpack":
+            if not MSGPACK_AVAILABLE:
+                raise ValueError("entry is msgpack-encoded but msgpack is missing")
+            return msgpack.unpackb(data, raw=False, strict_map_key=False)
+        # Local cache files written by this class only
+        return pickle.loads(data)  # nosec B301 - cache files written by this class
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ESPN game cache maintenance")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    prewarm = subparsers.add_parser("prewarm", help="Fill the cache for a season")
+    prewarm.add_argument("--cache-dir", required=True, help="Cache directory")
+    prewarm.add_argument(
+        "--max-gb", type=float, default=10.0, help="Cache size budget (GB)"
+    )
+    prewarm.add_argument("--bucket", help="S3 bucket (default: config)")
+    prewarm.add_argument("--s3-prefix", default="box_scores", help="S3 key prefix")
+    source = prewarm.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "--game-ids-file", help="File with one ESPN game ID per line (a season)"
+    )
+    source.add_argument(
+        "--game-id-prefix",
+        help="Warm every game whose ID starts with this (e.g. 40158 for 2023-24)",
+    )
+    prewarm.add_argument("--workers", type=int, default=16, help="Download threads")
+
+    stats = subparsers.add_parser("stats", help="Show cache size and entries")
+    stats.add_argument("--cache-dir", required=True, help="Cache directory")
+
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    if args.command == "stats":
+        cache = GameCache(args.cache_dir, max_bytes=float("inf"))
+        for name, value in cache.stats().items():
+            print(f"{name}: {value}")
+        return
+
+    from .feature_extractor import ESPNJSONReader
+
+    cache = GameCache(args.cache_dir, max_bytes=int(args.max_gb * 1024**3))
+    reader = ESPNJSONReader(bucket=args.bucket, game_cache=cache)
+
+    if args.game_ids_file:
+        with open(args.game_ids_file) as f:
+            game_ids = [line.strip() for line in f if line.strip()]
+        summary = reader.prewarm(
+            game_ids, s3_prefix=args.s3_prefix, max_workers=args.workers
+        )
+    else:
+        summary = reader.prewarm(
+            game_id_prefix=args.game_id_prefix,
+            s3_prefix=args.s3_prefix,
+            max_workers=args.workers,
+        )
+
+    print(
+        f"Pre-warmed {summary['fetched']:,} games "
+        f"({summary['cached']:,} already cached, {summary['failed']:,} failed)"
+    )
+    print(f"Cache: {cache.stats()['total_bytes'] / 1e6:,.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,12 +8,14 @@ possession boundaries and calculate efficiency metrics.
 Exports:
     - PossessionDetector: Core detection logic
     - PossessionExtractor: Database operations
+    - ParallelPossessionExtractor: Multi-process sharded extraction
     - DeanOliverValidator: Possession validation
     - PossessionConfig: Main configuration class
 """
 
 from .detector import PossessionDetector, PossessionBoundary
 from .extractor import PossessionExtractor
+from .parallel import ParallelPossessionExtractor
 from .validator import DeanOliverValidator
 from .config import (
     DatabaseConfig,
@@ -28,6 +30,7 @@ __all__ = [
     "PossessionDetector",
     "PossessionBoundary",
     "PossessionExtractor",
+    "ParallelPossessionExtractor",
     "DeanOliverValidator",
     "DatabaseConfig",
     "PossessionDetectionConfig",
@@ -12,19 +12,70 @@ Author: NBA Simulator AWS Team
 Created: November 5, 2025
 """
 
+import csv
+import io
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 
 from .detector import PossessionDetector, PossessionBoundary
 from .config import PossessionConfig
 
 logger = logging.getLogger(__name__)
 
+# Column order shared by the INSERT and COPY write paths
+POSSESSION_COLUMNS = (
+    "game_id",
+    "season",
+    "game_date",
+    "possession_number",
+    "period",
+    "offensive_team_id",
+    "defensive_team_id",
+    "home_team_id",
+    "away_team_id",
+    "start_clock_minutes",
+    "start_clock_seconds",
+    "end_clock_minutes",
+    "end_clock_seconds",
+    "duration_seconds",
+    "score_differential_start",
+    "home_score_start",
+    "away_score_start",
+    "home_score_end",
+    "away_score_end",
+    "points_scored",
+    "possession_result",
+    "field_goals_attempted",
+    "field_goals_made",
+    "three_pointers_attempted",
+    "three_pointers_made",
+    "free_throws_attempted",
+    "free_throws_made",
+    "points_per_possession",
+    "effective_field_goal_pct",
+    "start_event_id",
+    "end_event_id",
+    "event_count",
+    "is_clutch_time",
+    "is_garbage_time",
+    "is_fastbreak",
+    "has_timeout",
+    "validation_status",
+    "validation_notes",
+)
+
+# Per-game checkpoint table used for exact resume
+CHECKPOINT_TABLE = "possession_extraction_checkpoints"
+
+# NULL marker for COPY ... FORMAT csv
+_COPY_NULL = "\\N"
+
 
 class PossessionExtractor:
     """
@@ -32,8 +83,10 @@ class PossessionExtractor:
 
     Features:
     - Batch processing for memory efficiency
-    - Checkpoint/resume capability
-    - Parallel processing support (future)
+    - Chunked event streaming (one query per chunk of games)
+    - COPY-based possession writes
+    - Per-game checkpoint table for exact resume
+    - Parallel processing via ParallelPossessionExtractor
     - Progress tracking
     - Error handling with validation
 
@@ -43,14 +96,19 @@ class PossessionExtractor:
         extractor.extract_all_games()
     """
 
-    def __init__(self, config: PossessionConfig):
+    # Games whose events are fetched with a single query
+    DEFAULT_CHUNK_SIZE = 50
+
+    def __init__(self, config: PossessionConfig, worker_id: int = 0):
         """
         Initialize extractor with configuration.
 
         Args:
             config: PossessionExtractionConfig object
+            worker_id: Worker number when running inside a process pool
         """
         self.config = config
+        self.worker_id = worker_id
         self.detector = PossessionDetector(config)
         self.conn = None
         self.cursor = None
@@ -59,6 +117,7 @@ class PossessionExtractor:
         self.stats = {
             "games_processed": 0,
             "games_failed": 0,
+            "games_skipped": 0,
             "possessions_extracted": 0,
             "events_processed": 0,
             "start_time": None,
@@ -114,18 +173,8 @@ class PossessionExtractor:
         logger.info(f"Found {len(games)} games to process")
         return games
 
-    def get_events_for_game(self, game_id: str) -> List[Dict]:
-        """
-        Get all events for a specific game, sorted by (period, clock).
-
-        Args:
-            game_id: Game identifier
-
-        Returns:
-            List of event dictionaries
-        """
-        query = """
-            SELECT
+    # Shared SELECT list for single-game and chunked event queries
+    _EVENT_COLUMNS = """
                 event_id,
                 game_id,
                 quarter as period,
@@ -139,6 +188,50 @@ class PossessionExtractor:
                 event_data->>'description' as description,
                 event_data->>'season' as season,
                 event_data->>'game_date' as game_date
+    """
+
+    @staticmethod
+    def _normalize_event(row: Dict) -> Dict:
+        """
+        Convert a raw event row to the types expected by the detector.
+
+        Args:
+            row: Row returned by the events query
+
+        Returns:
+            Event dictionary
+        """
+        event = dict(row)
+        # Convert scores to integers if present
+        if event.get("home_score"):
+            try:
+                event["home_score"] = int(event["home_score"])
+            except:
+                event["home_score"] = 0
+        if event.get("away_score"):
+            try:
+                event["away_score"] = int(event["away_score"])
+            except:
+                event["away_score"] = 0
+        # Add season and game_date if available
+        if not event.get("season"):
+            event["season"] = 2013  # Default fallback
+        if not event.get("game_date"):
+            event["game_date"] = "2013-01-01"  # Default fallback
+        return event
+
+    def get_events_for_game(self, game_id: str) -> List[Dict]:
+        """
+        Get all events for a specific game, sorted by (period, clock).
+
+        Args:
+            game_id: Game identifier
+
+        Returns:
+            List of event dictionaries
+        """
+        query = f"""
+            SELECT {self._EVENT_COLUMNS}
             FROM temporal_events
             WHERE game_id = %s
             ORDER BY quarter ASC, game_clock_seconds DESC, event_id ASC
@@ -148,31 +241,123 @@ class PossessionExtractor:
         raw_events = self.cursor.fetchall()
 
         # Convert to dictionaries with proper types
-        events = []
-        for row in raw_events:
-            event = dict(row)
-            # Convert scores to integers if present
-            if event.get("home_score"):
-                try:
-                    event["home_score"] = int(event["home_score"])
-                except:
-                    event["home_score"] = 0
-            if event.get("away_score"):
-                try:
-                    event["away_score"] = int(event["away_score"])
-                except:
-                    event["away_score"] = 0
-            # Add season and game_date if available
-            if not event.get("season"):
-                event["season"] = 2013  # Default fallback
-            if not event.get("game_date"):
-                event["game_date"] = "2013-01-01"  # Default fallback
-
-            events.append(event)
+        events = [self._normalize_event(row) for row in raw_events]
 
         logger.debug(f"Retrieved {len(events)} events for game {game_id}")
         return events
 
+    def iter_events_for_games(
+        self, game_ids: List[str]
+    ) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        Stream events for a chunk of games using a single query.
+
+        Rows are read through a server-side cursor (``batch_size`` rows per
+        round trip) and grouped by game, so only one game's events are held
+        in memory at a time.
+
+        Args:
+            game_ids: Game identifiers to fetch
+
+        Yields:
+            Tuples of (game_id, events sorted by period and clock)
+        """
+        if not game_ids:
+            return
+
+        query = f"""
+            SELECT {self._EVENT_COLUMNS}
+            FROM temporal_events
+            WHERE game_id = ANY(%s)
+            ORDER BY game_id ASC, quarter ASC, game_clock_seconds DESC, event_id ASC
+        """
+
+        stream = self.conn.cursor(
+            name=f"possession_events_w{self.worker_id}_{os.getpid()}",
+            cursor_factory=RealDictCursor,
+        )
+        stream.itersize = self.config.processing.batch_size
+        try:
+            stream.execute(query, (list(game_ids),))
+
+            current_game = None
+            events: List[Dict] = []
+            for row in stream:
+                if row["game_id"] != current_game:
+                    if current_game is not None:
+                        yield current_game, events
+                    current_game = row["game_id"]
+                    events = []
+                events.append(self._normalize_event(row))
+
+            if current_game is not None:
+                yield current_game, events
+        finally:
+            stream.close()
+
+    @staticmethod
+    def _possession_to_row(poss: PossessionBoundary) -> Dict[str, Any]:
+        """
+        Convert a PossessionBoundary to a row keyed by POSSESSION_COLUMNS.
+
+        Args:
+            poss: Detected possession
+
+        Returns:
+            Dictionary of column values
+        """
+        # Handle None values for calculated fields
+        try:
+            ppp = poss.calculate_efficiency()
+        except:
+            ppp = None
+
+        try:
+            efg = poss.calculate_efg_percentage()
+        except:
+            efg = None
+
+        return {
+            "game_id": poss.game_id,
+            "season": poss.season,
+            "game_date": poss.game_date,
+            "possession_number": poss.possession_number,
+            "period": poss.period,
+            "offensive_team_id": poss.offensive_team_id,
+            "defensive_team_id": poss.defensive_team_id,
+            "home_team_id": poss.home_team_id,
+            "away_team_id": poss.away_team_id,
+            "start_clock_minutes": poss.start_clock_minutes,
+            "start_clock_seconds": poss.start_clock_seconds,
+            "end_clock_minutes": poss.end_clock_minutes,
+            "end_clock_seconds": poss.end_clock_seconds,
+            "duration_seconds": poss.duration_seconds,
+            "score_differential_start": poss.score_differential_start,
+            "home_score_start": poss.home_score_start,
+            "away_score_start": poss.away_score_start,
+            "home_score_end": poss.home_score_end,
+            "away_score_end": poss.away_score_end,
+            "points_scored": poss.points_scored,
+            "possession_result": poss.possession_result,
+            "field_goals_attempted": poss.field_goals_attempted,
+            "field_goals_made": poss.field_goals_made,
+            "three_pointers_attempted": poss.three_pointers_attempted,
+            "three_pointers_made": poss.three_pointers_made,
+            "free_throws_attempted": poss.free_throws_attempted,
+            "free_throws_made": poss.free_throws_made,
+            "points_per_possession": ppp,
+            "effective_field_goal_pct": efg,
+            "start_event_id": poss.start_event_id,
+            "end_event_id": poss.end_event_id,
+            "event_count": poss.event_count,
+            "is_clutch_time": poss.is_clutch_time,
+            "is_garbage_time": poss.is_garbage_time,
+            "is_fastbreak": poss.is_fastbreak,
+            "has_timeout": poss.has_timeout,
+            "validation_status": poss.validation_status,
+            "validation_notes": poss.validation_notes,
+        }
+
     def write_possessions(self, possessions: List[PossessionBoundary]) -> int:
         """
         Write possessions to database.
@@ -186,97 +371,13 @@ class PossessionExtractor:
         if not possessions:
             return 0
 
-        insert_query = """
-            INSERT INTO temporal_possession_stats (
-                game_id, season, game_date, possession_number, period,
-                offensive_team_id, defensive_team_id, home_team_id, away_team_id,
-                start_clock_minutes, start_clock_seconds,
-                end_clock_minutes, end_clock_seconds, duration_seconds,
-                score_differential_start,
-                home_score_start, away_score_start,
-                home_score_end, away_score_end,
-                points_scored, possession_result,
-                field_goals_attempted, field_goals_made,
-                three_pointers_attempted, three_pointers_made,
-                free_throws_attempted, free_throws_made,
-                points_per_possession, effective_field_goal_pct,
-                start_event_id, end_event_id, event_count,
-                is_clutch_time, is_garbage_time, is_fastbreak, has_timeout,
-                validation_status, validation_notes
-            ) VALUES (
-                %(game_id)s, %(season)s, %(game_date)s, %(possession_number)s, %(period)s,
-                %(offensive_team_id)s, %(defensive_team_id)s, %(home_team_id)s, %(away_team_id)s,
-                %(start_clock_minutes)s, %(start_clock_seconds)s,
-                %(end_clock_minutes)s, %(end_clock_seconds)s, %(duration_seconds)s,
-                %(score_differential_start)s,
-                %(home_score_start)s, %(away_score_start)s,
-                %(home_score_end)s, %(away_score_end)s,
-                %(points_scored)s, %(possession_result)s,
-                %(field_goals_attempted)s, %(field_goals_made)s,
-                %(three_pointers_attempted)s, %(three_pointers_made)s,
-                %(free_throws_attempted)s, %(free_throws_made)s,
-                %(points_per_possession)s, %(effective_field_goal_pct)s,
-                %(start_event_id)s, %(end_event_id)s, %(event_count)s,
-                %(is_clutch_time)s, %(is_garbage_time)s, %(is_fastbreak)s, %(has_timeout)s,
-                %(validation_status)s, %(validation_notes)s
-            )
+        insert_query = f"""
+            INSERT INTO temporal_possession_stats ({", ".join(POSSESSION_COLUMNS)})
+            VALUES ({", ".join(f"%({col})s" for col in POSSESSION_COLUMNS)})
         """
 
         # Convert PossessionBoundary objects to dictionaries
-        possession_dicts = []
-        for poss in possessions:
-            # Handle None values for calculated fields
-            try:
-                ppp = poss.calculate_efficiency()
-            except:
-                ppp = None
-
-            try:
-                efg = poss.calculate_efg_percentage()
-            except:
-                efg = None
-
-            poss_dict = {
-                "game_id": poss.game_id,
-                "season": poss.season,
-                "game_date": poss.game_date,
-                "possession_number": poss.possession_number,
-                "period": poss.period,
-                "offensive_team_id": poss.offensive_team_id,
-                "defensive_team_id": poss.defensive_team_id,
-                "home_team_id": poss.home_team_id,
-                "away_team_id": poss.away_team_id,
-                "start_clock_minutes": poss.start_clock_minutes,
-                "start_clock_seconds": poss.start_clock_seconds,
-                "end_clock_minutes": poss.end_clock_minutes,
-                "end_clock_seconds": poss.end_clock_seconds,
-                "duration_seconds": poss.duration_seconds,
-                "score_differential_start": poss.score_differential_start,
-                "home_score_start": poss.home_score_start,
-                "away_score_start": poss.away_score_start,
-                "home_score_end": poss.home_score_end,
-                "away_score_end": poss.away_score_end,
-                "points_scored": poss.points_scored,
-                "possession_result": poss.possession_result,
-                "field_goals_attempted": poss.field_goals_attempted,
-                "field_goals_made": poss.field_goals_made,
-                "three_pointers_attempted": poss.three_pointers_attempted,
-                "three_pointers_made": poss.three_pointers_made,
-                "free_throws_attempted": poss.free_throws_attempted,
-                "free_throws_made": poss.free_throws_made,
-                "points_per_possession": ppp,
-                "effective_field_goal_pct": efg,
-                "start_event_id": poss.start_event_id,
-                "end_event_id": poss.end_event_id,
-                "event_count": poss.event_count,
-                "is_clutch_time": poss.is_clutch_time,
-                "is_garbage_time": poss.is_garbage_time,
-                "is_fastbreak": poss.is_fastbreak,
-                "has_timeout": poss.has_timeout,
-                "validation_status": poss.validation_status,
-                "validation_notes": poss.validation_notes,
-            }
-            possession_dicts.append(poss_dict)
+        possession_dicts = [self._possession_to_row(poss) for poss in possessions]
 
         # Batch insert
         try:
@@ -289,6 +390,156 @@ class PossessionExtractor:
             logger.error(f"Failed to write possessions: {e}")
             raise
 
+    @classmethod
+    def build_copy_buffer(
+        cls, possessions: Iterable[PossessionBoundary]
+    ) -> io.StringIO:
+        """
+        Serialize possessions as CSV for ``COPY ... FROM STDIN``.
+
+        Args:
+            possessions: Possessions to serialize
+
+        Returns:
+            StringIO positioned at the start of the CSV payload
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        for poss in possessions:
+            row = cls._possession_to_row(poss)
+            writer.writerow(
+                _COPY_NULL if row[col] is None else row[col]
+                for col in POSSESSION_COLUMNS
+            )
+        buffer.seek(0)
+        return buffer
+
+    def write_possessions_copy(self, possessions: List[PossessionBoundary]) -> int:
+        """
+        Write possessions with COPY inside the caller's transaction.
+
+        The caller is responsible for commit/rollback so the write can be
+        made atomic with the matching checkpoint rows.
+
+        Args:
+            possessions: List of PossessionBoundary objects
+
+        Returns:
+            Number of possessions written
+        """
+        if not possessions:
+            return 0
+
+        copy_sql = (
+            f"COPY temporal_possession_stats ({', '.join(POSSESSION_COLUMNS)}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')"
+        )
+        self.cursor.copy_expert(copy_sql, self.build_copy_buffer(possessions))
+        logger.debug(f"Copied {len(possessions)} possessions to database")
+        return len(possessions)
+
+    # =========================================================================
+    # Checkpointing
+    # =========================================================================
+
+    def ensure_checkpoint_table(self):
+        """Create the per-game checkpoint table if it does not exist."""
+        self.cursor.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} (
+                game_id VARCHAR(50) PRIMARY KEY,
+                status VARCHAR(20) NOT NULL,
+                possessions_written INTEGER NOT NULL DEFAULT 0,
+                events_processed INTEGER NOT NULL DEFAULT 0,
+                worker_id INTEGER,
+                completed_at TIMESTAMP NOT NULL DEFAULT NOW()
+            )
+            """
+        )
+        self.conn.commit()
+
+    def get_completed_games(self) -> Set[str]:
+        """
+        Get game IDs already extracted by a previous run.
+
+        Games checkpointed as "empty" (no events or no possessions yet) are
+        not included, so they are retried once their play-by-play arrives.
+
+        Returns:
+            Set of completed game_id strings
+        """
+        self.cursor.execute(
+            f"SELECT game_id FROM {CHECKPOINT_TABLE} WHERE status = 'completed'"
+        )
+        return {row["game_id"] for row in self.cursor.fetchall()}
+
+    def clear_checkpoints(self):
+        """Remove all checkpoints so the next run reprocesses every game."""
+        self.cursor.execute(f"TRUNCATE {CHECKPOINT_TABLE}")
+        self.conn.commit()
+        logger.info("Possession extraction checkpoints cleared")
+
+    def _record_checkpoints(self, rows: List[Tuple[str, str, int, int]]):
+        """
+        Upsert checkpoint rows inside the caller's transaction.
+
+        Args:
+            rows: Tuples of (game_id, status, possessions_written, events_processed)
+        """
+        if not rows:
+            return
+
+        execute_values(
+            self.cursor,
+            f"""
+            INSERT INTO {CHECKPOINT_TABLE} (
+                game_id, status, possessions_written, events_processed, worker_id
+            ) VALUES %s
+            ON CONFLICT (game_id) DO UPDATE SET
+                status = EXCLUDED.status,
+                possessions_written = EXCLUDED.possessions_written,
+                events_processed = EXCLUDED.events_processed,
+                worker_id = EXCLUDED.worker_id,
+                completed_at = NOW()
+            """,
+            [row + (self.worker_id,) for row in rows],
+        )
+
+    def _commit_games(
+        self,
+        possessions: List[PossessionBoundary],
+        checkpoints: List[Tuple[str, str, int, int]],
+    ):
+        """
+        Atomically replace possessions for the given games and checkpoint them.
+
+        Existing rows for the games are deleted first so a game left behind
+        by an older, non-checkpointed run is never duplicated.
+
+        Args:
+            possessions: Possessions for every game in ``checkpoints``
+            checkpoints: Checkpoint rows to record
+        """
+        if not checkpoints:
+            return
+
+        game_ids = [row[0] for row in checkpoints]
+        try:
+            self.cursor.execute(
+                "DELETE FROM temporal_possession_stats WHERE game_id = ANY(%s)",
+                (game_ids,),
+            )
+            self.write_possessions_copy(possessions)
+            self._record_checkpoints(checkpoints)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    # =========================================================================
+    # Processing
+    # =========================================================================
+
     def process_game(self, game_id: str) -> Tuple[bool, int]:
         """
         Process a single game: extract events, detect possessions, write to DB.
@@ -333,48 +584,173 @@ class PossessionExtractor:
             self.stats["games_failed"] += 1
             return False, 0
 
+    def process_games(self, game_ids: List[str]) -> Dict[str, int]:
+        """
+        Process a chunk of games with one events query and one COPY.
+
+        Possessions and checkpoints for the whole chunk are committed in a
+        single transaction. If that write fails, each game is retried in its
+        own transaction so one bad game cannot block the rest of the chunk.
+        Games that fail detection are not checkpointed and are retried on
+        the next run.
+
+        Args:
+            game_ids: Game identifiers to process
+
+        Returns:
+            Dictionary with games, possessions and events counts for the chunk
+        """
+        result = {"games": 0, "failed": 0, "possessions": 0, "events": 0}
+        per_game: Dict[str, List[PossessionBoundary]] = {}
+        checkpoints: List[Tuple[str, str, int, int]] = []
+        seen: Set[str] = set()
+
+        try:
+            for game_id, events in self.iter_events_for_games(game_ids):
+                seen.add(game_id)
+                result["events"] += len(events)
+                try:
+                    possessions = self.detector.detect_possessions(events)
+                except Exception as e:
+                    logger.error(f"Failed to detect possessions for {game_id}: {e}")
+                    result["failed"] += 1
+                    continue
+
+                if not possessions:
+                    logger.warning(f"No possessions detected for game {game_id}")
+                    checkpoints.append((game_id, "empty", 0, len(events)))
+                    continue
+
+                per_game[game_id] = possessions
+                checkpoints.append(
+                    (game_id, "completed", len(possessions), len(events))
+                )
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Failed to read events for chunk: {e}", exc_info=True)
+            failed = {"games": 0, "failed": len(game_ids), "possessions": 0}
+            return self._finish_chunk({**failed, "events": 0})
+
+        for game_id in game_ids:
+            if game_id not in seen:
+                logger.warning(f"No events found for game {game_id}")
+                checkpoints.append((game_id, "empty", 0, 0))
+
+        all_possessions = [p for poss in per_game.values() for p in poss]
+        try:
+            self._commit_games(all_possessions, checkpoints)
+            result["games"] += len(per_game)
+            result["possessions"] += len(all_possessions)
+        except Exception as e:
+            logger.warning(f"Chunk write failed ({e}) - retrying games individually")
+            for row in checkpoints:
+                possessions = per_game.get(row[0], [])
+                try:
+                    self._commit_games(possessions, [row])
+                except Exception as game_error:
+                    logger.error(f"Failed to write game {row[0]}: {game_error}")
+                    result["failed"] += 1
+                    continue
+                if possessions:
+                    result["games"] += 1
+                    result["possessions"] += len(possessions)
+
+        return self._finish_chunk(result)
+
+    def _finish_chunk(self, result: Dict[str, int]) -> Dict[str, int]:
+        """Fold a chunk result into the running statistics."""
+        self.stats["games_processed"] += result["games"]
+        self.stats["games_failed"] += result["failed"]
+        self.stats["possessions_extracted"] += result["possessions"]
+        self.stats["events_processed"] += result["events"]
+        return result
+
+    def get_pending_games(
+        self, limit: Optional[int] = None, resume: bool = True
+    ) -> List[str]:
+        """
+        Get games that still need extraction.
+
+        Args:
+            limit: Optional limit on number of games
+            resume: Skip games recorded in the checkpoint table
+
+        Returns:
+            List of game_id strings
+        """
+        self.ensure_checkpoint_table()
+        if not resume:
+            self.clear_checkpoints()
+
+        games = self.get_game_list(limit)
+        if resume:
+            completed = self.get_completed_games()
+            if completed:
+                before = len(games)
+                games = [g for g in games if g not in completed]
+                self.stats["games_skipped"] = before - len(games)
+                logger.info(
+                    f"Resuming: {self.stats['games_skipped']:,} games already "
+                    f"checkpointed, {len(games):,} remaining"
+                )
+        return games
+
     def extract_all_games(
-        self, limit: Optional[int] = None, resume_from: Optional[str] = None
+        self,
+        limit: Optional[int] = None,
+        resume: bool = True,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
     ) -> Dict:
         """
         Extract possessions for all games in database.
 
+        Games already present in the checkpoint table are skipped, so an
+        interrupted run picks up exactly where it stopped.
+
         Args:
             limit: Optional limit on number of games to process
-            resume_from: Optional game_id to resume from
+            resume: Skip checkpointed games (False clears checkpoints first)
+            workers: Worker processes (default: config.processing.parallel_games)
+            chunk_size: Games fetched per events query
 
         Returns:
             Dictionary with extraction statistics
         """
-        self.stats["start_time"] = datetime.now()
+        workers = workers or self.config.processing.parallel_games
+        chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
 
-        logger.info("Starting possession extraction for all games")
+        if workers > 1:
+            from .parallel import ParallelPossessionExtractor
 
-        # Get game list
-        games = self.get_game_list(limit)
-
-        # Resume from checkpoint if provided
-        if resume_from and resume_from in games:
-            resume_idx = games.index(resume_from)
-            games = games[resume_idx:]
-            logger.info(
-                f"Resuming from game {resume_from} ({resume_idx} games skipped)"
+            parallel = ParallelPossessionExtractor(
+                self.config, workers=workers, chunk_size=chunk_size
             )
+            games = self.get_pending_games(limit, resume=resume)
+            self.stats = parallel.run(games, skipped=self.stats["games_skipped"])
+            self._log_final_report()
+            return self.stats
 
-        total_games = len(games)
+        self.stats["start_time"] = datetime.now()
 
-        # Process games
-        for i, game_id in enumerate(games, 1):
-            logger.info(f"Processing game {i}/{total_games}: {game_id}")
+        logger.info("Starting possession extraction for all games")
 
-            success, num_possessions = self.process_game(game_id)
+        # Get game list, minus checkpointed games
+        games = self.get_pending_games(limit, resume=resume)
+        total_games = len(games)
 
-            if not success:
-                logger.warning(f"Game {game_id} processing failed - continuing")
+        # Process games in chunks
+        done = 0
+        chunks_done = 0
+        for start in range(0, total_games, chunk_size):
+            chunk = games[start : start + chunk_size]
+            self.process_games(chunk)
+            done += len(chunk)
+            chunks_done += 1
 
-            # Progress reporting every 10 games
-            if i % 10 == 0:
-                self._log_progress(i, total_games)
+            # Progress reporting every 10 chunks
+            if chunks_done % 10 == 0:
+                self._log_progress(done, total_games)
 
         self.stats["end_time"] = datetime.now()
 
@@ -388,16 +764,18 @@ class PossessionExtractor:
         pct = (current / total) * 100
         elapsed = (datetime.now() - self.stats["start_time"]).total_seconds()
         rate = current / elapsed if elapsed > 0 else 0
+        event_rate = self.stats["events_processed"] / elapsed if elapsed > 0 else 0
 
         logger.info(
             f"Progress: {current}/{total} ({pct:.1f}%) | "
             f"{self.stats['possessions_extracted']:,} possessions | "
-            f"{rate:.1f} games/sec"
+            f"{rate:.1f} games/sec | {event_rate:,.0f} events/sec"
         )
 
     def _log_final_report(self):
         """Log final extraction report."""
         elapsed = (self.stats["end_time"] - self.stats["start_time"]).total_seconds()
+        elapsed = max(elapsed, 1e-9)
 
         logger.info("")
         logger.info("=" * 60)
@@ -405,10 +783,23 @@ class PossessionExtractor:
         logger.info("=" * 60)
         logger.info(f"Total games processed: {self.stats['games_processed']:,}")
         logger.info(f"Total games failed: {self.stats['games_failed']:,}")
+        logger.info(
+            f"Total games skipped (checkpointed): {self.stats['games_skipped']:,}"
+        )
         logger.info(
             f"Total possessions extracted: {self.stats['possessions_extracted']:,}"
         )
         logger.info(f"Total events processed: {self.stats['events_processed']:,}")
         logger.info(f"Total time: {elapsed:.1f} seconds")
         logger.info(f"Average: {self.stats['games_processed']/elapsed:.1f} games/sec")
+        logger.info(
+            f"Average: {self.stats['events_processed']/elapsed:,.0f} events/sec"
+        )
+        for worker in self.stats.get("workers", []):
+            logger.info(
+                f"  Worker {worker['worker_id']}: "
+                f"{worker['games_processed']:,} games, "
+                f"{worker['games_per_sec']:.1f} games/sec, "
+                f"{worker['events_per_sec']:,.0f} events/sec"
+            )
         logger.info("=" * 60)
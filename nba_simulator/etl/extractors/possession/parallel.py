@@ -0,0 +1,206 @@
+"""
+Phase 0.0005: Possession Extraction - Parallel Extraction Engine
+
+Multi-process possession extraction for full temporal_events backfills:
+- Shards the pending game list across worker processes
+- Each worker owns its own database connection
+- Events are streamed per chunk of games with a single query
+- Possessions are written with COPY, atomically with per-game checkpoints
+- Per-worker games/sec and events/sec reporting
+
+Author: NBA Simulator AWS Team
+Created: November 5, 2025
+"""
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .config import PossessionConfig
+from .extractor import PossessionExtractor
+
+logger = logging.getLogger(__name__)
+
+
+def shard_games(games: List[str], workers: int) -> List[List[str]]:
+    """
+    Split games across workers round-robin.
+
+    Round-robin (rather than contiguous ranges) keeps shards balanced when
+    game IDs cluster by season and event counts drift over time.
+
+    Args:
+        games: Ordered game IDs
+        workers: Number of shards
+
+    Returns:
+        List of non-empty shards
+    """
+    shards = [games[i::workers] for i in range(max(workers, 1))]
+    return [shard for shard in shards if shard]
+
+
+def run_worker(
+    config: PossessionConfig, worker_id: int, game_ids: List[str], chunk_size: int
+) -> Dict:
+    """
+    Extract possessions for one shard of games.
+
+    Runs in a child process, so it opens its own connection and returns a
+    plain dictionary of statistics.
+
+    Args:
+        config: Possession extraction configuration
+        worker_id: Worker number (recorded on checkpoint rows)
+        game_ids: Games assigned to this worker
+        chunk_size: Games per events query / COPY transaction
+
+    Returns:
+        Worker statistics including games/sec and events/sec
+    """
+    extractor = PossessionExtractor(config, worker_id=worker_id)
+    started = time.perf_counter()
+
+    if not extractor.connect():
+        return _worker_summary(
+            worker_id,
+            {**extractor.stats, "games_failed": len(game_ids)},
+            time.perf_counter() - started,
+        )
+
+    try:
+        for start in range(0, len(game_ids), chunk_size):
+            chunk = game_ids[start : start + chunk_size]
+            extractor.process_games(chunk)
+
+            elapsed = time.perf_counter() - started
+            logger.info(
+                f"Worker {worker_id}: "
+                f"{min(start + chunk_size, len(game_ids))}/{len(game_ids)} games | "
+                f"{extractor.stats['games_processed'] / elapsed:.1f} games/sec | "
+                f"{extractor.stats['events_processed'] / elapsed:,.0f} events/sec"
+            )
+    finally:
+        extractor.disconnect()
+
+    return _worker_summary(worker_id, extractor.stats, time.perf_counter() - started)
+
+
+def _worker_summary(worker_id: int, stats: Dict, elapsed: float) -> Dict:
+    """Build the per-worker statistics dictionary."""
+    elapsed = max(elapsed, 1e-9)
+    return {
+        "worker_id": worker_id,
+        "games_processed": stats["games_processed"],
+        "games_failed": stats["games_failed"],
+        "possessions_extracted": stats["possessions_extracted"],
+        "events_processed": stats["events_processed"],
+        "elapsed_seconds": elapsed,
+        "games_per_sec": stats["games_processed"] / elapsed,
+        "events_per_sec": stats["events_processed"] / elapsed,
+    }
+
+
+class ParallelPossessionExtractor:
+    """
+    Runs possession extraction across a pool of worker processes.
+
+    Resume is driven by the checkpoint table maintained by
+    PossessionExtractor: callers pass the list of pending games (see
+    PossessionExtractor.get_pending_games) and a crashed run simply
+    restarts with the games that were never committed.
+
+    Usage:
+        config = load_config()
+        extractor = PossessionExtractor(config)
+        extractor.connect()
+        games = extractor.get_pending_games()
+
+        parallel = ParallelPossessionExtractor(config, workers=8)
+        stats = parallel.run(games)
+    """
+
+    def __init__(
+        self,
+        config: PossessionConfig,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        """
+        Initialize parallel extractor.
+
+        Args:
+            config: Possession extraction configuration
+            workers: Worker processes (default: config.processing.parallel_games)
+            chunk_size: Games per events query / COPY transaction
+        """
+        self.config = config
+        self.workers = workers or config.processing.parallel_games
+        self.chunk_size = chunk_size or PossessionExtractor.DEFAULT_CHUNK_SIZE
+
+    def run(self, games: List[str], skipped: int = 0) -> Dict:
+        """
+        Extract possessions for the given games.
+
+        Args:
+            games: Pending game IDs
+            skipped: Games skipped because they were already checkpointed
+
+        Returns:
+            Aggregated statistics with a per-worker breakdown under "workers"
+        """
+        stats = {
+            "games_processed": 0,
+            "games_failed": 0,
+            "games_skipped": skipped,
+            "possessions_extracted": 0,
+            "events_processed": 0,
+            "start_time": datetime.now(),
+            "end_time": None,
+            "workers": [],
+        }
+
+        shards = shard_games(games, self.workers)
+        logger.info(
+            f"Starting parallel possession extraction: {len(games):,} games "
+            f"across {len(shards)} workers ({self.chunk_size} games/chunk)"
+        )
+
+        if shards:
+            with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+                futures = {
+                    pool.submit(
+                        run_worker, self.config, worker_id, shard, self.chunk_size
+                    ): worker_id
+                    for worker_id, shard in enumerate(shards)
+                }
+                for future in as_completed(futures):
+                    worker_id = futures[future]
+                    try:
+                        summary = future.result()
+                    except Exception as e:
+                        logger.error(f"Worker {worker_id} crashed: {e}")
+                        stats["games_failed"] += len(shards[worker_id])
+                        continue
+
+                    stats["workers"].append(summary)
+                    for key in (
+                        "games_processed",
+                        "games_failed",
+                        "possessions_extracted",
+                        "events_processed",
+                    ):
+                        stats[key] += summary[key]
+                    logger.info(
+                        f"Worker {worker_id} finished: "
+                        f"{summary['games_processed']:,} games, "
+                        f"{summary['games_per_sec']:.1f} games/sec, "
+                        f"{summary['events_per_sec']:,.0f} events/sec"
+                    )
+
+        stats["workers"].sort(key=lambda w: w["worker_id"])
+        stats["end_time"] = datetime.now()
+
+        return stats
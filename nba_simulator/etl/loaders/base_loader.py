@@ -20,6 +20,7 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
+import asyncio
 import logging
 import json
 import time
@@ -49,6 +50,8 @@ class LoadMetrics:
     records_attempted: int = 0
     records_loaded: int = 0
     records_failed: int = 0
+    records_inserted: int = 0  # Upserts that added a new row
+    records_updated: int = 0  # Upserts that changed an existing row
     batches_processed: int = 0
     batches_failed: int = 0
     
@@ -152,7 +155,8 @@ class BaseLoader(ABC):
         batch_size: int = 1000,
         max_retries: int = 3,
         retry_delay: float = 1.0,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        concurrency: int = 1
     ):
         """
         Initialize base loader.
@@ -162,11 +166,16 @@ class BaseLoader(ABC):
             max_retries: Maximum retry attempts
             retry_delay: Seconds between retries
             config: Additional configuration
+            concurrency: Batches loaded concurrently (1 = sequential)
         """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        
         self.batch_size = batch_size
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.config = config or {}
+        self.concurrency = concurrency
         
         # Setup logging
         self.logger = setup_logging(
@@ -183,6 +192,7 @@ class BaseLoader(ABC):
         self.logger.info(f"Initialized {self.__class__.__name__}")
         self.logger.info(f"Batch size: {self.batch_size:,}")
         self.logger.info(f"Max retries: {self.max_retries}")
+        self.logger.info(f"Concurrency: {self.concurrency}")
     
     @abstractmethod
     async def validate_input(self, data: Any) -> Tuple[bool, str]:
@@ -303,44 +313,63 @@ class BaseLoader(ABC):
             return self.metrics
     
     async def _load_batches(self, data: List[Any]):
-        """Load data in batches with retry logic"""
+        """
+        Load data in batches with retry logic.
+        
+        With concurrency > 1, that many workers pull batches from one shared
+        iterator, so at most `concurrency` batches are in flight at a time.
+        """
         total_batches = (len(data) + self.batch_size - 1) // self.batch_size
+        batches = (
+            (i // self.batch_size + 1, data[i:i + self.batch_size])
+            for i in range(0, len(data), self.batch_size)
+        )
         
-        for i in range(0, len(data), self.batch_size):
-            batch_num = i // self.batch_size + 1
-            batch = data[i:i + self.batch_size]
-            
-            self.logger.info(f"Loading batch {batch_num}/{total_batches} ({len(batch)} records)...")
-            
-            # Retry logic
-            for attempt in range(1, self.max_retries + 1):
-                try:
-                    loaded, failed = await self.load_batch(batch)
-                    self.metrics.records_loaded += loaded
-                    self.metrics.records_failed += failed
-                    self.metrics.batches_processed += 1
-                    
-                    if failed > 0:
-                        self.logger.warning(f"Batch {batch_num}: {failed} records failed")
-                    
-                    # Success - break retry loop
-                    break
-                    
-                except Exception as e:
-                    self.logger.error(f"Batch {batch_num} attempt {attempt} failed: {e}")
-                    
-                    if attempt == self.max_retries:
-                        # Final attempt failed
-                        self.metrics.batches_failed += 1
-                        self.metrics.records_failed += len(batch)
-                        self.logger.error(f"Batch {batch_num} failed after {self.max_retries} attempts")
-                    else:
-                        # Retry after delay
-                        await self._async_sleep(self.retry_delay * attempt)
-            
-            # Log progress every 10 batches
-            if batch_num % 10 == 0:
-                self._log_progress(batch_num, total_batches)
+        if self.concurrency == 1:
+            for batch_num, batch in batches:
+                await self._load_batch_with_retry(batch_num, total_batches, batch)
+            return
+        
+        async def worker():
+            for batch_num, batch in batches:
+                await self._load_batch_with_retry(batch_num, total_batches, batch)
+        
+        workers = min(self.concurrency, total_batches)
+        await asyncio.gather(*(worker() for _ in range(workers)))
+    
+    async def _load_batch_with_retry(self, batch_num: int, total_batches: int, batch: List[Any]):
+        """Load one batch, retrying failed attempts"""
+        self.logger.info(f"Loading batch {batch_num}/{total_batches} ({len(batch)} records)...")
+        
+        # Retry logic
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                loaded, failed = await self.load_batch(batch)
+                self.metrics.records_loaded += loaded
+                self.metrics.records_failed += failed
+                self.metrics.batches_processed += 1
+                
+                if failed > 0:
+                    self.logger.warning(f"Batch {batch_num}: {failed} records failed")
+                
+                # Success - break retry loop
+                break
+                
+            except Exception as e:
+                self.logger.error(f"Batch {batch_num} attempt {attempt} failed: {e}")
+                
+                if attempt == self.max_retries:
+                    # Final attempt failed
+                    self.metrics.batches_failed += 1
+                    self.metrics.records_failed += len(batch)
+                    self.logger.error(f"Batch {batch_num} failed after {self.max_retries} attempts")
+                else:
+                    # Retry after delay
+                    await self._async_sleep(self.retry_delay * attempt)
+        
+        # Log progress every 10 batches
+        if batch_num % 10 == 0:
+            self._log_progress(batch_num, total_batches)
     
     def _log_progress(self, batch_num: int, total_batches: int):
         """Log loading progress"""
@@ -366,6 +395,9 @@ class BaseLoader(ABC):
         self.logger.info(f"Records attempted: {self.metrics.records_attempted:,}")
         self.logger.info(f"Records loaded: {self.metrics.records_loaded:,}")
         self.logger.info(f"Records failed: {self.metrics.records_failed:,}")
+        if self.metrics.records_inserted or self.metrics.records_updated:
+            self.logger.info(f"Records inserted: {self.metrics.records_inserted:,}")
+            self.logger.info(f"Records updated: {self.metrics.records_updated:,}")
         self.logger.info(f"Batches processed: {self.metrics.batches_processed:,}")
         self.logger.info(f"Batches failed: {self.metrics.batches_failed:,}")
         self.logger.info(f"Duration: {self.metrics.duration_seconds:.1f} seconds")
@@ -377,7 +409,6 @@ class BaseLoader(ABC):
     
     async def _async_sleep(self, seconds: float):
         """Async sleep for retry delays"""
-        import asyncio
         await asyncio.sleep(seconds)
 
 
@@ -8,8 +8,10 @@ Loads data to PostgreSQL RDS across 4 schemas:
 - raw_data: Staging area (5 tables)
 
 Features:
-- Bulk COPY for fast loading (100K+ rows/sec)
-- Upsert support (INSERT ... ON CONFLICT)
+- Bulk binary COPY for fast loading (100K+ rows/sec)
+- Pooled mode: concurrent batches over an asyncpg pool
+- Upsert support: COPY into a staging table, then one set-based
+  INSERT ... SELECT ... ON CONFLICT per batch
 - Transaction management
 - Automatic table creation
 - Index management
@@ -20,11 +22,12 @@ Based on proven patterns from:
 - scripts/db/load_hoopr_to_rds.py
 """
 
+from contextlib import asynccontextmanager
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+import asyncio
 import json
-import io
 import asyncpg
 
 from .base_loader import BaseLoader, LoadStatus, transaction_manager
@@ -38,14 +41,26 @@ class RDSLoader(BaseLoader):
     
     Optimized for loading large datasets (millions of rows).
     Uses COPY command for 10-100x faster loading vs INSERT.
+    
+    With concurrency > 1 the loader runs in pooled mode: batches are
+    loaded concurrently, each on its own connection acquired from an
+    asyncpg pool sized to the concurrency.
+    
+    Usage:
+        loader = RDSLoader('games', upsert=False, concurrency=4)
+        metrics = await loader.load(records)
     """
     
+    UPSERT_METHODS = ('staging', 'insert')
+    
     def __init__(
         self,
         table_name: str,
         schema: str = 'public',
         upsert: bool = True,
+        upsert_method: str = 'staging',
         create_table: bool = False,
+        db_config: Optional[Dict[str, Any]] = None,
         **kwargs
     ):
         """
@@ -55,31 +70,71 @@ class RDSLoader(BaseLoader):
             table_name: Target table name
             schema: Schema name (public, odds, rag, raw_data)
             upsert: Use UPSERT (ON CONFLICT) instead of INSERT
+            upsert_method: 'staging' (COPY to a temp table + one merge
+                statement per batch) or 'insert' (executemany INSERT ... ON CONFLICT)
             create_table: Create table if doesn't exist
-            **kwargs: Additional BaseLoader arguments
+            db_config: asyncpg connection parameters (default: project database config)
+            **kwargs: Additional BaseLoader arguments (batch_size, concurrency, ...)
         """
         super().__init__(**kwargs)
         
+        if upsert_method not in self.UPSERT_METHODS:
+            raise ValueError(
+                f"upsert_method must be one of {self.UPSERT_METHODS}, got {upsert_method!r}"
+            )
+        
         self.table_name = table_name
         self.schema = schema
         self.full_table_name = f"{schema}.{table_name}"
         self.upsert = upsert
+        self.upsert_method = upsert_method
+        self.staging_table = f"_staging_{table_name}"
         self.create_table_if_missing = create_table
+        self.db_config = db_config
         
-        # Database connection (will be initialized)
+        # Database connection / pool (will be initialized)
         self.conn = None
         self.pool = None
+        self.pooled = self.concurrency > 1
+        self._pool_lock = asyncio.Lock()
         
         self.logger.info(f"Target table: {self.full_table_name}")
-        self.logger.info(f"Upsert mode: {self.upsert}")
+        self.logger.info(f"Upsert mode: {self.upsert} ({self.upsert_method})")
+        self.logger.info(f"Pooled mode: {self.pooled}")
+    
+    def _connection_params(self) -> Dict[str, Any]:
+        """asyncpg connection parameters"""
+        if self.db_config is not None:
+            return self.db_config
+        return config.load_database_config()
     
     async def _get_connection(self):
-        """Get database connection from pool"""
+        """Get the loader's single database connection"""
         if self.conn is None:
-            db_config = config.load_database_config()
-            self.conn = await asyncpg.connect(**db_config)
+            self.conn = await asyncpg.connect(**self._connection_params())
         return self.conn
     
+    async def _get_pool(self):
+        """Get the connection pool (one connection per concurrent batch)"""
+        async with self._pool_lock:
+            if self.pool is None:
+                self.pool = await asyncpg.create_pool(
+                    min_size=1,
+                    max_size=self.concurrency,
+                    **self._connection_params()
+                )
+        return self.pool
+    
+    @asynccontextmanager
+    async def _acquire(self):
+        """Yield a connection: from the pool in pooled mode, else the single connection"""
+        if self.pooled:
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                yield conn
+        else:
+            yield await self._get_connection()
+    
     async def validate_input(self, data: Any) -> Tuple[bool, str]:
         """
         Validate input data.
@@ -105,8 +160,8 @@ class RDSLoader(BaseLoader):
             return False, "Data must be list of dicts or dict of lists"
         
         # Check table exists (or will be created)
-        conn = await self._get_connection()
-        exists = await self._table_exists(conn)
+        async with self._acquire() as conn:
+            exists = await self._table_exists(conn)
         
         if not exists and not self.create_table_if_missing:
             return False, f"Table {self.full_table_name} does not exist"
@@ -149,15 +204,17 @@ class RDSLoader(BaseLoader):
         if not batch:
             return 0, 0
         
-        conn = await self._get_connection()
-        
         try:
-            if self.upsert:
-                # Use INSERT with ON CONFLICT
-                return await self._load_batch_upsert(conn, batch)
-            else:
-                # Use fast COPY
-                return await self._load_batch_copy(conn, batch)
+            async with self._acquire() as conn:
+                if self.upsert and self.upsert_method == 'staging':
+                    # COPY to staging table, merge with one statement
+                    return await self._load_batch_staged_upsert(conn, batch)
+                elif self.upsert:
+                    # Use INSERT with ON CONFLICT
+                    return await self._load_batch_upsert(conn, batch)
+                else:
+                    # Use fast COPY
+                    return await self._load_batch_copy(conn, batch)
                 
         except Exception as e:
             self.logger.error(f"Batch load failed: {e}")
@@ -169,7 +226,11 @@ class RDSLoader(BaseLoader):
         batch: List[Dict[str, Any]]
     ) -> Tuple[int, int]:
         """
-        Load batch using COPY command (fastest method).
+        Load batch using binary COPY (fastest method).
+        
+        Records are sent as native Python values in PostgreSQL's binary
+        COPY format, so values must match the column types (datetime for
+        timestamps, str or dict-as-JSON-string for JSONB, ...).
         
         Args:
             conn: Database connection
@@ -183,32 +244,15 @@ class RDSLoader(BaseLoader):
         
         # Get columns from first record
         columns = list(batch[0].keys())
-        column_list = ", ".join(columns)
-        
-        # Create CSV in memory
-        output = io.StringIO()
-        for row in batch:
-            csv_row = []
-            for col in columns:
-                value = row.get(col)
-                if value is None:
-                    csv_row.append("")
-                else:
-                    # Escape for CSV
-                    value_str = str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
-                    csv_row.append(value_str)
-            output.write("\t".join(csv_row) + "\n")
-        
-        output.seek(0)
+        records = [tuple(row.get(col) for col in columns) for row in batch]
         
         # Execute COPY
         try:
-            result = await conn.copy_to_table(
+            result = await conn.copy_records_to_table(
                 self.table_name,
-                source=output,
-                schema_name=self.schema,
+                records=records,
                 columns=columns,
-                format='text'
+                schema_name=self.schema
             )
             
             # Parse result (format: "COPY N")
@@ -219,6 +263,85 @@ class RDSLoader(BaseLoader):
             self.logger.error(f"COPY failed: {e}")
             return 0, len(batch)
     
+    async def _load_batch_staged_upsert(
+        self,
+        conn: asyncpg.Connection,
+        batch: List[Dict[str, Any]]
+    ) -> Tuple[int, int]:
+        """
+        Load batch by COPYing into a staging table and merging (upsert).
+        
+        The staging table is a session temp table (no WAL) shaped like the
+        target and emptied on commit. One INSERT ... SELECT ... ON CONFLICT
+        merges the whole batch; `xmax = 0` on the returned rows tells
+        inserts from updates, which are added to the load metrics.
+        
+        Falls back to the executemany upsert if the merge fails.
+        
+        Args:
+            conn: Database connection
+            batch: Records to load
+            
+        Returns:
+            (loaded, failed)
+        """
+        if not batch:
+            return 0, 0
+        
+        # Get columns
+        # Assumes first column is primary key
+        columns = list(batch[0].keys())
+        pk_column = columns[0]
+        
+        # A key may only be merged once per statement: last record wins,
+        # as with row-by-row upserts
+        latest = {row[pk_column]: row for row in batch}
+        records = [tuple(row.get(col) for col in columns) for row in latest.values()]
+        
+        try:
+            async with conn.transaction():
+                await conn.execute(
+                    f"""
+                    CREATE TEMP TABLE IF NOT EXISTS {self.staging_table}
+                    (LIKE {self.full_table_name} INCLUDING DEFAULTS)
+                    ON COMMIT DELETE ROWS
+                    """
+                )
+                await conn.copy_records_to_table(
+                    self.staging_table,
+                    records=records,
+                    columns=columns
+                )
+                counts = await conn.fetchrow(self._merge_query(columns))
+            
+        except Exception as e:
+            self.logger.error(f"Staged UPSERT failed, falling back to INSERT: {e}")
+            return await self._load_batch_upsert(conn, batch)
+        
+        self.metrics.records_inserted += counts['inserted']
+        self.metrics.records_updated += counts['updated']
+        return len(batch), 0
+    
+    def _merge_query(self, columns: List[str]) -> str:
+        """Set-based merge of the staging table into the target table"""
+        column_list = ", ".join(columns)
+        pk_column = columns[0]
+        update_list = ", ".join([f"{col} = EXCLUDED.{col}" for col in columns[1:]])
+        on_conflict = f"DO UPDATE SET {update_list}" if update_list else "DO NOTHING"
+        
+        return f"""
+            WITH merged AS (
+                INSERT INTO {self.full_table_name} ({column_list})
+                SELECT {column_list} FROM {self.staging_table}
+                ON CONFLICT ({pk_column}) {on_conflict}
+                RETURNING (xmax = 0) AS inserted
+            )
+            SELECT
+                COUNT(*) FILTER (WHERE inserted) AS inserted,
+                COUNT(*) FILTER (WHERE NOT inserted) AS updated
+            FROM merged
+        """
+    
     async def _load_batch_upsert(
         self,
         conn: asyncpg.Connection,
@@ -287,12 +410,11 @@ class RDSLoader(BaseLoader):
         Returns:
             True if count matches
         """
-        conn = await self._get_connection()
-        
         try:
-            result = await conn.fetchval(
-                f"SELECT COUNT(*) FROM {self.full_table_name}"
-            )
+            async with self._acquire() as conn:
+                result = await conn.fetchval(
+                    f"SELECT COUNT(*) FROM {self.full_table_name}"
+                )
             
             if result >= expected_count:
                 self.logger.info(f"✓ Verification passed: {result:,} records in table")
@@ -308,10 +430,13 @@ class RDSLoader(BaseLoader):
             return False
     
     async def cleanup(self):
-        """Close database connection"""
+        """Close database connection and pool"""
         if self.conn:
             await self.conn.close()
             self.conn = None
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
     
     async def _table_exists(self, conn: asyncpg.Connection) -> bool:
         """Check if table exists"""
@@ -337,23 +462,22 @@ class RDSLoader(BaseLoader):
                 - columns: List of column names
                 - unique: Whether index is unique (optional)
         """
-        conn = await self._get_connection()
-        
-        for idx_def in index_definitions:
-            idx_name = idx_def['name']
-            columns = ", ".join(idx_def['columns'])
-            unique = "UNIQUE" if idx_def.get('unique', False) else ""
-            
-            query = f"""
-                CREATE {unique} INDEX IF NOT EXISTS {idx_name}
-                ON {self.full_table_name} ({columns})
-            """
-            
-            try:
-                await conn.execute(query)
-                self.logger.info(f"✓ Created index: {idx_name}")
-            except Exception as e:
-                self.logger.warning(f"⚠️  Index {idx_name} creation failed: {e}")
+        async with self._acquire() as conn:
+            for idx_def in index_definitions:
+                idx_name = idx_def['name']
+                columns = ", ".join(idx_def['columns'])
+                unique = "UNIQUE" if idx_def.get('unique', False) else ""
+                
+                query = f"""
+                    CREATE {unique} INDEX IF NOT EXISTS {idx_name}
+                    ON {self.full_table_name} ({columns})
+                """
+                
+                try:
+                    await conn.execute(query)
+                    self.logger.info(f"✓ Created index: {idx_name}")
+                except Exception as e:
+                    self.logger.warning(f"⚠️  Index {idx_name} creation failed: {e}")
 
 
 class TemporalEventsLoader(RDSLoader):
@@ -51,65 +51,46 @@ Usage:
     )
 """
 
-from .dims import DIMS, DIMSCore, DIMSCache
-from .quality import (
-    QualityMonitor,
-    QualityStatus,
-    QualityMetric,
-    DataQualityChecker,
-    DataQualityConfig,
-    QualityMetricsTracker,
-    QualityThreshold,
-    QualityReportGenerator,
-    ReportFormat,
-)
-from .alerts import (
-    AlertManager,
-    AlertConfig,
-    EmailNotifier,
-    SlackNotifier,
-    WebhookNotifier,
-    NotificationChannel,
-    AlertDeduplicator,
-    EscalationPolicy,
-    AlertHistory,
-)
+from ..utils.lazy import lazy_exports
 
-# TODO: Fix health and telemetry module imports
-# from .health import HealthMonitor, ScraperHealthCheck
-# from .telemetry import TelemetryCollector, MetricsPublisher
-
-__all__ = [
-    # DIMS
-    "DIMS",
-    "DIMSCore",
-    "DIMSCache",
+# Public name -> defining submodule. Submodules load on first attribute
+# access, so importing one component does not pull in boto3/psycopg2 for
+# the others.
+_EXPORTS = {
+    # DIMS (DIMSCore is the DIMS entry point: verify_all_metrics, get_metric, ...)
+    "DIMS": ".dims:DIMSCore",
+    "DIMSCore": ".dims",
+    "DIMSCache": ".dims",
     # Quality Monitoring
-    "QualityMonitor",
-    "QualityStatus",
-    "QualityMetric",
-    "DataQualityChecker",
-    "DataQualityConfig",
-    "QualityMetricsTracker",
-    "QualityThreshold",
-    "QualityReportGenerator",
-    "ReportFormat",
+    "QualityMonitor": ".quality",
+    "QualityStatus": ".quality",
+    "QualityMetric": ".quality",
+    "DataQualityChecker": ".quality",
+    "DataQualityConfig": ".quality",
+    "QualityMetricsTracker": ".quality",
+    "QualityThreshold": ".quality",
+    "QualityReportGenerator": ".quality",
+    "ReportFormat": ".quality",
     # Alert System
-    "AlertManager",
-    "AlertConfig",
-    "EmailNotifier",
-    "SlackNotifier",
-    "WebhookNotifier",
-    "NotificationChannel",
-    "AlertDeduplicator",
-    "EscalationPolicy",
-    "AlertHistory",
+    "AlertManager": ".alerts",
+    "AlertConfig": ".alerts",
+    "EmailNotifier": ".alerts",
+    "SlackNotifier": ".alerts",
+    "WebhookNotifier": ".alerts",
+    "NotificationChannel": ".alerts",
+    "AlertDeduplicator": ".alerts",
+    "EscalationPolicy": ".alerts",
+    "AlertHistory": ".alerts",
     # Health (TODO: re-enable after fixing imports)
-    # 'HealthMonitor',
-    # 'ScraperHealthCheck',
+    # "HealthMonitor": ".health",
+    # "ScraperHealthCheck": ".health",
     # Telemetry (TODO: re-enable after fixing imports)
-    # 'TelemetryCollector',
-    # 'MetricsPublisher',
-]
+    # "TelemetryCollector": ".telemetry",
+    # "MetricsPublisher": ".telemetry",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
 
 __version__ = "1.0.0"
@@ -17,6 +17,7 @@ Components:
 - WebhookNotifier: Generic webhook notifications
 - AlertDeduplicator: Prevent duplicate alerts
 - EscalationPolicy: Alert escalation logic
+- AlertDispatcher: Queued, concurrent notification delivery
 
 Created: November 5, 2025
 Phase: 4 (Monitoring)
@@ -30,7 +31,8 @@ from .channels import (
     WebhookNotifier,
     NotificationConfig,
 )
-from .deduplicator import AlertDeduplicator, DeduplicationConfig
+from .deduplicator import AlertDeduplicator, DeduplicationConfig, FingerprintStore
+from .dispatcher import AlertDispatcher, DispatcherConfig
 from .escalation import EscalationPolicy, EscalationLevel
 from .history import AlertHistory, AlertResolution
 
@@ -47,6 +49,10 @@ __all__ = [
     # Deduplication
     "AlertDeduplicator",
     "DeduplicationConfig",
+    "FingerprintStore",
+    # Dispatch
+    "AlertDispatcher",
+    "DispatcherConfig",
     # Escalation
     "EscalationPolicy",
     "EscalationLevel",
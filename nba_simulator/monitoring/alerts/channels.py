@@ -2,9 +2,9 @@
 Notification Channels
 
 Multi-channel notification system for alerts:
-- Email notifications (SMTP)
-- Slack notifications (webhooks)
-- Generic webhooks
+- Email notifications (SMTP, one persistent session per notifier)
+- Slack notifications (webhooks over a keep-alive connection pool)
+- Generic webhooks (keep-alive connection pool)
 - SMS notifications (future)
 - PagerDuty integration (future)
 
@@ -14,6 +14,7 @@ Created: November 5, 2025
 import json
 import logging
 import smtplib
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -21,10 +22,28 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Any, Dict, List, Optional
 import requests
+from requests.adapters import HTTPAdapter
 
 from ...utils import setup_logging
 
 
+def create_http_session(pool_size: int = 4) -> requests.Session:
+    """
+    requests Session with a keep-alive connection pool.
+
+    Args:
+        pool_size: Connections kept open per host
+
+    Returns:
+        Session reusing TCP/TLS connections across requests
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 @dataclass
 class NotificationConfig:
     """
@@ -180,6 +199,9 @@ class NotificationChannel(ABC):
         """
         raise NotImplementedError("Subclasses must implement _send_notification()")
 
+    def close(self):
+        """Release connections held by this channel"""
+
     def get_statistics(self) -> Dict[str, int]:
         """Get channel statistics"""
         return {
@@ -201,6 +223,8 @@ class EmailNotifier(NotificationChannel):
     - Plain text and HTML emails
     - Multiple recipients
     - CC and BCC
+    - Persistent SMTP session (connect/STARTTLS/login once, reconnect
+      when the server drops an idle connection)
     - Attachments (future)
     """
 
@@ -214,6 +238,7 @@ class EmailNotifier(NotificationChannel):
         smtp_password: Optional[str] = None,
         use_tls: bool = True,
         config: Optional[NotificationConfig] = None,
+        persistent_connection: bool = True,
     ):
         """
         Initialize email notifier.
@@ -227,6 +252,7 @@ class EmailNotifier(NotificationChannel):
             smtp_password: SMTP password (if required)
             use_tls: Whether to use TLS
             config: Notification configuration
+            persistent_connection: Reuse one SMTP session across emails
         """
         super().__init__("email", config)
 
@@ -237,6 +263,26 @@ class EmailNotifier(NotificationChannel):
         self.smtp_username = smtp_username
         self.smtp_password = smtp_password
         self.use_tls = use_tls
+        self.persistent_connection = persistent_connection
+
+        self._server: Optional[smtplib.SMTP] = None
+        self._server_lock = threading.Lock()
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open an SMTP session (STARTTLS and login if configured)"""
+        server = smtplib.SMTP(
+            self.smtp_host, self.smtp_port, timeout=self.config.timeout_seconds
+        )
+        try:
+            if self.use_tls:
+                server.starttls()
+
+            if self.smtp_username and self.smtp_password:
+                server.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
 
     def _send_notification(self, subject: str, message: str, **kwargs):
         """Send email notification"""
@@ -266,16 +312,37 @@ class EmailNotifier(NotificationChannel):
         # Connect to SMTP server and send
         recipients = self.to_emails + cc_emails
 
-        with smtplib.SMTP(
-            self.smtp_host, self.smtp_port, timeout=self.config.timeout_seconds
-        ) as server:
-            if self.use_tls:
-                server.starttls()
+        if not self.persistent_connection:
+            with self._connect() as server:
+                server.sendmail(self.from_email, recipients, msg.as_string())
+            return
 
-            if self.smtp_username and self.smtp_password:
-                server.login(self.smtp_username, self.smtp_password)
+        with self._server_lock:
+            if self._server is None:
+                self._server = self._connect()
+            try:
+                self._server.sendmail(self.from_email, recipients, msg.as_string())
+            except smtplib.SMTPServerDisconnected:
+                # Idle session dropped by the server: reconnect once
+                self._server = self._connect()
+                self._server.sendmail(self.from_email, recipients, msg.as_string())
+            except Exception:
+                self._close_server()
+                raise
+
+    def _close_server(self):
+        """Quit the persistent session, ignoring errors"""
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                self._server.close()
+            self._server = None
 
-            server.sendmail(self.from_email, recipients, msg.as_string())
+    def close(self):
+        """Quit the persistent SMTP session"""
+        with self._server_lock:
+            self._close_server()
 
 
 class SlackNotifier(NotificationChannel):
@@ -287,6 +354,7 @@ class SlackNotifier(NotificationChannel):
     - Attachments
     - Custom colors
     - Mentions
+    - Keep-alive connection pool
     """
 
     def __init__(
@@ -296,6 +364,7 @@ class SlackNotifier(NotificationChannel):
         username: str = "NBA Simulator",
         icon_emoji: str = ":basketball:",
         config: Optional[NotificationConfig] = None,
+        pool_size: int = 4,
     ):
         """
         Initialize Slack notifier.
@@ -306,6 +375,7 @@ class SlackNotifier(NotificationChannel):
             username: Bot username
             icon_emoji: Bot icon emoji
             config: Notification configuration
+            pool_size: Keep-alive connections to the webhook host
         """
         super().__init__("slack", config)
 
@@ -313,6 +383,7 @@ class SlackNotifier(NotificationChannel):
         self.channel = channel
         self.username = username
         self.icon_emoji = icon_emoji
+        self.session = create_http_session(pool_size)
 
     def _send_notification(self, subject: str, message: str, **kwargs):
         """Send Slack notification"""
@@ -345,12 +416,16 @@ class SlackNotifier(NotificationChannel):
         payload["attachments"] = [attachment]
 
         # Send to Slack
-        response = requests.post(
+        response = self.session.post(
             self.webhook_url, json=payload, timeout=self.config.timeout_seconds
         )
 
         response.raise_for_status()
 
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+
 
 class WebhookNotifier(NotificationChannel):
     """
@@ -361,6 +436,7 @@ class WebhookNotifier(NotificationChannel):
     - Custom headers
     - JSON payload
     - Authentication
+    - Keep-alive connection pool
     """
 
     def __init__(
@@ -370,6 +446,7 @@ class WebhookNotifier(NotificationChannel):
         headers: Optional[Dict[str, str]] = None,
         auth_token: Optional[str] = None,
         config: Optional[NotificationConfig] = None,
+        pool_size: int = 4,
     ):
         """
         Initialize webhook notifier.
@@ -380,12 +457,14 @@ class WebhookNotifier(NotificationChannel):
             headers: Custom headers
             auth_token: Optional bearer token
             config: Notification configuration
+            pool_size: Keep-alive connections to the webhook host
         """
         super().__init__("webhook", config)
 
         self.webhook_url = webhook_url
         self.method = method.upper()
         self.headers = headers or {}
+        self.session = create_http_session(pool_size)
 
         # Add auth token if provided
         if auth_token:
@@ -409,7 +488,7 @@ class WebhookNotifier(NotificationChannel):
         payload.update(additional_data)
 
         # Send webhook
-        response = requests.request(
+        response = self.session.request(
             method=self.method,
             url=self.webhook_url,
             headers=self.headers,
@@ -419,6 +498,10 @@ class WebhookNotifier(NotificationChannel):
 
         response.raise_for_status()
 
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+
 
 class ConsoleNotifier(NotificationChannel):
     """
@@ -6,15 +6,23 @@ Prevents duplicate alerts from flooding notification channels:
 - Content-based deduplication
 - Fingerprint generation
 - Suppression tracking
+- Amortized O(1) expiry: fingerprints kept in last-seen order, so expired
+  ones are popped from the front instead of scanning every fingerprint
+- Optional SQLite state file shared by alerting processes on a host
 
 Created: November 5, 2025
 """
 
 import hashlib
 import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional, Set
+from typing import Callable, Dict, Iterator, Optional, Set
 
 from ...utils import setup_logging
 
@@ -29,6 +37,10 @@ class DeduplicationConfig:
         window_minutes: Time window for deduplication
         max_suppressed: Maximum alerts to suppress before forcing
         fingerprint_fields: Fields to include in fingerprint
+        state_path: SQLite file for suppression state shared across
+            processes (None: in-process only)
+        state_cleanup_seconds: Minimum interval between purges of expired
+            rows from the state file
     """
 
     enabled: bool = True
@@ -37,6 +49,8 @@ class DeduplicationConfig:
     fingerprint_fields: Set[str] = field(
         default_factory=lambda: {"alert_type", "severity", "message"}
     )
+    state_path: Optional[str] = None
+    state_cleanup_seconds: float = 60.0
 
 
 @dataclass
@@ -60,12 +74,141 @@ class AlertFingerprint:
     last_seen: datetime
     count: int = 1
 
-    def update(self):
+    def update(self, now: Optional[datetime] = None):
         """Update fingerprint with new occurrence"""
-        self.last_seen = datetime.now(timezone.utc)
+        self.last_seen = now or datetime.now(timezone.utc)
         self.count += 1
 
 
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS fingerprints (
+        fingerprint TEXT PRIMARY KEY,
+        alert_type TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        first_seen REAL NOT NULL,
+        last_seen REAL NOT NULL,
+        count INTEGER NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_fingerprints_last_seen
+        ON fingerprints (last_seen);
+"""
+
+
+class FingerprintStore:
+    """
+    SQLite-backed fingerprint state shared by processes on one host.
+
+    Each deduplication decision runs in an IMMEDIATE transaction, so two
+    processes seeing the same alert cannot both treat it as new. Expired
+    rows are ignored on read and purged at most every cleanup_seconds.
+    """
+
+    def __init__(self, path: str, cleanup_seconds: float = 60.0):
+        """
+        Initialize fingerprint store.
+
+        Args:
+            path: SQLite database file (created if missing)
+            cleanup_seconds: Minimum interval between purges of expired rows
+        """
+        self.path = path
+        self.cleanup_seconds = cleanup_seconds
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._last_cleanup = 0.0
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Serialize a read-modify-write against other processes"""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def get(self, fingerprint: str, cutoff: datetime) -> Optional[AlertFingerprint]:
+        """Fingerprint seen at or after cutoff, or None (call inside transaction)"""
+        row = self._db.execute(
+            "SELECT alert_type, severity, first_seen, last_seen, count "
+            "FROM fingerprints WHERE fingerprint = ? AND last_seen >= ?",
+            (fingerprint, cutoff.timestamp()),
+        ).fetchone()
+        if row is None:
+            return None
+        alert_type, severity, first_seen, last_seen, count = row
+        return AlertFingerprint(
+            fingerprint=fingerprint,
+            alert_type=alert_type,
+            severity=severity,
+            first_seen=datetime.fromtimestamp(first_seen, timezone.utc),
+            last_seen=datetime.fromtimestamp(last_seen, timezone.utc),
+            count=count,
+        )
+
+    def put(self, alert_fp: AlertFingerprint):
+        """Insert or replace a fingerprint (call inside transaction)"""
+        self._db.execute(
+            "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                alert_fp.fingerprint,
+                alert_fp.alert_type,
+                alert_fp.severity,
+                alert_fp.first_seen.timestamp(),
+                alert_fp.last_seen.timestamp(),
+                alert_fp.count,
+            ),
+        )
+
+    def delete(self, fingerprint: str):
+        """Remove a fingerprint"""
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM fingerprints WHERE fingerprint = ?", (fingerprint,)
+            )
+
+    def purge(self, cutoff: datetime, force: bool = False) -> int:
+        """
+        Delete rows last seen before cutoff.
+
+        Args:
+            cutoff: Oldest last_seen to keep
+            force: Ignore cleanup_seconds
+
+        Returns:
+            Rows deleted (0 if skipped)
+        """
+        now = time.monotonic()
+        if not force and now - self._last_cleanup < self.cleanup_seconds:
+            return 0
+        self._last_cleanup = now
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM fingerprints WHERE last_seen < ?", (cutoff.timestamp(),)
+            )
+        return cursor.rowcount
+
+    def count(self, cutoff: datetime) -> int:
+        """Fingerprints seen at or after cutoff"""
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM fingerprints WHERE last_seen >= ?",
+                (cutoff.timestamp(),),
+            ).fetchone()[0]
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._db.close()
+
+
 class AlertDeduplicator:
     """
     Deduplicates alerts to prevent notification flooding.
@@ -82,6 +225,7 @@ class AlertDeduplicator:
         self,
         config: Optional[DeduplicationConfig] = None,
         logger: Optional[logging.Logger] = None,
+        clock: Optional[Callable[[], datetime]] = None,
     ):
         """
         Initialize deduplicator.
@@ -89,14 +233,26 @@ class AlertDeduplicator:
         Args:
             config: Deduplication configuration
             logger: Optional logger instance
+            clock: Current UTC time source (default: datetime.now)
         """
         self.config = config or DeduplicationConfig()
         self.logger = logger or setup_logging(
             "nba_simulator.monitoring.alerts.deduplicator"
         )
 
-        # Track recent alerts by fingerprint
-        self.recent_alerts: Dict[str, AlertFingerprint] = {}
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+        self.window = timedelta(minutes=self.config.window_minutes)
+
+        # Track recent alerts by fingerprint, least recently seen first
+        self.recent_alerts: Dict[str, AlertFingerprint] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Shared state across processes
+        self.store: Optional[FingerprintStore] = None
+        if self.config.state_path:
+            self.store = FingerprintStore(
+                self.config.state_path, self.config.state_cleanup_seconds
+            )
 
         # Statistics
         self.total_alerts = 0
@@ -128,19 +284,65 @@ class AlertDeduplicator:
             alert_type=alert_type, severity=severity, message=message, **metadata
         )
 
-        # Clean up old fingerprints
-        self._cleanup_old_fingerprints()
+        with self._lock:
+            now = self.clock()
+
+            # Clean up old fingerprints
+            self._cleanup_old_fingerprints(now)
+
+            if self.store is None:
+                return self._check_fingerprint(
+                    fingerprint,
+                    self.recent_alerts.get(fingerprint),
+                    alert_type,
+                    severity,
+                    now,
+                )
+
+            # Shared state is authoritative: another process may have seen
+            # or cleared this fingerprint
+            with self.store.transaction():
+                alert_fp = self.store.get(fingerprint, now - self.window)
+                result = self._check_fingerprint(
+                    fingerprint, alert_fp, alert_type, severity, now
+                )
+                self.store.put(self.recent_alerts[fingerprint])
+            return result
+
+    def _check_fingerprint(
+        self,
+        fingerprint: str,
+        alert_fp: Optional[AlertFingerprint],
+        alert_type: str,
+        severity: str,
+        now: datetime,
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Suppress or send, and record the occurrence.
+
+        Args:
+            fingerprint: Alert fingerprint
+            alert_fp: Current state for the fingerprint (None if not seen
+                within the window)
+            alert_type: Type of alert
+            severity: Severity level
+            now: Current time
 
+        Returns:
+            Tuple of (should_send, reason)
+        """
         # Check if we've seen this alert recently
-        if fingerprint in self.recent_alerts:
-            alert_fp = self.recent_alerts[fingerprint]
+        if alert_fp is not None:
+            # Keep recent_alerts ordered by last_seen
+            self.recent_alerts.pop(fingerprint, None)
+            self.recent_alerts[fingerprint] = alert_fp
 
             # Check if we've suppressed too many
             if alert_fp.count >= self.config.max_suppressed:
                 # Force send after threshold
                 self.forced_alerts += 1
                 alert_fp.count = 0  # Reset counter
-                alert_fp.update()
+                alert_fp.update(now)
 
                 self.logger.info(
                     f"Forcing alert after {self.config.max_suppressed} suppressions: "
@@ -150,7 +352,7 @@ class AlertDeduplicator:
                 return True, f"forced_after_{self.config.max_suppressed}_suppressions"
 
             # Suppress duplicate
-            alert_fp.update()
+            alert_fp.update(now)
             self.suppressed_alerts += 1
 
             self.logger.debug(
@@ -161,12 +363,13 @@ class AlertDeduplicator:
             return False, f"duplicate_within_{self.config.window_minutes}min"
 
         # New alert - add to tracking
+        self.recent_alerts.pop(fingerprint, None)
         self.recent_alerts[fingerprint] = AlertFingerprint(
             fingerprint=fingerprint,
             alert_type=alert_type,
             severity=severity,
-            first_seen=datetime.now(timezone.utc),
-            last_seen=datetime.now(timezone.utc),
+            first_seen=now,
+            last_seen=now,
         )
 
         return True, "new_alert"
@@ -195,23 +398,24 @@ class AlertDeduplicator:
         # Generate hash
         return hashlib.sha256(fingerprint_str.encode()).hexdigest()[:16]
 
-    def _cleanup_old_fingerprints(self):
-        """Remove fingerprints outside the time window"""
-        cutoff_time = datetime.now(timezone.utc) - timedelta(
-            minutes=self.config.window_minutes
-        )
+    def _cleanup_old_fingerprints(self, now: Optional[datetime] = None):
+        """
+        Remove fingerprints outside the time window.
 
-        # Find expired fingerprints
-        expired = [
-            fp
-            for fp, alert_fp in self.recent_alerts.items()
-            if alert_fp.last_seen < cutoff_time
-        ]
+        recent_alerts is ordered by last_seen, so only expired fingerprints
+        at the front are visited (amortized O(1) per alert).
+        """
+        cutoff_time = (now or self.clock()) - self.window
 
-        # Remove expired
-        for fp in expired:
+        while self.recent_alerts:
+            fp, alert_fp = next(iter(self.recent_alerts.items()))
+            if alert_fp.last_seen >= cutoff_time:
+                break
             del self.recent_alerts[fp]
 
+        if self.store is not None:
+            self.store.purge(cutoff_time)
+
     def get_suppression_stats(self) -> Dict[str, any]:
         """
         Get deduplication statistics.
@@ -225,7 +429,7 @@ class AlertDeduplicator:
             else 0
         )
 
-        return {
+        stats = {
             "total_alerts": self.total_alerts,
             "suppressed_alerts": self.suppressed_alerts,
             "forced_alerts": self.forced_alerts,
@@ -234,6 +438,9 @@ class AlertDeduplicator:
             "active_fingerprints": len(self.recent_alerts),
             "window_minutes": self.config.window_minutes,
         }
+        if self.store is not None:
+            stats["shared_fingerprints"] = self.store.count(self.clock() - self.window)
+        return stats
 
     def clear_fingerprint(self, alert_type: str, severity: str, message: str):
         """
@@ -248,9 +455,13 @@ class AlertDeduplicator:
             alert_type=alert_type, severity=severity, message=message
         )
 
-        if fingerprint in self.recent_alerts:
-            del self.recent_alerts[fingerprint]
-            self.logger.debug(f"Cleared fingerprint: {fingerprint}")
+        with self._lock:
+            if self.store is not None:
+                self.store.delete(fingerprint)
+
+            if fingerprint in self.recent_alerts:
+                del self.recent_alerts[fingerprint]
+                self.logger.debug(f"Cleared fingerprint: {fingerprint}")
 
     def reset_statistics(self):
         """Reset deduplication statistics"""
@@ -258,3 +469,8 @@ class AlertDeduplicator:
         self.suppressed_alerts = 0
         self.forced_alerts = 0
         self.logger.info("Deduplication statistics reset")
+
+    def close(self):
+        """Close the shared state file"""
+        if self.store is not None:
+            self.store.close()
@@ -0,0 +1,439 @@
+"""
+Alert Dispatcher
+
+Queue-backed fan-out of alert notifications:
+- One bounded queue and worker thread per channel, so channels send
+  concurrently and each keeps its own connection (SMTP session, HTTP
+  keep-alive pool) without locking
+- Backpressure when a queue is full: block for up to put_timeout, or drop
+  the newest/oldest notification
+- History writes (new alerts, notification counts) are queued and written
+  in batches by one writer thread
+- Queue depth and enqueue-to-delivery latency per channel, optionally
+  published through a CloudWatchPublisher
+
+send_alert() in queued mode returns once notifications are enqueued; a
+scraper raising alerts during an incident storm no longer waits on SMTP
+or webhook round trips.
+
+Created: November 2025
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from .channels import NotificationChannel
+from .history import AlertHistory, AlertHistoryEntry
+from ...utils import setup_logging
+
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+# Worker shutdown marker
+_STOP = object()
+
+
+@dataclass
+class DispatcherConfig:
+    """
+    Configuration for the alert dispatcher.
+
+    Attributes:
+        queue_size: Pending notifications per channel
+        overflow: Full-queue policy (block, drop_newest, drop_oldest)
+        put_timeout: Seconds submit() blocks under 'block' before dropping
+        history_batch_size: Maximum history items per database transaction
+        history_flush_seconds: Maximum wait before writing a partial batch
+        latency_window: Recent deliveries kept per channel for percentiles
+    """
+
+    queue_size: int = 1000
+    overflow: str = "block"
+    put_timeout: float = 1.0
+    history_batch_size: int = 200
+    history_flush_seconds: float = 1.0
+    latency_window: int = 1000
+
+
+@dataclass
+class QueuedNotification:
+    """Notification waiting in a channel queue"""
+
+    alert_id: str
+    subject: str
+    message: str
+    kwargs: Dict[str, Any]
+    enqueued_at: float
+
+
+class _ChannelStats:
+    """Delivery counters and recent latencies for one channel"""
+
+    def __init__(self, window: int):
+        self.queued = 0
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.max_queue_depth = 0
+        self.latencies: Deque[float] = deque(maxlen=window)
+
+    def to_dict(self, queue_depth: int) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+        return {
+            "queued": self.queued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "queue_depth": queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "latency_ms": {
+                "p50": percentile(0.50),
+                "p95": percentile(0.95),
+                "max": latencies[-1] * 1000 if latencies else 0.0,
+            },
+        }
+
+
+class AlertDispatcher:
+    """
+    Concurrent, queue-backed notification delivery.
+
+    Usage:
+        dispatcher = AlertDispatcher(manager.channels, history=manager.history)
+        dispatcher.submit(alert_id, {"slack": {"subject": s, "message": m}})
+        dispatcher.flush(timeout=10)
+        dispatcher.close()
+    """
+
+    def __init__(
+        self,
+        channels: Dict[str, NotificationChannel],
+        history: Optional[AlertHistory] = None,
+        config: Optional[DispatcherConfig] = None,
+        metrics_publisher: Any = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize dispatcher.
+
+        Args:
+            channels: Channel registry (shared with AlertManager, so channels
+                added later are picked up)
+            history: Alert history for batched writes
+            config: Dispatcher configuration
+            metrics_publisher: Optional CloudWatchPublisher for latency and
+                queue depth metrics
+            logger: Optional logger instance
+        """
+        self.config = config or DispatcherConfig()
+        if self.config.overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow must be one of {OVERFLOW_POLICIES}, "
+                f"got {self.config.overflow!r}"
+            )
+
+        self.channels = channels
+        self.history = history
+        self.metrics_publisher = metrics_publisher
+        self.logger = logger or setup_logging(
+            "nba_simulator.monitoring.alerts.dispatcher"
+        )
+
+        self._queues: Dict[str, queue.Queue] = {}
+        self._workers: Dict[str, threading.Thread] = {}
+        self._stats: Dict[str, _ChannelStats] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self._history_queue: queue.Queue = queue.Queue()
+        self._history_worker: Optional[threading.Thread] = None
+        self.history_batches = 0
+        self.history_items_written = 0
+        self.history_errors = 0
+
+    # =========================================================================
+    # Submission
+    # =========================================================================
+
+    def submit(
+        self, alert_id: str, notifications: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, bool]:
+        """
+        Enqueue notifications for an alert.
+
+        Args:
+            alert_id: Alert identifier
+            notifications: {channel_name: {"subject", "message", **kwargs}}
+
+        Returns:
+            {channel_name: True if queued, False if dropped or unknown}
+        """
+        if self._closed:
+            raise RuntimeError("Dispatcher is closed")
+
+        queued = {}
+        for channel_name, notification in notifications.items():
+            if channel_name not in self.channels:
+                self.logger.warning(f"Channel not found: {channel_name}")
+                queued[channel_name] = False
+                continue
+
+            kwargs = dict(notification)
+            item = QueuedNotification(
+                alert_id=alert_id,
+                subject=kwargs.pop("subject"),
+                message=kwargs.pop("message"),
+                kwargs=kwargs,
+                enqueued_at=time.perf_counter(),
+            )
+            queued[channel_name] = self._enqueue(channel_name, item)
+
+        return queued
+
+    def record_history(self, entry: AlertHistoryEntry):
+        """Queue a new alert (recorded with persist=False) for a batched write"""
+        if self.history is None:
+            return
+        self._ensure_history_worker()
+        self._history_queue.put(("alert", entry))
+
+    def _enqueue(self, channel_name: str, item: QueuedNotification) -> bool:
+        """Put an item on a channel queue, applying the overflow policy"""
+        channel_queue = self._channel_queue(channel_name)
+        stats = self._stats[channel_name]
+        overflow = self.config.overflow
+
+        try:
+            if overflow == "block":
+                channel_queue.put(item, timeout=self.config.put_timeout)
+            else:
+                channel_queue.put_nowait(item)
+        except queue.Full:
+            if overflow != "drop_oldest":
+                return self._drop(channel_name, item)
+            try:
+                oldest = channel_queue.get_nowait()
+                channel_queue.task_done()
+                self._drop(channel_name, oldest)
+            except queue.Empty:
+                pass
+            try:
+                channel_queue.put_nowait(item)
+            except queue.Full:
+                return self._drop(channel_name, item)
+
+        depth = channel_queue.qsize()
+        with self._lock:
+            stats.queued += 1
+            stats.max_queue_depth = max(stats.max_queue_depth, depth)
+        self._publish_metric("AlertQueueDepth", depth, "Count", channel_name)
+        return True
+
+    def _drop(self, channel_name: str, item: QueuedNotification) -> bool:
+        with self._lock:
+            self._stats[channel_name].dropped += 1
+        self.logger.warning(
+            f"Alert queue for {channel_name} full, dropped notification "
+            f"for alert {item.alert_id}"
+        )
+        return False
+
+    # =========================================================================
+    # Workers
+    # =========================================================================
+
+    def _channel_queue(self, channel_name: str) -> queue.Queue:
+        """Queue for a channel, starting its worker on first use"""
+        with self._lock:
+            if channel_name not in self._queues:
+                self._queues[channel_name] = queue.Queue(maxsize=self.config.queue_size)
+                self._stats[channel_name] = _ChannelStats(self.config.latency_window)
+                worker = threading.Thread(
+                    target=self._channel_worker,
+                    args=(channel_name,),
+                    name=f"alert-{channel_name}",
+                    daemon=True,
+                )
+                self._workers[channel_name] = worker
+                worker.start()
+            return self._queues[channel_name]
+
+    def _channel_worker(self, channel_name: str):
+        channel_queue = self._queues[channel_name]
+        stats = self._stats[channel_name]
+
+        while True:
+            item = channel_queue.get()
+            if item is _STOP:
+                channel_queue.task_done()
+                return
+
+            try:
+                channel = self.channels.get(channel_name)
+                if channel is None:
+                    success = False
+                else:
+                    result = channel.send(item.subject, item.message, **item.kwargs)
+                    success = result.success
+            except Exception as e:
+                self.logger.error(f"Error sending via {channel_name}: {e}")
+                success = False
+
+            latency = time.perf_counter() - item.enqueued_at
+            with self._lock:
+                if success:
+                    stats.sent += 1
+                else:
+                    stats.failed += 1
+                stats.latencies.append(latency)
+
+            if success and self.history is not None:
+                self.history.record_notification(item.alert_id, persist=False)
+                self._ensure_history_worker()
+                self._history_queue.put(("notification", item.alert_id))
+
+            self._publish_metric(
+                "AlertDispatchLatency", latency, "Seconds", channel_name
+            )
+            channel_queue.task_done()
+
+    def _ensure_history_worker(self):
+        with self._lock:
+            if self._history_worker is None:
+                self._history_worker = threading.Thread(
+                    target=self._history_writer, name="alert-history", daemon=True
+                )
+                self._history_worker.start()
+
+    def _history_writer(self):
+        """Write queued alerts and notification counts in batches"""
+        while True:
+            item = self._history_queue.get()
+            batch = [item]
+            deadline = time.monotonic() + self.config.history_flush_seconds
+            while item is not _STOP and len(batch) < self.config.history_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._history_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+
+            stop = batch[-1] is _STOP
+            items = batch[:-1] if stop else batch
+            entries: List[AlertHistoryEntry] = []
+            notifications: Counter = Counter()
+            for kind, value in items:
+                if kind == "alert":
+                    entries.append(value)
+                else:
+                    notifications[value] += 1
+
+            try:
+                if items and self.history.write_batch(entries, dict(notifications)):
+                    self.history_batches += 1
+                    self.history_items_written += len(items)
+                elif items:
+                    self.history_errors += 1
+            except Exception as e:
+                self.history_errors += 1
+                self.logger.error(f"Error writing alert history batch: {e}")
+            finally:
+                for _ in batch:
+                    self._history_queue.task_done()
+
+            if stop:
+                return
+
+    def _publish_metric(self, name: str, value: float, unit: str, channel_name: str):
+        if self.metrics_publisher is None:
+            return
+        try:
+            self.metrics_publisher.record(
+                "NBA-Simulator/Health",
+                name,
+                value,
+                unit,
+                {"Channel": channel_name},
+            )
+        except Exception as e:
+            self.logger.debug(f"Could not publish {name}: {e}")
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued notification is delivered and history written.
+
+        Args:
+            timeout: Maximum seconds to wait (None: no limit)
+
+        Returns:
+            True if everything drained within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            queues = list(self._queues.values())
+
+        for pending in queues + [self._history_queue]:
+            while pending.unfinished_tasks:
+                if deadline is not None and time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.005)
+        return True
+
+    def close(self, timeout: Optional[float] = None):
+        """Deliver what is queued, then stop workers"""
+        self._closed = True
+        for channel_queue in list(self._queues.values()):
+            channel_queue.put(_STOP)
+        for worker in list(self._workers.values()):
+            worker.join(timeout)
+        if self._history_worker is not None:
+            self._history_queue.put(_STOP)
+            self._history_worker.join(timeout)
+
+    # =========================================================================
+    # Statistics
+    # =========================================================================
+
+    def queue_depth(self, channel_name: str) -> int:
+        """Notifications waiting for a channel"""
+        channel_queue = self._queues.get(channel_name)
+        return channel_queue.qsize() if channel_queue else 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Per-channel delivery statistics and history batching counters.
+
+        Returns:
+            Dictionary with channels and history sections
+        """
+        with self._lock:
+            channels = {
+                name: stats.to_dict(self._queues[name].qsize())
+                for name, stats in self._stats.items()
+            }
+        return {
+            "channels": channels,
+            "history": {
+                "pending": self._history_queue.qsize(),
+                "batches": self.history_batches,
+                "items_written": self.history_items_written,
+                "errors": self.history_errors,
+            },
+        }
@@ -6,13 +6,14 @@ Tracks alert lifecycle and resolution history:
 - Resolution tracking
 - History queries
 - Performance metrics
+- Batched writes (write_batch) for queued dispatch
 
 Created: November 5, 2025
 """
 
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Dict, List, Optional
 
@@ -139,8 +140,14 @@ class AlertHistory:
         self.recent_alerts: Dict[str, AlertHistoryEntry] = {}
 
     def record_alert(
-        self, alert_id: str, alert_type: str, severity: str, message: str, **metadata
-    ):
+        self,
+        alert_id: str,
+        alert_type: str,
+        severity: str,
+        message: str,
+        persist: bool = True,
+        **metadata,
+    ) -> AlertHistoryEntry:
         """
         Record new alert in history.
 
@@ -149,7 +156,12 @@ class AlertHistory:
             alert_type: Type of alert
             severity: Severity level
             message: Alert message
+            persist: Write to the database now (False: caller passes the
+                entry to write_batch later)
             **metadata: Additional metadata
+
+        Returns:
+            The cached history entry
         """
         entry = AlertHistoryEntry(
             alert_id=alert_id,
@@ -163,7 +175,7 @@ class AlertHistory:
         self.recent_alerts[alert_id] = entry
 
         # Persist to database
-        if self.db_conn:
+        if persist and self.db_conn:
             try:
                 with self.db_conn.cursor() as cur:
                     cur.execute(
@@ -188,18 +200,21 @@ class AlertHistory:
                 self.logger.error(f"Error recording alert: {e}")
 
         self.logger.info(f"Recorded alert: {alert_id} [{severity}]")
+        return entry
 
-    def record_notification(self, alert_id: str):
+    def record_notification(self, alert_id: str, persist: bool = True):
         """
         Record that a notification was sent.
 
         Args:
             alert_id: Alert identifier
+            persist: Write to the database now (False: counted in a later
+                write_batch)
         """
         if alert_id in self.recent_alerts:
             self.recent_alerts[alert_id].notifications_sent += 1
 
-        if self.db_conn:
+        if persist and self.db_conn:
             try:
                 with self.db_conn.cursor() as cur:
                     cur.execute(
@@ -214,6 +229,69 @@ class AlertHistory:
             except Exception as e:
                 self.logger.error(f"Error recording notification: {e}")
 
+    def write_batch(
+        self,
+        entries: List[AlertHistoryEntry],
+        notification_counts: Optional[Dict[str, int]] = None,
+    ) -> bool:
+        """
+        Persist queued alerts and notification counts in one transaction.
+
+        Args:
+            entries: Alerts recorded with persist=False
+            notification_counts: Notifications sent per alert_id
+
+        Returns:
+            True if written (or nothing to write), False on error
+        """
+        if not self.db_conn or not (entries or notification_counts):
+            return True
+
+        try:
+            with self.db_conn.cursor() as cur:
+                if entries:
+                    cur.executemany(
+                        """
+                        INSERT INTO alert_history (
+                            alert_id, alert_type, severity, message,
+                            created_at, escalation_level
+                        ) VALUES (%s, %s, %s, %s, %s, %s)
+                        ON CONFLICT (alert_id) DO NOTHING
+                    """,
+                        [
+                            (
+                                entry.alert_id,
+                                entry.alert_type,
+                                entry.severity,
+                                entry.message,
+                                entry.created_at,
+                                entry.escalation_level,
+                            )
+                            for entry in entries
+                        ],
+                    )
+                if notification_counts:
+                    cur.executemany(
+                        """
+                        UPDATE alert_history
+                        SET notifications_sent = notifications_sent + %s
+                        WHERE alert_id = %s
+                    """,
+                        [
+                            (count, alert_id)
+                            for alert_id, count in notification_counts.items()
+                        ],
+                    )
+            self.db_conn.commit()
+            return True
+        except Exception as e:
+            self.logger.error(f"Error writing alert history batch: {e}")
+            try:
+                self.db_conn.rollback()
+            except Exception:
+                pass
+            return False
+
     def record_escalation(self, alert_id: str, escalation_level: str):
         """
         Record alert escalation.
@@ -19,6 +19,7 @@ from typing import Dict, List, Optional, Set
 
 from .channels import NotificationChannel, NotificationResult, ConsoleNotifier
 from .deduplicator import AlertDeduplicator, DeduplicationConfig
+from .dispatcher import AlertDispatcher, DispatcherConfig
 from .escalation import EscalationPolicy, EscalationLevel, create_default_policy
 from .history import AlertHistory, ResolutionStatus
 from ...utils import setup_logging
@@ -35,6 +36,9 @@ class AlertConfig:
         enable_deduplication: Enable alert deduplication
         enable_escalation: Enable alert escalation
         deduplication_config: Deduplication configuration
+        async_dispatch: Queue notifications for per-channel worker threads
+            instead of sending them inline in send_alert
+        dispatcher_config: Queue sizes, backpressure and history batching
     """
 
     enabled: bool = True
@@ -42,6 +46,8 @@ class AlertConfig:
     enable_deduplication: bool = True
     enable_escalation: bool = True
     deduplication_config: Optional[DeduplicationConfig] = None
+    async_dispatch: bool = False
+    dispatcher_config: Optional[DispatcherConfig] = None
 
 
 class AlertManager:
@@ -66,6 +72,7 @@ class AlertManager:
         self,
         config: Optional[AlertConfig] = None,
         logger: Optional[logging.Logger] = None,
+        metrics_publisher=None,
     ):
         """
         Initialize alert manager.
@@ -73,6 +80,8 @@ class AlertManager:
         Args:
             config: Alert configuration
             logger: Optional logger instance
+            metrics_publisher: Optional CloudWatchPublisher for dispatch
+                latency and queue depth (async_dispatch only)
         """
         self.config = config or AlertConfig()
         self.logger = logger or setup_logging("nba_simulator.monitoring.alerts.manager")
@@ -82,6 +91,7 @@ class AlertManager:
         self.deduplicator: Optional[AlertDeduplicator] = None
         self.escalation_policy: Optional[EscalationPolicy] = None
         self.history = AlertHistory(logger=self.logger)
+        self.dispatcher: Optional[AlertDispatcher] = None
 
         # Initialize deduplicator
         if self.config.enable_deduplication:
@@ -92,6 +102,16 @@ class AlertManager:
         if self.config.enable_escalation:
             self.escalation_policy = create_default_policy()
 
+        # Initialize queued dispatch
+        if self.config.async_dispatch:
+            self.dispatcher = AlertDispatcher(
+                self.channels,
+                history=self.history,
+                config=self.config.dispatcher_config,
+                metrics_publisher=metrics_publisher,
+                logger=self.logger,
+            )
+
         # Add default console channel
         self.add_channel("console", ConsoleNotifier())
 
@@ -177,14 +197,17 @@ class AlertManager:
                 "suppressed": True,
             }
 
-        # Record in history
-        self.history.record_alert(
+        # Record in history (written in a batch by the dispatcher if queued)
+        entry = self.history.record_alert(
             alert_id=alert_id,
             alert_type=alert_type,
             severity=severity,
             message=message,
+            persist=self.dispatcher is None,
             **metadata,
         )
+        if self.dispatcher:
+            self.dispatcher.record_history(entry)
 
         # Register for escalation if enabled
         if self.escalation_policy:
@@ -195,6 +218,11 @@ class AlertManager:
         # Determine channels to use
         target_channels = channels or self.config.default_channels
 
+        if self.dispatcher:
+            return self._queue_alert(
+                alert_id, alert_type, severity, message, target_channels, metadata
+            )
+
         # Send notifications
         results = []
         for channel_name in target_channels:
@@ -241,6 +269,79 @@ class AlertManager:
             "suppressed": False,
         }
 
+    def _queue_alert(
+        self,
+        alert_id: str,
+        alert_type: str,
+        severity: str,
+        message: str,
+        target_channels: Set[str],
+        metadata: Dict[str, any],
+    ) -> Dict[str, any]:
+        """
+        Hand notifications to the dispatcher instead of sending inline.
+
+        Returns:
+            Dictionary with alert results (channels that were queued)
+        """
+        metadata["severity"] = severity
+        metadata["alert_type"] = alert_type
+        metadata["alert_id"] = alert_id
+
+        notifications = {}
+        for channel_name in target_channels:
+            notification = dict(
+                metadata, subject=f"[{severity.upper()}] {alert_type}", message=message
+            )
+            if channel_name == "slack":
+                notification["color"] = self._get_severity_color(severity)
+            notifications[channel_name] = notification
+
+        queued = self.dispatcher.submit(alert_id, notifications)
+        queued_channels = sorted(name for name, ok in queued.items() if ok)
+
+        self.logger.info(
+            f"Alert queued: {alert_id} [{severity}] {alert_type} - "
+            f"{len(queued_channels)}/{len(queued)} channels queued"
+        )
+
+        return {
+            "success": bool(queued_channels),
+            "message": "Alert queued",
+            "alert_id": alert_id,
+            "queued": queued_channels,
+            "suppressed": False,
+        }
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued notifications and history writes (async_dispatch).
+
+        Args:
+            timeout: Maximum seconds to wait (None: no limit)
+
+        Returns:
+            True if everything was delivered within the timeout
+        """
+        if not self.dispatcher:
+            return True
+        return self.dispatcher.flush(timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        Drain the dispatcher and close channel connections and shared
+        deduplication state.
+
+        Args:
+            timeout: Maximum seconds to wait per worker
+        """
+        if self.dispatcher:
+            self.dispatcher.close(timeout)
+        for channel in self.channels.values():
+            channel.close()
+        if self.deduplicator:
+            self.deduplicator.close()
+
     def check_escalations(self):
         """
         Check for alerts that need escalation.
@@ -345,6 +446,10 @@ class AlertManager:
         for name, channel in self.channels.items():
             stats["channels"][name] = channel.get_statistics()
 
+        # Queued dispatch statistics
+        if self.dispatcher:
+            stats["dispatcher"] = self.dispatcher.get_statistics()
+
         # Deduplication statistics
         if self.deduplicator:
             stats["deduplication"] = self.deduplicator.get_suppression_stats()
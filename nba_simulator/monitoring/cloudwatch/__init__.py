@@ -3,13 +3,17 @@
 from .publisher import (
     CloudWatchPublisher,
     DIMSCloudWatchPublisher,
+    MetricAggregate,
     MetricNamespace,
-    MetricUnit
+    MetricUnit,
+    PublisherStats
 )
 
 __all__ = [
     'CloudWatchPublisher',
     'DIMSCloudWatchPublisher',
+    'MetricAggregate',
     'MetricNamespace',
-    'MetricUnit'
+    'MetricUnit',
+    'PublisherStats'
 ]
@@ -3,12 +3,26 @@
 NBA Simulator - CloudWatch Metrics Publisher
 
 Publishes monitoring metrics to AWS CloudWatch for native AWS monitoring.
+
+Publishing never blocks the caller:
+- Datapoints for the same (namespace, name, unit, dimensions, minute) are
+  aggregated in memory into one StatisticSet (or Values/Counts) datum
+- A background thread flushes every flush_interval seconds, sending up to
+  MAX_DATUMS_PER_CALL datums per put_metric_data call
+- Failed calls are retried with backoff, then held in a bounded spill
+  buffer and resent on the next flush (oldest datums dropped when full)
+- emit='emf' writes Embedded Metric Format log lines instead of calling
+  the API (CloudWatch Logs extracts the metrics, e.g. from Lambda)
 """
 
 import asyncio
 import json
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, Dict, List, Optional, Any, TextIO, Tuple, Union
 import logging
 from dataclasses import dataclass
 from enum import Enum
@@ -21,6 +35,14 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# PutMetricData limits
+MAX_DATUMS_PER_CALL = 1000
+MAX_VALUES_PER_DATUM = 150
+# Embedded Metric Format limit on values per metric per log line
+MAX_EMF_VALUES = 100
+# Standard-resolution metrics are stored per minute
+RESOLUTION_SECONDS = 60
+
 class MetricNamespace(Enum):
     """CloudWatch metric namespaces"""
     DIMS = "NBA-Simulator/DIMS"
@@ -59,83 +81,366 @@ class CloudWatchMetric:
             metric['Timestamp'] = self.timestamp
         return metric
 
+@dataclass
+class MetricAggregate:
+    """Datapoints merged for one (namespace, name, unit, dimensions, minute)"""
+    namespace: str
+    name: str
+    unit: str
+    dimensions: Tuple[Tuple[str, str], ...]
+    timestamp: datetime
+    count: int = 0
+    total: float = 0.0
+    minimum: float = float('inf')
+    maximum: float = float('-inf')
+    values: Optional[Dict[float, int]] = None
+    
+    def add(self, value: float) -> None:
+        """Merge one datapoint"""
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        if self.values is not None:
+            self.values[value] = self.values.get(value, 0) + 1
+    
+    def _datum(self) -> Dict[str, Any]:
+        return {
+            'MetricName': self.name,
+            'Unit': self.unit,
+            'Dimensions': [{'Name': k, 'Value': v} for k, v in self.dimensions],
+            'Timestamp': self.timestamp
+        }
+    
+    def to_boto3_format(self) -> List[Dict[str, Any]]:
+        """put_metric_data datums (Values/Counts split at MAX_VALUES_PER_DATUM)"""
+        if self.values is None:
+            datum = self._datum()
+            datum['StatisticValues'] = {
+                'SampleCount': float(self.count),
+                'Sum': self.total,
+                'Minimum': self.minimum,
+                'Maximum': self.maximum
+            }
+            return [datum]
+        
+        items = list(self.values.items())
+        datums = []
+        for i in range(0, len(items), MAX_VALUES_PER_DATUM):
+            chunk = items[i:i + MAX_VALUES_PER_DATUM]
+            datum = self._datum()
+            datum['Values'] = [value for value, _ in chunk]
+            datum['Counts'] = [float(count) for _, count in chunk]
+            datums.append(datum)
+        return datums
+    
+    def to_emf(self) -> List[str]:
+        """Embedded Metric Format log lines (MAX_EMF_VALUES values per line)"""
+        values = [v for v, count in (self.values or {}).items() for _ in range(count)]
+        lines = []
+        for i in range(0, len(values), MAX_EMF_VALUES):
+            chunk = values[i:i + MAX_EMF_VALUES]
+            record = {
+                '_aws': {
+                    'Timestamp': int(self.timestamp.timestamp() * 1000),
+                    'CloudWatchMetrics': [{
+                        'Namespace': self.namespace,
+                        'Dimensions': [[k for k, _ in self.dimensions]],
+                        'Metrics': [{'Name': self.name, 'Unit': self.unit}]
+                    }]
+                },
+                **dict(self.dimensions),
+                self.name: chunk if len(chunk) > 1 else chunk[0]
+            }
+            lines.append(json.dumps(record))
+        return lines
+
+@dataclass
+class PublisherStats:
+    """Counters for a CloudWatchPublisher"""
+    datapoints_recorded: int = 0
+    datums_sent: int = 0
+    api_calls: int = 0
+    failed_calls: int = 0
+    retries: int = 0
+    spilled: int = 0
+    dropped: int = 0
+    emf_lines: int = 0
+
 class CloudWatchPublisher:
-    """Publishes metrics to AWS CloudWatch with batching and cost optimization"""
+    """
+    Publishes metrics to AWS CloudWatch with client-side aggregation and
+    cost optimization.
+    
+    Recording a datapoint only updates an in-memory aggregate; a daemon
+    thread (started on first use) sends the aggregates every flush_interval
+    seconds. Call close() at shutdown for a final flush.
     
-    def __init__(self, region: str = 'us-east-1', cost_optimized: bool = True):
+    Usage:
+        publisher = CloudWatchPublisher(flush_interval=30)
+        await publisher.publish_metric(MetricNamespace.DIMS, 'VerificationErrors', 1)
+        publisher.record(MetricNamespace.HEALTH, 'HealthCheckFailures', 1)  # sync code
+        publisher.close()
+    """
+    
+    def __init__(
+        self,
+        region: str = 'us-east-1',
+        cost_optimized: bool = True,
+        client: Any = None,
+        flush_interval: float = 60.0,
+        aggregation: str = 'statistics',
+        emit: str = 'api',
+        emf_stream: Optional[TextIO] = None,
+        max_retries: int = 2,
+        retry_delay: float = 0.5,
+        spill_capacity: int = 10000,
+        background: bool = True
+    ):
+        """
+        Initialize publisher.
+        
+        Args:
+            region: AWS region for the CloudWatch client
+            cost_optimized: Only publish critical metrics (see _is_critical_metric)
+            client: CloudWatch client (default: boto3.client('cloudwatch'))
+            flush_interval: Seconds between background flushes
+            aggregation: 'statistics' (StatisticSet) or 'values' (Values/Counts)
+            emit: 'api' (put_metric_data) or 'emf' (Embedded Metric Format lines)
+            emf_stream: Stream for EMF lines (default: sys.stdout)
+            max_retries: Retries per put_metric_data call before spilling
+            retry_delay: Base backoff in seconds (doubled per retry)
+            spill_capacity: Datums kept for resending after failed calls
+            background: Flush from a background thread (False: flush() only)
+        """
+        if aggregation not in ('statistics', 'values'):
+            raise ValueError(f"aggregation must be 'statistics' or 'values', got {aggregation!r}")
+        if emit not in ('api', 'emf'):
+            raise ValueError(f"emit must be 'api' or 'emf', got {emit!r}")
+        
         self.region = region
         self.cost_optimized = cost_optimized
-        self.client = None
-        self._metric_buffer: List[CloudWatchMetric] = []
-        self._buffer_size = 20
+        self.client = client
+        self.flush_interval = flush_interval
+        self.aggregation = aggregation
+        self.emit = emit
+        self.emf_stream = emf_stream
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.background = background
+        self.stats = PublisherStats()
         
-        if boto3:
+        self._aggregates: Dict[Tuple, MetricAggregate] = {}
+        self._spill: Deque[Tuple[str, Dict[str, Any]]] = deque(maxlen=spill_capacity)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        
+        if emit == 'api' and client is None and boto3:
             try:
                 self.client = boto3.client('cloudwatch', region_name=region)
                 logger.info(f"CloudWatch client initialized for {region}")
             except Exception as e:
                 logger.error(f"Failed to initialize CloudWatch: {e}")
     
-    async def publish_metric(
+    @property
+    def enabled(self) -> bool:
+        """True if datapoints can be delivered (API client or EMF output)"""
+        return self.emit == 'emf' or self.client is not None
+    
+    @property
+    def pending(self) -> int:
+        """Aggregated series waiting for the next flush"""
+        return len(self._aggregates)
+    
+    def record(
         self,
-        namespace: MetricNamespace,
+        namespace: Union[MetricNamespace, str],
         name: str,
         value: float,
-        unit: MetricUnit = MetricUnit.COUNT,
+        unit: Union[MetricUnit, str] = MetricUnit.COUNT,
         dimensions: Optional[Dict[str, str]] = None,
         timestamp: Optional[datetime] = None
     ) -> bool:
-        """Publish a single metric"""
-        if not self.client:
+        """
+        Aggregate a single datapoint (non-blocking).
+        
+        Returns:
+            False if the metric is filtered out or publishing is disabled
+        """
+        if not self.enabled:
             return False
         
         if self.cost_optimized and not self._is_critical_metric(name):
             return False
         
-        metric = CloudWatchMetric(
-            namespace=namespace.value,
-            name=name,
-            value=value,
-            unit=unit.value,
-            dimensions=dimensions or {},
-            timestamp=timestamp or datetime.now()
-        )
-        
-        self._metric_buffer.append(metric)
+        namespace = namespace.value if isinstance(namespace, MetricNamespace) else namespace
+        unit = unit.value if isinstance(unit, MetricUnit) else unit
+        dims = tuple(sorted((dimensions or {}).items()))
+        epoch = (timestamp or datetime.now(timezone.utc)).timestamp()
+        minute = int(epoch // RESOLUTION_SECONDS)
+        key = (namespace, name, unit, dims, minute)
         
-        if len(self._metric_buffer) >= self._buffer_size:
-            return await self.flush()
+        with self._lock:
+            aggregate = self._aggregates.get(key)
+            if aggregate is None:
+                aggregate = MetricAggregate(
+                    namespace=namespace,
+                    name=name,
+                    unit=unit,
+                    dimensions=dims,
+                    timestamp=datetime.fromtimestamp(minute * RESOLUTION_SECONDS, tz=timezone.utc),
+                    values={} if self._tracks_values else None
+                )
+                self._aggregates[key] = aggregate
+            aggregate.add(float(value))
+            self.stats.datapoints_recorded += 1
         
+        if self.background and self._worker is None:
+            self.start()
         return True
     
+    async def publish_metric(
+        self,
+        namespace: MetricNamespace,
+        name: str,
+        value: float,
+        unit: MetricUnit = MetricUnit.COUNT,
+        dimensions: Optional[Dict[str, str]] = None,
+        timestamp: Optional[datetime] = None
+    ) -> bool:
+        """Publish a single metric (aggregated; sent by the next flush)"""
+        return self.record(namespace, name, value, unit, dimensions, timestamp)
+    
     async def flush(self) -> bool:
-        """Flush buffered metrics"""
-        if not self._metric_buffer or not self.client:
-            self._metric_buffer.clear()
-            return False
+        """Flush aggregated metrics without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.flush_now)
+    
+    def flush_now(self) -> bool:
+        """
+        Send everything aggregated so far, plus spilled datums (blocking).
         
-        try:
-            namespaces: Dict[str, List[CloudWatchMetric]] = {}
-            for metric in self._metric_buffer:
-                if metric.namespace not in namespaces:
-                    namespaces[metric.namespace] = []
-                namespaces[metric.namespace].append(metric)
+        Returns:
+            True if nothing is left unsent
+        """
+        with self._flush_lock:
+            with self._lock:
+                aggregates = list(self._aggregates.values())
+                self._aggregates = {}
             
-            for namespace, metrics in namespaces.items():
-                for i in range(0, len(metrics), self._buffer_size):
-                    batch = metrics[i:i + self._buffer_size]
-                    self.client.put_metric_data(
-                        Namespace=namespace,
-                        MetricData=[m.to_boto3_format() for m in batch]
-                    )
-                    logger.info(f"Published {len(batch)} metrics to {namespace}")
-            
-            self._metric_buffer.clear()
+            if self.emit == 'emf':
+                return self._write_emf(aggregates)
+            if not self.client:
+                return False
+            return self._send(aggregates)
+    
+    # =========================================================================
+    # Background flushing
+    # =========================================================================
+    
+    def start(self) -> None:
+        """Start the background flush thread (idempotent)"""
+        with self._lock:
+            if self._worker is not None:
+                return
+            self._stop_event.clear()
+            self._worker = threading.Thread(
+                target=self._run, name='cloudwatch-publisher', daemon=True
+            )
+            self._worker.start()
+    
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Stop the background thread and flush what is left"""
+        self._stop_event.set()
+        worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+            self._worker = None
+        return self.flush_now()
+    
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush_now()
+            except Exception as e:
+                logger.error(f"CloudWatch background flush failed: {e}")
+    
+    # =========================================================================
+    # Delivery
+    # =========================================================================
+    
+    @property
+    def _tracks_values(self) -> bool:
+        return self.aggregation == 'values' or self.emit == 'emf'
+    
+    def _send(self, aggregates: List[MetricAggregate]) -> bool:
+        """put_metric_data per namespace in MAX_DATUMS_PER_CALL batches"""
+        with self._lock:
+            spilled = list(self._spill)
+            self._spill.clear()
+        
+        namespaces: Dict[str, List[Dict[str, Any]]] = {}
+        for namespace, datum in spilled:
+            namespaces.setdefault(namespace, []).append(datum)
+        for aggregate in aggregates:
+            namespaces.setdefault(aggregate.namespace, []).extend(aggregate.to_boto3_format())
+        
+        delivered = True
+        for namespace, datums in namespaces.items():
+            for i in range(0, len(datums), MAX_DATUMS_PER_CALL):
+                batch = datums[i:i + MAX_DATUMS_PER_CALL]
+                if self._put(namespace, batch):
+                    logger.debug(f"Published {len(batch)} metrics to {namespace}")
+                else:
+                    self._spill_batch(namespace, batch)
+                    delivered = False
+        return delivered
+    
+    def _put(self, namespace: str, batch: List[Dict[str, Any]]) -> bool:
+        """One put_metric_data call with retries"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.client.put_metric_data(Namespace=namespace, MetricData=batch)
+                with self._lock:
+                    self.stats.api_calls += 1
+                    self.stats.datums_sent += len(batch)
+                return True
+            except Exception as e:
+                with self._lock:
+                    self.stats.failed_calls += 1
+                if attempt == self.max_retries:
+                    logger.error(f"Error publishing {len(batch)} metrics to {namespace}: {e}")
+                    return False
+                with self._lock:
+                    self.stats.retries += 1
+                time.sleep(self.retry_delay * 2 ** attempt)
+        return False
+    
+    def _spill_batch(self, namespace: str, batch: List[Dict[str, Any]]) -> None:
+        """Keep a failed batch for the next flush, dropping the oldest when full"""
+        with self._lock:
+            overflow = max(0, len(self._spill) + len(batch) - self._spill.maxlen)
+            self._spill.extend((namespace, datum) for datum in batch)
+            self.stats.spilled += len(batch)
+            self.stats.dropped += overflow
+        if overflow:
+            logger.warning(f"CloudWatch spill buffer full, dropped {overflow} metrics")
+    
+    def _write_emf(self, aggregates: List[MetricAggregate]) -> bool:
+        """Write Embedded Metric Format lines to emf_stream"""
+        lines = [line for aggregate in aggregates for line in aggregate.to_emf()]
+        if not lines:
             return True
-        except Exception as e:
-            logger.error(f"Error publishing to CloudWatch: {e}")
-            self._metric_buffer.clear()
-            return False
+        stream = self.emf_stream or sys.stdout
+        stream.write('\n'.join(lines) + '\n')
+        stream.flush()
+        with self._lock:
+            self.stats.emf_lines += len(lines)
+        return True
     
     def _is_critical_metric(self, metric_name: str) -> bool:
         """Check if metric is critical"""
@@ -167,4 +472,7 @@ class DIMSCloudWatchPublisher:
         )
         return True
 
-__all__ = ['CloudWatchPublisher', 'DIMSCloudWatchPublisher', 'MetricNamespace', 'MetricUnit']
+__all__ = [
+    'CloudWatchPublisher', 'DIMSCloudWatchPublisher', 'MetricAggregate',
+    'MetricNamespace', 'MetricUnit', 'PublisherStats'
+]
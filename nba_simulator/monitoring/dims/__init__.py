@@ -10,14 +10,16 @@ Features:
 - Event-driven updates
 - Approval workflows
 - Output generation
+- In-process metric providers with shared scans
 
 Created: November 5, 2025
 Migrated from: scripts/monitoring/dims/
 """
 
 from .core import DIMSCore
+from .providers import ScanContext, register_provider
 
-__all__ = ["DIMSCore"]
+__all__ = ["DIMSCore", "ScanContext", "register_provider"]
 
 # Additional imports available when database is enabled
 try:
@@ -7,13 +7,17 @@ Original: scripts/monitoring/dims/core.py
 """
 
 import os
+import time
 import yaml
 import subprocess
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 
+from .providers import ScanContext, calculate_with_provider
+
 logger = logging.getLogger(__name__)
 
 # Phase 2 imports (optional - only if enabled)
@@ -213,17 +217,36 @@ class DIMSCore:
 
         return current
 
-    def calculate_metric(self, metric_category: str, metric_name: str) -> Optional[Any]:
+    def calculate_metric(
+        self,
+        metric_category: str,
+        metric_name: str,
+        context: Optional[ScanContext] = None,
+    ) -> Optional[Any]:
         """
-        Calculate current value of a metric by executing its command.
+        Calculate current value of a metric.
+
+        Uses the metric's in-process provider when one is configured (and
+        verification.native_providers is not disabled), falling back to
+        executing its shell command.
 
         Args:
             metric_category: Metric category (e.g., 's3_storage')
             metric_name: Metric name (e.g., 'total_objects')
+            context: Shared scans for the current verification run
 
         Returns:
             Calculated value or None if calculation failed
         """
+        return self._calculate_metric(metric_category, metric_name, context)[0]
+
+    def _calculate_metric(
+        self,
+        metric_category: str,
+        metric_name: str,
+        context: Optional[ScanContext] = None,
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        """calculate_metric, also returning the source used ('provider:<type>' or 'command')"""
         # Get metric definition from config
         metric_def = (
             self.config.get("metrics", {}).get(metric_category, {}).get(metric_name)
@@ -233,12 +256,37 @@ class DIMSCore:
             logger.error(
                 f"Metric definition not found: {metric_category}.{metric_name}"
             )
-            return None
+            return (None, None)
 
         # Check if metric is enabled
         if not metric_def.get("enabled", True):
             logger.info(f"Metric disabled: {metric_category}.{metric_name}")
-            return None
+            return (None, None)
+
+        # In-process provider
+        provider = metric_def.get("provider")
+        native = self.config.get("verification", {}).get("native_providers", True)
+        if provider and native:
+            owns_context = context is None
+            if owns_context:
+                context = self.create_scan_context()
+            try:
+                value = calculate_with_provider(provider, context)
+                if value is not None:
+                    return (
+                        self._parse_value(value, metric_def),
+                        f"provider:{provider.get('type')}",
+                    )
+                logger.warning(
+                    f"Provider returned no value for {metric_category}.{metric_name}"
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Provider failed for {metric_category}.{metric_name}: {e}"
+                )
+            finally:
+                if owns_context:
+                    context.close()
 
         # Get command
         command = metric_def.get("command")
@@ -246,15 +294,18 @@ class DIMSCore:
             logger.error(
                 f"No command defined for metric: {metric_category}.{metric_name}"
             )
-            return None
+            return (None, None)
 
         # Execute command
         success, output = self.execute_command(command)
 
         if not success or output is None:
-            return None
+            return (None, "command")
+
+        return (self._parse_value(output, metric_def), "command")
 
-        # Parse output based on parse_type
+    def _parse_value(self, output: Any, metric_def: Dict[str, Any]) -> Optional[Any]:
+        """Parse command output or provider value based on parse_type"""
         parse_type = metric_def.get("parse_type", "string")
 
         try:
@@ -264,15 +315,25 @@ class DIMSCore:
                 precision = metric_def.get("precision", 2)
                 return round(float(output), precision)
             elif parse_type == "string":
-                return output
+                return str(output)
             elif parse_type == "boolean":
-                return output.lower() in ("true", "yes", "1")
+                if isinstance(output, bool):
+                    return output
+                return str(output).lower() in ("true", "yes", "1")
             else:
                 return output
         except (ValueError, TypeError) as e:
             logger.error(f"Failed to parse output '{output}' as {parse_type}: {e}")
             return None
 
+    def create_scan_context(self) -> ScanContext:
+        """Shared scans for one verification run"""
+        verification = self.config.get("verification", {})
+        return ScanContext(
+            self.project_root,
+            s3_max_workers=verification.get("s3_max_workers", 16),
+        )
+
     def update_metric(
         self,
         metric_category: str,
@@ -350,16 +411,22 @@ class DIMSCore:
 
         return True
 
-    def verify_metric(self, metric_category: str, metric_name: str) -> Dict[str, Any]:
+    def verify_metric(
+        self,
+        metric_category: str,
+        metric_name: str,
+        context: Optional[ScanContext] = None,
+    ) -> Dict[str, Any]:
         """
         Verify a single metric by comparing documented vs actual value.
 
         Args:
             metric_category: Metric category
             metric_name: Metric name
+            context: Shared scans for the current verification run
 
         Returns:
-            Dict with verification results
+            Dict with verification results (including elapsed_ms and source)
         """
         result = {
             "metric": f"{metric_category}.{metric_name}",
@@ -370,6 +437,8 @@ class DIMSCore:
             "status": "ok",
             "severity": "none",
             "message": "",
+            "source": None,
+            "elapsed_ms": None,
         }
 
         # Get documented value
@@ -377,7 +446,10 @@ class DIMSCore:
         result["documented"] = documented
 
         # Calculate actual value
-        actual = self.calculate_metric(metric_category, metric_name)
+        started = time.perf_counter()
+        actual, source = self._calculate_metric(metric_category, metric_name, context)
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        result["source"] = source
         result["actual"] = actual
 
         if actual is None:
@@ -447,15 +519,22 @@ class DIMSCore:
 
         return result
 
-    def verify_all_metrics(self, triggered_by: str = "manual") -> Dict[str, Any]:
+    def verify_all_metrics(
+        self, triggered_by: str = "manual", max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Verify all metrics defined in config.
 
+        Metrics run concurrently on a bounded pool and share provider scans
+        (one S3 listing per bucket, one walk per tree, one DB connection).
+
         Args:
             triggered_by: What triggered this verification
+            max_workers: Concurrent metrics (default: verification.max_workers or 4)
 
         Returns:
-            Dict with verification results
+            Dict with verification results, per-metric timings and shared
+            scan timings
         """
         start_time = datetime.now()
 
@@ -474,10 +553,13 @@ class DIMSCore:
                 "error": 0,
                 "new": 0,
             },
+            "metric_timings": {},
+            "scan_timings": {},
         }
 
         metrics_config = self.config.get("metrics", {})
 
+        to_verify = []
         for category, metrics in metrics_config.items():
             for metric_name, metric_def in metrics.items():
                 results["total_metrics"] += 1
@@ -486,22 +568,47 @@ class DIMSCore:
                 if not metric_def.get("enabled", True):
                     continue
 
-                logger.info(f"Verifying {category}.{metric_name}...")
+                to_verify.append((category, metric_name))
 
-                verification = self.verify_metric(category, metric_name)
-                results["verified"] += 1
+        if max_workers is None:
+            max_workers = self.config.get("verification", {}).get("max_workers", 4)
 
-                # Update summary
-                status = verification["status"]
-                if status in results["summary"]:
-                    results["summary"][status] += 1
+        context = self.create_scan_context()
 
-                # Add to discrepancies if not OK
-                if status != "ok":
-                    results["discrepancies"].append(verification)
+        def verify(item: Tuple[str, str]) -> Dict[str, Any]:
+            category, metric_name = item
+            logger.info(f"Verifying {category}.{metric_name}...")
+            return self.verify_metric(category, metric_name, context)
 
-                if status in ("minor", "moderate", "major"):
-                    results["drift_detected"] = True
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                verifications = list(executor.map(verify, to_verify))
+        finally:
+            context.close()
+
+        # Results in config order
+        for verification in verifications:
+            results["verified"] += 1
+            results["metric_timings"][verification["metric"]] = verification[
+                "elapsed_ms"
+            ]
+
+            # Update summary
+            status = verification["status"]
+            if status in results["summary"]:
+                results["summary"][status] += 1
+
+            # Add to discrepancies if not OK
+            if status != "ok":
+                results["discrepancies"].append(verification)
+
+            if status in ("minor", "moderate", "major"):
+                results["drift_detected"] = True
+
+        results["scan_timings"] = {
+            scan: round(seconds * 1000, 1)
+            for scan, seconds in context.scan_seconds.items()
+        }
 
         execution_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
 
@@ -0,0 +1,322 @@
+"""
+DIMS Metric Providers - In-Process Metric Calculation
+
+Native replacements for the shell commands in inventory/config.yaml.
+A metric opts in with a ``provider`` block; its ``command`` stays as the
+fallback when the provider is disabled or fails:
+
+    s3_storage:
+      total_objects:
+        provider:
+          type: s3_inventory
+          bucket: nba-sim-raw-data-lake
+          aggregate: count
+        command: "python3 -c ..."   # fallback
+
+Providers share work through a ScanContext created once per verification
+run: one bucket listing per S3 bucket, one directory walk per tree, one
+line count per file and one database connection, however many metrics
+read from them. Metrics in the same run can execute concurrently; each
+shared scan runs once and the other metrics wait for it.
+
+Provider types:
+- s3_inventory: count/size aggregates over a bucket listing (S3Inventory)
+- file_count: files under a tree matching name/path patterns (find | wc -l)
+- line_count: newline count over files and trees (wc -l / cat | wc -l)
+- sql_query: first column of the first row of a query
+
+Created: November 2025
+"""
+
+import fnmatch
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+S3_AGGREGATES = (
+    "count",
+    "size_bytes",
+    "size_gb",
+    "avg_size_kb",
+    "small_files",
+    "newest_age_hours",
+    "oldest_age_days",
+)
+
+
+class ScanContext:
+    """
+    Shared scans for one verification run.
+
+    Each scan is keyed (e.g. ("s3", bucket), ("walk", path)) and computed
+    at most once; concurrent callers of the same key wait for the first.
+
+    Usage:
+        context = ScanContext(project_root)
+        value = calculate_with_provider(spec, context)
+        context.close()
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        s3_client_factory: Optional[Callable[[], Any]] = None,
+        connect: Optional[Callable[[], Any]] = None,
+        s3_max_workers: int = 16,
+    ):
+        """
+        Initialize scan context.
+
+        Args:
+            project_root: Base directory for relative file paths
+            s3_client_factory: Returns an S3 client (default: boto3.client('s3'))
+            connect: Returns a DB-API connection (default: get_database_connection)
+            s3_max_workers: Concurrent list requests per bucket listing
+        """
+        self.project_root = Path(project_root)
+        self.s3_client_factory = s3_client_factory
+        self.connect = connect
+        self.s3_max_workers = s3_max_workers
+
+        self._values: Dict[Any, Any] = {}
+        self._key_locks: Dict[Any, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._connection = None
+        self._connection_lock = threading.Lock()
+        # Seconds spent computing each shared scan (not waiting on it)
+        self.scan_seconds: Dict[str, float] = {}
+
+    def shared(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Value for key, computing it once per run"""
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    return self._values[key]
+            started = time.perf_counter()
+            value = compute()
+            with self._lock:
+                self._values[key] = value
+                self.scan_seconds[":".join(map(str, key))] = (
+                    time.perf_counter() - started
+                )
+            return value
+
+    def resolve(self, path: str) -> Path:
+        """Expand ~ and make relative paths relative to project_root"""
+        expanded = Path(os.path.expanduser(path))
+        return expanded if expanded.is_absolute() else self.project_root / expanded
+
+    # =========================================================================
+    # Shared scans
+    # =========================================================================
+
+    def s3_inventory(self, bucket: str):
+        """One S3Inventory listing per bucket per run"""
+
+        def build():
+            from ..quality.s3_inventory import S3Inventory
+
+            if self.s3_client_factory is not None:
+                client = self.s3_client_factory()
+            else:
+                import boto3
+
+                client = boto3.client("s3")
+            inventory = S3Inventory(
+                client, bucket, max_workers=self.s3_max_workers, ttl_seconds=1e12
+            )
+            inventory.refresh(force=True)
+            return inventory
+
+        return self.shared(("s3", bucket), build)
+
+    def walk(self, path: str) -> List[str]:
+        """
+        Regular files under a tree, as find(1) would print them.
+
+        Paths keep the caller's spelling of the root (e.g. './scripts/x.py')
+        so find-style -path patterns match. Symlinks are not followed.
+        """
+
+        def build():
+            root = self.resolve(path)
+            if not root.is_dir():
+                return []
+            files = []
+            for directory, _, filenames in os.walk(root):
+                relative = os.path.relpath(directory, root)
+                display = path if relative == "." else os.path.join(path, relative)
+                for name in filenames:
+                    if not os.path.islink(os.path.join(directory, name)):
+                        files.append(os.path.join(display, name))
+            return files
+
+        return self.shared(("walk", path), build)
+
+    def line_count(self, path: str) -> Optional[int]:
+        """Newline count of one file (wc -l), None if unreadable"""
+
+        def build():
+            try:
+                with open(self.resolve(path), "rb") as f:
+                    return sum(
+                        chunk.count(b"\n")
+                        for chunk in iter(lambda: f.read(1 << 20), b"")
+                    )
+            except OSError:
+                return None
+
+        return self.shared(("lines", path), build)
+
+    def query(self, sql: str) -> Any:
+        """First column of the first row, one connection per run"""
+
+        def build():
+            with self._connection_lock:
+                if self._connection is None:
+                    if self.connect is not None:
+                        self._connection = self.connect()
+                    else:
+                        from ...database import get_database_connection
+
+                        self._connection = get_database_connection()
+                with self._connection.cursor() as cursor:
+                    cursor.execute(sql)
+                    row = cursor.fetchone()
+                    self._connection.rollback()
+            return row[0] if row else None
+
+        return self.shared(("sql", sql), build)
+
+    def close(self) -> None:
+        """Release the database connection"""
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception as e:
+                logger.debug(f"Error closing DIMS provider connection: {e}")
+            self._connection = None
+
+
+# =============================================================================
+# Providers
+# =============================================================================
+
+
+def s3_inventory_metric(spec: Dict[str, Any], context: ScanContext) -> Any:
+    """Aggregate over objects under spec['prefix'] (or each of 'prefixes')"""
+    aggregate = spec.get("aggregate", "count")
+    if aggregate not in S3_AGGREGATES:
+        raise ValueError(
+            f"Unknown s3_inventory aggregate {aggregate!r} (expected {S3_AGGREGATES})"
+        )
+
+    inventory = context.s3_inventory(spec["bucket"])
+    prefixes = spec.get("prefixes") or [spec.get("prefix", "")]
+    objects = [info for prefix in prefixes for info in inventory.objects(prefix)]
+    sizes = [info.size for info in objects]
+
+    if aggregate == "count":
+        return len(objects)
+    if aggregate == "size_bytes":
+        return sum(sizes)
+    if aggregate == "size_gb":
+        return sum(sizes) / 1024**3
+    if aggregate == "avg_size_kb":
+        return sum(sizes) / len(sizes) / 1024 if sizes else 0.0
+    if aggregate == "small_files":
+        return sum(1 for size in sizes if size < spec.get("max_size_bytes", 1024))
+
+    if not objects:
+        return None
+    now = datetime.now(timezone.utc)
+    if aggregate == "newest_age_hours":
+        newest = max(info.last_modified for info in objects)
+        return int((now - newest).total_seconds() // 3600)
+    oldest = min(info.last_modified for info in objects)
+    return int((now - oldest).total_seconds() // 86400)
+
+
+def _matching_files(spec: Dict[str, Any], context: ScanContext) -> List[str]:
+    """Files under spec['path'] matching 'pattern' (name) and 'path_pattern'"""
+    pattern = spec.get("pattern", "*")
+    path_pattern = spec.get("path_pattern")
+    return [
+        path
+        for path in context.walk(spec.get("path", "."))
+        if fnmatch.fnmatchcase(os.path.basename(path), pattern)
+        and (path_pattern is None or fnmatch.fnmatchcase(path, path_pattern))
+    ]
+
+
+def file_count_metric(spec: Dict[str, Any], context: ScanContext) -> int:
+    """Number of files under a tree (find PATH -name PATTERN -type f | wc -l)"""
+    return len(_matching_files(spec, context))
+
+
+def line_count_metric(spec: Dict[str, Any], context: ScanContext) -> Optional[int]:
+    """
+    Total lines over explicit files and tree patterns.
+
+    spec:
+        files: [path, ...]                     # wc -l files
+        trees: [{path, pattern, path_pattern}]  # find ... -exec cat | wc -l
+
+    Missing files are skipped like `wc -l ... 2>/dev/null`; as with wc, a
+    single missing file fails the metric (None) rather than counting 0.
+    """
+    files = spec.get("files", [])
+    counts = [context.line_count(path) for path in files]
+    existing = [count for count in counts if count is not None]
+    if len(files) == 1 and not existing:
+        return None
+
+    total = sum(existing)
+    for tree in spec.get("trees", []):
+        for path in _matching_files(tree, context):
+            total += context.line_count(path) or 0
+    return total
+
+
+def sql_query_metric(spec: Dict[str, Any], context: ScanContext) -> Any:
+    """Scalar result of spec['query']"""
+    return context.query(spec["query"])
+
+
+PROVIDERS: Dict[str, Callable[[Dict[str, Any], ScanContext], Any]] = {
+    "s3_inventory": s3_inventory_metric,
+    "file_count": file_count_metric,
+    "line_count": line_count_metric,
+    "sql_query": sql_query_metric,
+}
+
+
+def register_provider(
+    name: str, provider: Callable[[Dict[str, Any], ScanContext], Any]
+) -> None:
+    """Add or replace a provider type"""
+    PROVIDERS[name] = provider
+
+
+def calculate_with_provider(spec: Dict[str, Any], context: ScanContext) -> Any:
+    """
+    Run the provider named by spec['type'].
+
+    Raises:
+        ValueError: Unknown provider type
+    """
+    provider = PROVIDERS.get(spec.get("type"))
+    if provider is None:
+        raise ValueError(f"Unknown metric provider: {spec.get('type')!r}")
+    return provider(spec, context)
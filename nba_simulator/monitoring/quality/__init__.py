@@ -12,6 +12,7 @@ Comprehensive data quality monitoring for NBA data pipeline:
 Components:
 - QualityMonitor: Main quality monitoring orchestrator
 - DataQualityChecker: Data validation and quality checks
+- S3Inventory: Shared, cached parallel listing of the data lake bucket
 - QualityMetrics: Quality metrics tracking and analysis
 - QualityReport: Automated quality report generation
 
@@ -21,6 +22,7 @@ Phase: 4 (Monitoring)
 
 from .base import QualityMonitor, QualityStatus, QualityMetric
 from .data_quality import DataQualityChecker, DataQualityConfig
+from .s3_inventory import S3Inventory
 from .metrics import QualityMetricsTracker, QualityThreshold
 from .reports import QualityReportGenerator, ReportFormat
 
@@ -32,6 +34,7 @@ __all__ = [
     # Data Quality
     "DataQualityChecker",
     "DataQualityConfig",
+    "S3Inventory",
     # Metrics
     "QualityMetricsTracker",
     "QualityThreshold",
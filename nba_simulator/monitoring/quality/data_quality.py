@@ -8,6 +8,9 @@ Comprehensive data quality checks for NBA data pipeline:
 - Schema validation
 - Data completeness checks
 
+S3 checks share one cached, parallel bucket listing (S3Inventory) and
+validate sampled JSON objects concurrently.
+
 Migrated from: scripts/monitoring/data_quality_monitor.py
 Enhanced with better error handling, type safety, and integration
 
@@ -15,11 +18,12 @@ Created: November 5, 2025
 """
 
 import json
-import random
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 import boto3
 from botocore.exceptions import ClientError
 
@@ -31,6 +35,7 @@ from .base import (
     QualitySeverity,
     BaseQualityChecker,
 )
+from .s3_inventory import S3Inventory
 from ...database import get_database_connection
 
 
@@ -47,6 +52,10 @@ class DataQualityConfig:
         sample_size: Number of files to sample for validation
         enable_s3_checks: Enable S3-based quality checks
         enable_db_checks: Enable database quality checks
+        max_workers: Concurrent S3 list/get requests
+        inventory_ttl_seconds: Reuse the bucket listing for this long
+        inventory_cache_path: Optional file to persist the bucket listing
+        json_result_cache_size: JSON validation outcomes remembered (LRU)
     """
 
     s3_bucket: str = "nba-sim-raw-data-lake"
@@ -56,6 +65,10 @@ class DataQualityConfig:
     sample_size: int = 50  # Sample 50 files
     enable_s3_checks: bool = True
     enable_db_checks: bool = True
+    max_workers: int = 16
+    inventory_ttl_seconds: float = 300.0
+    inventory_cache_path: Optional[str] = None
+    json_result_cache_size: int = 10000
 
 
 class DataQualityChecker(BaseQualityChecker):
@@ -71,7 +84,10 @@ class DataQualityChecker(BaseQualityChecker):
     """
 
     def __init__(
-        self, monitor: QualityMonitor, config: Optional[DataQualityConfig] = None
+        self,
+        monitor: QualityMonitor,
+        config: Optional[DataQualityConfig] = None,
+        s3_client=None,
     ):
         """
         Initialize data quality checker.
@@ -79,20 +95,42 @@ class DataQualityChecker(BaseQualityChecker):
         Args:
             monitor: Parent quality monitor
             config: Quality check configuration
+            s3_client: Optional S3 client (defaults to boto3.client("s3"))
         """
         super().__init__("data_quality", monitor)
 
         self.config = config or DataQualityConfig()
 
         # AWS clients
-        if self.config.enable_s3_checks:
+        if not self.config.enable_s3_checks:
+            self.s3_client = None
+        elif s3_client is not None:
+            self.s3_client = s3_client
+        else:
             try:
                 self.s3_client = boto3.client("s3")
             except Exception as e:
                 self.logger.warning(f"Could not initialize S3 client: {e}")
                 self.s3_client = None
-        else:
-            self.s3_client = None
+
+        # Shared bucket listing for counts, sampling and freshness
+        self.inventory = (
+            S3Inventory(
+                self.s3_client,
+                self.config.s3_bucket,
+                max_workers=self.config.max_workers,
+                ttl_seconds=self.config.inventory_ttl_seconds,
+                cache_path=self.config.inventory_cache_path,
+            )
+            if self.s3_client
+            else None
+        )
+
+        # JSON validation outcomes: key -> ((ETag, LastModified), outcome).
+        # One entry per key, least recently used evicted past the size limit
+        self._json_results: "OrderedDict[str, Tuple[Tuple[str, datetime], str]]" = (
+            OrderedDict()
+        )
 
         # Database connection
         if self.config.enable_db_checks:
@@ -214,49 +252,17 @@ class DataQualityChecker(BaseQualityChecker):
 
     def _get_file_counts(self) -> Dict[str, Dict[str, Any]]:
         """
-        Get current file counts from S3.
+        Get current file counts from the shared S3 inventory.
 
         Returns:
             Dictionary of {data_type: {count, size_gb}}
         """
-        file_counts = {}
-
         try:
-            paginator = self.s3_client.get_paginator("list_objects_v2")
-            pages = paginator.paginate(Bucket=self.config.s3_bucket)
-
-            for page in pages:
-                if "Contents" not in page:
-                    continue
-
-                for obj in page["Contents"]:
-                    key = obj["Key"]
-                    size = obj["Size"]
-
-                    # Extract data type from path
-                    if "/" in key:
-                        data_type = key.split("/")[0]
-                    else:
-                        data_type = "root"
-
-                    if data_type not in file_counts:
-                        file_counts[data_type] = {"count": 0, "size": 0}
-
-                    file_counts[data_type]["count"] += 1
-                    file_counts[data_type]["size"] += size
-
-            # Convert sizes to GB
-            for data_type in file_counts:
-                file_counts[data_type]["size_gb"] = file_counts[data_type]["size"] / (
-                    1024**3
-                )
-
+            return self.inventory.file_counts()
         except ClientError as e:
             self.logger.error(f"S3 error getting file counts: {str(e)}")
             raise
 
-        return file_counts
-
     def _check_file_count_anomaly(
         self, data_type: str, current_count: int
     ) -> Optional[QualityMetric]:
@@ -356,26 +362,10 @@ class DataQualityChecker(BaseQualityChecker):
                 self.logger.warning("No JSON files found for quality check")
                 return metrics
 
-            valid_count = 0
-            invalid_count = 0
-            empty_count = 0
-
-            for file_path in json_files:
-                try:
-                    response = self.s3_client.get_object(
-                        Bucket=self.config.s3_bucket, Key=file_path
-                    )
-                    content = response["Body"].read()
-
-                    if len(content) == 0:
-                        empty_count += 1
-                        continue
-
-                    json.loads(content.decode("utf-8"))
-                    valid_count += 1
-
-                except Exception:
-                    invalid_count += 1
+            outcomes = list(self._validate_json_files(json_files).values())
+            valid_count = outcomes.count("valid")
+            invalid_count = outcomes.count("invalid")
+            empty_count = outcomes.count("empty")
 
             # Calculate quality percentage
             total_sampled = len(json_files)
@@ -428,34 +418,84 @@ class DataQualityChecker(BaseQualityChecker):
 
     def _get_json_files_sample(self) -> List[str]:
         """
-        Get random sample of JSON files from S3.
+        Get random sample of JSON files from the shared S3 inventory.
 
         Returns:
             List of S3 keys for JSON files
         """
-        json_files = []
-
         try:
-            paginator = self.s3_client.get_paginator("list_objects_v2")
-            pages = paginator.paginate(Bucket=self.config.s3_bucket)
+            return self.inventory.sample_keys(self.config.sample_size, suffix=".json")
+        except Exception as e:
+            self.logger.error(f"Error getting JSON files sample: {str(e)}")
+            raise
 
-            for page in pages:
-                if "Contents" not in page:
-                    continue
+    def _validate_json_files(self, keys: List[str]) -> Dict[str, str]:
+        """
+        Validate JSON objects concurrently.
 
-                for obj in page["Contents"]:
-                    if obj["Key"].endswith(".json"):
-                        json_files.append(obj["Key"])
+        Objects whose ETag/LastModified are unchanged since a previous run
+        reuse that run's outcome instead of being downloaded again.
 
-            # Random sample
-            if len(json_files) > self.config.sample_size:
-                json_files = random.sample(json_files, self.config.sample_size)
+        Args:
+            keys: S3 keys to validate
 
-        except Exception as e:
-            self.logger.error(f"Error getting JSON files sample: {str(e)}")
-            raise
+        Returns:
+            Dictionary of {key: 'valid' | 'invalid' | 'empty'}
+        """
+        results = {}
+        pending = []
+
+        for key in keys:
+            info = self.inventory.get(key)
+            version = info.version if info else None
+            cached = self._json_results.get(key)
+            if version is not None and cached and cached[0] == version:
+                self._json_results.move_to_end(key)
+                results[key] = cached[1]
+            else:
+                pending.append((key, version))
 
-        return json_files
+        if pending:
+            workers = min(self.config.max_workers, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = executor.map(
+                    self._validate_json_object, [key for key, _ in pending]
+                )
+                for (key, version), outcome in zip(pending, outcomes):
+                    results[key] = outcome
+                    if version is not None:
+                        self._remember_json_result(key, version, outcome)
+
+        return results
+
+    def _remember_json_result(
+        self, key: str, version: Tuple[str, datetime], outcome: str
+    ) -> None:
+        """Cache a validation outcome, evicting the least recently used"""
+        self._json_results[key] = (version, outcome)
+        self._json_results.move_to_end(key)
+        while len(self._json_results) > self.config.json_result_cache_size:
+            self._json_results.popitem(last=False)
+
+    def _validate_json_object(self, key: str) -> str:
+        """
+        Download and parse one JSON object.
+
+        Returns:
+            'valid', 'invalid' or 'empty'
+        """
+        try:
+            response = self.s3_client.get_object(Bucket=self.config.s3_bucket, Key=key)
+            content = response["Body"].read()
+
+            if len(content) == 0:
+                return "empty"
+
+            json.loads(content.decode("utf-8"))
+            return "valid"
+
+        except Exception:
+            return "invalid"
 
     def _check_data_freshness(self) -> List[QualityMetric]:
         """
@@ -475,28 +515,18 @@ class DataQualityChecker(BaseQualityChecker):
             # Check schedule files for recent dates
             recent_files = []
 
-            paginator = self.s3_client.get_paginator("list_objects_v2")
-            pages = paginator.paginate(Bucket=self.config.s3_bucket, Prefix="schedule/")
+            for info in self.inventory.objects(prefix="schedule/", suffix=".json"):
+                # Extract date from filename
+                filename = Path(info.key).stem
 
-            for page in pages:
-                if "Contents" not in page:
+                try:
+                    if len(filename) == 8 and filename.isdigit():
+                        file_date = datetime.strptime(filename, "%Y%m%d")
+                        if file_date >= datetime.now() - timedelta(days=7):
+                            recent_files.append(file_date)
+                except ValueError:
                     continue
 
-                for obj in page["Contents"]:
-                    if not obj["Key"].endswith(".json"):
-                        continue
-
-                    # Extract date from filename
-                    filename = Path(obj["Key"]).stem
-
-                    try:
-                        if len(filename) == 8 and filename.isdigit():
-                            file_date = datetime.strptime(filename, "%Y%m%d")
-                            if file_date >= datetime.now() - timedelta(days=7):
-                                recent_files.append(file_date)
-                    except ValueError:
-                        continue
-
             if recent_files:
                 latest_date = max(recent_files)
                 days_old = (datetime.now() - latest_date).days
@@ -0,0 +1,372 @@
+"""
+S3 Inventory
+
+Shared, cached listing of the data lake bucket for quality checks:
+- Prefix discovery with delimiter listings, then parallel per-prefix listing
+- In-memory (optionally on-disk) cache with a TTL
+- Incremental refresh: re-listed objects are diffed against the cache by
+  LastModified/ETag, so callers can reuse work keyed on unchanged objects
+- Per data type file counts and key sampling from one listing
+
+S3 cannot list "objects changed since", so a refresh still re-lists every
+prefix; it does so concurrently and reports what changed.
+
+Created: November 5, 2025
+"""
+
+import json
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class S3ObjectInfo:
+    """Listing entry for a single S3 object"""
+
+    key: str
+    size: int
+    last_modified: datetime
+    etag: str
+
+    @property
+    def version(self) -> Tuple[str, datetime]:
+        """Identity of this object's content for cache keys"""
+        return (self.etag, self.last_modified)
+
+    def to_record(self) -> List[Any]:
+        """Compact JSON-serializable form"""
+        return [self.key, self.size, self.last_modified.isoformat(), self.etag]
+
+    @classmethod
+    def from_record(cls, record: List[Any]) -> "S3ObjectInfo":
+        """Inverse of to_record"""
+        key, size, last_modified, etag = record
+        return cls(key, int(size), datetime.fromisoformat(last_modified), etag)
+
+
+@dataclass
+class InventoryChanges:
+    """Differences found by the most recent refresh"""
+
+    added: int = 0
+    modified: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    prefixes_listed: int = 0
+    elapsed_seconds: float = 0.0
+    added_keys: List[str] = field(default_factory=list, repr=False)
+    modified_keys: List[str] = field(default_factory=list, repr=False)
+    removed_keys: List[str] = field(default_factory=list, repr=False)
+
+
+class S3Inventory:
+    """
+    Cached listing of a bucket, shared by the DataQualityChecker checks.
+
+    Usage:
+        inventory = S3Inventory(s3_client, "nba-sim-raw-data-lake")
+        counts = inventory.file_counts()
+        sample = inventory.sample_keys(50, suffix=".json")
+        schedule = inventory.objects(prefix="schedule/")
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket: str,
+        max_workers: int = 16,
+        ttl_seconds: float = 300.0,
+        prefix_depth: int = 1,
+        cache_path: Optional[str] = None,
+    ):
+        """
+        Initialize inventory.
+
+        Args:
+            s3_client: boto3 S3 client
+            bucket: Bucket name
+            max_workers: Concurrent list requests
+            ttl_seconds: Age after which the listing is refreshed on access
+            prefix_depth: Delimiter levels to split into parallel listings
+            cache_path: Optional JSON file to persist the listing across runs
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if prefix_depth < 0:
+            raise ValueError("prefix_depth must be >= 0")
+
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.max_workers = max_workers
+        self.ttl_seconds = ttl_seconds
+        self.prefix_depth = prefix_depth
+        self.cache_path = Path(cache_path) if cache_path else None
+
+        self._objects: Dict[str, S3ObjectInfo] = {}
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self.last_changes = InventoryChanges()
+
+        if self.cache_path:
+            self._load_cache()
+
+    def __len__(self) -> int:
+        """Number of objects in the current listing"""
+        return len(self._ensure_fresh())
+
+    # =========================================================================
+    # Listing
+    # =========================================================================
+
+    @property
+    def is_stale(self) -> bool:
+        """True if the listing is missing or older than ttl_seconds"""
+        if self._refreshed_at is None:
+            return True
+        return time.time() - self._refreshed_at > self.ttl_seconds
+
+    def refresh(self, force: bool = False) -> InventoryChanges:
+        """
+        Re-list the bucket and diff it against the cached listing.
+
+        Args:
+            force: Refresh even if the listing is within its TTL
+
+        Returns:
+            Added/modified/removed/unchanged counts for this refresh
+        """
+        with self._lock:
+            if not force and not self.is_stale:
+                return self.last_changes
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                leaves, objects = self._discover(executor)
+                for listing in executor.map(self._list_prefix, leaves):
+                    objects.update(listing)
+
+            changes = self._diff(objects)
+            changes.prefixes_listed = len(leaves)
+            changes.elapsed_seconds = time.perf_counter() - started
+
+            self._objects = objects
+            self._refreshed_at = time.time()
+            self.last_changes = changes
+
+            logger.info(
+                f"Inventory of s3://{self.bucket}: {len(objects)} objects from "
+                f"{len(leaves)} prefixes in {changes.elapsed_seconds:.2f}s "
+                f"(+{changes.added} ~{changes.modified} -{changes.removed})"
+            )
+
+            if self.cache_path:
+                self._save_cache()
+
+            return changes
+
+    def _discover(self, executor) -> Tuple[List[str], Dict[str, S3ObjectInfo]]:
+        """
+        Walk delimiter listings down prefix_depth levels.
+
+        Returns:
+            (leaf prefixes to list in full, objects found above the leaves)
+        """
+        objects: Dict[str, S3ObjectInfo] = {}
+        if self.prefix_depth == 0:
+            return [""], objects
+
+        level = [""]
+        for _ in range(self.prefix_depth):
+            children: List[str] = []
+            for found, sub_prefixes in executor.map(self._list_level, level):
+                objects.update(found)
+                children.extend(sub_prefixes)
+            level = children
+            if not level:
+                break
+
+        return level, objects
+
+    def _list_level(self, prefix: str) -> Tuple[Dict[str, S3ObjectInfo], List[str]]:
+        """Delimiter listing of one level: (objects at this level, sub-prefixes)"""
+        objects: Dict[str, S3ObjectInfo] = {}
+        sub_prefixes: List[str] = []
+
+        for page in self._paginate(Prefix=prefix, Delimiter="/"):
+            for obj in page.get("Contents", []):
+                info = self._to_info(obj)
+                objects[info.key] = info
+            for common in page.get("CommonPrefixes", []):
+                sub_prefixes.append(common["Prefix"])
+
+        return objects, sub_prefixes
+
+    def _list_prefix(self, prefix: str) -> Dict[str, S3ObjectInfo]:
+        """Full (recursive) listing of one prefix"""
+        objects: Dict[str, S3ObjectInfo] = {}
+        for page in self._paginate(Prefix=prefix):
+            for obj in page.get("Contents", []):
+                info = self._to_info(obj)
+                objects[info.key] = info
+        return objects
+
+    def _paginate(self, **kwargs) -> Iterator[Dict[str, Any]]:
+        """list_objects_v2 pages for this bucket"""
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        return paginator.paginate(Bucket=self.bucket, **kwargs)
+
+    @staticmethod
+    def _to_info(obj: Dict[str, Any]) -> S3ObjectInfo:
+        """Convert a list_objects_v2 Contents entry"""
+        return S3ObjectInfo(
+            key=obj["Key"],
+            size=obj["Size"],
+            last_modified=obj["LastModified"],
+            etag=obj.get("ETag", "").strip('"'),
+        )
+
+    def _diff(self, objects: Dict[str, S3ObjectInfo]) -> InventoryChanges:
+        """Compare a new listing against the cached one"""
+        changes = InventoryChanges()
+        for key, info in objects.items():
+            previous = self._objects.get(key)
+            if previous is None:
+                changes.added_keys.append(key)
+            elif previous.version != info.version:
+                changes.modified_keys.append(key)
+            else:
+                changes.unchanged += 1
+        changes.removed_keys = [key for key in self._objects if key not in objects]
+
+        changes.added = len(changes.added_keys)
+        changes.modified = len(changes.modified_keys)
+        changes.removed = len(changes.removed_keys)
+        return changes
+
+    def _ensure_fresh(self) -> Dict[str, S3ObjectInfo]:
+        """Current listing, refreshed first if stale"""
+        if self.is_stale:
+            self.refresh()
+        return self._objects
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def objects(
+        self, prefix: str = "", suffix: Optional[str] = None
+    ) -> List[S3ObjectInfo]:
+        """
+        Objects under a prefix, optionally filtered by key suffix.
+
+        Args:
+            prefix: Key prefix (e.g. 'schedule/')
+            suffix: Key suffix (e.g. '.json')
+
+        Returns:
+            List of S3ObjectInfo
+        """
+        return [
+            info
+            for key, info in self._ensure_fresh().items()
+            if key.startswith(prefix) and (suffix is None or key.endswith(suffix))
+        ]
+
+    def get(self, key: str) -> Optional[S3ObjectInfo]:
+        """Listing entry for a key, if present"""
+        return self._ensure_fresh().get(key)
+
+    def file_counts(self) -> Dict[str, Dict[str, Any]]:
+        """
+        File count and size per data type (top-level key segment).
+
+        Returns:
+            Dictionary of {data_type: {count, size, size_gb}}
+        """
+        file_counts: Dict[str, Dict[str, Any]] = {}
+
+        for key, info in self._ensure_fresh().items():
+            data_type = key.split("/")[0] if "/" in key else "root"
+
+            if data_type not in file_counts:
+                file_counts[data_type] = {"count": 0, "size": 0}
+
+            file_counts[data_type]["count"] += 1
+            file_counts[data_type]["size"] += info.size
+
+        for counts in file_counts.values():
+            counts["size_gb"] = counts["size"] / (1024**3)
+
+        return file_counts
+
+    def sample_keys(
+        self,
+        sample_size: int,
+        suffix: Optional[str] = None,
+        prefix: str = "",
+        rng: Optional[random.Random] = None,
+    ) -> List[str]:
+        """
+        Random sample of keys from the listing.
+
+        Args:
+            sample_size: Maximum number of keys
+            suffix: Key suffix filter
+            prefix: Key prefix filter
+            rng: Random generator (for reproducible samples)
+
+        Returns:
+            List of keys (all matching keys if fewer than sample_size)
+        """
+        keys = [info.key for info in self.objects(prefix=prefix, suffix=suffix)]
+        if len(keys) > sample_size:
+            keys = (rng or random).sample(keys, sample_size)
+        return keys
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def _save_cache(self):
+        """Write the listing to cache_path (atomic replace)"""
+        payload = {
+            "bucket": self.bucket,
+            "refreshed_at": self._refreshed_at,
+            "objects": [info.to_record() for info in self._objects.values()],
+        }
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def _load_cache(self):
+        """Load a persisted listing, ignoring missing or mismatched caches"""
+        if not self.cache_path.exists():
+            return
+
+        try:
+            with open(self.cache_path) as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable inventory cache: {e}")
+            return
+
+        if payload.get("bucket") != self.bucket:
+            return
+
+        self._objects = {
+            record[0]: S3ObjectInfo.from_record(record)
+            for record in payload.get("objects", [])
+        }
+        self._refreshed_at = payload.get("refreshed_at")
@@ -0,0 +1,23 @@
+"""
+Game Simulation
+
+Monte Carlo game simulation driven by possession-level statistics.
+
+Exports:
+    - PossessionModel: Per-team possession outcome distributions
+    - PossessionSimulator: Vectorized, chunked Monte Carlo engine
+    - SimulationResult: Full score-sample matrix for one game
+"""
+
+from ..utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "PossessionModel": ".possession_engine",
+    "PossessionSimulator": ".possession_engine",
+    "SimulationResult": ".possession_engine",
+    "TeamPossessionProfile": ".possession_engine",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
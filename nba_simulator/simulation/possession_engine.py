@@ -0,0 +1,558 @@
+"""
+Possession-Level Monte Carlo Game Simulation
+
+Vectorized game simulator driven by the temporal_possession_stats table
+produced by PossessionExtractor:
+
+- PossessionModel: per-team distributions of points scored (offense) and
+  allowed (defense) per possession, plus possessions per game (pace)
+- PossessionSimulator: simulates N games as (simulations x possessions)
+  array operations, in fixed-size chunks so 100k+ simulations run in
+  bounded memory, with seedable per-game / per-chunk RNG streams
+- SimulationResult: the full (n_simulations, 2) home/away score matrix
+
+Matchup outcome distributions combine the offense's distribution with the
+opponent's defensive distribution relative to the league (log5). Tied
+games go to five-minute overtimes until every simulation has a winner.
+
+Usage:
+    model = PossessionModel.from_database(conn, seasons=[2023, 2024])
+    simulator = PossessionSimulator(model, seed=42)
+    result = simulator.simulate("1610612738", "1610612752", n_simulations=100_000)
+    result.scores          # (100000, 2) int32 matrix
+    result.home_win_prob
+
+Author: NBA Simulator AWS Team
+Created: October 2026
+"""
+
+import logging
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Points on a single possession are bucketed 0..MAX_POINTS (and-ones = 4)
+MAX_POINTS = 4
+POINT_VALUES = np.arange(MAX_POINTS + 1)
+
+REGULATION_SECONDS = 2880
+OVERTIME_SECONDS = 300
+MAX_OVERTIMES = 10
+
+OUTCOMES_QUERY = """
+SELECT offensive_team_id,
+       defensive_team_id,
+       LEAST(GREATEST(points_scored, 0), %(max_points)s) AS points,
+       COUNT(*) AS possessions
+FROM temporal_possession_stats
+{where}
+GROUP BY 1, 2, 3
+"""
+
+PACE_QUERY = """
+SELECT game_id, offensive_team_id, COUNT(*) AS possessions
+FROM temporal_possession_stats
+WHERE period <= 4{filters}
+GROUP BY 1, 2
+"""
+
+
+@dataclass
+class TeamPossessionProfile:
+    """Possession outcome distributions and pace for one team"""
+
+    team_id: str
+    offense: np.ndarray  # P(points scored = k) on own possessions
+    defense: np.ndarray  # P(points allowed = k) on opponent possessions
+    pace: float  # Offensive possessions per regulation game
+    pace_std: float
+    possessions: int = 0  # Offensive possessions observed
+    games: int = 0
+
+    @property
+    def points_per_possession(self) -> float:
+        return float(self.offense @ POINT_VALUES)
+
+
+class PossessionModel:
+    """
+    Per-team possession outcome distributions from temporal_possession_stats.
+
+    Team distributions are shrunk toward the league distribution with
+    prior_possessions pseudo-possessions, so thin samples (early season,
+    new franchises) stay sensible. Unknown teams use the league profile.
+    """
+
+    DEFAULT_PRIOR_POSSESSIONS = 200
+
+    def __init__(
+        self,
+        profiles: Dict[str, TeamPossessionProfile],
+        league: TeamPossessionProfile,
+    ):
+        self.profiles = profiles
+        self.league = league
+        self._warned = set()
+
+    @classmethod
+    def from_counts(
+        cls,
+        outcome_rows: Iterable[Sequence],
+        pace_rows: Iterable[Sequence],
+        prior_possessions: int = DEFAULT_PRIOR_POSSESSIONS,
+    ) -> "PossessionModel":
+        """
+        Build a model from aggregated possession counts.
+
+        Args:
+            outcome_rows: (offensive_team_id, defensive_team_id, points,
+                possessions) rows, as returned by OUTCOMES_QUERY
+            pace_rows: (game_id, team_id, possessions) rows for regulation
+                play, as returned by PACE_QUERY
+            prior_possessions: Pseudo-possessions of league prior per team
+
+        Returns:
+            PossessionModel
+        """
+        outcomes = pd.DataFrame(
+            list(outcome_rows),
+            columns=["offensive_team_id", "defensive_team_id", "points", "count"],
+        )
+        if outcomes.empty:
+            raise ValueError("No possessions to build a PossessionModel from")
+        outcomes["offensive_team_id"] = outcomes["offensive_team_id"].astype(str)
+        outcomes["defensive_team_id"] = outcomes["defensive_team_id"].astype(str)
+        outcomes["points"] = outcomes["points"].clip(0, MAX_POINTS).astype(int)
+
+        def counts_by(team_column: str) -> pd.DataFrame:
+            return outcomes.pivot_table(
+                index=team_column,
+                columns="points",
+                values="count",
+                aggfunc="sum",
+                fill_value=0,
+            ).reindex(columns=POINT_VALUES, fill_value=0)
+
+        offense = counts_by("offensive_team_id")
+        defense = counts_by("defensive_team_id")
+        league_counts = offense.sum(axis=0).to_numpy(dtype=np.float64)
+        league_dist = league_counts / league_counts.sum()
+
+        pace = pd.DataFrame(
+            list(pace_rows), columns=["game_id", "team_id", "possessions"]
+        )
+        pace["team_id"] = pace["team_id"].astype(str)
+        team_pace = pace.groupby("team_id")["possessions"].agg(["mean", "std", "count"])
+        league_pace = float(pace["possessions"].mean()) if len(pace) else 100.0
+        league_pace_std = float(pace["possessions"].std(ddof=0)) if len(pace) else 4.0
+
+        def shrink(counts: np.ndarray) -> np.ndarray:
+            return (counts + prior_possessions * league_dist) / (
+                counts.sum() + prior_possessions
+            )
+
+        profiles = {}
+        for team_id in offense.index.union(defense.index):
+            off_counts = (
+                offense.loc[team_id].to_numpy(dtype=np.float64)
+                if team_id in offense.index
+                else np.zeros(MAX_POINTS + 1)
+            )
+            def_counts = (
+                defense.loc[team_id].to_numpy(dtype=np.float64)
+                if team_id in defense.index
+                else np.zeros(MAX_POINTS + 1)
+            )
+            if team_id in team_pace.index:
+                row = team_pace.loc[team_id]
+                games = int(row["count"])
+                team_mean = float(row["mean"])
+                team_std = float(row["std"]) if games > 1 else league_pace_std
+            else:
+                games, team_mean, team_std = 0, league_pace, league_pace_std
+
+            profiles[team_id] = TeamPossessionProfile(
+                team_id=team_id,
+                offense=shrink(off_counts),
+                defense=shrink(def_counts),
+                pace=team_mean,
+                pace_std=team_std,
+                possessions=int(off_counts.sum()),
+                games=games,
+            )
+
+        league = TeamPossessionProfile(
+            team_id="league",
+            offense=league_dist,
+            defense=league_dist,
+            pace=league_pace,
+            pace_std=league_pace_std,
+            possessions=int(league_counts.sum()),
+            games=int(pace["game_id"].nunique()) if len(pace) else 0,
+        )
+        return cls(profiles, league)
+
+    @classmethod
+    def from_database(
+        cls,
+        conn,
+        seasons: Optional[List[int]] = None,
+        before: Optional[date] = None,
+        prior_possessions: int = DEFAULT_PRIOR_POSSESSIONS,
+    ) -> "PossessionModel":
+        """
+        Load a model from temporal_possession_stats.
+
+        Args:
+            conn: psycopg2 connection
+            seasons: Restrict to these seasons (default: all)
+            before: Only use games strictly before this date (no leakage
+                when simulating a given game date)
+            prior_possessions: Pseudo-possessions of league prior per team
+
+        Returns:
+            PossessionModel
+        """
+        conditions = []
+        params: Dict[str, Any] = {"max_points": MAX_POINTS}
+        if seasons:
+            conditions.append("season = ANY(%(seasons)s)")
+            params["seasons"] = list(seasons)
+        if before is not None:
+            conditions.append("game_date < %(before)s")
+            params["before"] = before
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        filters = "".join(f" AND {condition}" for condition in conditions)
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(OUTCOMES_QUERY.format(where=where), params)
+            outcome_rows = cursor.fetchall()
+            cursor.execute(PACE_QUERY.format(filters=filters), params)
+            pace_rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        logger.info(
+            f"Loaded possession model: {len(outcome_rows):,} outcome groups, "
+            f"{len(pace_rows):,} team-games"
+        )
+        return cls.from_counts(outcome_rows, pace_rows, prior_possessions)
+
+    def profile(self, team_id) -> TeamPossessionProfile:
+        """Profile for a team, falling back to the league profile"""
+        team_id = str(team_id)
+        profile = self.profiles.get(team_id)
+        if profile is None:
+            if team_id not in self._warned:
+                logger.warning(f"No possessions for team {team_id}; using league")
+                self._warned.add(team_id)
+            return self.league
+        return profile
+
+    def matchup(self, offense_team_id, defense_team_id) -> np.ndarray:
+        """
+        Points-per-possession distribution for one offense vs one defense.
+
+        log5: P(k) is proportional to offense(k) * defense(k) / league(k).
+        """
+        offense = self.profile(offense_team_id).offense
+        defense = self.profile(defense_team_id).defense
+        league = self.league.offense
+        weights = np.divide(
+            offense * defense,
+            league,
+            out=np.zeros_like(league),
+            where=league > 0,
+        )
+        total = weights.sum()
+        return weights / total if total > 0 else league.copy()
+
+    def pace(self, home_team_id, away_team_id) -> Tuple[float, float]:
+        """Expected possessions per team and its std for a matchup"""
+        home = self.profile(home_team_id)
+        away = self.profile(away_team_id)
+        return (
+            (home.pace + away.pace) / 2,
+            float(np.sqrt((home.pace_std**2 + away.pace_std**2) / 2)),
+        )
+
+
+@dataclass
+class SimulationResult:
+    """Score samples for one simulated game"""
+
+    home_team_id: str
+    away_team_id: str
+    scores: np.ndarray  # (n_simulations, 2) int32: home, away
+    overtimes: np.ndarray  # (n_simulations,) overtime periods played
+    seed: Optional[int] = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def n_simulations(self) -> int:
+        return int(self.scores.shape[0])
+
+    @property
+    def home_scores(self) -> np.ndarray:
+        return self.scores[:, 0]
+
+    @property
+    def away_scores(self) -> np.ndarray:
+        return self.scores[:, 1]
+
+    @property
+    def margins(self) -> np.ndarray:
+        return self.home_scores - self.away_scores
+
+    @property
+    def totals(self) -> np.ndarray:
+        return self.home_scores + self.away_scores
+
+    @property
+    def predicted_home_score(self) -> float:
+        return float(self.home_scores.mean())
+
+    @property
+    def predicted_away_score(self) -> float:
+        return float(self.away_scores.mean())
+
+    @property
+    def home_win_prob(self) -> float:
+        return float((self.margins > 0).mean())
+
+    @property
+    def away_win_prob(self) -> float:
+        return 1.0 - self.home_win_prob
+
+    @property
+    def simulations_per_second(self) -> float:
+        return (
+            self.n_simulations / self.elapsed_seconds if self.elapsed_seconds else 0.0
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """Summary statistics of the score distribution"""
+        margins = self.margins
+        totals = self.totals
+        return {
+            "home_team_id": self.home_team_id,
+            "away_team_id": self.away_team_id,
+            "n_simulations": self.n_simulations,
+            "predicted_home_score": self.predicted_home_score,
+            "predicted_away_score": self.predicted_away_score,
+            "home_win_prob": self.home_win_prob,
+            "margin_mean": float(margins.mean()),
+            "margin_std": float(margins.std()),
+            "total_mean": float(totals.mean()),
+            "total_std": float(totals.std()),
+            "overtime_rate": float((self.overtimes > 0).mean()),
+            "simulations_per_second": self.simulations_per_second,
+        }
+
+
+class PossessionSimulator:
+    """
+    Vectorized possession-level Monte Carlo simulator.
+
+    Each chunk of simulations draws a (chunk, possessions) matrix of
+    uniforms per team and maps it through the matchup CDF, so peak memory
+    is about chunk_size x possessions x 14 bytes regardless of
+    n_simulations (~25 MB traced at the default chunk size).
+
+    RNG streams: with a seed, each game gets its own SeedSequence derived
+    from (seed, home, away) and each chunk a spawned child stream, so
+    results are reproducible for a given (seed, chunk_size) and games do
+    not share random numbers.
+
+    predict_game() mirrors the multi-simulator interface used by the
+    betting scripts; its result exposes home_scores / away_scores.
+    """
+
+    DEFAULT_CHUNK_SIZE = 10_000
+
+    def __init__(
+        self,
+        model: PossessionModel,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        seed: Optional[int] = None,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.model = model
+        self.chunk_size = chunk_size
+        self.seed = seed
+
+    def _seed_sequence(
+        self, home_team_id: str, away_team_id: str, seed: Optional[int]
+    ) -> np.random.SeedSequence:
+        if seed is None:
+            return np.random.SeedSequence()
+        game_key = zlib.crc32(f"{home_team_id}:{away_team_id}".encode("utf-8"))
+        return np.random.SeedSequence(seed, spawn_key=(game_key,))
+
+    @staticmethod
+    def _score_possessions(
+        rng: np.random.Generator, cdf: np.ndarray, possessions: np.ndarray
+    ) -> np.ndarray:
+        """Total points over each row's possessions (rows = simulations)"""
+        width = int(possessions.max()) if len(possessions) else 0
+        if width == 0:
+            return np.zeros(len(possessions), dtype=np.int32)
+        draws = rng.random((len(possessions), width), dtype=np.float32)
+        points = np.searchsorted(cdf, draws, side="right").astype(np.int8)
+        points[np.arange(width) >= possessions[:, None]] = 0
+        return points.sum(axis=1, dtype=np.int32)
+
+    @staticmethod
+    def _draw_possessions(
+        rng: np.random.Generator,
+        size: int,
+        pace: float,
+        pace_std: float,
+        seconds: float,
+    ) -> np.ndarray:
+        """Possessions per team for each simulation over `seconds` of play"""
+        fraction = seconds / REGULATION_SECONDS
+        mean = pace * fraction
+        std = pace_std * np.sqrt(fraction)
+        return np.clip(np.rint(rng.normal(mean, std, size)), 0, None).astype(np.int32)
+
+    def _simulate_chunk(
+        self,
+        rng: np.random.Generator,
+        size: int,
+        cdfs: Tuple[np.ndarray, np.ndarray],
+        pace: Tuple[float, float],
+        start: Tuple[int, int],
+        seconds: float,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Scores (size, 2) and overtime counts for one chunk"""
+        scores = np.empty((size, 2), dtype=np.int32)
+        scores[:, 0], scores[:, 1] = start
+        if seconds > 0:
+            possessions = self._draw_possessions(rng, size, *pace, seconds)
+            scores[:, 0] += self._score_possessions(rng, cdfs[0], possessions)
+            scores[:, 1] += self._score_possessions(rng, cdfs[1], possessions)
+
+        overtimes = np.zeros(size, dtype=np.int8)
+        tied = np.flatnonzero(scores[:, 0] == scores[:, 1])
+        while len(tied) and overtimes.max(initial=0) < MAX_OVERTIMES:
+            possessions = self._draw_possessions(
+                rng, len(tied), *pace, OVERTIME_SECONDS
+            )
+            scores[tied, 0] += self._score_possessions(rng, cdfs[0], possessions)
+            scores[tied, 1] += self._score_possessions(rng, cdfs[1], possessions)
+            overtimes[tied] += 1
+            tied = tied[scores[tied, 0] == scores[tied, 1]]
+
+        # Still level after MAX_OVERTIMES: decide by a single point
+        if len(tied):
+            scores[tied, rng.integers(0, 2, len(tied))] += 1
+        return scores, overtimes
+
+    @staticmethod
+    def _remaining_seconds(game_state: Optional[Dict[str, Any]]) -> float:
+        """Seconds of regulation/overtime left in a game state"""
+        if not game_state:
+            return float(REGULATION_SECONDS)
+        if "seconds_remaining" in game_state:
+            return max(float(game_state["seconds_remaining"]), 0.0)
+        period = int(game_state.get("period", 1))
+        clock = float(game_state.get("clock_minutes", 0)) * 60 + float(
+            game_state.get("clock_seconds", 0)
+        )
+        if period > 4:
+            return clock
+        return (4 - period) * 720 + clock
+
+    def simulate(
+        self,
+        home_team_id,
+        away_team_id,
+        n_simulations: int = 10000,
+        seed: Optional[int] = None,
+        game_state: Optional[Dict[str, Any]] = None,
+    ) -> SimulationResult:
+        """
+        Simulate n_simulations games between two teams.
+
+        Args:
+            home_team_id: Home team ID
+            away_team_id: Away team ID
+            n_simulations: Number of simulated games
+            seed: RNG seed (default: the simulator's seed)
+            game_state: In-progress state with home_score, away_score and
+                either seconds_remaining or period + clock_minutes/seconds
+
+        Returns:
+            SimulationResult with the (n_simulations, 2) score matrix
+        """
+        if n_simulations < 1:
+            raise ValueError("n_simulations must be at least 1")
+        home_team_id, away_team_id = str(home_team_id), str(away_team_id)
+        seed = self.seed if seed is None else seed
+        started = time.perf_counter()
+
+        cdfs = (
+            np.cumsum(self.model.matchup(home_team_id, away_team_id))[:-1],
+            np.cumsum(self.model.matchup(away_team_id, home_team_id))[:-1],
+        )
+        pace = self.model.pace(home_team_id, away_team_id)
+        game_state = game_state or {}
+        start = (
+            int(game_state.get("home_score", 0)),
+            int(game_state.get("away_score", 0)),
+        )
+        seconds = self._remaining_seconds(game_state)
+
+        scores = np.empty((n_simulations, 2), dtype=np.int32)
+        overtimes = np.empty(n_simulations, dtype=np.int8)
+        n_chunks = -(-n_simulations // self.chunk_size)
+        streams = self._seed_sequence(home_team_id, away_team_id, seed).spawn(n_chunks)
+        for chunk, stream in enumerate(streams):
+            lo = chunk * self.chunk_size
+            hi = min(lo + self.chunk_size, n_simulations)
+            scores[lo:hi], overtimes[lo:hi] = self._simulate_chunk(
+                np.random.default_rng(stream), hi - lo, cdfs, pace, start, seconds
+            )
+
+        return SimulationResult(
+            home_team_id=home_team_id,
+            away_team_id=away_team_id,
+            scores=scores,
+            overtimes=overtimes,
+            seed=seed,
+            elapsed_seconds=time.perf_counter() - started,
+        )
+
+    def predict_game(
+        self,
+        home_team_id,
+        away_team_id,
+        game_date: Optional[date] = None,
+        n_simulations: int = 10000,
+        game_state: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> SimulationResult:
+        """
+        Multi-simulator compatible entry point.
+
+        game_date is accepted for interface compatibility; build the model
+        with PossessionModel.from_database(before=game_date) to keep it
+        out of sample. Other keyword arguments (use_ensemble) are ignored.
+        """
+        return self.simulate(
+            home_team_id,
+            away_team_id,
+            n_simulations=n_simulations,
+            game_state=game_state,
+        )
@@ -0,0 +1,13 @@
+"""
+Testing Helpers
+
+Test doubles shared by the unit tests and benchmark scripts. Nothing in the
+production packages imports from here.
+
+Components:
+- LocalS3Client: Filesystem stand-in for the boto3 S3 client
+"""
+
+from .local_s3 import LocalS3Client
+
+__all__ = ["LocalS3Client"]
@@ -0,0 +1,171 @@
+"""
+Local S3 Client
+
+Filesystem stand-in for the subset of the boto3 S3 client used by the data
+lake code (inventory listing, key manifests, ESPN readers and scrapers).
+Used by unit tests and by the benchmark scripts, which need per-request
+counts and simulated latency that moto does not provide.
+
+Created: November 5, 2025
+"""
+
+import io
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class LocalS3Client:
+    """
+    Filesystem stand-in for the subset of the boto3 S3 client used here.
+
+    Objects of bucket ``b`` live under ``<root>/b/``. Supports
+    get_paginator('list_objects_v2') (Prefix, Delimiter, StartAfter, MaxKeys
+    pages), get_object, head_object and upload_file. ``latency`` adds a
+    sleep per request to mimic network round trips in benchmarks.
+    """
+
+    def __init__(self, root: str, latency: float = 0.0, page_size: int = 1000):
+        """
+        Initialize local client.
+
+        Args:
+            root: Directory holding one sub-directory per bucket
+            latency: Seconds slept per list page / get_object call
+            page_size: Keys per list_objects_v2 page
+        """
+        self.root = Path(root)
+        self.latency = latency
+        self.page_size = page_size
+        self.request_count = 0
+        self._count_lock = threading.Lock()
+
+    def _request(self):
+        """Count a request and apply simulated latency"""
+        with self._count_lock:
+            self.request_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes = b"") -> Dict[str, Any]:
+        """Write an object"""
+        path = self.root / Bucket / Key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(Body if isinstance(Body, bytes) else Body.encode("utf-8"))
+        return {"ETag": self._entry(Bucket, Key)["ETag"]}
+
+    def get_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        """Read an object"""
+        self._request()
+        path = self.root / Bucket / Key
+        if not path.is_file():
+            raise FileNotFoundError(f"s3://{Bucket}/{Key}")
+        entry = self._entry(Bucket, Key)
+        content = path.read_bytes()
+        return {
+            "Body": io.BytesIO(content),
+            "ContentLength": len(content),
+            "ETag": entry["ETag"],
+            "LastModified": entry["LastModified"],
+        }
+
+    def head_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        """Object metadata without the body"""
+        self._request()
+        if not (self.root / Bucket / Key).is_file():
+            raise FileNotFoundError(f"s3://{Bucket}/{Key}")
+        entry = self._entry(Bucket, Key)
+        return {
+            "ContentLength": entry["Size"],
+            "ETag": entry["ETag"],
+            "LastModified": entry["LastModified"],
+        }
+
+    def upload_file(self, Filename: str, Bucket: str, Key: str) -> None:
+        """Copy a local file into the bucket"""
+        self._request()
+        path = self.root / Bucket / Key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(Path(Filename).read_bytes())
+
+    def get_paginator(self, operation_name: str) -> "_LocalListPaginator":
+        """Return a paginator (only list_objects_v2 is supported)"""
+        if operation_name != "list_objects_v2":
+            raise NotImplementedError(operation_name)
+        return _LocalListPaginator(self)
+
+    def _all_keys(self, bucket: str) -> List[str]:
+        """Every key in a bucket, sorted like S3 (lexicographic)"""
+        base = self.root / bucket
+        if not base.is_dir():
+            return []
+        return sorted(
+            path.relative_to(base).as_posix()
+            for path in base.rglob("*")
+            if path.is_file()
+        )
+
+    def _entry(self, bucket: str, key: str) -> Dict[str, Any]:
+        """Contents entry for a key (ETag derived from size and mtime)"""
+        stat = (self.root / bucket / key).stat()
+        return {
+            "Key": key,
+            "Size": stat.st_size,
+            "LastModified": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            "ETag": f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"',
+        }
+
+
+class _LocalListPaginator:
+    """list_objects_v2 paginator for LocalS3Client"""
+
+    def __init__(self, client: LocalS3Client):
+        self.client = client
+
+    def paginate(
+        self,
+        Bucket: str,
+        Prefix: str = "",
+        Delimiter: Optional[str] = None,
+        StartAfter: str = "",
+        PaginationConfig: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield pages shaped like boto3 list_objects_v2 responses"""
+        page_size = (PaginationConfig or {}).get("PageSize", self.client.page_size)
+
+        # Build the flat result list (objects and common prefixes in key order)
+        entries: List[Tuple[str, bool]] = []
+        seen_prefixes = set()
+        for key in self.client._all_keys(Bucket):
+            if not key.startswith(Prefix) or key <= StartAfter:
+                continue
+            if Delimiter:
+                position = key.find(Delimiter, len(Prefix))
+                if position >= 0:
+                    common = key[: position + len(Delimiter)]
+                    if common not in seen_prefixes:
+                        seen_prefixes.add(common)
+                        entries.append((common, True))
+                    continue
+            entries.append((key, False))
+
+        if not entries:
+            self.client._request()
+            yield {"KeyCount": 0, "Prefix": Prefix}
+            return
+
+        for start in range(0, len(entries), page_size):
+            self.client._request()
+            chunk = entries[start : start + page_size]
+            page: Dict[str, Any] = {"KeyCount": len(chunk), "Prefix": Prefix}
+            contents = [
+                self.client._entry(Bucket, key) for key, common in chunk if not common
+            ]
+            prefixes = [{"Prefix": key} for key, common in chunk if common]
+            if contents:
+                page["Contents"] = contents
+            if prefixes:
+                page["CommonPrefixes"] = prefixes
+            yield page
@@ -0,0 +1,65 @@
+"""
+Lazy Package Exports
+
+PEP 562 module __getattr__/__dir__ so a package's public names load their
+submodule on first access instead of at import time. Keeps
+`import nba_simulator.monitoring` (and CLI tools and cron jobs that only
+need one component) from paying for boto3, psycopg2 and every sibling
+submodule up front.
+
+Usage (in a package __init__.py):
+    from ..utils.lazy import lazy_exports
+
+    _EXPORTS = {
+        "DIMSCore": ".dims",
+        "DIMS": ".dims:DIMSCore",  # alias
+        "quality": ".quality",  # submodule
+    }
+
+    __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+    __all__ = list(_EXPORTS)
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level __getattr__ and __dir__ for lazy exports.
+
+    Args:
+        package: Package __name__
+        exports: Public name -> "module" or "module:attribute". Modules may
+            be relative to the package. A name whose target module has the
+            same name as the export ("quality": ".quality") is a submodule.
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package namespace
+    """
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        module_name, _, attribute = target.partition(":")
+        module = importlib.import_module(module_name, package)
+        if attribute:
+            value = getattr(module, attribute)
+        elif module_name.lstrip(".") == name:
+            value = module
+        else:
+            value = getattr(module, name)
+
+        # Cache so later lookups bypass __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -9,6 +9,7 @@ Key Components:
 - WorkflowTask: Individual task representation
 - WorkflowState: State machine for workflow lifecycle
 - WorkflowMetrics: Standard metrics collection
+- DAGScheduler: Dependency-driven async task scheduler with worker pools
 
 Example Usage:
     from nba_simulator.workflows import BaseWorkflow, WorkflowTask, WorkflowPriority
@@ -42,54 +43,29 @@ Example Usage:
     report = workflow.generate_report()
 """
 
-from .base_workflow import (
-    BaseWorkflow,
-    WorkflowState,
-    WorkflowPriority,
-    WorkflowTask,
-    WorkflowMetrics,
-)
+from ..utils.lazy import lazy_exports
 
-# Dispatcher imports - temporarily commented out pending WorkflowDispatcher implementation
+# Dispatcher exports - WorkflowDispatcher, HandlerInterface, DispatcherStats
+# and create_dispatch_task are pending implementation
 # See: nba_simulator/workflows/dispatcher.py (incomplete - only has DispatchTask class)
-# from .dispatcher import (
-#     WorkflowDispatcher,
-#     DispatchTask,
-#     TaskPriority,
-#     TaskStatus,
-#     HandlerType,
-#     HandlerInterface,
-#     DispatcherStats,
-#     create_dispatch_task,
-# )
-
-# Import what actually exists in dispatcher.py
-from .dispatcher import (
-    DispatchTask,
-    TaskPriority,
-    TaskStatus,
-    HandlerType,
-)
-
-__all__ = [
+_EXPORTS = {
     # Base Classes
-    "BaseWorkflow",
-    # "HandlerInterface",  # Not yet implemented in dispatcher.py
-    # Dispatcher (incomplete - WorkflowDispatcher not yet implemented)
-    # "WorkflowDispatcher",  # Not yet implemented in dispatcher.py
+    "BaseWorkflow": ".base_workflow",
+    "DAGScheduler": ".scheduler",
     # Enums
-    "WorkflowState",
-    "WorkflowPriority",
-    "TaskPriority",
-    "TaskStatus",
-    "HandlerType",
+    "WorkflowState": ".base_workflow",
+    "WorkflowPriority": ".base_workflow",
+    "TaskPriority": ".dispatcher",
+    "TaskStatus": ".dispatcher",
+    "HandlerType": ".dispatcher",
     # Data Classes
-    "WorkflowTask",
-    "WorkflowMetrics",
-    "DispatchTask",
-    # "DispatcherStats",  # Not yet implemented in dispatcher.py
-    # Utility Functions
-    # "create_dispatch_task",  # Not yet implemented in dispatcher.py
-]
+    "WorkflowTask": ".base_workflow",
+    "WorkflowMetrics": ".base_workflow",
+    "DispatchTask": ".dispatcher",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
 
 __version__ = "1.1.0"  # Bumped for dispatcher addition
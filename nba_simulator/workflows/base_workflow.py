@@ -28,6 +28,7 @@ from dataclasses import dataclass, asdict, field
 
 from ..database import get_db_connection
 from ..utils import setup_logging
+from .scheduler import DAGScheduler, critical_path
 
 
 class WorkflowState(Enum):
@@ -105,6 +106,9 @@ class WorkflowTask:
     max_retries: int = 3
     retry_delay_seconds: int = 60  # Delay between retries
     is_critical: bool = True  # If False, workflow continues on failure
+    resources: List[str] = field(
+        default_factory=list
+    )  # Rate-limited resources held while running (e.g. 'db', 's3')
 
     @property
     def can_retry(self) -> bool:
@@ -162,6 +166,11 @@ class WorkflowMetrics:
     quality_score: float = 0.0
     data_completeness: float = 0.0
 
+    # Scheduling metrics
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_seconds: float = 0.0
+    task_seconds_total: float = 0.0
+
     @property
     def success_rate(self) -> float:
         """Calculate overall success rate"""
@@ -176,6 +185,13 @@ class WorkflowMetrics:
             return 0.0
         return (self.items_successful / self.items_processed) * 100
 
+    @property
+    def parallelism(self) -> float:
+        """Average number of tasks running at once (task time / wall time)"""
+        if self.duration_seconds == 0:
+            return 0.0
+        return self.task_seconds_total / self.duration_seconds
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert metrics to dictionary"""
         data = asdict(self)
@@ -187,6 +203,7 @@ class WorkflowMetrics:
         # Add computed properties
         data["success_rate"] = self.success_rate
         data["item_success_rate"] = self.item_success_rate
+        data["parallelism"] = self.parallelism
         return data
 
 
@@ -286,6 +303,13 @@ class BaseWorkflow(ABC):
             f"Workflow {workflow_name} (type={workflow_type}) created with priority {priority.name}"
         )
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle support for process-pool task execution"""
+        state = self.__dict__.copy()
+        state["_db"] = None
+        state["_execution_future"] = None
+        return state
+
     @property
     def db(self):
         """Lazy-load database connection"""
@@ -514,6 +538,7 @@ class BaseWorkflow(ABC):
             ).total_seconds()
             self.metrics.errors_encountered = len(self.errors)
             self.metrics.warnings_issued = len(self.warnings)
+            self._record_critical_path()
 
             # Calculate quality score
             self._calculate_quality_score()
@@ -570,41 +595,15 @@ class BaseWorkflow(ABC):
         return self.metrics.tasks_failed == 0
 
     async def _execute_tasks_async(self) -> bool:
-        """Execute tasks asynchronously"""
-        # Group tasks by dependency level
-        task_groups = self._group_tasks_by_dependencies()
-
-        for group in task_groups:
-            if self.is_cancelled:
-                for task in group:
-                    task.status = "skipped"
-                    self.metrics.tasks_skipped += 1
-                break
-
-            # Execute tasks in group concurrently
-            results = await asyncio.gather(
-                *[self._execute_task_async(task) for task in group],
-                return_exceptions=True,
-            )
-
-            # Process results
-            for task, result in zip(group, results):
-                if isinstance(result, Exception):
-                    task.status = "failed"
-                    task.error = str(result)
-                    self.metrics.tasks_failed += 1
-                elif result:
-                    self.metrics.tasks_completed += 1
-                else:
-                    self.metrics.tasks_failed += 1
-
-            # Check if workflow should continue
-            if self.metrics.tasks_failed > 0 and not self.config.get(
-                "continue_on_error", False
-            ):
-                return False
+        """
+        Execute tasks asynchronously as a dependency graph.
 
-        return self.metrics.tasks_failed == 0
+        Each task starts as soon as its dependencies complete; sync
+        _execute_task implementations run on a worker pool. See
+        DAGScheduler for the executor, max_workers and resource_limits
+        config keys.
+        """
+        return await DAGScheduler.from_config(self).run()
 
     def _execute_task_with_retry(self, task: WorkflowTask) -> bool:
         """Execute a single task with retry logic"""
@@ -644,40 +643,6 @@ class BaseWorkflow(ABC):
                     self.errors.append(error_msg)
                     return False
 
-    async def _execute_task_async(self, task: WorkflowTask) -> bool:
-        """Execute a single task asynchronously"""
-        task.status = "running"
-        task.start_time = datetime.now(timezone.utc)
-
-        try:
-            self.logger.info(
-                f"Executing task (async): {task.task_id} ({task.task_name})"
-            )
-
-            # Check if _execute_task is async
-            result = self._execute_task(task)
-            if asyncio.iscoroutine(result):
-                result = await result
-
-            task.status = "completed"
-            task.result = result
-            task.end_time = datetime.now(timezone.utc)
-            self.task_results[task.task_id] = result
-
-            self.logger.info(
-                f"Task {task.task_id} completed (async, duration={task.duration:.2f}s)"
-            )
-            return True
-
-        except Exception as e:
-            error_msg = f"Task {task.task_id} failed: {str(e)}"
-            self.logger.error(error_msg)
-            task.status = "failed"
-            task.error = str(e)
-            task.end_time = datetime.now(timezone.utc)
-            self.errors.append(error_msg)
-            return False
-
     def _check_task_dependencies(self, task: WorkflowTask) -> bool:
         """Check if all task dependencies are satisfied"""
         for dep_id in task.dependencies:
@@ -686,32 +651,19 @@ class BaseWorkflow(ABC):
                 return False
         return True
 
-    def _group_tasks_by_dependencies(self) -> List[List[WorkflowTask]]:
-        """Group tasks by dependency level for parallel execution"""
-        groups = []
-        remaining_tasks = self.tasks.copy()
-        completed_task_ids = set()
-
-        while remaining_tasks:
-            # Find tasks with no incomplete dependencies
-            ready_tasks = [
-                task
-                for task in remaining_tasks
-                if all(dep in completed_task_ids for dep in task.dependencies)
-            ]
-
-            if not ready_tasks:
-                # Circular dependency or invalid task graph
-                self.logger.error("Cannot resolve task dependencies")
-                break
-
-            groups.append(ready_tasks)
-            completed_task_ids.update(task.task_id for task in ready_tasks)
-            remaining_tasks = [
-                task for task in remaining_tasks if task not in ready_tasks
-            ]
-
-        return groups
+    def _record_critical_path(self) -> None:
+        """Record the critical path and total task time in metrics"""
+        path, seconds = critical_path(self.tasks)
+        self.metrics.critical_path = path
+        self.metrics.critical_path_seconds = seconds
+        self.metrics.task_seconds_total = sum(
+            task.duration for task in self.tasks if task.start_time and task.end_time
+        )
+        if path:
+            self.logger.info(
+                f"Critical path: {' -> '.join(path)} ({seconds:.2f}s, "
+                f"parallelism={self.metrics.parallelism:.2f})"
+            )
 
     def _calculate_quality_score(self) -> None:
         """Calculate overall workflow quality score"""
@@ -41,6 +41,7 @@ Migrated: November 4, 2025
 """
 
 import asyncio
+import importlib
 import logging
 from typing import Dict, List, Optional, Any, Type, Callable, Union
 from dataclasses import dataclass, field
@@ -53,25 +54,43 @@ from abc import ABC, abstractmethod
 from ..database import get_db_connection
 from ..utils import setup_logging
 
-# Import ETL components
-from ..etl.extractors import (
-    ESPNScraper,
-    BasketballReferenceScraper,
-    HoopRScraper,
-    NBAAPIScraper,
-)
-
-# Import agents
-from ..agents import (
-    MasterAgent,
-    QualityAgent,
-    IntegrationAgent,
-    NBAStatsAgent,
-    DeduplicationAgent,
-    HistoricalAgent,
-    HooprAgent,
-    BasketballReferenceAgent,
-)
+# Handler classes by identifier. Scrapers and agents import on first
+# resolve_handler() call, not when the dispatcher module loads.
+HANDLER_CLASSES: Dict[str, str] = {
+    # ETL components
+    "espn_scraper": "nba_simulator.etl.extractors.espn:ESPNScraper",
+    "basketball_reference_scraper": (
+        "nba_simulator.etl.extractors.basketball_reference:BasketballReferenceScraper"
+    ),
+    "hoopr_scraper": "nba_simulator.etl.extractors.hoopr:HoopRScraper",
+    "nba_api_scraper": "nba_simulator.etl.extractors.nba_api:NBAAPIScraper",
+    # Agents
+    "master_agent": "nba_simulator.agents.master:MasterAgent",
+    "quality_agent": "nba_simulator.agents.quality:QualityAgent",
+    "integration_agent": "nba_simulator.agents.integration:IntegrationAgent",
+    "nba_stats_agent": "nba_simulator.agents.nba_stats:NBAStatsAgent",
+    "deduplication_agent": "nba_simulator.agents.deduplication:DeduplicationAgent",
+    "historical_agent": "nba_simulator.agents.historical:HistoricalAgent",
+    "hoopr_agent": "nba_simulator.agents.hoopr:HooprAgent",
+    "bbref_agent": "nba_simulator.agents.bbref:BasketballReferenceAgent",
+}
+
+
+def resolve_handler(handler: str) -> Type:
+    """
+    Import and return the class registered for a handler identifier.
+
+    Args:
+        handler: Handler identifier (e.g., 'espn_scraper', 'quality_agent')
+
+    Returns:
+        Handler class
+
+    Raises:
+        KeyError: If no handler is registered under that identifier
+    """
+    module_name, _, class_name = HANDLER_CLASSES[handler].partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 class TaskPriority(Enum):
@@ -0,0 +1,359 @@
+"""
+DAG Scheduler - Dependency-Driven Task Execution for BaseWorkflow
+
+Runs a workflow's tasks as a dependency graph instead of level by level:
+
+- Ready queue: a task starts as soon as all of its dependencies complete,
+  without waiting for the slowest task of its "level"
+- Worker pools: synchronous _execute_task implementations run on a thread
+  pool (default) or process pool, so blocking work overlaps; coroutine
+  implementations run on the event loop
+- Resource limits: tasks declare resources (e.g. "db", "s3",
+  "scraper:espn.com") and at most N tasks hold each resource at once
+- Critical path: the longest chain of measured task durations is recorded
+  in WorkflowMetrics
+
+Configuration (workflow config keys):
+    executor: "thread" (default), "process" or "inline" (run sync tasks on
+        the event loop thread, the pre-scheduler behaviour)
+    max_workers: Worker pool size (default: executor default)
+    resource_limits: {"db": 4, "s3": 16, "scraper:espn.com": 2}
+    continue_on_error: Keep scheduling after a task fails
+
+Usage:
+    WorkflowTask(task_id="load", task_name="Load RDS", task_type="load",
+                 dependencies=["transform"], resources=["db"])
+
+    workflow.execute(async_mode=True)
+"""
+
+import asyncio
+import logging
+from collections import defaultdict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import AsyncExitStack
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .base_workflow import BaseWorkflow, WorkflowTask
+
+logger = logging.getLogger(__name__)
+
+EXECUTORS = ("thread", "process", "inline")
+
+
+def _execute_in_process(workflow: "BaseWorkflow", task: "WorkflowTask") -> Any:
+    """Process pool entry point (must be importable at module level)"""
+    return workflow._execute_task(task)
+
+
+def find_graph_errors(tasks: List["WorkflowTask"]) -> List[str]:
+    """
+    Check a task list for unknown dependencies and cycles.
+
+    Args:
+        tasks: Workflow tasks
+
+    Returns:
+        List of error messages (empty if the graph is a valid DAG)
+    """
+    task_ids = {task.task_id for task in tasks}
+    errors = [
+        f"Task {task.task_id} depends on unknown task {dep_id}"
+        for task in tasks
+        for dep_id in task.dependencies
+        if dep_id not in task_ids
+    ]
+    if errors:
+        return errors
+
+    order = topological_order(tasks)
+    if len(order) < len(tasks):
+        stuck = sorted(task_ids - {task.task_id for task in order})
+        errors.append(f"Circular dependency between tasks: {', '.join(stuck)}")
+    return errors
+
+
+def topological_order(tasks: List["WorkflowTask"]) -> List["WorkflowTask"]:
+    """
+    Tasks in dependency order (Kahn's algorithm, declaration order on ties).
+
+    Tasks on a cycle or depending on unknown tasks are left out.
+    """
+    by_id = {task.task_id: task for task in tasks}
+    waiting = {task.task_id: len(set(task.dependencies)) for task in tasks}
+    dependents = defaultdict(list)
+    for task in tasks:
+        for dep_id in set(task.dependencies):
+            dependents[dep_id].append(task.task_id)
+
+    ready = deque(task.task_id for task in tasks if waiting[task.task_id] == 0)
+    order = []
+    while ready:
+        task_id = ready.popleft()
+        order.append(by_id[task_id])
+        for child in dependents[task_id]:
+            waiting[child] -= 1
+            if waiting[child] == 0:
+                ready.append(child)
+    return order
+
+
+def critical_path(tasks: List["WorkflowTask"]) -> Tuple[List[str], float]:
+    """
+    Longest chain of measured task durations through the dependency graph.
+
+    Tasks that never ran count as zero seconds.
+
+    Args:
+        tasks: Workflow tasks after execution
+
+    Returns:
+        (task IDs on the critical path in execution order, total seconds)
+    """
+    finish: Dict[str, float] = {}
+    previous: Dict[str, Optional[str]] = {}
+    for task in topological_order(tasks):
+        duration = task.duration if task.start_time and task.end_time else 0.0
+        parent = max(task.dependencies, key=lambda d: finish[d], default=None)
+        finish[task.task_id] = duration + (finish[parent] if parent else 0.0)
+        previous[task.task_id] = parent
+
+    if not finish:
+        return [], 0.0
+    task_id = max(finish, key=finish.get)
+    total = finish[task_id]
+    path = []
+    while task_id is not None:
+        path.append(task_id)
+        task_id = previous[task_id]
+    return path[::-1], total
+
+
+class DAGScheduler:
+    """
+    Ready-queue scheduler for a BaseWorkflow's tasks.
+
+    Each task is started as soon as its dependencies have completed.
+    Dependents of a failed task are skipped; with continue_on_error off
+    (the default) no new tasks start after the first failure, tasks
+    already running finish, and everything else is skipped. Failed tasks
+    are retried up to task.max_retries times, like the sync path.
+
+    Process pools pickle the workflow for each task: _execute_task must be
+    defined on an importable class, and only its return value comes back.
+    """
+
+    def __init__(
+        self,
+        workflow: "BaseWorkflow",
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+        resource_limits: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            workflow: Workflow whose tasks to run
+            executor: "thread", "process" or "inline" for sync tasks
+            max_workers: Worker pool size
+            resource_limits: Max concurrent tasks per resource name
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of {EXECUTORS}, got {executor!r}")
+        for resource, limit in (resource_limits or {}).items():
+            if limit < 1:
+                raise ValueError(f"Resource limit for {resource} must be at least 1")
+
+        self.workflow = workflow
+        self.executor = executor
+        self.max_workers = max_workers
+        self.resource_limits = dict(resource_limits or {})
+
+        self._pool: Optional[Executor] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        # Peak concurrent holders per resource (observed)
+        self.peak_usage: Dict[str, int] = defaultdict(int)
+        self._in_use: Dict[str, int] = defaultdict(int)
+
+    @classmethod
+    def from_config(cls, workflow: "BaseWorkflow") -> "DAGScheduler":
+        """Scheduler configured from the workflow's config dict"""
+        config = workflow.config
+        return cls(
+            workflow,
+            executor=config.get("executor", "thread"),
+            max_workers=config.get("max_workers"),
+            resource_limits=config.get("resource_limits"),
+        )
+
+    def _create_pool(self) -> Optional[Executor]:
+        if self.executor == "thread":
+            return ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"workflow-{self.workflow.workflow_name}",
+            )
+        if self.executor == "process":
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return None
+
+    async def run(self) -> bool:
+        """
+        Execute every task in dependency order.
+
+        Returns:
+            bool: True if no task failed
+        """
+        workflow = self.workflow
+        metrics = workflow.metrics
+        tasks = workflow.tasks
+
+        graph_errors = find_graph_errors(tasks)
+        if graph_errors:
+            for error in graph_errors:
+                workflow.log_error(f"Cannot resolve task dependencies: {error}")
+            self._skip_pending(tasks)
+            return False
+
+        self._semaphores = {
+            resource: asyncio.Semaphore(limit)
+            for resource, limit in self.resource_limits.items()
+        }
+        waiting = {task.task_id: len(set(task.dependencies)) for task in tasks}
+        dependents = defaultdict(list)
+        for task in tasks:
+            for dep_id in set(task.dependencies):
+                dependents[dep_id].append(task)
+
+        ready = deque(task for task in tasks if waiting[task.task_id] == 0)
+        running: Dict[asyncio.Task, "WorkflowTask"] = {}
+        stop = False
+        continue_on_error = workflow.config.get("continue_on_error", False)
+
+        self._pool = self._create_pool()
+        try:
+            while ready or running:
+                while ready and not stop and not workflow.is_cancelled:
+                    task = ready.popleft()
+                    running[asyncio.create_task(self._run_task(task))] = task
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    task = running.pop(future)
+                    if future.result():
+                        metrics.tasks_completed += 1
+                        for child in dependents[task.task_id]:
+                            waiting[child.task_id] -= 1
+                            if waiting[child.task_id] == 0:
+                                ready.append(child)
+                    else:
+                        metrics.tasks_failed += 1
+                        if not continue_on_error:
+                            stop = True
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+        self._skip_pending(tasks)
+        return metrics.tasks_failed == 0
+
+    def _skip_pending(self, tasks: List["WorkflowTask"]) -> None:
+        """Mark tasks that never started as skipped"""
+        for task in tasks:
+            if task.status == "pending":
+                task.status = "skipped"
+                self.workflow.metrics.tasks_skipped += 1
+                self.workflow.logger.warning(
+                    f"Task {task.task_id} skipped due to dependencies"
+                )
+
+    async def _acquire_resources(self, task: "WorkflowTask", stack: AsyncExitStack):
+        """Hold every limited resource the task declares (sorted: no deadlock)"""
+        for resource in sorted(set(task.resources)):
+            semaphore = self._semaphores.get(resource)
+            if semaphore is None:
+                continue
+            await stack.enter_async_context(semaphore)
+            self._in_use[resource] += 1
+            self.peak_usage[resource] = max(
+                self.peak_usage[resource], self._in_use[resource]
+            )
+            stack.callback(self._release, resource)
+
+    def _release(self, resource: str) -> None:
+        self._in_use[resource] -= 1
+
+    async def _call(self, task: "WorkflowTask") -> Any:
+        """Run _execute_task on the loop (async) or on the worker pool (sync)"""
+        workflow = self.workflow
+        if asyncio.iscoroutinefunction(workflow._execute_task):
+            return await workflow._execute_task(task)
+
+        loop = asyncio.get_running_loop()
+        if self.executor == "process":
+            result = await loop.run_in_executor(
+                self._pool, _execute_in_process, workflow, task
+            )
+        elif self.executor == "thread":
+            result = await loop.run_in_executor(
+                self._pool, workflow._execute_task, task
+            )
+        else:
+            result = workflow._execute_task(task)
+
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+    async def _run_task(self, task: "WorkflowTask") -> bool:
+        """Execute one task with resource limits and retries"""
+        workflow = self.workflow
+        async with AsyncExitStack() as stack:
+            await self._acquire_resources(task, stack)
+
+            task.status = "running"
+            task.start_time = datetime.now(timezone.utc)
+            while True:
+                try:
+                    workflow.logger.info(
+                        f"Executing task (async): {task.task_id} ({task.task_name})"
+                    )
+                    result = await self._call(task)
+
+                    task.status = "completed"
+                    task.result = result
+                    task.end_time = datetime.now(timezone.utc)
+                    workflow.task_results[task.task_id] = result
+
+                    workflow.logger.info(
+                        f"Task {task.task_id} completed "
+                        f"(async, duration={task.duration:.2f}s)"
+                    )
+                    return True
+
+                except Exception as e:
+                    error_msg = f"Task {task.task_id} failed: {str(e)}"
+                    workflow.logger.error(error_msg)
+
+                    if task.can_retry:
+                        task.retry_count += 1
+                        workflow.metrics.retries_attempted += 1
+                        workflow.logger.info(
+                            f"Retrying task {task.task_id} "
+                            f"({task.retry_count}/{task.max_retries})"
+                        )
+                        continue
+
+                    task.status = "failed"
+                    task.error = str(e)
+                    task.end_time = datetime.now(timezone.utc)
+                    workflow.errors.append(error_msg)
+                    return False
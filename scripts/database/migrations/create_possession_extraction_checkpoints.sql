@@ -0,0 +1,31 @@
+-- =============================================================================
+-- Phase 0.0005: Possession Extraction - Checkpoint Table
+-- =============================================================================
+-- Per-game checkpoints for PossessionExtractor / ParallelPossessionExtractor.
+-- A game's possessions and its checkpoint row are committed in the same
+-- transaction, so an interrupted run resumes exactly at the first game that
+-- was never committed.
+--
+-- PossessionExtractor.ensure_checkpoint_table() creates this table on demand;
+-- this script is provided for environments that manage DDL separately.
+--
+-- Created: November 5, 2025
+-- Author: NBA Simulator AWS Team
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS possession_extraction_checkpoints (
+    game_id VARCHAR(50) PRIMARY KEY,
+    status VARCHAR(20) NOT NULL,              -- 'completed' or 'empty'
+    possessions_written INTEGER NOT NULL DEFAULT 0,
+    events_processed INTEGER NOT NULL DEFAULT 0,
+    worker_id INTEGER,
+    completed_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON TABLE possession_extraction_checkpoints IS
+    'Games already extracted into temporal_possession_stats (resume checkpoints)';
+
+-- Reset all checkpoints (equivalent to possession_extraction_cli.py --force)
+-- TRUNCATE possession_extraction_checkpoints;
+
+-- End of migration script
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Benchmark ESPN feature extraction: batch vs streaming
+
+Writes a season of synthetic ESPN box score JSON (Format 1) to a local
+directory standing in for S3, then extracts features for every game with
+
+- batch:  ESPNFeatureExtractor.batch_extract_games (read all, extract serially)
+- stream: ESPNFeatureExtractor.stream_extract_games (I/O threads -> bounded
+          window -> process pool, results yielded as they complete)
+
+Each mode runs in a fresh interpreter so peak RSS is measured per mode.
+Reports games/sec, peak RSS of the main process and of the largest worker.
+
+Usage:
+    python scripts/etl/benchmark_espn_feature_extraction.py
+    python scripts/etl/benchmark_espn_feature_extraction.py --games 1230 --processes 8
+    python scripts/etl/benchmark_espn_feature_extraction.py --root /tmp/espn_lake --latency 0.02
+"""
+
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+BUCKET = "espn-benchmark"
+PREFIX = "box_scores"
+
+STAT_KEYS = [
+    "minutes",
+    "fieldGoalsMade-fieldGoalsAttempted",
+    "threePointFieldGoalsMade-threePointFieldGoalsAttempted",
+    "freeThrowsMade-freeThrowsAttempted",
+    "offensiveRebounds",
+    "defensiveRebounds",
+    "rebounds",
+    "assists",
+    "steals",
+    "blocks",
+    "turnovers",
+    "fouls",
+    "plusMinus",
+    "points",
+]
+
+PLAY_TYPES = [
+    "Jump Shot",
+    "Layup Shot",
+    "Three Point Jumper",
+    "Defensive Rebound",
+    "Offensive Rebound",
+    "Personal Foul",
+    "Free Throw - 1 of 2",
+    "Turnover",
+    "Substitution",
+]
+
+
+def synthetic_game(game_id: str, rng: random.Random, plays_per_period: int = 120):
+    """One Format 1 (page.content.gamepackage) game, roughly ESPN-sized"""
+    teams = []
+    box = []
+    for side, abbrev in enumerate(rng.sample(["BOS", "LAL", "MIA", "NYK", "GSW"], 2)):
+        quarters = [rng.randint(18, 38) for _ in range(4)]
+        teams.append(
+            {
+                "abbrev": abbrev,
+                "score": str(sum(quarters)),
+                "linescores": [{"displayValue": str(q)} for q in quarters],
+            }
+        )
+        groups = []
+        for group_type, size in (("starters", 5), ("bench", 8)):
+            athletes = []
+            for i in range(size):
+                made, attempted = rng.randint(0, 12), rng.randint(12, 22)
+                stats = [
+                    str(rng.randint(5, 40)),
+                    f"{made}-{attempted}",
+                    f"{rng.randint(0, 4)}-{rng.randint(4, 9)}",
+                    f"{rng.randint(0, 6)}-{rng.randint(6, 8)}",
+                ] + [str(rng.randint(0, 12)) for _ in STAT_KEYS[4:]]
+                athletes.append(
+                    {
+                        "athlt": {
+                            "id": f"{side}{group_type[0]}{i}",
+                            "dspNm": f"Player {abbrev} {group_type} {i}",
+                            "jersey": str(rng.randint(0, 99)),
+                            "pos": rng.choice(["G", "F", "C"]),
+                        },
+                        "stats": stats,
+                    }
+                )
+            groups.append(
+                {
+                    "type": group_type,
+                    "keys": STAT_KEYS,
+                    "lbls": [k.upper()[:3] for k in STAT_KEYS],
+                    "athlts": athletes,
+                }
+            )
+        box.append(
+            {
+                "tm": {"id": side + 1, "displayName": abbrev, "abbrev": abbrev},
+                "stats": groups,
+            }
+        )
+
+    play_groups = []
+    for period in range(4):
+        plays = []
+        for n in range(plays_per_period):
+            play_type = rng.choice(PLAY_TYPES)
+            plays.append(
+                {
+                    "id": f"{game_id}{period}{n:04d}",
+                    "clock": {"displayValue": f"{11 - n * 12 // plays_per_period}:00"},
+                    "team": {"abbreviation": teams[n % 2]["abbrev"]},
+                    "type": {"id": str(PLAY_TYPES.index(play_type)), "text": play_type},
+                    "text": f"Player {n % 13} made {play_type.lower()} ({n} PTS)",
+                    "scoringPlay": rng.random() < 0.4,
+                    "coordinate": {"x": rng.uniform(0, 50), "y": rng.uniform(0, 47)},
+                    "participants": [
+                        {"athlete": {"id": f"{n % 2}s{n % 5}"}, "type": "shooter"}
+                    ],
+                }
+            )
+        play_groups.append(plays)
+
+    return {
+        "page": {
+            "content": {
+                "gamepackage": {
+                    "gmStrp": {
+                        "gid": game_id,
+                        "dt": f"2023-{rng.randint(10, 12)}-{rng.randint(10, 28)}T00:30Z",
+                        "seasonType": 2,
+                        "tms": teams,
+                    },
+                    "gmInfo": {
+                        "attnd": str(rng.randint(15000, 21000)),
+                        "venue": {
+                            "fullName": "Synthetic Arena",
+                            "address": {"city": "Boston", "state": "MA"},
+                        },
+                        "refs": [{"dspNm": f"Ref {i}", "number": i} for i in range(3)],
+                        "cvrg": [{"name": "ESPN"}],
+                    },
+                    "bxscr": box,
+                    "pbp": {"playGrps": play_groups},
+                }
+            }
+        }
+    }
+
+
+def build_lake(root: Path, n_games: int, seed: int = 42):
+    """Write n_games synthetic games under root (skips games already written)"""
+    from nba_simulator.testing import LocalS3Client
+
+    client = LocalS3Client(str(root))
+    rng = random.Random(seed)
+    game_ids = [f"4016{i:05d}" for i in range(n_games)]
+    for game_id in game_ids:
+        game = synthetic_game(game_id, rng)
+        if not (root / BUCKET / PREFIX / f"{game_id}.json").exists():
+            client.put_object(
+                Bucket=BUCKET,
+                Key=f"{PREFIX}/{game_id}.json",
+                Body=json.dumps(game).encode("utf-8"),
+            )
+    return game_ids
+
+
+def run_mode(args):
+    """Child process: extract every game in one mode, print JSON stats"""
+    from nba_simulator.etl.extractors.espn import ESPNFeatureExtractor, ESPNJSONReader
+    from nba_simulator.testing import LocalS3Client
+
+    client = LocalS3Client(args.root, latency=args.latency)
+    reader = ESPNJSONReader(bucket=BUCKET, s3_client=client)
+    extractor = ESPNFeatureExtractor(reader=reader)
+    game_ids = [f"4016{i:05d}" for i in range(args.games)]
+
+    started = time.perf_counter()
+    if args.run == "batch":
+        results = extractor.batch_extract_games(game_ids)
+        extracted = sum(1 for f in results.values() if f)
+    else:
+        extracted = 0
+        for _, features in extractor.stream_extract_games(
+            game_ids, io_workers=args.io_workers, processes=args.processes
+        ):
+            extracted += features is not None
+    elapsed = time.perf_counter() - started
+
+    print(
+        json.dumps(
+            {
+                "extracted": extracted,
+                "seconds": elapsed,
+                # Linux reports ru_maxrss in KiB
+                "rss_main_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                / 1024,
+                "rss_worker_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+                / 1024,
+            }
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark batch vs streaming ESPN feature extraction"
+    )
+    parser.add_argument("--games", type=int, default=1230, help="Games (one season)")
+    parser.add_argument("--root", help="Local S3 stand-in directory (default: temp)")
+    parser.add_argument("--processes", type=int, help="Extractor processes")
+    parser.add_argument("--io-workers", type=int, default=10, help="Reader threads")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Simulated seconds per S3 GET"
+    )
+    parser.add_argument("--run", choices=["batch", "stream"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_mode(args)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(args.root or tmp)
+        print(f"Writing {args.games:,} synthetic games to {root}...")
+        build_lake(root, args.games)
+        lake_mb = sum(p.stat().st_size for p in (root / BUCKET).rglob("*.json")) / 1e6
+        print(f"Lake: {lake_mb:,.0f} MB\n")
+
+        print(f"{'mode':<8} {'games/sec':>10} {'main RSS':>10} {'worker RSS':>11}")
+        print("-" * 42)
+        for mode in ("batch", "stream"):
+            cmd = [
+                sys.executable,
+                __file__,
+                "--run",
+                mode,
+                "--root",
+                str(root),
+                "--games",
+                str(args.games),
+                "--io-workers",
+                str(args.io_workers),
+                "--latency",
+                str(args.latency),
+            ]
+            if args.processes:
+                cmd += ["--processes", str(args.processes)]
+            output = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            stats = json.loads(output.stdout.strip().splitlines()[-1])
+            worker = f"{stats['rss_worker_mb']:,.0f} MB" if mode == "stream" else "-"
+            print(
+                f"{mode:<8} {stats['extracted'] / stats['seconds']:>10,.1f} "
+                f"{stats['rss_main_mb']:>7,.0f} MB {worker:>11}"
+            )
+
+
+if __name__ == "__main__":
+    main()
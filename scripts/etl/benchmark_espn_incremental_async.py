@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Benchmark ESPNIncrementalScraperAsync against local fake ESPN and S3
+
+Starts an aiohttp server imitating the ESPN scoreboard/summary endpoints
+(with per-request latency) and points the scraper at a LocalS3Client bucket
+(with per-request latency) in which a fraction of the games already exist.
+Each mode scrapes the same date range into a fresh copy of the bucket:
+
+- sequential+head: one date and one game at a time, head_object per game
+  (the previous behavior)
+- concurrent+head: bounded concurrency, head_object per game
+- concurrent+manifest: bounded concurrency, key manifest existence checks
+
+Reports wall time, HTTP requests, and S3 HEAD/LIST/PUT requests per mode.
+
+Usage:
+    python scripts/etl/benchmark_espn_incremental_async.py
+    python scripts/etl/benchmark_espn_incremental_async.py --days 60 --games-per-date 10
+    python scripts/etl/benchmark_espn_incremental_async.py --http-latency 0.2 --rate 20
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from aiohttp import web
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from nba_simulator.etl.base.async_scraper import RateLimiter
+from nba_simulator.testing import LocalS3Client
+from scripts.etl.espn_incremental_async import (
+    S3_PREFIX_BOX,
+    S3_PREFIX_PBP,
+    S3_PREFIX_TEAM,
+    ESPNIncrementalScraperAsync,
+)
+
+BUCKET = "espn-benchmark"
+
+MODES = {
+    "sequential+head": {"concurrent": False, "manifest": False},
+    "concurrent+head": {"concurrent": True, "manifest": False},
+    "concurrent+manifest": {"concurrent": True, "manifest": True},
+}
+
+
+def game_ids(date_str: str, games_per_date: int) -> list:
+    """Deterministic ESPN-style game IDs for a date"""
+    return [f"4{date_str}{i:02d}" for i in range(games_per_date)]
+
+
+def make_fake_espn(games_per_date: int, latency: float, payload_kb: int):
+    """aiohttp app serving /scoreboard and /summary; counts requests"""
+    requests = Counter()
+    filler = "x" * 1024
+
+    async def scoreboard(request):
+        requests["scoreboard"] += 1
+        await asyncio.sleep(latency)
+        date_str = request.query["dates"]
+        events = [{"id": gid} for gid in game_ids(date_str, games_per_date)]
+        return web.json_response({"events": events})
+
+    async def summary(request):
+        requests["summary"] += 1
+        await asyncio.sleep(latency)
+        game_id = request.query["event"]
+        plays = [{"id": i, "text": filler} for i in range(payload_kb)]
+        return web.json_response({"header": {"id": game_id}, "plays": plays})
+
+    app = web.Application()
+    app.router.add_get("/scoreboard", scoreboard)
+    app.router.add_get("/summary", summary)
+    return app, requests
+
+
+class CountingS3Client(LocalS3Client):
+    """LocalS3Client counting HEAD, LIST (pages) and PUT requests"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = Counter()
+        self._calls_lock = threading.Lock()
+
+    def _count(self, name: str) -> None:
+        with self._calls_lock:
+            self.calls[name] += 1
+
+    def head_object(self, Bucket, Key):
+        self._count("head")
+        return super().head_object(Bucket=Bucket, Key=Key)
+
+    def upload_file(self, Filename, Bucket, Key):
+        self._count("put")
+        return super().upload_file(Filename, Bucket, Key)
+
+    def get_paginator(self, operation_name):
+        paginator = super().get_paginator(operation_name)
+        client = self
+
+        class CountingPaginator:
+            def paginate(self, **kwargs):
+                for page in paginator.paginate(**kwargs):
+                    client._count("list")
+                    yield page
+
+        return CountingPaginator()
+
+
+def seed_bucket(client, dates, games_per_date, existing_fraction, seed=11):
+    """Upload a random fraction of the games to all three prefixes"""
+    rng = random.Random(seed)
+    existing = 0
+    for date_str in dates:
+        for game_id in game_ids(date_str, games_per_date):
+            if rng.random() < existing_fraction:
+                existing += 1
+                for prefix in (S3_PREFIX_PBP, S3_PREFIX_BOX, S3_PREFIX_TEAM):
+                    client.put_object(
+                        Bucket=BUCKET, Key=f"{prefix}/{game_id}.json", Body=b"{}"
+                    )
+    return existing
+
+
+async def run_mode(args, url, work_dir, concurrent, manifest):
+    """Scrape the date range once; return (seconds, result, s3 calls)"""
+    s3_client = CountingS3Client(str(work_dir / "lake"), latency=args.s3_latency)
+    scraper = ESPNIncrementalScraperAsync(
+        days_back=args.days,
+        concurrent_dates=args.concurrent_dates if concurrent else 1,
+        use_key_manifest=manifest,
+    )
+    seed_bucket(
+        s3_client,
+        scraper.get_date_range(),
+        args.games_per_date,
+        args.existing_fraction,
+    )
+
+    scraper.base_url = url
+    scraper.s3_client = s3_client
+    scraper.output_dir = work_dir / "output"
+    scraper.config.s3_bucket = BUCKET
+    scraper.config.dry_run = False
+    scraper.config.max_concurrent = args.max_concurrent if concurrent else 1
+    scraper.rate_limiter = RateLimiter(1.0 / args.rate)
+
+    async with scraper:
+        start = time.perf_counter()
+        result = await scraper.scrape()
+        elapsed = time.perf_counter() - start
+
+    return elapsed, result, s3_client.calls
+
+
+async def main_async(args):
+    app, http_requests = make_fake_espn(
+        args.games_per_date, args.http_latency, args.payload_kb
+    )
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}"
+
+    total_games = (args.days + 1) * args.games_per_date
+    print(
+        f"{args.days + 1} dates x {args.games_per_date} games = {total_games} games, "
+        f"~{args.existing_fraction:.0%} already in S3"
+    )
+    print(
+        f"HTTP latency {args.http_latency * 1000:.0f} ms, "
+        f"S3 latency {args.s3_latency * 1000:.0f} ms, rate limit {args.rate} req/s, "
+        f"max_concurrent {args.max_concurrent}"
+    )
+    print(
+        f"{'mode':<22} {'seconds':>8} {'games':>6} {'skipped':>8} "
+        f"{'http':>6} {'head':>6} {'list':>6} {'put':>6}"
+    )
+
+    try:
+        for mode in args.modes.split(","):
+            options = MODES[mode]
+            http_requests.clear()
+            with tempfile.TemporaryDirectory() as tmp:
+                elapsed, result, s3_calls = await run_mode(
+                    args, url, Path(tmp), options["concurrent"], options["manifest"]
+                )
+            print(
+                f"{mode:<22} {elapsed:>8.2f} {result['games_scraped']:>6} "
+                f"{result['games_skipped']:>8} {sum(http_requests.values()):>6} "
+                f"{s3_calls['head']:>6} {s3_calls['list']:>6} {s3_calls['put']:>6}"
+            )
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the ESPN incremental async scraper"
+    )
+    parser.add_argument("--days", type=int, default=13, help="Days back (default: 13)")
+    parser.add_argument("--games-per-date", type=int, default=8)
+    parser.add_argument("--existing-fraction", type=float, default=0.5)
+    parser.add_argument("--http-latency", type=float, default=0.05)
+    parser.add_argument("--s3-latency", type=float, default=0.02)
+    parser.add_argument("--payload-kb", type=int, default=64)
+    parser.add_argument(
+        "--rate", type=float, default=50.0, help="ESPN requests/sec (default: 50)"
+    )
+    parser.add_argument("--max-concurrent", type=int, default=10)
+    parser.add_argument("--concurrent-dates", type=int, default=4)
+    parser.add_argument("--modes", default=",".join(MODES))
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
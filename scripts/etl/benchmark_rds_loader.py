@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark RDSLoader: binary COPY vs UPSERT at different concurrency levels
+
+Upserts are measured both ways: executemany INSERT ... ON CONFLICT
+("upsert") and COPY into a staging table + one merge per batch ("staged").
+
+Loads synthetic play-by-play rows into a scratch table and reports rows/sec
+for each (mode, concurrency) pair. Concurrency 1 is the single-connection
+sequential loader; higher values use the pooled loader.
+
+The scratch table is created in the target database and dropped afterwards.
+
+Usage:
+    python scripts/etl/benchmark_rds_loader.py --dsn postgresql://localhost/nba_simulator
+    python scripts/etl/benchmark_rds_loader.py --rows 500000 --concurrency 1,4,8,16
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import asyncpg
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from nba_simulator.etl.loaders import RDSLoader
+
+TABLE = "rds_loader_benchmark"
+
+SCHEMA_SQL = f"""
+    CREATE TABLE IF NOT EXISTS public.{TABLE} (
+        event_id BIGINT PRIMARY KEY,
+        game_id TEXT NOT NULL,
+        period INTEGER NOT NULL,
+        game_clock_seconds DOUBLE PRECISION,
+        points INTEGER,
+        wall_clock_utc TIMESTAMPTZ,
+        description TEXT
+    )
+"""
+
+
+def make_rows(n: int, seed: int = 42):
+    """Synthetic play-by-play rows with native Python values"""
+    rng = random.Random(seed)
+    tipoff = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "event_id": i,
+            "game_id": f"40159{i // 500:04d}",
+            "period": (i % 500) // 125 + 1,
+            "game_clock_seconds": rng.uniform(0, 720),
+            "points": rng.choice([0, 0, 1, 2, 3]),
+            "wall_clock_utc": tipoff + timedelta(seconds=i),
+            "description": f"Player {rng.randint(1, 450)} makes shot\t(assist)",
+        }
+        for i in range(n)
+    ]
+
+
+async def run_once(
+    dsn: str, rows, upsert: bool, method: str, concurrency: int, batch_size: int
+):
+    """Truncate the scratch table, load rows, return (rows/sec, metrics)"""
+    conn = await asyncpg.connect(dsn)
+    try:
+        await conn.execute(f"TRUNCATE public.{TABLE}")
+    finally:
+        await conn.close()
+
+    loader = RDSLoader(
+        TABLE,
+        upsert=upsert,
+        upsert_method=method,
+        db_config={"dsn": dsn},
+        batch_size=batch_size,
+        concurrency=concurrency,
+        config={"verify": False, "log_level": "WARNING"},
+    )
+    started = time.perf_counter()
+    metrics = await loader.load(rows)
+    elapsed = time.perf_counter() - started
+    return metrics.records_loaded / elapsed, metrics
+
+
+async def run_benchmark(args):
+    levels = [int(c) for c in args.concurrency.split(",")]
+    rows = make_rows(args.rows)
+
+    conn = await asyncpg.connect(args.dsn)
+    await conn.execute(SCHEMA_SQL)
+    await conn.close()
+
+    print(f"\nRDSLoader benchmark: {args.rows:,} rows, batch size {args.batch_size:,}")
+    print(
+        f"{'mode':<8} {'concurrency':>11} {'rows/sec':>12} {'loaded':>10} {'failed':>8}"
+    )
+    print("-" * 53)
+
+    try:
+        modes = (
+            ("copy", False, "staging"),
+            ("upsert", True, "insert"),
+            ("staged", True, "staging"),
+        )
+        for mode, upsert, method in modes:
+            for concurrency in levels:
+                rate, metrics = await run_once(
+                    args.dsn, rows, upsert, method, concurrency, args.batch_size
+                )
+                print(
+                    f"{mode:<8} {concurrency:>11} {rate:>12,.0f} "
+                    f"{metrics.records_loaded:>10,} {metrics.records_failed:>8,}"
+                )
+    finally:
+        if not args.keep_table:
+            conn = await asyncpg.connect(args.dsn)
+            await conn.execute(f"DROP TABLE IF EXISTS public.{TABLE}")
+            await conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark RDSLoader COPY vs UPSERT throughput"
+    )
+    parser.add_argument(
+        "--dsn",
+        default=os.environ.get(
+            "BENCHMARK_DSN", "postgresql://localhost:5432/nba_simulator"
+        ),
+        help="PostgreSQL DSN (default: $BENCHMARK_DSN or local nba_simulator)",
+    )
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows per run")
+    parser.add_argument(
+        "--concurrency",
+        default="1,2,4,8",
+        help="Comma-separated concurrency levels (default: 1,2,4,8)",
+    )
+    parser.add_argument("--batch-size", type=int, default=5_000, help="Rows per batch")
+    parser.add_argument(
+        "--keep-table", action="store_true", help="Don't drop the scratch table"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
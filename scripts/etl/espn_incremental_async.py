@@ -7,7 +7,10 @@ Scrapes last N days of ESPN data and uploads to S3 with proper folder structure.
 
 Features:
 - Async HTTP requests with aiohttp
-- Built-in rate limiting (token bucket)
+- Concurrent games and dates, bounded by max_concurrent and the shared
+  rate limiter (token bucket)
+- S3 existence checks from a per-prefix key manifest (one listing per
+  prefix, incremental across runs) instead of a HEAD request per game
 - Retry logic with exponential backoff
 - Progress tracking and telemetry
 - S3 upload management
@@ -16,6 +19,7 @@ Features:
 Usage:
     python scripts/etl/espn_incremental_async.py --days 3              # Last 3 days
     python scripts/etl/espn_incremental_async.py --days 7 --dry-run    # Test mode
+    python scripts/etl/espn_incremental_async.py --days 180 --concurrent-dates 8  # Backfill
 
     # ADCE autonomous mode
     from espn_incremental_async import ESPNIncrementalScraperAsync
@@ -40,6 +44,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from nba_simulator.etl.base.async_scraper import AsyncScraper, ScraperConfig
+from nba_simulator.etl.base.key_manifest import S3KeyManifest
 from scripts.etl.scraper_config import (
     ScraperConfigManager,
     RateLimitConfig,
@@ -57,6 +62,9 @@ S3_PREFIX_BOX = "espn_box_scores"
 S3_PREFIX_SCHEDULE = "espn_schedules"
 S3_PREFIX_TEAM = "espn_team_stats"
 
+# Key manifest cache (not *.json, so cleanup_old_temp_files keeps it)
+KEY_MANIFEST_FILENAME = "s3_keys.manifest"
+
 
 class ESPNIncrementalScraperAsync(AsyncScraper):
     """
@@ -75,6 +83,8 @@ class ESPNIncrementalScraperAsync(AsyncScraper):
         days_back: int = 3,
         save_local: bool = False,
         local_data_dir: Optional[Path] = None,
+        concurrent_dates: int = 4,
+        use_key_manifest: bool = True,
     ):
         """
         Initialize ESPN scraper.
@@ -84,6 +94,10 @@ class ESPNIncrementalScraperAsync(AsyncScraper):
             days_back: Number of days to scrape back from today
             save_local: If True, save JSON files locally in addition to S3
             local_data_dir: Directory to save local files (default: /Users/ryanranft/nba-simulator-aws/data/)
+            concurrent_dates: Dates scraped at once (games across all dates
+                are bounded by max_concurrent)
+            use_key_manifest: Check S3 existence against a listed key manifest
+                instead of one head_object per game
         """
         # Load config from YAML
         config_file = (
@@ -113,6 +127,14 @@ class ESPNIncrementalScraperAsync(AsyncScraper):
         self.days_back = days_back
         self.base_url = BASE_URL
         self.save_local = save_local
+        self.concurrent_dates = max(1, concurrent_dates)
+        self.use_key_manifest = use_key_manifest
+
+        # Built on first existence check (see key_manifest)
+        self._key_manifest: Optional[S3KeyManifest] = None
+        self._manifest_lock = asyncio.Lock()
+        # Games in flight across all dates
+        self._game_slots = asyncio.Semaphore(self.config.max_concurrent)
 
         # Local data directories
         if local_data_dir is None:
@@ -140,6 +162,7 @@ class ESPNIncrementalScraperAsync(AsyncScraper):
 
         # Stats specific to ESPN scraper
         self.games_scraped = 0
+        self.games_skipped = 0
         self.schedules_scraped = 0
         self.local_files_saved = 0
 
@@ -245,10 +268,25 @@ class ESPNIncrementalScraperAsync(AsyncScraper):
             self.stats.errors += 1
             return None
 
+    @property
+    def key_manifest(self) -> Optional[S3KeyManifest]:
+        """Key manifest for the S3 bucket (None if disabled or no S3 client)"""
+        if self._key_manifest is None and self.use_key_manifest and self.s3_client:
+            self._key_manifest = S3KeyManifest(
+                self.s3_client,
+                self.config.s3_bucket,
+                cache_path=str(self.output_dir / KEY_MANIFEST_FILENAME),
+            )
+        return self._key_manifest
+
     async def file_exists_in_s3(self, s3_key: str) -> bool:
         """
         Check if file already exists in S3.
 
+        Uses the key manifest when enabled: the key's prefix is listed once
+        (in the executor, one listing even with many concurrent callers)
+        and later checks are in-memory.
+
         Args:
             s3_key: S3 key to check (e.g., 'espn_play_by_play/401810037.json')
 
@@ -259,6 +297,25 @@ class ESPNIncrementalScraperAsync(AsyncScraper):
             # In dry-run mode, assume files don't exist
             return False
 
+        manifest = self.key_manifest
+        if manifest is not None:
+            prefix = s3_key.rsplit("/", 1)[0] + "/"
+            if not manifest.is_loaded(prefix):
+                async with self._manifest_lock:
+                    if not manifest.is_loaded(prefix):
+                        try:
+                            loop = asyncio.get_event_loop()
+                            await loop.run_in_executor(None, manifest.load, prefix)
+                        except Exception as e:
+                            self.logger.warning(
+                                f"Key manifest listing failed for {prefix}, "
+                                f"falling back to head_object: {e}"
+                            )
+                            self.use_key_manifest = False
+                            self._key_manifest = None
+                            return await self.file_exists_in_s3(s3_key)
+            return manifest.contains(s3_key)
+
         try:
             # Use head_object to check existence without downloading
             loop = asyncio.get_event_loop()
@@ -321,7 +378,9 @@ class ESPNIncrementalScraperAsync(AsyncScraper):
             self.schedules_scraped += 1
         return success
 
-    async def store_game_data(self, game_data: Dict, game_id: str) -> int:
+    async def store_game_data(
+        self, game_data: Dict, game_id: str, check_existing: bool = True
+    ) -> int:
         """
         Store game data to all three S3 folders (PBP, box scores, team stats) and optionally local files.
 
@@ -331,6 +390,7 @@ class ESPNIncrementalScraperAsync(AsyncScraper):
         Args:
             game_data: Game data dict
             game_id: ESPN game ID
+            check_existing: Check S3 first (False if the caller already has)
 
         Returns:
             Number of successful uploads (0-3), or -1 if skipped (duplicate)
@@ -339,23 +399,18 @@ class ESPNIncrementalScraperAsync(AsyncScraper):
 
         # Check if game already exists in S3 (check play-by-play as representative)
         pbp_key = f"{S3_PREFIX_PBP}/{filename}"
-        if await self.file_exists_in_s3(pbp_key):
+        if check_existing and await self.file_exists_in_s3(pbp_key):
             self.logger.info(f"    ⏭️  Game {game_id} already exists in S3, skipping")
             return -1  # Indicate skip
 
         uploads_successful = 0
 
-        # Upload to play-by-play folder
-        if await self.store_data(game_data, filename, S3_PREFIX_PBP):
-            uploads_successful += 1
-
-        # Upload to box scores folder
-        if await self.store_data(game_data, filename, S3_PREFIX_BOX):
-            uploads_successful += 1
-
-        # Upload to team stats folder
-        if await self.store_data(game_data, filename, S3_PREFIX_TEAM):
-            uploads_successful += 1
+        # Upload to play-by-play, box scores and team stats folders
+        for prefix in (S3_PREFIX_PBP, S3_PREFIX_BOX, S3_PREFIX_TEAM):
+            if await self.store_data(game_data, filename, prefix):
+                uploads_successful += 1
+                if self._key_manifest is not None and not self.config.dry_run:
+                    self._key_manifest.add(f"{prefix}/{filename}")
 
         # Save to local files if enabled
         if self.save_local:
@@ -399,34 +454,59 @@ class ESPNIncrementalScraperAsync(AsyncScraper):
 
         self.logger.info(f"  Found {len(events)} games for {date_str}")
 
-        # Process games concurrently
+        # Process games concurrently (bounded across all dates)
         game_ids = [event.get("id") for event in events if event.get("id")]
+        results = await asyncio.gather(
+            *(self.process_game(game_id) for game_id in game_ids)
+        )
+
+        for uploads in results:
+            if uploads > 0:
+                stats["games"] += 1
+                stats["uploads"] += uploads
+
+        return stats
+
+    async def process_game(self, game_id: str) -> int:
+        """
+        Fetch and store one game, holding a game slot throughout.
+
+        Games already in S3 are skipped before the summary request is made.
+
+        Args:
+            game_id: ESPN game ID
+
+        Returns:
+            Number of successful uploads (0-3), or -1 if skipped (duplicate)
+        """
+        async with self._game_slots:
+            pbp_key = f"{S3_PREFIX_PBP}/{game_id}.json"
+            if await self.file_exists_in_s3(pbp_key):
+                self.logger.info(
+                    f"    ⏭️  Game {game_id} already exists in S3, skipping"
+                )
+                self.games_skipped += 1
+                return -1
 
-        for game_id in game_ids:
             self.logger.info(f"  Processing game {game_id}...")
 
             # Fetch game data
             game_data = await self.fetch_game_data(game_id)
+            if not game_data:
+                return 0
 
-            if game_data:
-                # Store to all three folders
-                uploads = await self.store_game_data(game_data, game_id)
-
-                if uploads == -1:
-                    # Game was skipped (already exists)
-                    continue
-                elif uploads > 0:
-                    stats["games"] += 1
-                    stats["uploads"] += uploads
-
-                    if uploads == 3:
-                        self.logger.info(f"    ✓ Uploaded {game_id} to all folders")
-                    else:
-                        self.logger.warning(
-                            f"    ⚠ Only {uploads}/3 uploads succeeded for {game_id}"
-                        )
+            # Store to all three folders
+            uploads = await self.store_game_data(
+                game_data, game_id, check_existing=False
+            )
 
-        return stats
+            if uploads == 3:
+                self.logger.info(f"    ✓ Uploaded {game_id} to all folders")
+            elif uploads >= 0:
+                self.logger.warning(
+                    f"    ⚠ Only {uploads}/3 uploads succeeded for {game_id}"
+                )
+            return uploads
 
     async def cleanup_old_temp_files(self, max_age_hours: int = 24) -> int:
         """
@@ -495,26 +575,43 @@ class ESPNIncrementalScraperAsync(AsyncScraper):
         dates = self.get_date_range()
         self.logger.info(f"Date range: {dates[0]} to {dates[-1]} ({len(dates)} days)")
 
-        # Scrape each date
-        total_games = 0
-        total_uploads = 0
+        # Scrape dates concurrently; the game slots and rate limiter are shared
+        # (rebuilt per run so config overrides after __init__ apply)
+        self._game_slots = asyncio.Semaphore(self.config.max_concurrent)
+        self._manifest_lock = asyncio.Lock()
+        date_slots = asyncio.Semaphore(self.concurrent_dates)
 
-        for date_str in dates:
-            stats = await self.scrape_date(date_str)
-            total_games += stats["games"]
-            total_uploads += stats["uploads"]
+        async def scrape_bounded(date_str: str) -> Dict[str, int]:
+            async with date_slots:
+                return await self.scrape_date(date_str)
+
+        results = await asyncio.gather(*(scrape_bounded(d) for d in dates))
+        total_games = sum(stats["games"] for stats in results)
+        total_uploads = sum(stats["uploads"] for stats in results)
+
+        # Persist the key manifest for an incremental listing next run
+        if self._key_manifest is not None:
+            try:
+                self._key_manifest.save()
+            except OSError as e:
+                self.logger.warning(f"Could not save key manifest: {e}")
 
         # Print summary
         self.logger.info(f"\n{'='*70}")
         self.logger.info("SCRAPING SUMMARY")
         self.logger.info("=" * 70)
         self.logger.info(f"Games scraped:   {total_games}")
+        self.logger.info(f"Games skipped:   {self.games_skipped}")
         self.logger.info(f"Files uploaded:  {total_uploads}")
         if self.save_local:
             self.logger.info(f"Local files:     {self.local_files_saved}")
         self.logger.info(f"Schedules:       {self.schedules_scraped}")
         self.logger.info(f"Errors:          {self.stats.errors}")
         self.logger.info(f"Success rate:    {self.stats.success_rate:.1%}")
+        if self._key_manifest is not None:
+            self.logger.info(
+                f"S3 list calls:   {self._key_manifest.list_requests} (key manifest)"
+            )
         self.logger.info("=" * 70)
         self.logger.info(f"✓ Complete: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
@@ -527,6 +624,7 @@ class ESPNIncrementalScraperAsync(AsyncScraper):
         # Return stats for ADCE
         return {
             "games_scraped": total_games,
+            "games_skipped": self.games_skipped,
             "files_uploaded": total_uploads,
             "schedules_scraped": self.schedules_scraped,
             "errors": self.stats.errors,
@@ -550,6 +648,8 @@ async def main_async(args):
         days_back=args.days,
         save_local=args.save_local,
         local_data_dir=local_data_dir,
+        concurrent_dates=args.concurrent_dates,
+        use_key_manifest=not args.no_key_manifest,
     )
 
     # Set dry_run if specified
@@ -583,6 +683,18 @@ def main():
         help="Local data directory (default: /Users/ryanranft/nba-simulator-aws/data/)",
     )
 
+    parser.add_argument(
+        "--concurrent-dates",
+        type=int,
+        default=4,
+        help="Dates scraped concurrently (default: 4)",
+    )
+    parser.add_argument(
+        "--no-key-manifest",
+        action="store_true",
+        help="Check S3 with head_object per game instead of a key manifest",
+    )
+
     args = parser.parse_args()
 
     # Run async main
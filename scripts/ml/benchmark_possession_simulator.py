@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark the possession-level Monte Carlo simulator
+
+Simulates one matchup at several simulation counts and chunk sizes and
+reports simulations/sec and peak memory traced during the run. The model
+is built from temporal_possession_stats (--from-database) or from a
+synthetic 30-team league.
+
+Usage:
+    python scripts/ml/benchmark_possession_simulator.py
+    python scripts/ml/benchmark_possession_simulator.py --simulations 10000,100000,1000000
+    python scripts/ml/benchmark_possession_simulator.py --chunk-sizes 1000,10000,100000
+    python scripts/ml/benchmark_possession_simulator.py --from-database --seasons 2023,2024
+"""
+
+import argparse
+import sys
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from nba_simulator.simulation import PossessionModel, PossessionSimulator
+
+# Points-per-possession distribution roughly matching the modern NBA
+LEAGUE_DISTRIBUTION = np.array([0.47, 0.06, 0.33, 0.13, 0.01])
+
+
+def synthetic_model(n_teams: int = 30, seed: int = 42) -> PossessionModel:
+    """One season of synthetic possession aggregates"""
+    rng = np.random.default_rng(seed)
+    teams = [1610612737 + i for i in range(n_teams)]
+    outcome_rows = []
+    for offense in teams:
+        for defense in teams:
+            if offense == defense:
+                continue
+            dist = LEAGUE_DISTRIBUTION * rng.uniform(0.9, 1.1, 5)
+            counts = rng.multinomial(330, dist / dist.sum())
+            outcome_rows += [
+                (offense, defense, points, int(count))
+                for points, count in enumerate(counts)
+            ]
+    pace_rows = []
+    for game in range(1230):
+        home, away = rng.choice(teams, 2, replace=False)
+        possessions = round(rng.normal(100, 4))
+        pace_rows += [(game, home, possessions), (game, away, possessions)]
+    return PossessionModel.from_counts(outcome_rows, pace_rows)
+
+
+def database_model(seasons) -> PossessionModel:
+    from nba_simulator.database import get_database_connection
+
+    conn = get_database_connection()
+    try:
+        return PossessionModel.from_database(conn, seasons=seasons)
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the possession-level Monte Carlo simulator"
+    )
+    parser.add_argument(
+        "--simulations",
+        default="10000,100000",
+        help="Comma-separated simulation counts",
+    )
+    parser.add_argument(
+        "--chunk-sizes",
+        default=str(PossessionSimulator.DEFAULT_CHUNK_SIZE),
+        help="Comma-separated chunk sizes",
+    )
+    parser.add_argument(
+        "--from-database",
+        action="store_true",
+        help="Build the model from temporal_possession_stats",
+    )
+    parser.add_argument("--seasons", help="Comma-separated seasons (database)")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed")
+    args = parser.parse_args()
+
+    if args.from_database:
+        seasons = [int(s) for s in args.seasons.split(",")] if args.seasons else None
+        model = database_model(seasons)
+    else:
+        model = synthetic_model(seed=args.seed)
+    home, away = sorted(model.profiles)[:2]
+    print(
+        f"Model: {len(model.profiles)} teams, {model.league.possessions:,} possessions"
+    )
+    print(f"Matchup: {away} @ {home}\n")
+
+    print(
+        f"{'simulations':>12} {'chunk':>8} {'sims/sec':>12} {'peak MB':>9} "
+        f"{'home win':>9} {'total':>7}"
+    )
+    print("-" * 62)
+    for n in [int(x) for x in args.simulations.split(",")]:
+        for chunk_size in [int(x) for x in args.chunk_sizes.split(",")]:
+            simulator = PossessionSimulator(
+                model, chunk_size=chunk_size, seed=args.seed
+            )
+            tracemalloc.start()
+            result = simulator.simulate(home, away, n_simulations=n)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{n:>12,} {chunk_size:>8,} {result.simulations_per_second:>12,.0f} "
+                f"{peak / 1e6:>9.1f} {result.home_win_prob:>9.1%} "
+                f"{result.totals.mean():>7.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
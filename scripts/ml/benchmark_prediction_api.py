@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark the prediction Lambda behind its local HTTP server
+
+Starts lambda/prediction_api/lambda_function.py's local server in-process
+(or targets --url), sends single-game and batch requests over keep-alive
+connections, and reports p50/p99 request latency, requests/sec and
+games/sec per batch size. Without --model/--scaler a logistic regression
+is fit on synthetic features so no S3 access is needed.
+
+Usage:
+    python scripts/ml/benchmark_prediction_api.py
+    python scripts/ml/benchmark_prediction_api.py --batch-sizes 1,10,100,1000 --requests 5000
+    python scripts/ml/benchmark_prediction_api.py --model /tmp/lr.joblib --scaler /tmp/scaler.joblib
+    python scripts/ml/benchmark_prediction_api.py --url http://localhost:8080
+"""
+
+import argparse
+import http.client
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlparse
+
+import numpy as np
+
+# Add Lambda source directory to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "lambda" / "prediction_api"))
+
+import lambda_function
+
+
+def synthetic_model(seed: int = 42):
+    """Logistic regression + scaler fit on synthetic feature rows"""
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.preprocessing import StandardScaler
+
+    rng = np.random.default_rng(seed)
+    X = synthetic_features(5000, rng)
+    margin = X[:, 3] - X[:, 9] + rng.normal(0, 5, len(X))
+    y = (margin > 0).astype(int)
+
+    scaler = StandardScaler().fit(X)
+    model = LogisticRegression(max_iter=1000).fit(scaler.transform(X), y)
+    return model, scaler
+
+
+def synthetic_features(n: int, rng: np.random.Generator) -> np.ndarray:
+    """Plausible values for the 16 Lambda features"""
+    home = np.column_stack(
+        [
+            rng.uniform(0.2, 0.8, n),  # rolling_win_pct
+            rng.normal(112, 5, n),  # rolling_ppg
+            rng.normal(112, 5, n),  # rolling_papg
+            rng.normal(0, 6, n),  # rolling_margin
+            rng.integers(0, 4, n),  # rest_days
+            rng.integers(0, 2, n),  # back_to_back
+        ]
+    )
+    away = np.column_stack(
+        [
+            rng.uniform(0.2, 0.8, n),
+            rng.normal(112, 5, n),
+            rng.normal(112, 5, n),
+            rng.normal(0, 6, n),
+            rng.integers(0, 4, n),
+            rng.integers(0, 2, n),
+        ]
+    )
+    schedule = np.column_stack(
+        [
+            rng.integers(1, 13, n),  # month
+            rng.integers(0, 7, n),  # day_of_week
+            rng.integers(0, 2, n),  # is_weekend
+            rng.integers(0, 3, n),  # season_phase
+        ]
+    )
+    return np.hstack([home, away, schedule])
+
+
+def build_payloads(batch_size: int, count: int, seed: int = 7) -> list:
+    """Encoded request bodies: single-game for batch_size 1, else batches"""
+    rng = np.random.default_rng(seed)
+    names = lambda_function.FEATURE_NAMES
+    payloads = []
+    for _ in range(count):
+        games = [
+            {
+                "home_team": "LAL",
+                "away_team": "BOS",
+                "features": dict(zip(names, row.tolist())),
+            }
+            for row in synthetic_features(batch_size, rng)
+        ]
+        body = games[0] if batch_size == 1 else {"games": games}
+        payloads.append(json.dumps(body).encode("utf-8"))
+    return payloads
+
+
+def run_load(url: str, payloads: list, path: str, concurrency: int) -> np.ndarray:
+    """Send every payload; return per-request latencies in seconds"""
+    parsed = urlparse(url)
+    local = threading.local()
+    headers = {"Content-Type": "application/json"}
+
+    def send(payload: bytes) -> float:
+        if not hasattr(local, "conn"):
+            local.conn = http.client.HTTPConnection(parsed.hostname, parsed.port)
+        start = time.perf_counter()
+        local.conn.request("POST", path, body=payload, headers=headers)
+        response = local.conn.getresponse()
+        response.read()
+        elapsed = time.perf_counter() - start
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status} from {path}")
+        return elapsed
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return np.array(list(pool.map(send, payloads)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the prediction Lambda")
+    parser.add_argument("--url", help="Existing server (default: start one locally)")
+    parser.add_argument(
+        "--batch-sizes",
+        default="1,10,100,1000",
+        help="Comma-separated games per request",
+    )
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--model", help="Local model artifact (joblib/pickle)")
+    parser.add_argument("--scaler", help="Local scaler artifact (joblib/pickle)")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        if args.model and args.scaler:
+            import joblib
+
+            lambda_function.use_model(
+                joblib.load(args.model, mmap_mode="r"),
+                joblib.load(args.scaler, mmap_mode="r"),
+            )
+        else:
+            lambda_function.use_model(*synthetic_model())
+        server = lambda_function.create_local_server(port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"Target: {url} ({args.requests} requests, concurrency {args.concurrency})")
+    print(f"{'batch':>6} {'p50 ms':>9} {'p99 ms':>9} {'req/sec':>10} {'games/sec':>12}")
+    try:
+        for batch_size in [int(b) for b in args.batch_sizes.split(",")]:
+            path = "/predict" if batch_size == 1 else "/predict/batch"
+            payloads = build_payloads(batch_size, args.requests)
+            # Warm up connections and the model
+            run_load(url, payloads[: args.concurrency], path, args.concurrency)
+
+            start = time.perf_counter()
+            latencies = run_load(url, payloads, path, args.concurrency)
+            elapsed = time.perf_counter() - start
+
+            p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+            print(
+                f"{batch_size:>6} {p50:>9.2f} {p99:>9.2f} "
+                f"{len(payloads) / elapsed:>10,.0f} "
+                f"{len(payloads) * batch_size / elapsed:>12,.0f}"
+            )
+    finally:
+        if server is not None:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,20 @@
 """
 Export trained model coefficients to JSON format
 This allows Lambda to make predictions without scikit-learn
+
+Also exports the model and scaler as joblib artifacts, which the
+prediction Lambda memory-maps instead of unpickling from a byte stream:
+    python scripts/ml/export_model_coefficients.py --joblib
 """
 
+import argparse
 import json
 import pickle
+import tempfile
+from pathlib import Path
+
 import boto3
+import joblib
 import numpy as np
 from io import BytesIO
 
@@ -92,5 +101,30 @@ def export_coefficients():
     return coefficients
 
 
+def export_joblib_artifacts(model_name="logistic_regression"):
+    """Re-save model and scaler as joblib artifacts next to the pickles"""
+    print("Loading model from S3...")
+    model, scaler = load_model_from_s3(model_name)
+
+    s3 = boto3.client("s3")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, obj in [(model_name, model), ("scaler", scaler)]:
+            path = Path(tmpdir) / f"{name}.joblib"
+            joblib.dump(obj, path)
+            key = f"{S3_MODELS_PREFIX}/{name}.joblib"
+            s3.upload_file(str(path), S3_BUCKET, key)
+            print(f"✓ Exported s3://{S3_BUCKET}/{key}")
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export trained model artifacts")
+    parser.add_argument(
+        "--joblib",
+        action="store_true",
+        help="Also export joblib artifacts for the prediction Lambda",
+    )
+    args = parser.parse_args()
+
     export_coefficients()
+    if args.joblib:
+        export_joblib_artifacts()
@@ -19,6 +19,19 @@ from enum import Enum
 import threading
 from collections import OrderedDict
 import sqlite3
+import weakref
+from urllib.parse import quote
+
+import numpy as np
+
+# Optional columnar backend (Arrow IPC files, pandas frames)
+try:
+    import pandas as pd
+    import pyarrow as pa
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -139,18 +152,461 @@ class LRUCache:
             return len(self.cache)
 
 
+class ColumnarFeatureBackend:
+    """
+    Columnar on-disk storage for feature values (Arrow IPC).
+
+    Layout::
+
+        <root>/<name>/<version>/part-00000.arrow
+        <root>/<name>/<version>/part-00001.arrow
+        ...
+
+    Each part holds ``entity_id``, ``timestamp`` and ``value`` columns for one
+    flushed write batch. Parts are append-only and the latest write for an
+    entity wins, matching the pickle backend's overwrite semantics while
+    keeping every timestamped value. Parts are memory-mapped on read, and an
+    entity-id index (entity -> part, row) is built once per partition and
+    rebuilt only after new parts are flushed.
+
+    Single-value writes are buffered and flushed every ``flush_rows`` rows
+    (and on flush()/close), so per-entity writes do not create per-entity
+    files. Reads never flush: buffered rows are served from memory through a
+    per-partition entity -> buffer row dict and overlaid on the on-disk parts.
+    """
+
+    ENCODING_KEY = b"value_encoding"
+    DEFAULT_FLUSH_ROWS = 10000
+
+    def __init__(self, root: Union[str, Path], flush_rows: int = DEFAULT_FLUSH_ROWS):
+        """
+        Initialize columnar backend.
+
+        Args:
+            root: Directory holding one sub-directory per feature/version
+            flush_rows: Buffered rows per partition before writing a part
+
+        Raises:
+            ImportError: If pyarrow/pandas are not installed
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Columnar feature backend requires pyarrow and pandas")
+
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.flush_rows = flush_rows
+        self.lock = threading.RLock()
+
+        # (name, version) -> {"entity_ids": [], "values": [], "timestamps": [],
+        #                     "latest": {entity_id: buffer row}}
+        self._buffers: Dict[Tuple[str, str], Dict[str, list]] = {}
+        # (name, version) -> loaded partition (tables + entity index)
+        self._partitions: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def write(
+        self,
+        name: str,
+        version: str,
+        entity_ids: List[str],
+        values: List[Any],
+        timestamps: List[datetime],
+    ) -> int:
+        """
+        Buffer feature values for a partition.
+
+        Args:
+            name: Feature name
+            version: Feature version
+            entity_ids: Entity identifiers
+            values: Feature values (same length as entity_ids)
+            timestamps: Value timestamps (same length as entity_ids)
+
+        Returns:
+            Number of rows written
+        """
+        if not (len(entity_ids) == len(values) == len(timestamps)):
+            raise ValueError("entity_ids, values and timestamps must be equal length")
+
+        key = (name, version)
+        with self.lock:
+            buffer = self._buffers.setdefault(
+                key, {"entity_ids": [], "values": [], "timestamps": [], "latest": {}}
+            )
+            latest = buffer["latest"]
+            offset = len(buffer["entity_ids"])
+            for i, entity_id in enumerate(entity_ids):
+                entity_id = str(entity_id)
+                latest[entity_id] = offset + i
+                buffer["entity_ids"].append(entity_id)
+            buffer["values"].extend(values)
+            buffer["timestamps"].extend(timestamps)
+
+            if len(buffer["entity_ids"]) >= self.flush_rows:
+                self._flush_partition(key)
+
+        return len(entity_ids)
+
+    def flush(self) -> None:
+        """Write all buffered rows to new parts."""
+        with self.lock:
+            for key in list(self._buffers):
+                self._flush_partition(key)
+
+    def _flush_partition(self, key: Tuple[str, str]) -> None:
+        """Write one partition's buffer as a new Arrow IPC part."""
+        buffer = self._buffers.pop(key, None)
+        if not buffer or not buffer["entity_ids"]:
+            return
+
+        values, encoding = self._encode_values(buffer["values"])
+        table = pa.table(
+            {
+                "entity_id": pa.array(buffer["entity_ids"], type=pa.string()),
+                "timestamp": pa.array(buffer["timestamps"], type=pa.timestamp("us")),
+                "value": values,
+            }
+        ).replace_schema_metadata({self.ENCODING_KEY: encoding.encode()})
+
+        directory = self._partition_dir(*key)
+        directory.mkdir(parents=True, exist_ok=True)
+        existing = sorted(directory.glob("part-*.arrow"))
+        sequence = int(existing[-1].stem.split("-")[1]) + 1 if existing else 0
+        path = directory / f"part-{sequence:05d}.arrow"
+
+        # Write to a temporary name first so readers never see partial parts
+        tmp_path = path.with_suffix(".tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        tmp_path.replace(path)
+
+        self._partitions.pop(key, None)
+        logger.debug(f"Wrote {table.num_rows} rows to {path}")
+
+    @staticmethod
+    def _encode_values(values: List[Any]) -> Tuple["pa.Array", str]:
+        """
+        Convert values to an Arrow array.
+
+        Scalars, strings and lists of scalars (embeddings, time series) are
+        stored natively; anything else is pickled into a binary column.
+        """
+        try:
+            array = pa.array(values)
+            value_type = array.type
+            if pa.types.is_list(value_type) or pa.types.is_large_list(value_type):
+                value_type = value_type.value_type
+            if (
+                pa.types.is_integer(value_type)
+                or pa.types.is_floating(value_type)
+                or pa.types.is_boolean(value_type)
+                or pa.types.is_string(value_type)
+                or pa.types.is_null(value_type)
+            ):
+                return array, "arrow"
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass
+
+        pickled = [pickle.dumps(v) for v in values]  # nosec B301
+        return pa.array(pickled, type=pa.binary()), "pickle"
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _load_partition(self, name: str, version: str) -> Dict[str, Any]:
+        """Memory-map a partition's parts and build its entity index."""
+        key = (name, version)
+        partition = self._partitions.get(key)
+        if partition is not None:
+            return partition
+
+        tables, encodings = [], []
+        for path in sorted(self._partition_dir(name, version).glob("part-*.arrow")):
+            table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+            metadata = table.schema.metadata or {}
+            tables.append(table)
+            encodings.append(metadata.get(self.ENCODING_KEY, b"arrow").decode())
+
+        if tables:
+            sizes = [t.num_rows for t in tables]
+            part_of_row = np.repeat(np.arange(len(tables)), sizes)
+            row_in_part = np.concatenate([np.arange(n) for n in sizes])
+            entity_ids = np.concatenate(
+                [t.column("entity_id").to_numpy() for t in tables]
+            )
+        else:
+            part_of_row = row_in_part = np.array([], dtype=np.int64)
+            entity_ids = np.array([], dtype=object)
+
+        # Latest write per entity wins
+        latest = pd.Series(np.arange(len(entity_ids)), index=entity_ids)
+        latest = latest[~latest.index.duplicated(keep="last")]
+
+        partition = {
+            "tables": tables,
+            "encodings": encodings,
+            "part_of_row": part_of_row,
+            "row_in_part": row_in_part,
+            "entity_ids": entity_ids,
+            "index": pd.Index(latest.index),
+            "latest_rows": latest.to_numpy(),
+        }
+        self._partitions[key] = partition
+        return partition
+
+    def _gather(
+        self, partition: Dict[str, Any], rows: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Values and timestamps for global row numbers."""
+        values = np.empty(len(rows), dtype=object)
+        timestamps = np.empty(len(rows), dtype="datetime64[us]")
+
+        part_ids = partition["part_of_row"][rows]
+        local_rows = partition["row_in_part"][rows]
+        for part in np.unique(part_ids):
+            selected = part_ids == part
+            taken = partition["tables"][part].take(pa.array(local_rows[selected]))
+
+            column = taken.column("value").to_pylist()
+            if partition["encodings"][part] == "pickle":
+                column = [pickle.loads(v) for v in column]  # nosec B301
+            # Element-wise so list values (embeddings) are not broadcast
+            for i, value in zip(np.flatnonzero(selected), column):
+                values[i] = value
+            timestamps[selected] = taken.column("timestamp").to_numpy()
+
+        return values, timestamps
+
+    def _buffered_rows(
+        self, key: Tuple[str, str]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Entity ids, values and timestamps of a partition's unflushed rows."""
+        buffer = self._buffers.get(key)
+        if not buffer:
+            return (
+                np.array([], dtype=object),
+                np.empty(0, dtype=object),
+                np.array([], dtype="datetime64[us]"),
+            )
+
+        entity_ids = np.array(buffer["entity_ids"], dtype=object)
+        values = np.empty(len(entity_ids), dtype=object)
+        # Element-wise so list values (embeddings) are not broadcast
+        for i, value in enumerate(buffer["values"]):
+            values[i] = value
+        # Same conversion as flushed parts
+        timestamps = pa.array(buffer["timestamps"], type=pa.timestamp("us"))
+        return entity_ids, values, timestamps.to_numpy(zero_copy_only=False)
+
+    def read(self, name: str, version: str, entity_ids: List[str]) -> "pd.DataFrame":
+        """
+        Latest value per entity for a list of entity ids.
+
+        Args:
+            name: Feature name
+            version: Feature version
+            entity_ids: Entity identifiers
+
+        Returns:
+            DataFrame indexed by entity_id (request order, unknown ids
+            dropped) with ``value`` and ``timestamp`` columns
+        """
+        requested = pd.Index([str(e) for e in entity_ids])
+        values = np.empty(len(requested), dtype=object)
+        timestamps = np.empty(len(requested), dtype="datetime64[us]")
+
+        with self.lock:
+            partition = self._load_partition(name, version)
+
+            positions = partition["index"].get_indexer(requested)
+            found = positions >= 0
+            rows = partition["latest_rows"][positions[found]]
+            disk_values, disk_timestamps = self._gather(partition, rows)
+            for i, value in zip(np.flatnonzero(found), disk_values):
+                values[i] = value
+            timestamps[found] = disk_timestamps
+
+            # Buffered writes are newer than anything on disk
+            buffer = self._buffers.get((name, version))
+            if buffer:
+                latest = buffer["latest"]
+                hits = [(i, latest[e]) for i, e in enumerate(requested) if e in latest]
+                if hits:
+                    slots, buffer_rows = map(list, zip(*hits))
+                    for slot, row in zip(slots, buffer_rows):
+                        values[slot] = buffer["values"][row]
+                    timestamps[slots] = pa.array(
+                        [buffer["timestamps"][row] for row in buffer_rows],
+                        type=pa.timestamp("us"),
+                    ).to_numpy(zero_copy_only=False)
+                    found[slots] = True
+
+        frame = pd.DataFrame(
+            {
+                "value": pd.Series(values[found]).infer_objects(),
+                "timestamp": timestamps[found],
+            }
+        )
+        frame.index = pd.Index(requested[found], name="entity_id")
+        return frame
+
+    def read_all(self, name: str, version: str) -> "pd.DataFrame":
+        """
+        Every stored row for a partition (buffered rows included), in write
+        order.
+
+        Returns:
+            DataFrame with ``entity_id``, ``timestamp`` and ``value`` columns
+        """
+        with self.lock:
+            partition = self._load_partition(name, version)
+            buffered = self._buffered_rows((name, version))
+
+        rows = np.arange(len(partition["entity_ids"]))
+        values, timestamps = self._gather(partition, rows)
+        return pd.DataFrame(
+            {
+                "entity_id": np.concatenate(
+                    [partition["entity_ids"].astype(object), buffered[0]]
+                ),
+                "timestamp": np.concatenate([timestamps, buffered[2]]),
+                "value": pd.Series(
+                    np.concatenate([values, buffered[1]])
+                ).infer_objects(),
+            }
+        )
+
+    def history(self, name: str, version: str) -> "pd.DataFrame":
+        """
+        Every stored row for a partition, sorted by timestamp.
+
+        The sort is stable, so among rows with equal timestamps the latest
+        write comes last. The result is cached until new rows are written.
+
+        Returns:
+            DataFrame with ``entity_id``, ``timestamp`` and ``value`` columns
+        """
+        key = (name, version)
+        with self.lock:
+            partition = self._load_partition(name, version)
+            buffer = self._buffers.get(key)
+            pending = len(buffer["entity_ids"]) if buffer else 0
+
+            # The buffer only grows until it is flushed, and a flush drops
+            # the loaded partition, so the buffered row count is a cache key
+            cached = partition.get("history")
+            if cached is not None and cached[0] == pending:
+                return cached[1]
+
+            history = self.read_all(name, version)
+            history = history.sort_values("timestamp", kind="mergesort")
+            history = history.reset_index(drop=True)
+            partition["history"] = (pending, history)
+
+        return history
+
+    def lookup(self, name: str, version: str, entity_id: str) -> Optional[Dict]:
+        """
+        Latest stored value for one entity (buffered writes included).
+
+        Returns:
+            {"value", "timestamp", "entity_id"} or None if not stored
+        """
+        entity_id = str(entity_id)
+        with self.lock:
+            buffer = self._buffers.get((name, version))
+            row = buffer["latest"].get(entity_id) if buffer else None
+            if row is not None:
+                return {
+                    "value": buffer["values"][row],
+                    "timestamp": buffer["timestamps"][row].isoformat(),
+                    "entity_id": entity_id,
+                }
+
+        frame = self.read(name, version, [entity_id])
+        if frame.empty:
+            return None
+
+        return {
+            "value": frame["value"].tolist()[0],
+            "timestamp": frame["timestamp"].iloc[0].to_pydatetime().isoformat(),
+            "entity_id": entity_id,
+        }
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def compact(self, name: str, version: str) -> int:
+        """
+        Merge a partition's parts into a single part (all rows kept).
+
+        Returns:
+            Number of rows in the compacted part
+        """
+        with self.lock:
+            frame = self.read_all(name, version)
+            if frame.empty:
+                return 0
+
+            directory = self._partition_dir(name, version)
+            old_parts = sorted(directory.glob("part-*.arrow"))
+            self._partitions.pop((name, version), None)
+
+            self._buffers[(name, version)] = {
+                "entity_ids": frame["entity_id"].tolist(),
+                "values": frame["value"].tolist(),
+                "timestamps": [t.to_pydatetime() for t in frame["timestamp"]],
+                "latest": {},
+            }
+            self._flush_partition((name, version))
+            for path in old_parts:
+                path.unlink()
+            self._partitions.pop((name, version), None)
+
+        return len(frame)
+
+    def drop(self, name: str, version: str) -> None:
+        """Delete a partition and any buffered rows."""
+        with self.lock:
+            self._buffers.pop((name, version), None)
+            self._partitions.pop((name, version), None)
+            directory = self._partition_dir(name, version)
+            if directory.exists():
+                for path in directory.iterdir():
+                    path.unlink()
+                directory.rmdir()
+
+    def _partition_dir(self, name: str, version: str) -> Path:
+        """Directory for one feature/version partition."""
+        return self.root / quote(name, safe="") / quote(version, safe="")
+
+
 class FeatureStore:
     """
     Feature store for NBA analytics platform.
 
     Manages feature registration, storage, retrieval, and versioning.
+
+    Feature values are stored either as one pickle file per
+    (feature, version, entity) (``backend="pickle"``, the default) or in
+    columnar Arrow IPC partitions per feature/version
+    (``backend="columnar"``, see ColumnarFeatureBackend).
     """
 
+    BACKENDS = ("pickle", "columnar")
+
     def __init__(
         self,
         storage_path: Union[str, Path],
         cache_size: int = 1000,
         enable_cache: bool = True,
+        backend: str = "pickle",
     ):
         """
         Initialize feature store.
@@ -159,12 +615,19 @@ class FeatureStore:
             storage_path: Path to storage directory
             cache_size: Size of LRU cache
             enable_cache: Whether to enable caching
+            backend: Value storage backend ("pickle" or "columnar")
 
         Raises:
-            ValueError: If storage_path is invalid
+            ValueError: If storage_path or backend is invalid
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                f"Unknown backend {backend!r}, expected one of {self.BACKENDS}"
+            )
+
         self.storage_path = Path(storage_path)
         self.enable_cache = enable_cache
+        self.backend = backend
 
         if not self.storage_path:
             raise ValueError("storage_path cannot be empty")
@@ -176,6 +639,12 @@ class FeatureStore:
         self.features_path = self.storage_path / "features"
         self.features_path.mkdir(exist_ok=True)
 
+        # Columnar value storage (buffered writes are flushed on close/exit)
+        self.columnar: Optional[ColumnarFeatureBackend] = None
+        if backend == "columnar":
+            self.columnar = ColumnarFeatureBackend(self.storage_path / "columnar")
+            weakref.finalize(self, self.columnar.flush)
+
         # Initialize cache
         self.cache = LRUCache(capacity=cache_size) if enable_cache else None
 
@@ -434,9 +903,18 @@ class FeatureStore:
             }
 
             # Store to disk
-            feature_file = self.features_path / f"{feature_key}.pkl"
-            with open(feature_file, "wb") as f:
-                pickle.dump(feature_data, f)
+            if self.columnar:
+                self.columnar.write(
+                    name,
+                    version,
+                    [entity_id],
+                    [value],
+                    [datetime.fromisoformat(feature_data["timestamp"])],
+                )
+            else:
+                feature_file = self.features_path / f"{feature_key}.pkl"
+                with open(feature_file, "wb") as f:
+                    pickle.dump(feature_data, f)
 
             # Update cache
             if self.cache:
@@ -473,18 +951,15 @@ class FeatureStore:
                 return cached_value["value"]
 
         # Check disk storage
-        feature_file = self.features_path / f"{feature_key}.pkl"
-        if feature_file.exists():
-            try:
-                with open(feature_file, "rb") as f:
-                    feature_data = pickle.load(f)  # nosec B301 - controlled data source
-
+        try:
+            feature_data = self._load_stored(name, version, entity_id)
+            if feature_data is not None:
                 if self.cache:
                     self.cache.put(feature_key, feature_data)
 
                 return feature_data["value"]
-            except Exception as e:
-                logger.error(f"Failed to load feature from disk: {e}")
+        except Exception as e:
+            logger.error(f"Failed to load feature from disk: {e}")
 
         # Compute if missing and function available
         if compute_if_missing:
@@ -521,6 +996,27 @@ class FeatureStore:
         """
         results = {}
 
+        if self.columnar:
+            # One vectorized read; only missing entities fall back per entity
+            try:
+                frame = self.columnar.read(name, version, entity_ids)
+                stored = dict(zip(frame.index, frame["value"].tolist()))
+            except Exception as e:
+                logger.error(f"Failed to read features for {name}:{version}: {e}")
+                stored = {}
+
+            for entity_id in entity_ids:
+                value = stored.get(str(entity_id))
+                if value is None and compute_if_missing:
+                    try:
+                        value = self.get_feature(name, version, entity_id, True)
+                    except Exception as e:
+                        logger.error(f"Failed to get feature for {entity_id}: {e}")
+                if value is not None:
+                    results[entity_id] = value
+
+            return results
+
         for entity_id in entity_ids:
             try:
                 value = self.get_feature(name, version, entity_id, compute_if_missing)
@@ -531,6 +1027,295 @@ class FeatureStore:
 
         return results
 
+    def store_features_batch(
+        self,
+        name: str,
+        version: str,
+        values: Dict[str, Any],
+        timestamp: Optional[datetime] = None,
+    ) -> int:
+        """
+        Store feature values for many entities.
+
+        With the columnar backend this is a single buffered write; with the
+        pickle backend it falls back to store_feature per entity.
+
+        Args:
+            name: Feature name
+            version: Feature version
+            values: Mapping of entity_id to feature value
+            timestamp: Optional timestamp applied to every value
+
+        Returns:
+            Number of values stored
+        """
+        if not self.feature_exists(name, version):
+            logger.error(f"Feature {name}:{version} not registered")
+            return 0
+
+        if not self.columnar:
+            return sum(
+                self.store_feature(name, version, entity_id, value, timestamp)
+                for entity_id, value in values.items()
+            )
+
+        timestamp = timestamp or datetime.utcnow()
+        try:
+            entity_ids = list(values)
+            stored = self.columnar.write(
+                name,
+                version,
+                entity_ids,
+                list(values.values()),
+                [timestamp] * len(entity_ids),
+            )
+        except Exception as e:
+            logger.error(f"Failed to store features for {name}:{version}: {e}")
+            return 0
+
+        if self.cache:
+            for entity_id, value in values.items():
+                self.cache.put(
+                    self._get_feature_key(name, version, entity_id),
+                    {
+                        "value": value,
+                        "timestamp": timestamp.isoformat(),
+                        "entity_id": entity_id,
+                    },
+                )
+
+        logger.debug(f"Stored {stored} values for feature {name}:{version}")
+        return stored
+
+    def get_features_frame(
+        self, name: str, version: str, entity_ids: List[str]
+    ) -> "pd.DataFrame":
+        """
+        Retrieve stored values for many entities as a DataFrame.
+
+        Args:
+            name: Feature name
+            version: Feature version
+            entity_ids: List of entity identifiers
+
+        Returns:
+            DataFrame indexed by entity_id (request order) with ``value`` and
+            ``timestamp`` columns; entities without a stored value are omitted
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("get_features_frame requires pandas and pyarrow")
+
+        if self.columnar:
+            return self.columnar.read(name, version, entity_ids)
+
+        rows = []
+        for entity_id in entity_ids:
+            feature_data = self._load_stored(name, version, entity_id)
+            if feature_data is not None:
+                rows.append(
+                    (
+                        str(entity_id),
+                        feature_data["value"],
+                        pd.Timestamp(feature_data["timestamp"]),
+                    )
+                )
+
+        frame = pd.DataFrame(rows, columns=["entity_id", "value", "timestamp"])
+        return frame.set_index("entity_id")
+
+    def get_features_asof(
+        self,
+        entities: "pd.DataFrame",
+        features: List[Tuple[str, str]],
+        entity_column: str = "entity_id",
+        timestamp_column: str = "event_timestamp",
+    ) -> "pd.DataFrame":
+        """
+        Point-in-time join: feature values as of each row's timestamp.
+
+        For every (entity_id, event_timestamp) row, each feature takes the
+        latest value stored at or before event_timestamp, so training rows
+        never see values recorded after the event (e.g. after tip-off).
+        Each feature is joined in one merge-asof sweep over time-sorted
+        values instead of per-row lookups.
+
+        Args:
+            entities: Frame with entity and timestamp columns
+            features: (name, version) pairs to join
+            entity_column: Column holding entity identifiers
+            timestamp_column: Column holding event timestamps (naive UTC,
+                or timezone-aware and converted to UTC)
+
+        Returns:
+            Copy of ``entities`` with one column per feature, named by feature
+            name ("name:version" when several versions of a name are
+            requested); NaN where no value existed yet
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("get_features_asof requires pandas and pyarrow")
+
+        result = entities.copy()
+        timestamps = pd.to_datetime(entities[timestamp_column])
+        if timestamps.dt.tz is not None:
+            timestamps = timestamps.dt.tz_convert("UTC").dt.tz_localize(None)
+
+        keys = pd.DataFrame(
+            {
+                "_row": np.arange(len(entities)),
+                "entity_id": entities[entity_column].astype(str).to_numpy(),
+                "timestamp": timestamps.astype("datetime64[ns]").to_numpy(),
+            }
+        )
+        keys = keys[keys["timestamp"].notna()].sort_values(
+            "timestamp", kind="mergesort"
+        )
+
+        names = [name for name, _ in features]
+        for name, version in features:
+            column = name if names.count(name) == 1 else f"{name}:{version}"
+            values = np.full(len(entities), np.nan, dtype=object)
+
+            history = self._feature_history(
+                name, version, keys["entity_id"].unique().tolist()
+            )
+            if not history.empty and not keys.empty:
+                merged = pd.merge_asof(
+                    keys,
+                    history,
+                    on="timestamp",
+                    by="entity_id",
+                    direction="backward",
+                    allow_exact_matches=True,
+                )
+                values[merged["_row"].to_numpy()] = merged["value"].to_numpy()
+
+            result[column] = pd.Series(values, index=result.index).infer_objects()
+
+        return result
+
+    def _feature_history(
+        self, name: str, version: str, entity_ids: List[str]
+    ) -> "pd.DataFrame":
+        """Time-sorted (entity_id, timestamp, value) rows for one feature."""
+        if self.columnar:
+            history = self.columnar.history(name, version)
+        else:
+            # Pickle files only hold the latest value per entity
+            history = self.get_features_frame(name, version, entity_ids)
+            history = history.reset_index().sort_values("timestamp", kind="mergesort")
+
+        history = history[["entity_id", "timestamp", "value"]].copy()
+        history["timestamp"] = history["timestamp"].astype("datetime64[ns]")
+        return history
+
+    def _load_stored(
+        self, name: str, version: str, entity_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Read one stored value from the active backend (no cache)."""
+        if self.columnar:
+            return self.columnar.lookup(name, version, entity_id)
+
+        feature_key = self._get_feature_key(name, version, entity_id)
+        feature_file = self.features_path / f"{feature_key}.pkl"
+        if not feature_file.exists():
+            return None
+
+        with open(feature_file, "rb") as f:
+            return pickle.load(f)  # nosec B301 - controlled data source
+
+    def flush(self) -> None:
+        """Write buffered columnar values to disk."""
+        if self.columnar:
+            self.columnar.flush()
+
+    def close(self) -> None:
+        """Flush pending writes."""
+        self.flush()
+
+    def __enter__(self) -> "FeatureStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def migrate_pickle_store(self, remove_pickles: bool = False) -> Dict[str, int]:
+        """
+        Copy values from per-entity pickle files into the columnar backend.
+
+        Pickle file names are hashes of "name:version:entity_id", so each
+        file is matched against every registered feature using the entity_id
+        stored inside it.
+
+        Args:
+            remove_pickles: Delete pickle files once migrated
+
+        Returns:
+            Counts of migrated, unmatched and failed files
+        """
+        if not self.columnar:
+            raise ValueError("migrate_pickle_store requires backend='columnar'")
+
+        features = [(m.name, m.version) for m in self.list_features()]
+        stats = {"migrated": 0, "unmatched": 0, "failed": 0}
+        batches: Dict[Tuple[str, str], Dict[str, list]] = {}
+        migrated_files = []
+
+        for feature_file in sorted(self.features_path.glob("*.pkl")):
+            try:
+                with open(feature_file, "rb") as f:
+                    feature_data = pickle.load(f)  # nosec B301 - controlled data source
+            except Exception as e:
+                logger.error(f"Failed to read {feature_file}: {e}")
+                stats["failed"] += 1
+                continue
+
+            entity_id = feature_data["entity_id"]
+            match = next(
+                (
+                    (name, version)
+                    for name, version in features
+                    if self._get_feature_key(name, version, entity_id)
+                    == feature_file.stem
+                ),
+                None,
+            )
+            if match is None:
+                stats["unmatched"] += 1
+                continue
+
+            batch = batches.setdefault(
+                match, {"entity_ids": [], "values": [], "timestamps": []}
+            )
+            batch["entity_ids"].append(entity_id)
+            batch["values"].append(feature_data["value"])
+            batch["timestamps"].append(
+                datetime.fromisoformat(feature_data["timestamp"])
+            )
+            migrated_files.append(feature_file)
+
+        for (name, version), batch in batches.items():
+            # Pickles hold only the latest value, so write oldest first
+            order = sorted(
+                range(len(batch["entity_ids"])), key=lambda i: batch["timestamps"][i]
+            )
+            self.columnar.write(
+                name,
+                version,
+                [batch["entity_ids"][i] for i in order],
+                [batch["values"][i] for i in order],
+                [batch["timestamps"][i] for i in order],
+            )
+            stats["migrated"] += len(order)
+            logger.info(f"Migrated {len(order)} values for {name}:{version}")
+
+        self.columnar.flush()
+
+        if remove_pickles:
+            for feature_file in migrated_files:
+                feature_file.unlink()
+
+        return stats
+
     def list_features(
         self, status: Optional[FeatureStatus] = None, tags: Optional[List[str]] = None
     ) -> List[FeatureMetadata]:
@@ -642,6 +1427,10 @@ class FeatureStore:
             if fn_key in self.feature_functions:
                 del self.feature_functions[fn_key]
 
+            # Remove columnar values
+            if self.columnar:
+                self.columnar.drop(name, version)
+
             # Clear cache entries
             if self.cache:
                 self.cache.clear()
@@ -666,11 +1455,11 @@ class FeatureStore:
         Returns:
             Dictionary of statistics
         """
-        values = []
-        for entity_id in entity_ids:
-            value = self.get_feature(name, version, entity_id, compute_if_missing=False)
-            if value is not None:
-                values.append(value)
+        values = list(
+            self.get_features_batch(
+                name, version, entity_ids, compute_if_missing=False
+            ).values()
+        )
 
         if not values:
             return {}
@@ -737,9 +1526,33 @@ class FeatureStore:
 
 
 if __name__ == "__main__":
-    # Example usage and testing
+    import argparse
     import tempfile
 
+    parser = argparse.ArgumentParser(description="NBA analytics feature store")
+    subparsers = parser.add_subparsers(dest="command")
+    migrate_parser = subparsers.add_parser(
+        "migrate", help="Copy a pickle feature store into columnar storage"
+    )
+    migrate_parser.add_argument("storage_path", help="Feature store directory")
+    migrate_parser.add_argument(
+        "--remove-pickles",
+        action="store_true",
+        help="Delete pickle files once migrated",
+    )
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        with FeatureStore(args.storage_path, backend="columnar") as store:
+            migration = store.migrate_pickle_store(remove_pickles=args.remove_pickles)
+        print(
+            f"Migrated {migration['migrated']} values "
+            f"({migration['unmatched']} unmatched, {migration['failed']} failed)"
+        )
+        raise SystemExit(1 if migration["failed"] else 0)
+
+    # Example usage and testing
+
     # Create temporary storage
     with tempfile.TemporaryDirectory() as tmpdir:
         # Initialize feature store
@@ -2,8 +2,8 @@
 """
 Generate betting picks based on actual simulation results.
 
-For each bet, runs simulations and counts how many times the bet wins.
-Only shows picks that win >60% of simulations.
+Simulates each game once, then counts how many simulations every bet on
+that game wins. Only shows picks that win >60% of simulations.
 
 Usage:
     python scripts/ml/generate_betting_picks_from_simulations.py --min-win-pct 0.60
@@ -30,6 +30,12 @@ from scripts.ml.advanced_multi_simulator import (
     AdvancedMultiSimulator,
     DatabaseConnector,
 )
+from scripts.ml.market_evaluator import (
+    GameSimulationCache,
+    SimulatedGame,
+    evaluate_odds,
+    simulation_cache_for,
+)
 
 warnings.filterwarnings("ignore")
 
@@ -45,6 +51,9 @@ for path in env_paths:
         load_dotenv(path)
         break
 
+# Games are keyed by their odds-feed team names
+GAME_KEY = ["home_team", "away_team"]
+
 
 def american_odds_to_probability(odds: float) -> float:
     """Convert American odds to implied probability."""
@@ -100,10 +109,14 @@ def simulate_bet_win_rate(
     outcome_name: str,
     point: Optional[float],
     n_simulations: int = 10000,
+    cache: Optional[GameSimulationCache] = None,
 ) -> float:
     """
     Simulate a bet and return win percentage.
 
+    The game is simulated once; later bets on the same game are evaluated
+    against the cached score vectors.
+
     Returns:
         Win percentage (0.0 to 1.0)
     """
@@ -114,84 +127,31 @@ def simulate_bet_win_rate(
     if not home_team_id or not away_team_id:
         return 0.0
 
-    # Run simulation
     try:
-        result = simulator.predict_game(
-            home_team_id=home_team_id,
-            away_team_id=away_team_id,
-            game_date=game_date,
-            use_ensemble=True,
-            n_simulations=n_simulations,
+        cache = cache if cache is not None else simulation_cache_for(simulator)
+        game = cache.get(
+            home_team_id, away_team_id, game_date, n_simulations=n_simulations
+        )
+        bet = pd.DataFrame(
+            [
+                {
+                    "home_team": home_team_name,
+                    "away_team": away_team_name,
+                    "market_key": market_type,
+                    "outcome_name": outcome_name,
+                    "spread_or_total": point,
+                }
+            ]
+        )
+        evaluated = evaluate_odds(
+            bet, {(home_team_name, away_team_name): game}, key=GAME_KEY
         )
-
-        # Get simulated scores (need to access individual simulation results)
-        # Since we don't have access to individual sim results, we'll use the score distributions
-        # For now, simulate based on predicted scores and variance
-
-        # For spreads
-        if market_type == "spreads" and point is not None:
-            predicted_margin = result.predicted_home_score - result.predicted_away_score
-            outcome_normalized = normalize_team_name(outcome_name)
-            home_normalized = normalize_team_name(home_team_name)
-
-            spread = float(point)
-
-            if (
-                outcome_normalized in home_normalized
-                or home_normalized in outcome_normalized
-            ):
-                # Home team covering spread
-                # Use normal distribution approximation
-                # Margin ~ N(predicted_margin, std_dev)
-                # Win if margin > spread
-                std_dev = 12.0  # Typical NBA game margin std dev
-                z_score = (spread - predicted_margin) / std_dev
-                win_prob = 1 - (0.5 + 0.5 * np.tanh(z_score))  # Approximate CDF
-                return max(0.0, min(1.0, win_prob))
-            else:
-                # Away team covering spread
-                # Win if margin < -spread
-                std_dev = 12.0
-                z_score = (-spread - predicted_margin) / std_dev
-                win_prob = 0.5 + 0.5 * np.tanh(-z_score)
-                return max(0.0, min(1.0, win_prob))
-
-        # For totals
-        elif market_type == "totals" and point is not None:
-            predicted_total = result.predicted_home_score + result.predicted_away_score
-            total_line = float(point)
-
-            if "Over" in outcome_name or outcome_name == "Over":
-                # Win if total > line
-                std_dev = 15.0  # Typical NBA total std dev
-                z_score = (total_line - predicted_total) / std_dev
-                win_prob = 1 - (0.5 + 0.5 * np.tanh(z_score))
-                return max(0.0, min(1.0, win_prob))
-            elif "Under" in outcome_name or outcome_name == "Under":
-                # Win if total < line
-                std_dev = 15.0
-                z_score = (total_line - predicted_total) / std_dev
-                win_prob = 0.5 + 0.5 * np.tanh(-z_score)
-                return max(0.0, min(1.0, win_prob))
-
-        # For moneyline
-        elif market_type == "h2h":
-            outcome_normalized = normalize_team_name(outcome_name)
-            home_normalized = normalize_team_name(home_team_name)
-
-            if (
-                outcome_normalized in home_normalized
-                or home_normalized in outcome_normalized
-            ):
-                return result.home_win_prob
-            else:
-                return result.away_win_prob
-
     except Exception as e:
         print(f"  ⚠️  Error simulating {market_type} bet: {e}")
         return 0.0
 
-    return 0.0
+    win_prob = evaluated["win_prob"].iloc[0]
+    return 0.0 if pd.isna(win_prob) else float(win_prob)
 
 
 def query_all_odds_from_db(conn, game_date: date) -> pd.DataFrame:
@@ -232,6 +192,37 @@ def query_all_odds_from_db(conn, game_date: date) -> pd.DataFrame:
     return df
 
 
+def simulate_odds_games(
+    db: DatabaseConnector,
+    odds_df: pd.DataFrame,
+    game_date: date,
+    cache: GameSimulationCache,
+) -> Dict[Tuple[str, str], SimulatedGame]:
+    """Simulate every game in odds_df once, keyed by (home_team, away_team)."""
+    teams = pd.unique(odds_df[GAME_KEY].to_numpy().ravel())
+    team_ids = {team: get_team_id_from_name(team, db) for team in teams}
+
+    games = {}
+    for home_team, away_team in (
+        odds_df[GAME_KEY].drop_duplicates().itertuples(index=False)
+    ):
+        home_team_id = team_ids[home_team]
+        away_team_id = team_ids[away_team]
+        if not home_team_id or not away_team_id:
+            print(f"  ⚠️  No team ID for {away_team} @ {home_team}")
+            continue
+        try:
+            games[(home_team, away_team)] = cache.get(
+                home_team_id, away_team_id, game_date
+            )
+        except Exception as e:
+            print(f"  ⚠️  Error simulating {away_team} @ {home_team}: {e}")
+
+    print(f"  Simulated {len(games)} games")
+
+    return games
+
+
 def generate_betting_picks_from_simulations(
     simulator: AdvancedMultiSimulator,
     db: DatabaseConnector,
@@ -239,54 +230,43 @@ def generate_betting_picks_from_simulations(
     game_date: date,
     min_win_pct: float = 0.60,
     n_simulations: int = 10000,
+    cache: Optional[GameSimulationCache] = None,
 ) -> pd.DataFrame:
-    """Generate betting picks by simulating each bet and counting wins."""
-
-    matched = []
-    total_bets = len(odds_df)
+    """
+    Generate betting picks by simulating each game once and counting wins.
 
-    print(f"\nSimulating {total_bets} bets...")
-    print("This may take a few minutes...\n")
+    Every odds row of a game (all bookmakers, all markets) is evaluated
+    against that game's simulated scores in one vectorized pass.
+    """
+    if cache is None:
+        cache = GameSimulationCache(simulator, n_simulations=n_simulations)
 
-    for idx, (_, odds_row) in enumerate(odds_df.iterrows(), 1):
-        if idx % 10 == 0:
-            print(f"  Progress: {idx}/{total_bets} bets simulated")
+    n_games = len(odds_df[GAME_KEY].drop_duplicates())
+    print(f"\nSimulating {n_games} games for {len(odds_df)} bets...")
+    games = simulate_odds_games(db, odds_df, game_date, cache)
 
-        home_team = odds_row["home_team"]
-        away_team = odds_row["away_team"]
-        market_key = str(odds_row["market_key"])
-        outcome_name = str(odds_row["outcome_name"])
-        odds_value = float(odds_row["odds"])
-        point = odds_row.get("spread_or_total")
+    evaluated = evaluate_odds(odds_df, games, key=GAME_KEY)
+    # Only include if win rate > threshold
+    evaluated = evaluated[
+        evaluated["market_key"].isin(["h2h", "spreads", "totals"])
+        & (evaluated["win_prob"] >= min_win_pct)
+    ]
 
-        # Simulate bet win rate
-        win_pct = simulate_bet_win_rate(
-            simulator=simulator,
-            db=db,
-            home_team_name=home_team,
-            away_team_name=away_team,
-            game_date=game_date,
-            market_type=market_key,
-            outcome_name=outcome_name,
-            point=point if pd.notna(point) else None,
-            n_simulations=n_simulations,
-        )
-
-        # Only include if win rate > threshold
-        if win_pct < min_win_pct:
-            continue
+    matched = []
+    for row in evaluated.to_dict("records"):
+        market_key = str(row["market_key"])
+        outcome_name = str(row["outcome_name"])
+        odds_value = float(row["odds"])
+        point = row.get("spread_or_total")
+        win_pct = float(row["win_prob"])
 
         # Create recommendation string
         if market_key == "h2h":
             recommendation = f"{outcome_name} ML"
         elif market_key == "spreads":
-            point_str = f"{float(point):+.1f}" if pd.notna(point) else ""
-            recommendation = f"{outcome_name} {point_str}"
-        elif market_key == "totals":
-            point_str = f"{float(point):.1f}" if pd.notna(point) else ""
-            recommendation = f"{outcome_name} {point_str}"
+            recommendation = f"{outcome_name} {float(point):+.1f}"
         else:
-            continue
+            recommendation = f"{outcome_name} {float(point):.1f}"
 
         # Calculate metrics
         implied_prob = american_odds_to_probability(odds_value)
@@ -296,19 +276,19 @@ def generate_betting_picks_from_simulations(
         matched.append(
             {
                 "game_date": game_date,
-                "home_team": home_team,
-                "away_team": away_team,
+                "home_team": row["home_team"],
+                "away_team": row["away_team"],
                 "market_type": market_key,
                 "recommendation": recommendation,
-                "bookmaker": odds_row.get("bookmaker_title", "Unknown"),
-                "bookmaker_key": odds_row.get("bookmaker_key", ""),
+                "bookmaker": row.get("bookmaker_title", "Unknown"),
+                "bookmaker_key": row.get("bookmaker_key", ""),
                 "odds": odds_value,
                 "point": point if pd.notna(point) else None,
                 "simulation_win_pct": win_pct,
                 "market_probability": implied_prob,
                 "edge": edge,
                 "expected_value": ev,
-                "event_id": str(odds_row.get("event_id", "")),
+                "event_id": str(row.get("event_id", "")),
             }
         )
 
@@ -355,7 +335,7 @@ def main():
         "--n-simulations",
         type=int,
         default=10000,
-        help="Number of simulations per bet (default: 10000)",
+        help="Number of simulations per game (default: 10000)",
     )
 
     args = parser.parse_args()
@@ -36,6 +36,14 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from scripts.ml.advanced_multi_simulator import AdvancedMultiSimulator
+from scripts.ml.market_evaluator import (
+    GameSimulationCache,
+    SimulatedGame,
+    evaluate_odds,
+    join_predictions_to_odds,
+    simulation_cache_for,
+    team_key,
+)
 
 warnings.filterwarnings("ignore")
 
@@ -158,10 +166,14 @@ def simulate_bet_win_rate(
     away_team_name: str,
     n_simulations: int = 10000,
     game_state: Optional[Dict[str, Any]] = None,
+    cache: Optional[GameSimulationCache] = None,
 ) -> float:
     """
     Simulate a bet and return actual win percentage from simulations.
 
+    The game is simulated once per (teams, date, game state); every later
+    bet on the same game is evaluated against the cached score vectors.
+
     Args:
         simulator: AdvancedMultiSimulator instance
         home_team_id: Home team ID
@@ -174,149 +186,38 @@ def simulate_bet_win_rate(
         away_team_name: Away team name
         n_simulations: Number of simulations (default: 10000)
         game_state: Optional game state dictionary for in-progress games
+        cache: GameSimulationCache to use (default: shared cache for simulator)
 
     Returns:
         Win percentage (0.0 to 1.0) - actual percentage of simulations where bet wins
     """
     try:
-        # Run simulation with game state if provided
-        result, _ = simulator.predict_game(
-            home_team_id=home_team_id,
-            away_team_id=away_team_id,
-            game_date=game_date,
-            use_ensemble=True,
-            n_simulations=n_simulations,
+        cache = cache if cache is not None else simulation_cache_for(simulator)
+        game = cache.get(
+            home_team_id,
+            away_team_id,
+            game_date,
             game_state=game_state,
+            n_simulations=n_simulations,
         )
-
-        # Get predicted scores from simulation result
-        # Note: These scores may be inflated, so we use them for margin calculation
-        # but may need to normalize for total points
-        predicted_home_score = result.predicted_home_score
-        predicted_away_score = result.predicted_away_score
-
-        # Normalize scores to realistic NBA averages if they're inflated
-        # Typical NBA game: ~224 total points, ~12.7 margin
-        if predicted_home_score > 200 or predicted_away_score > 200:
-            # Scores are inflated, normalize to realistic range
-            # Use the margin from inflated scores but scale total
-            raw_margin = predicted_home_score - predicted_away_score
-            # Scale to realistic total (224 average)
-            scale_factor = 224.0 / (predicted_home_score + predicted_away_score)
-            predicted_home_score = 112.0 + (raw_margin / 2) * scale_factor
-            predicted_away_score = 112.0 - (raw_margin / 2) * scale_factor
-
-        predicted_total = predicted_home_score + predicted_away_score
-        predicted_margin = predicted_home_score - predicted_away_score
-
-        # For spreads
-        if market_type == "spreads" and point is not None:
-            spread = float(point)
-            outcome_normalized = normalize_team_name(outcome_name)
-            home_normalized = normalize_team_name(home_team_name)
-
-            # Use normal distribution approximation for margin
-            std_dev = 12.0  # Typical NBA game margin std dev
-
-            if (
-                outcome_normalized in home_normalized
-                or home_normalized in outcome_normalized
-            ):
-                # Home team covering spread: win if margin > spread
-                # z_score = (spread - predicted_margin) / std_dev
-                # If predicted_margin > spread, z_score is negative, so norm.cdf(z_score) < 0.5
-                # win_prob = 1 - norm.cdf(z_score) > 0.5
-                z_score = (spread - predicted_margin) / std_dev
-                try:
-                    from scipy.stats import norm
-
-                    win_prob = 1 - norm.cdf(z_score)
-                except ImportError:
-                    # Approximate CDF using error function
-                    import math
-
-                    win_prob = 0.5 * (1 - math.erf(z_score / math.sqrt(2)))
-                    win_prob = 1 - win_prob
-            else:
-                # Away team covering spread: win if margin < -spread
-                # This means: predicted_margin < -spread, or -spread > predicted_margin
-                # z_score = (-spread - predicted_margin) / std_dev
-                # If predicted_margin < -spread, then -spread - predicted_margin > 0, so z_score > 0
-                # win_prob = norm.cdf(z_score) > 0.5
-                # But we need: if home -X wins with prob P, then away +X should win with prob (1-P)
-                # For complementary spreads: if spread = X, then home -X and away +X are opposite
-                # If home -X wins when margin > X, then away +X wins when margin < X
-                # So for away +X: z_score = (X - predicted_margin) / std_dev
-                # win_prob = norm.cdf(z_score) = 1 - (1 - norm.cdf(z_score)) = 1 - prob(home -X)
-                z_score = (spread - predicted_margin) / std_dev
-                try:
-                    from scipy.stats import norm
-
-                    # Away covers if margin < spread (for +spread), which is complementary to home covering
-                    win_prob = norm.cdf(z_score)
-                except ImportError:
-                    # Approximate CDF using error function
-                    import math
-
-                    win_prob = 0.5 * (1 + math.erf(z_score / math.sqrt(2)))
-
-            return max(0.0, min(1.0, win_prob))
-
-        # For totals
-        elif market_type == "totals" and point is not None:
-            total_line = float(point)
-
-            if "Over" in outcome_name or outcome_name == "Over":
-                # Win if total > line
-                std_dev = 15.0  # Typical NBA total std dev
-                z_score = (total_line - predicted_total) / std_dev
-                try:
-                    from scipy.stats import norm
-
-                    win_prob = 1 - norm.cdf(z_score)
-                except ImportError:
-                    # Approximate CDF using error function
-                    import math
-
-                    win_prob = 0.5 * (1 - math.erf(z_score / math.sqrt(2)))
-                    win_prob = 1 - win_prob
-            elif "Under" in outcome_name or outcome_name == "Under":
-                # Win if total < line
-                std_dev = 15.0
-                z_score = (total_line - predicted_total) / std_dev
-                try:
-                    from scipy.stats import norm
-
-                    win_prob = norm.cdf(z_score)
-                except ImportError:
-                    # Approximate CDF using error function
-                    import math
-
-                    win_prob = 0.5 * (1 - math.erf(z_score / math.sqrt(2)))
-                    win_prob = 1 - win_prob
-            else:
-                return 0.0
-
-            return max(0.0, min(1.0, win_prob))
-
-        # For moneyline
-        elif market_type == "h2h":
-            outcome_normalized = normalize_team_name(outcome_name)
-            home_normalized = normalize_team_name(home_team_name)
-
-            if (
-                outcome_normalized in home_normalized
-                or home_normalized in outcome_normalized
-            ):
-                return result.home_win_prob
-            else:
-                return result.away_win_prob
-
+        bet = pd.DataFrame(
+            [
+                {
+                    "game_key": 0,
+                    "home_team": home_team_name,
+                    "away_team": away_team_name,
+                    "market_key": market_type,
+                    "outcome_name": outcome_name,
+                    "spread_or_total": point,
+                }
+            ]
+        )
+        win_prob = evaluate_odds(bet, {0: game}, key="game_key")["win_prob"].iloc[0]
     except Exception as e:
         print(f"  ⚠️  Error simulating {market_type} bet: {e}")
         return 0.0
 
-    return 0.0
+    return 0.0 if pd.isna(win_prob) else float(win_prob)
 
 
 def get_team_id_from_name(team_name: str, db_conn) -> Optional[str]:
@@ -439,240 +340,151 @@ def validate_complementary_probabilities(game_picks: List[Dict]) -> List[Dict]:
     return validated
 
 
-def match_predictions_to_all_markets(
+def simulate_prediction_games(
     predictions_df: pd.DataFrame,
-    odds_df: pd.DataFrame,
     simulator: Optional[AdvancedMultiSimulator] = None,
     db_conn: Optional[psycopg2.extensions.connection] = None,
-) -> pd.DataFrame:
-    """Match predictions to all market types and calculate edges using actual simulation win rates."""
-
-    matched = []
-    today = date.today()
+    n_simulations: int = 10000,
+    seed: Optional[int] = 42,
+) -> Tuple[Dict[Any, SimulatedGame], List[str]]:
+    """
+    Simulated score vectors for each predicted game, keyed by game_id.
 
-    # Cache for team IDs
+    With a simulator and database connection each game is simulated once;
+    otherwise vectors are drawn around the predicted scores in the CSV.
+    """
+    cache = GameSimulationCache(simulator, n_simulations=n_simulations, seed=seed)
     team_id_cache = {}
-
-    # Track games processed for debugging
-    games_processed = set()
-    games_with_errors = []
-
-    for _, pred_row in predictions_df.iterrows():
-        game_id = pred_row["game_id"]
-        pred_home = normalize_team_name(pred_row["home_team"])
-        pred_away = normalize_team_name(pred_row["away_team"])
-        pred_date = pd.to_datetime(pred_row["game_date"]).date()
-
-        games_processed.add(game_id)
-
-        # Use realistic averages (scores from advanced sim are inflated)
-        predicted_total = 224.0  # NBA average
-        home_win_prob = pred_row["home_win_probability"]
-        away_win_prob = pred_row["away_win_probability"]
-        predicted_margin = (home_win_prob - 0.5) * 14  # Convert prob to spread
-
-        for _, odds_row in odds_df.iterrows():
-            odds_home = normalize_team_name(odds_row["home_team"])
-            odds_away = normalize_team_name(odds_row["away_team"])
-            odds_date = odds_row.get("game_date_ct", today)
-            if pd.isna(odds_date):
-                odds_date = today
-
-            # Match teams and date
-            home_match = (
-                pred_home == odds_home
-                or pred_home in odds_home
-                or odds_home in pred_home
-            )
-            away_match = (
-                pred_away == odds_away
-                or pred_away in odds_away
-                or odds_away in pred_away
-            )
-            date_match = pred_date == today and odds_date == today
-
-            if not (home_match and away_match and date_match):
-                continue
-
-            market_key = str(odds_row["market_key"])
-            outcome_name = str(odds_row["outcome_name"])
-            odds_value = float(odds_row["odds"])
-            point = odds_row.get("spread_or_total")
-
-            model_prob = None
-            recommendation = None
-
-            # Calculate model probability based on market type
-            if market_key == "h2h":
-                # Moneyline
-                if normalize_team_name(outcome_name) == normalize_team_name(
-                    pred_row["predicted_winner"]
-                ):
-                    model_prob = (
-                        home_win_prob
-                        if pred_row["predicted_winner"] == pred_row["home_team"]
-                        else away_win_prob
+    games = {}
+    errors = []
+
+    for pred in predictions_df.drop_duplicates("game_id").itertuples(index=False):
+        game_id = pred.game_id
+        if simulator is not None and db_conn is not None:
+            for team in (pred.home_team, pred.away_team):
+                if team not in team_id_cache:
+                    team_id_cache[team] = get_team_id_from_name(team, db_conn)
+            home_id = team_id_cache[pred.home_team]
+            away_id = team_id_cache[pred.away_team]
+            if home_id and away_id:
+                try:
+                    games[game_id] = cache.get(
+                        home_id, away_id, pd.to_datetime(pred.game_date).date()
                     )
-                    recommendation = f"{pred_row['predicted_winner']} ML"
-
-                    # Only show moneyline bets that win >60% of simulations
-                    if model_prob < 0.60:
-                        continue
-                else:
-                    continue
-
-            elif market_key == "spreads":
-                if pd.isna(point):
-                    continue
-                spread = float(point)
-                outcome_lower = normalize_team_name(outcome_name)
-                if pred_home in outcome_lower or outcome_lower in pred_home:
-                    recommendation = f"{pred_row['home_team']} {spread:+.1f}"
-                elif pred_away in outcome_lower or outcome_lower in pred_away:
-                    recommendation = f"{pred_row['away_team']} {spread:+.1f}"
-                else:
                     continue
+                except Exception as e:
+                    errors.append(f"{pred.away_team} @ {pred.home_team}: {e}")
 
-                # Calculate spread probability using predicted scores from predictions CSV
-                # Use the predicted scores directly (they're already from simulations)
-                # Normalize scores first if needed
-                pred_home_score = pred_row.get("predicted_home_score", 110.0)
-                pred_away_score = pred_row.get("predicted_away_score", 110.0)
-
-                # Normalize if inflated (scores > 200 are likely inflated)
-                if pred_home_score > 200 or pred_away_score > 200:
-                    raw_margin = pred_home_score - pred_away_score
-                    # Scale to realistic total (224 average)
-                    scale_factor = 224.0 / (pred_home_score + pred_away_score)
-                    pred_home_score = 112.0 + (raw_margin / 2) * scale_factor
-                    pred_away_score = 112.0 - (raw_margin / 2) * scale_factor
-
-                pred_margin = pred_home_score - pred_away_score
-
-                # Use normal distribution approximation for spread probability
-                std_dev = 12.0  # Typical NBA game margin std dev
-                abs_spread = abs(spread)
-                z_score = (abs_spread - pred_margin) / std_dev
-
-                try:
-                    from scipy.stats import norm
-
-                    if pred_home in outcome_lower or outcome_lower in pred_home:
-                        # Home team covering spread: win if margin > spread
-                        # For home -8.0: win if margin > 8.0
-                        model_prob = 1 - norm.cdf(z_score)
-                    else:
-                        # Away team covering spread: win if margin < spread (complementary)
-                        # For away +8.0: win if margin < 8.0 (complementary to home -8.0)
-                        model_prob = norm.cdf(z_score)
-                except ImportError:
-                    # Approximate CDF using error function
-                    import math
-
-                    if pred_home in outcome_lower or outcome_lower in pred_home:
-                        model_prob = 0.5 * (1 - math.erf(z_score / math.sqrt(2)))
-                        model_prob = 1 - model_prob
-                    else:
-                        model_prob = 0.5 * (1 + math.erf(z_score / math.sqrt(2)))
-
-                model_prob = max(0.0, min(1.0, model_prob))
-
-                # Only show spread bets that win >60% of simulations
-                if model_prob < 0.60:
-                    continue
+        games[game_id] = cache.from_prediction(
+            game_id,
+            getattr(pred, "predicted_home_score", 110.0),
+            getattr(pred, "predicted_away_score", 110.0),
+        )
 
-            elif market_key == "totals":
-                if pd.isna(point):
-                    continue
-                total_line = float(point)
-                if "Over" in outcome_name or outcome_name == "Over":
-                    recommendation = f"Over {total_line:.1f}"
-                elif "Under" in outcome_name or outcome_name == "Under":
-                    recommendation = f"Under {total_line:.1f}"
-                else:
-                    continue
+    return games, errors
 
-                # Calculate total probability using predicted scores from predictions CSV
-                # Use the predicted scores directly (they're already from simulations)
-                pred_home_score = pred_row.get("predicted_home_score", 110.0)
-                pred_away_score = pred_row.get("predicted_away_score", 110.0)
 
-                # Normalize if inflated (scores > 200 are likely inflated)
-                if pred_home_score > 200 or pred_away_score > 200:
-                    raw_total = pred_home_score + pred_away_score
-                    # Scale to realistic total (224 average)
-                    scale_factor = 224.0 / raw_total
-                    pred_home_score = pred_home_score * scale_factor
-                    pred_away_score = pred_away_score * scale_factor
+def match_predictions_to_all_markets(
+    predictions_df: pd.DataFrame,
+    odds_df: pd.DataFrame,
+    simulator: Optional[AdvancedMultiSimulator] = None,
+    db_conn: Optional[psycopg2.extensions.connection] = None,
+    n_simulations: int = 10000,
+    seed: Optional[int] = 42,
+) -> pd.DataFrame:
+    """
+    Match predictions to all market types and calculate edges using actual simulation win rates.
 
-                pred_total = pred_home_score + pred_away_score
+    Predictions are hash-joined to odds rows on (home team, away team),
+    each game is simulated once, and every spread and total line is
+    evaluated against that game's simulated scores in one vectorized pass.
+    Moneylines use the predicted winner's probability from the CSV.
+    """
+    today = date.today()
 
-                # Use normal distribution approximation for total probability
-                std_dev = 15.0  # Typical NBA total std dev
-                z_score = (total_line - pred_total) / std_dev
+    predictions = predictions_df[
+        pd.to_datetime(predictions_df["game_date"]).dt.date == today
+    ]
+    if "game_date_ct" in odds_df:
+        odds_dates = odds_df["game_date_ct"].where(
+            odds_df["game_date_ct"].notna(), today
+        )
+        odds = odds_df[odds_dates == today]
+    else:
+        odds = odds_df
 
-                try:
-                    from scipy.stats import norm
-
-                    if "Over" in outcome_name or outcome_name == "Over":
-                        # Over wins if total > line
-                        model_prob = 1 - norm.cdf(z_score)
-                    else:
-                        # Under wins if total < line (complementary)
-                        model_prob = norm.cdf(z_score)
-                except ImportError:
-                    # Approximate CDF using error function
-                    import math
-
-                    if "Over" in outcome_name or outcome_name == "Over":
-                        model_prob = 0.5 * (1 - math.erf(z_score / math.sqrt(2)))
-                        model_prob = 1 - model_prob
-                    else:
-                        model_prob = 0.5 * (1 + math.erf(z_score / math.sqrt(2)))
-
-                model_prob = max(0.0, min(1.0, model_prob))
-
-                # Only show totals bets that win >60% of simulations
-                if model_prob < 0.60:
-                    continue
+    games_processed = predictions_df["game_id"].nunique()
+    pairs = join_predictions_to_odds(predictions, odds)
 
-            else:
-                # Player props and other markets - skip for now
-                continue
+    if len(pairs) == 0:
+        print(f"\n⚠️  Warning: No bets matched. Games processed: {games_processed}")
+        return pd.DataFrame()
 
-            if model_prob is None:
-                continue
+    games, games_with_errors = simulate_prediction_games(
+        predictions,
+        simulator=simulator,
+        db_conn=db_conn,
+        n_simulations=n_simulations,
+        seed=seed,
+    )
+    pairs = evaluate_odds(pairs, games, key="game_id")
+    lines_evaluated = len(pairs)
 
-            # Calculate metrics
-            implied_prob = american_odds_to_probability(odds_value)
-            edge = calculate_edge(model_prob, implied_prob)
-            ev = calculate_expected_value(model_prob, odds_value)
+    # Moneyline: only the predicted winner, with its probability from the CSV
+    moneyline = (pairs["market_key"] == "h2h") & (
+        pairs["outcome_name"].map(team_key) == pairs["predicted_winner"].map(team_key)
+    )
+    pairs.loc[moneyline, "win_prob"] = np.where(
+        pairs.loc[moneyline, "predicted_winner"] == pairs.loc[moneyline, "home_team"],
+        pairs.loc[moneyline, "home_win_probability"],
+        pairs.loc[moneyline, "away_win_probability"],
+    )
+    # Only show bets that win >60% of simulations
+    markets = moneyline | pairs["market_key"].isin(["spreads", "totals"])
+    pairs = pairs[markets & (pairs["win_prob"] >= 0.60)]
 
-            matched.append(
-                {
-                    "game_id": pred_row["game_id"],
-                    "game_date": pred_date,
-                    "home_team": pred_row["home_team"],
-                    "away_team": pred_row["away_team"],
-                    "predicted_winner": pred_row["predicted_winner"],
-                    "model_probability": model_prob,
-                    "confidence": pred_row.get("confidence", 0),
-                    "prediction_strength": pred_row.get("prediction_strength", "N/A"),
-                    "market_type": market_key,
-                    "recommendation": recommendation,
-                    "bookmaker": odds_row.get("bookmaker_title", "Unknown"),
-                    "bookmaker_key": odds_row.get("bookmaker_key", ""),
-                    "odds": odds_value,
-                    "point": point,
-                    "market_probability": implied_prob,
-                    "edge": edge,
-                    "expected_value": ev,
-                    "event_id": str(odds_row.get("event_id", "")),
-                }
-            )
+    matched = []
+    for row in pairs.to_dict("records"):
+        market_key = row["market_key"]
+        point = row["spread_or_total"]
+        if market_key == "h2h":
+            recommendation = f"{row['predicted_winner']} ML"
+        elif market_key == "spreads":
+            team = row["home_team"] if row["side"] == "home" else row["away_team"]
+            recommendation = f"{team} {float(point):+.1f}"
+        else:
+            recommendation = f"{row['side'].capitalize()} {float(point):.1f}"
+
+        # Calculate metrics
+        model_prob = float(row["win_prob"])
+        odds_value = float(row["odds"])
+        implied_prob = american_odds_to_probability(odds_value)
+
+        matched.append(
+            {
+                "game_id": row["game_id"],
+                "game_date": pd.to_datetime(row["game_date"]).date(),
+                "home_team": row["home_team"],
+                "away_team": row["away_team"],
+                "predicted_winner": row["predicted_winner"],
+                "model_probability": model_prob,
+                "confidence": row.get("confidence", 0),
+                "prediction_strength": row.get("prediction_strength", "N/A"),
+                "market_type": market_key,
+                "recommendation": recommendation,
+                "bookmaker": row.get("bookmaker_title", "Unknown"),
+                "bookmaker_key": row.get("bookmaker_key", ""),
+                "odds": odds_value,
+                "point": point,
+                "market_probability": implied_prob,
+                "edge": calculate_edge(model_prob, implied_prob),
+                "expected_value": calculate_expected_value(model_prob, odds_value),
+                "event_id": str(row.get("event_id", "")),
+            }
+        )
 
     if len(matched) == 0:
-        print(f"\n⚠️  Warning: No bets matched. Games processed: {len(games_processed)}")
+        print(f"\n⚠️  Warning: No bets matched. Games processed: {games_processed}")
         if games_with_errors:
             print(f"  Errors encountered: {len(games_with_errors)}")
             for error in games_with_errors[:5]:  # Show first 5 errors
@@ -680,12 +492,14 @@ def match_predictions_to_all_markets(
         return pd.DataFrame()
 
     # Validate complementary probabilities
-    df_matched = pd.DataFrame(matched)
     validated_picks = validate_complementary_probabilities(matched)
     df_validated = pd.DataFrame(validated_picks)
 
     # Print debug info
-    print(f"\n✓ Matched {len(df_matched)} bets from {len(games_processed)} games")
+    print(
+        f"\n✓ Matched {len(df_validated)} bets from {games_processed} games "
+        f"({len(games)} simulated once, {lines_evaluated} lines evaluated)"
+    )
     if games_with_errors:
         print(
             f"  ⚠️  {len(games_with_errors)} errors encountered (using fallback probabilities)"
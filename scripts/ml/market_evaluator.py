@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+Simulate-Once Market Evaluation
+
+Shared by the betting pick scripts. Each game is simulated once, the raw
+simulated score vectors are kept in a keyed cache, and every market line
+for that game (moneyline, spreads, totals across all bookmakers) is
+evaluated against those vectors in one vectorized pass.
+
+- GameSimulationCache: one SimulatedGame per (teams, date, sims, game state)
+- join_predictions_to_odds: hash join of predictions to odds on team keys
+- evaluate_odds: win/push probabilities for every odds row of every game
+
+Usage:
+    from scripts.ml.market_evaluator import GameSimulationCache, evaluate_odds
+
+    cache = GameSimulationCache(simulator, n_simulations=10000)
+    games = {(home, away): cache.get(home_id, away_id, game_date)}
+    evaluated = evaluate_odds(odds_df, games, key=["home_team", "away_team"])
+
+Created: October 2026
+Author: NBA Simulator AWS Project
+"""
+
+import json
+import weakref
+from dataclasses import dataclass
+from datetime import date
+from functools import cached_property
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Normal approximation used when only mean predicted scores are available
+MARGIN_STD = 12.0  # Typical NBA game margin std dev
+TOTAL_STD = 15.0  # Typical NBA total std dev
+
+# Simulated scores above this are inflated and rescaled to the league average
+INFLATED_SCORE = 200.0
+LEAGUE_AVERAGE_TOTAL = 224.0
+
+DEFAULT_N_SIMULATIONS = 10000
+
+
+def normalize_team_name(name: str) -> str:
+    """Normalize team name for matching."""
+    if pd.isna(name):
+        return ""
+    name = str(name).strip().lower()
+    name = name.replace("philadelphia 76ers", "76ers").replace("sixers", "76ers")
+    name = name.replace("la clippers", "clippers").replace("l.a. clippers", "clippers")
+    name = name.replace("la lakers", "lakers").replace("l.a. lakers", "lakers")
+    return name
+
+
+def team_key(name: str) -> str:
+    """
+    Join key for a team name: the normalized nickname.
+
+    "Boston Celtics", "celtics" and "BOSTON CELTICS" all map to "celtics";
+    "Portland Trail Blazers" and "Trail Blazers" both map to "blazers".
+    Exact-key equality replaces the old substring scan over every odds row.
+    """
+    normalized = normalize_team_name(name)
+    return normalized.split()[-1] if normalized else ""
+
+
+def normalize_scores(home_scores, away_scores):
+    """
+    Rescale inflated simulated scores to a realistic NBA total.
+
+    Works on scalars or score vectors. Scores are scaled by the same
+    factor, so the mean total becomes 224 and the margin shrinks in
+    proportion.
+    """
+    home_mean = float(np.mean(home_scores))
+    away_mean = float(np.mean(away_scores))
+    if home_mean > INFLATED_SCORE or away_mean > INFLATED_SCORE:
+        scale = LEAGUE_AVERAGE_TOTAL / (home_mean + away_mean)
+        return home_scores * scale, away_scores * scale
+    return home_scores, away_scores
+
+
+@dataclass
+class SimulatedGame:
+    """Raw simulated scores for one game"""
+
+    home_scores: np.ndarray
+    away_scores: np.ndarray
+    # Home win probability reported by the simulator; moneylines use it in
+    # place of the vector estimate when set
+    home_win_prob: Optional[float] = None
+    source: str = "simulation"
+
+    def __post_init__(self):
+        self.home_scores = np.asarray(self.home_scores, dtype=np.float64)
+        self.away_scores = np.asarray(self.away_scores, dtype=np.float64)
+        if self.home_scores.shape != self.away_scores.shape:
+            raise ValueError("home_scores and away_scores must have the same shape")
+        if self.home_scores.size == 0:
+            raise ValueError("SimulatedGame needs at least one simulation")
+
+    @property
+    def n_simulations(self) -> int:
+        return int(self.home_scores.size)
+
+    @cached_property
+    def sorted_margins(self) -> np.ndarray:
+        """Home minus away score per simulation, sorted"""
+        return np.sort(self.home_scores - self.away_scores)
+
+    @cached_property
+    def sorted_totals(self) -> np.ndarray:
+        """Combined score per simulation, sorted"""
+        return np.sort(self.home_scores + self.away_scores)
+
+    def moneyline_probability(self, side: str) -> float:
+        """Probability the home or away side wins outright"""
+        if self.home_win_prob is not None:
+            return self.home_win_prob if side == "home" else 1 - self.home_win_prob
+        win, _ = self.line_probabilities(
+            np.array(["margin"]), np.array([side == "home"]), np.zeros(1)
+        )
+        return float(win[0])
+
+    def line_probabilities(
+        self, series: np.ndarray, above: np.ndarray, thresholds: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Win and push probabilities for many lines at once.
+
+        Args:
+            series: 'margin' or 'total' per line
+            above: True if the bet wins when the series is above the threshold
+            thresholds: Threshold per line
+
+        Returns:
+            (win_prob, push_prob) arrays aligned with the inputs
+        """
+        n = self.n_simulations
+        win = np.empty(len(thresholds), dtype=np.float64)
+        push = np.empty(len(thresholds), dtype=np.float64)
+        for name, values in (
+            ("margin", self.sorted_margins),
+            ("total", self.sorted_totals),
+        ):
+            mask = series == name
+            if not mask.any():
+                continue
+            t = thresholds[mask]
+            left = np.searchsorted(values, t, side="left")
+            right = np.searchsorted(values, t, side="right")
+            win[mask] = np.where(above[mask], n - right, left) / n
+            push[mask] = (right - left) / n
+        return win, push
+
+
+def scores_from_prediction(
+    predicted_home_score: float,
+    predicted_away_score: float,
+    n_simulations: int = DEFAULT_N_SIMULATIONS,
+    seed: Optional[int] = None,
+    margin_std: float = MARGIN_STD,
+    total_std: float = TOTAL_STD,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Draw score vectors around mean predicted scores.
+
+    Margin ~ N(home - away, margin_std) and total ~ N(home + away,
+    total_std), the same normal approximation the pick scripts applied
+    line by line. Inflated predictions are normalized first.
+    """
+    home, away = normalize_scores(
+        float(predicted_home_score), float(predicted_away_score)
+    )
+    rng = np.random.default_rng(seed)
+    margins = rng.normal(home - away, margin_std, n_simulations)
+    totals = rng.normal(home + away, total_std, n_simulations)
+    return (totals + margins) / 2, (totals - margins) / 2
+
+
+def simulate_game(
+    simulator,
+    home_team_id: str,
+    away_team_id: str,
+    game_date: date,
+    n_simulations: int = DEFAULT_N_SIMULATIONS,
+    game_state: Optional[Dict[str, Any]] = None,
+    seed: Optional[int] = None,
+) -> SimulatedGame:
+    """
+    Run the simulator once for a game and keep its score vectors.
+
+    Uses the per-simulation score arrays when the prediction result
+    exposes them (home_scores / away_scores). Otherwise falls back to
+    drawing vectors around the predicted mean scores.
+    """
+    kwargs = {"game_state": game_state} if game_state is not None else {}
+    result = simulator.predict_game(
+        home_team_id=home_team_id,
+        away_team_id=away_team_id,
+        game_date=game_date,
+        use_ensemble=True,
+        n_simulations=n_simulations,
+        **kwargs,
+    )
+    if isinstance(result, tuple):
+        result = result[0]
+
+    home_scores = getattr(result, "home_scores", None)
+    away_scores = getattr(result, "away_scores", None)
+    if home_scores is not None and away_scores is not None and len(home_scores):
+        home_scores, away_scores = normalize_scores(
+            np.asarray(home_scores, dtype=np.float64),
+            np.asarray(away_scores, dtype=np.float64),
+        )
+        source = "simulation"
+    else:
+        home_scores, away_scores = scores_from_prediction(
+            result.predicted_home_score,
+            result.predicted_away_score,
+            n_simulations=n_simulations,
+            seed=seed,
+        )
+        source = "normal_approximation"
+
+    return SimulatedGame(
+        home_scores=home_scores,
+        away_scores=away_scores,
+        home_win_prob=getattr(result, "home_win_prob", None),
+        source=source,
+    )
+
+
+class GameSimulationCache:
+    """
+    Simulate each game once and reuse its score vectors for every market.
+
+    Entries are keyed by (home_team_id, away_team_id, game_date,
+    n_simulations, game_state), so an in-progress game with a new state is
+    simulated again while every line for the same state shares one run.
+    """
+
+    def __init__(
+        self,
+        simulator=None,
+        n_simulations: int = DEFAULT_N_SIMULATIONS,
+        seed: Optional[int] = None,
+    ):
+        self.simulator = simulator
+        self.n_simulations = n_simulations
+        self.seed = seed
+        self._games: Dict[Hashable, SimulatedGame] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    @staticmethod
+    def make_key(
+        home_team_id,
+        away_team_id,
+        game_date,
+        n_simulations: int,
+        game_state: Optional[Dict[str, Any]] = None,
+    ) -> Tuple:
+        state = (
+            json.dumps(game_state, sort_keys=True, default=str)
+            if game_state is not None
+            else None
+        )
+        return (
+            str(home_team_id),
+            str(away_team_id),
+            str(game_date),
+            n_simulations,
+            state,
+        )
+
+    def get(
+        self,
+        home_team_id: str,
+        away_team_id: str,
+        game_date: date,
+        game_state: Optional[Dict[str, Any]] = None,
+        n_simulations: Optional[int] = None,
+    ) -> SimulatedGame:
+        """Cached SimulatedGame for a matchup, simulating it on first use"""
+        n_simulations = n_simulations or self.n_simulations
+        key = self.make_key(
+            home_team_id, away_team_id, game_date, n_simulations, game_state
+        )
+        game = self._games.get(key)
+        if game is not None:
+            self.hits += 1
+            return game
+
+        if self.simulator is None:
+            raise ValueError("GameSimulationCache has no simulator to run")
+        self.misses += 1
+        game = simulate_game(
+            self.simulator,
+            home_team_id,
+            away_team_id,
+            game_date,
+            n_simulations=n_simulations,
+            game_state=game_state,
+            seed=self.seed,
+        )
+        self._games[key] = game
+        return game
+
+    def from_prediction(
+        self,
+        key: Hashable,
+        predicted_home_score: float,
+        predicted_away_score: float,
+        n_simulations: Optional[int] = None,
+    ) -> SimulatedGame:
+        """Cached SimulatedGame drawn around mean predicted scores"""
+        game = self._games.get(key)
+        if game is not None:
+            self.hits += 1
+            return game
+
+        self.misses += 1
+        home_scores, away_scores = scores_from_prediction(
+            predicted_home_score,
+            predicted_away_score,
+            n_simulations=n_simulations or self.n_simulations,
+            seed=self.seed,
+        )
+        game = SimulatedGame(home_scores, away_scores, source="normal_approximation")
+        self._games[key] = game
+        return game
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "games": len(self._games),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+_simulator_caches: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def simulation_cache_for(simulator) -> GameSimulationCache:
+    """Process-wide GameSimulationCache for a simulator instance"""
+    cache = _simulator_caches.get(simulator)
+    if cache is None:
+        cache = _simulator_caches[simulator] = GameSimulationCache(simulator)
+    return cache
+
+
+def _add_team_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of df with home_key / away_key columns"""
+    names = pd.unique(pd.concat([df["home_team"], df["away_team"]]))
+    keys = {name: team_key(name) for name in names}
+    return df.assign(
+        home_key=df["home_team"].map(keys), away_key=df["away_team"].map(keys)
+    )
+
+
+def join_predictions_to_odds(
+    predictions_df: pd.DataFrame, odds_df: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Hash join predictions to odds rows on (home team, away team).
+
+    Prediction columns keep their names; odds columns that collide get an
+    "_odds" suffix (home_team_odds, away_team_odds).
+    """
+    return _add_team_keys(predictions_df).merge(
+        _add_team_keys(odds_df),
+        on=["home_key", "away_key"],
+        how="inner",
+        suffixes=("", "_odds"),
+    )
+
+
+def outcome_sides(odds_df: pd.DataFrame) -> np.ndarray:
+    """
+    Which side each odds row backs: 'home', 'away', 'over', 'under' or ''.
+
+    Team outcomes are matched on team_key; odds_df must carry home_key and
+    away_key columns (added by join_predictions_to_odds / evaluate_odds).
+    """
+    market = odds_df["market_key"].astype(str).to_numpy()
+    outcome = odds_df["outcome_name"].astype(str)
+    outcome_keys = outcome.map(team_key).to_numpy()
+    outcome_lower = outcome.str.strip().str.lower()
+    totals = market == "totals"
+    return np.select(
+        [
+            totals & outcome_lower.str.startswith("over").to_numpy(),
+            totals & outcome_lower.str.startswith("under").to_numpy(),
+            ~totals & (outcome_keys == odds_df["home_key"].to_numpy()),
+            ~totals & (outcome_keys == odds_df["away_key"].to_numpy()),
+        ],
+        ["over", "under", "home", "away"],
+        default="",
+    )
+
+
+def evaluate_odds(
+    odds_df: pd.DataFrame,
+    games: Dict[Hashable, SimulatedGame],
+    key: Union[str, List[str]] = "game_id",
+    point_column: str = "spread_or_total",
+) -> pd.DataFrame:
+    """
+    Evaluate every market line against its game's simulated scores.
+
+    A spread bet wins when the backed team's margin plus the point is
+    positive, a moneyline when the backed team's margin is positive, and
+    over/under when the total is above/below the line. Exact ties are
+    reported as pushes.
+
+    Args:
+        odds_df: Odds rows with market_key, outcome_name, home_team,
+            away_team and point_column
+        games: SimulatedGame per game, keyed like the key column(s)
+        key: Column(s) identifying the game of each odds row
+        point_column: Spread or total line column
+
+    Returns:
+        Copy of odds_df with side, win_prob and push_prob columns.
+        win_prob is NaN for rows without a simulated game, an unknown
+        market or outcome, or a missing line.
+    """
+    if "home_key" not in odds_df or "away_key" not in odds_df:
+        odds_df = _add_team_keys(odds_df)
+    result = odds_df.copy()
+    result["side"] = outcome_sides(result)
+    result["win_prob"] = np.nan
+    result["push_prob"] = np.nan
+    if result.empty:
+        return result
+
+    market = result["market_key"].astype(str).to_numpy()
+    side = result["side"].to_numpy()
+    point = pd.to_numeric(result[point_column], errors="coerce").to_numpy(float)
+
+    home_or_away = (side == "home") | (side == "away")
+    valid = (
+        ((market == "h2h") & home_or_away)
+        | ((market == "spreads") & home_or_away & ~np.isnan(point))
+        | ((market == "totals") & (side != "") & ~np.isnan(point))
+    )
+    above = (side == "home") | (side == "over")
+    series = np.where(market == "totals", "total", "margin")
+    # Home covers when margin > -point, away when margin < point
+    thresholds = np.select(
+        [market == "h2h", side == "home"], [0.0, -point], default=point
+    )
+
+    win_col = result.columns.get_loc("win_prob")
+    push_col = result.columns.get_loc("push_prob")
+    for game_key, positions in result.groupby(key, sort=False).indices.items():
+        game = games.get(game_key)
+        if game is None:
+            continue
+        positions = positions[valid[positions]]
+        if len(positions) == 0:
+            continue
+        win, push = game.line_probabilities(
+            series[positions], above[positions], thresholds[positions]
+        )
+        if game.home_win_prob is not None:
+            moneyline = market[positions] == "h2h"
+            win[moneyline] = np.where(
+                above[positions][moneyline],
+                game.home_win_prob,
+                1 - game.home_win_prob,
+            )
+            push[moneyline] = 0.0
+        result.iloc[positions, win_col] = win
+        result.iloc[positions, push_col] = push
+
+    return result
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark AlertDeduplicator at a simulated 100k alerts/minute
+
+Feeds alerts drawn from a pool of distinct messages through
+should_send_alert with a simulated clock advancing --rate alerts per
+minute, so fingerprints expire as they would in production. Reports
+wall-clock alerts/sec, microseconds per alert, and the headroom against
+the simulated rate.
+
+Modes:
+- legacy: previous expiry, scanning every fingerprint on each alert
+          (run for --legacy-alerts only; it is O(active fingerprints))
+- memory: last-seen-ordered fingerprints, amortized O(1) expiry
+- sqlite: memory + shared SQLite state file (one transaction per alert)
+
+Usage:
+    python scripts/monitoring/benchmark_alert_deduplicator.py
+    python scripts/monitoring/benchmark_alert_deduplicator.py --alerts 500000 --distinct 200000
+    python scripts/monitoring/benchmark_alert_deduplicator.py --modes memory,sqlite --window 5
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from nba_simulator.monitoring.alerts import AlertDeduplicator, DeduplicationConfig
+
+SEVERITIES = ("low", "medium", "high", "critical")
+
+
+class LegacyDeduplicator(AlertDeduplicator):
+    """Previous expiry: full scan of recent_alerts on every alert"""
+
+    def _cleanup_old_fingerprints(self, now=None):
+        cutoff_time = (now or self.clock()) - self.window
+        expired = [
+            fp
+            for fp, alert_fp in self.recent_alerts.items()
+            if alert_fp.last_seen < cutoff_time
+        ]
+        for fp in expired:
+            del self.recent_alerts[fp]
+
+
+class SimulatedClock:
+    """Advances 60/rate seconds per call"""
+
+    def __init__(self, rate_per_minute: int):
+        self.now = datetime(2025, 11, 10, tzinfo=timezone.utc)
+        self.step = timedelta(seconds=60 / rate_per_minute)
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+def make_alerts(count: int, distinct: int, seed: int = 7) -> list:
+    """(alert_type, severity, message) tuples with Zipf-like repetition"""
+    rng = random.Random(seed)
+    return [
+        (
+            f"scraper_failure_{i % 20}",
+            SEVERITIES[i % len(SEVERITIES)],
+            f"Game {i} failed to load",
+        )
+        for i in (int(distinct * rng.random() ** 2) for _ in range(count))
+    ]
+
+
+def run(mode: str, alerts: list, args, state_dir: str) -> dict:
+    config = DeduplicationConfig(
+        window_minutes=args.window,
+        state_path=f"{state_dir}/{mode}.sqlite" if mode == "sqlite" else None,
+        state_cleanup_seconds=1.0,
+    )
+    cls = LegacyDeduplicator if mode == "legacy" else AlertDeduplicator
+    dedup = cls(config, clock=SimulatedClock(args.rate))
+
+    start = time.perf_counter()
+    for alert_type, severity, message in alerts:
+        dedup.should_send_alert(alert_type, severity, message)
+    elapsed = time.perf_counter() - start
+
+    stats = dedup.get_suppression_stats()
+    dedup.close()
+    return {
+        "alerts": len(alerts),
+        "elapsed": elapsed,
+        "active": stats["active_fingerprints"],
+        "suppressed": stats["suppressed_alerts"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark AlertDeduplicator")
+    parser.add_argument("--alerts", type=int, default=200000)
+    parser.add_argument("--legacy-alerts", type=int, default=5000)
+    parser.add_argument("--distinct", type=int, default=50000)
+    parser.add_argument(
+        "--rate",
+        type=int,
+        default=100000,
+        help="Simulated alerts per minute (default: 100000)",
+    )
+    parser.add_argument("--window", type=int, default=1, help="Window minutes")
+    parser.add_argument("--modes", default="legacy,memory,sqlite")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    alerts = make_alerts(args.alerts, args.distinct)
+    print(
+        f"{args.alerts} alerts from {args.distinct} distinct, simulated "
+        f"{args.rate:,}/min, {args.window} min window"
+    )
+    print(
+        f"{'mode':<8} {'alerts':>8} {'alerts/sec':>11} {'us/alert':>9} "
+        f"{'headroom':>9} {'active':>8} {'suppressed':>11}"
+    )
+    with tempfile.TemporaryDirectory() as state_dir:
+        for mode in args.modes.split(","):
+            subset = alerts[: args.legacy_alerts] if mode == "legacy" else alerts
+            result = run(mode, subset, args, state_dir)
+            per_sec = result["alerts"] / result["elapsed"]
+            print(
+                f"{mode:<8} {result['alerts']:>8} {per_sec:>11,.0f} "
+                f"{result['elapsed'] / result['alerts'] * 1e6:>9.1f} "
+                f"{per_sec * 60 / args.rate:>8.1f}x {result['active']:>8} "
+                f"{result['suppressed']:>11}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Benchmark AlertManager.send_alert with inline vs queued dispatch
+
+Sends a burst of alerts to stub channels that sleep to stand in for
+SMTP/Slack/webhook round trips, and reports caller-side send_alert latency
+(p50/p95/max), time until every notification is delivered, and database
+commits for alert history (fake connection).
+
+Modes:
+- inline: channels called one after another inside send_alert (previous
+          behavior), one commit per alert and per notification
+- queued: AlertConfig(async_dispatch=True), per-channel worker threads and
+          batched history writes
+
+Usage:
+    python scripts/monitoring/benchmark_alert_dispatch.py
+    python scripts/monitoring/benchmark_alert_dispatch.py --alerts 500 --latency 0.05
+    python scripts/monitoring/benchmark_alert_dispatch.py --queue-size 50 --overflow drop_oldest
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from nba_simulator.monitoring.alerts import (
+    AlertConfig,
+    AlertManager,
+    DispatcherConfig,
+    NotificationConfig,
+)
+from nba_simulator.monitoring.alerts.channels import NotificationChannel
+
+CHANNELS = ("email", "slack", "webhook")
+
+
+class StubChannel(NotificationChannel):
+    """Channel with fixed per-send latency"""
+
+    def __init__(self, name: str, latency: float):
+        super().__init__(name, NotificationConfig(retry_attempts=1))
+        self.latency = latency
+
+    def _send_notification(self, subject: str, message: str, **kwargs):
+        time.sleep(self.latency)
+
+
+class CountingCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        time.sleep(self.conn.latency)
+
+    def executemany(self, sql, rows):
+        time.sleep(self.conn.latency)
+
+
+class CountingConnection:
+    """psycopg2 connection stand-in counting commits"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.commits = 0
+
+    def cursor(self):
+        return CountingCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+def run(mode: str, args) -> dict:
+    config = AlertConfig(
+        default_channels=set(CHANNELS),
+        enable_deduplication=False,
+        enable_escalation=False,
+        async_dispatch=mode == "queued",
+        dispatcher_config=DispatcherConfig(
+            queue_size=args.queue_size, overflow=args.overflow
+        ),
+    )
+    manager = AlertManager(config)
+    for name in CHANNELS:
+        manager.add_channel(name, StubChannel(name, args.latency))
+    conn = CountingConnection(args.db_latency)
+    manager.history.db_conn = conn
+
+    latencies = []
+    start = time.perf_counter()
+    for i in range(args.alerts):
+        call_start = time.perf_counter()
+        manager.send_alert("scraper_failure", "high", f"Game {i} failed")
+        latencies.append(time.perf_counter() - call_start)
+    manager.flush()
+    total = time.perf_counter() - start
+    dropped = 0
+    if manager.dispatcher:
+        stats = manager.dispatcher.get_statistics()
+        dropped = sum(channel["dropped"] for channel in stats["channels"].values())
+    manager.close()
+
+    latencies.sort()
+    return {
+        "p50": latencies[len(latencies) // 2],
+        "p95": latencies[int(len(latencies) * 0.95)],
+        "max": latencies[-1],
+        "total": total,
+        "commits": conn.commits,
+        "dropped": dropped,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark alert dispatch")
+    parser.add_argument("--alerts", type=int, default=200)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.02,
+        help="Seconds per channel send (default: 0.02)",
+    )
+    parser.add_argument("--db-latency", type=float, default=0.002)
+    parser.add_argument("--queue-size", type=int, default=1000)
+    parser.add_argument(
+        "--overflow", default="block", choices=("block", "drop_newest", "drop_oldest")
+    )
+    parser.add_argument("--modes", default="inline,queued")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    print(
+        f"{args.alerts} alerts x {len(CHANNELS)} channels, "
+        f"{args.latency * 1000:.0f} ms per send, "
+        f"{args.db_latency * 1000:.0f} ms per statement"
+    )
+    print(
+        f"{'mode':<8} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} "
+        f"{'total s':>8} {'commits':>8} {'dropped':>8}"
+    )
+    for mode in args.modes.split(","):
+        result = run(mode, args)
+        print(
+            f"{mode:<8} {result['p50'] * 1000:>8.2f} {result['p95'] * 1000:>8.2f} "
+            f"{result['max'] * 1000:>8.2f} {result['total']:>8.2f} "
+            f"{result['commits']:>8} {result['dropped']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Benchmark CloudWatchPublisher throughput with a stubbed CloudWatch client
+
+Records datapoints for a set of series from several threads and reports
+caller-side metrics/sec, total time including the final flush, and the
+put_metric_data calls/datums the stub received. The stub sleeps --latency
+seconds per call to stand in for the API round trip.
+
+Modes:
+- legacy:     unaggregated, put_metric_data every 20 datapoints on the
+              recording thread (the previous publisher's behavior)
+- statistics: aggregated StatisticSets, background flush thread
+- values:     aggregated Values/Counts, background flush thread
+- emf:        Embedded Metric Format lines to /dev/null, no API calls
+
+Usage:
+    python scripts/monitoring/cloudwatch/benchmark_publisher.py
+    python scripts/monitoring/cloudwatch/benchmark_publisher.py --datapoints 500000 --series 200
+    python scripts/monitoring/cloudwatch/benchmark_publisher.py --latency 0.05 --threads 8
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from nba_simulator.monitoring.cloudwatch import (
+    CloudWatchPublisher,
+    MetricNamespace,
+    MetricUnit,
+)
+
+LEGACY_BATCH_SIZE = 20
+
+
+class StubCloudWatchClient:
+    """put_metric_data stand-in with fixed latency"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self.datums = 0
+        self._lock = threading.Lock()
+
+    def put_metric_data(self, Namespace, MetricData):
+        time.sleep(self.latency)
+        with self._lock:
+            self.calls += 1
+            self.datums += len(MetricData)
+
+
+class LegacyPublisher:
+    """Previous behavior: buffer raw datapoints, send 20 at a time inline"""
+
+    def __init__(self, client):
+        self.client = client
+        self._buffer = []
+        self._lock = threading.Lock()
+
+    def record(self, namespace, name, value, unit, dimensions):
+        datum = {
+            "MetricName": name,
+            "Value": value,
+            "Unit": unit.value,
+            "Dimensions": [{"Name": k, "Value": v} for k, v in dimensions.items()],
+        }
+        with self._lock:
+            self._buffer.append(datum)
+            if len(self._buffer) < LEGACY_BATCH_SIZE:
+                return True
+            batch, self._buffer = self._buffer, []
+        self.client.put_metric_data(Namespace=namespace.value, MetricData=batch)
+        return True
+
+    def close(self):
+        if self._buffer:
+            self.client.put_metric_data(
+                Namespace=MetricNamespace.SCRAPERS.value, MetricData=self._buffer
+            )
+            self._buffer = []
+
+
+def build_publisher(mode: str, client, flush_interval: float, devnull):
+    if mode == "legacy":
+        return LegacyPublisher(client)
+    if mode == "emf":
+        return CloudWatchPublisher(
+            cost_optimized=False,
+            emit="emf",
+            emf_stream=devnull,
+            flush_interval=flush_interval,
+        )
+    return CloudWatchPublisher(
+        cost_optimized=False,
+        client=client,
+        aggregation=mode,
+        flush_interval=flush_interval,
+    )
+
+
+def run(mode: str, args, devnull) -> dict:
+    client = StubCloudWatchClient(args.latency)
+    publisher = build_publisher(mode, client, args.flush_interval, devnull)
+    per_thread = args.datapoints // args.threads
+
+    def worker(thread_id: int):
+        for i in range(per_thread):
+            series = (thread_id * per_thread + i) % args.series
+            publisher.record(
+                MetricNamespace.SCRAPERS,
+                "RequestLatency",
+                float(i % 50),
+                MetricUnit.SECONDS,
+                {"Scraper": f"scraper-{series}"},
+            )
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        list(pool.map(worker, range(args.threads)))
+    recorded = time.perf_counter() - start
+    publisher.close()
+    total = time.perf_counter() - start
+
+    return {
+        "datapoints": per_thread * args.threads,
+        "recorded": recorded,
+        "total": total,
+        "calls": client.calls,
+        "datums": client.datums,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CloudWatchPublisher")
+    parser.add_argument("--datapoints", type=int, default=200000)
+    parser.add_argument("--series", type=int, default=50)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.02,
+        help="Seconds per put_metric_data call (default: 0.02)",
+    )
+    parser.add_argument("--flush-interval", type=float, default=1.0)
+    parser.add_argument("--modes", default="legacy,statistics,values,emf")
+    args = parser.parse_args()
+
+    print(
+        f"{args.datapoints} datapoints, {args.series} series, {args.threads} threads, "
+        f"{args.latency * 1000:.0f} ms per API call"
+    )
+    print(
+        f"{'mode':<12} {'metrics/sec':>12} {'record s':>9} {'total s':>8} "
+        f"{'api calls':>10} {'datums':>8}"
+    )
+    with open(os.devnull, "w") as devnull:
+        for mode in args.modes.split(","):
+            result = run(mode, args, devnull)
+            print(
+                f"{mode:<12} {result['datapoints'] / result['recorded']:>12,.0f} "
+                f"{result['recorded']:>9.2f} {result['total']:>8.2f} "
+                f"{result['calls']:>10} {result['datums']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -24,9 +24,13 @@ The GameStateTracker is a state machine that:
 - Initializes with starting lineups
 - Processes each play event sequentially
 - Updates cumulative stats
-- Creates immutable snapshots after each event
+- Records a snapshot after each event (keyframe + delta SnapshotStore)
 - Validates state consistency
 
+Snapshots are not deep copies: SnapshotStore keeps periodic columnar
+keyframes plus per-event changed cells, and rebuilds any GameState on demand
+via get_snapshot(event_num) or the lazy get_all_snapshots() iterator.
+
 === USAGE ===
 
 ```python
@@ -39,16 +43,18 @@ tracker.set_starting_lineup("LAL", ["Kobe Bryant", "Pau Gasol", ...])
 # Process events
 for event in play_by_play_events:
     parsed_play = parser.parse(event.play_text)
-    snapshot = tracker.process_event(event, parsed_play)
+    tracker.process_event(event, parsed_play)
+
+# Rebuild a snapshot only when it is needed
+snapshot = tracker.get_snapshot(event_num)
 ```
 """
 
 import logging
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 import hashlib
-import copy
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -142,10 +148,16 @@ class GameStateTracker:
     Tracks the complete state of an NBA game as events are processed.
 
     Maintains cumulative stats, lineups, and plus/minus calculations.
-    Creates immutable snapshots after each event.
+    Records a snapshot after each event in a SnapshotStore.
     """
 
-    def __init__(self, game_id: str, home_team_id: str, away_team_id: str):
+    def __init__(
+        self,
+        game_id: str,
+        home_team_id: str,
+        away_team_id: str,
+        keyframe_interval: Optional[int] = None,
+    ):
         """
         Initialize GameStateTracker.
 
@@ -153,7 +165,14 @@ class GameStateTracker:
             game_id: Unique game identifier
             home_team_id: Home team ID
             away_team_id: Away team ID
+            keyframe_interval: Events between full snapshot keyframes
+                (default: SnapshotStore.DEFAULT_KEYFRAME_INTERVAL)
         """
+        try:
+            from .snapshot_store import SnapshotStore
+        except ImportError:
+            from snapshot_store import SnapshotStore
+
         self.game_id = game_id
         self.home_team_id = home_team_id
         self.away_team_id = away_team_id
@@ -168,8 +187,12 @@ class GameStateTracker:
             away_score=0,
         )
 
-        # Track all snapshots
-        self.snapshots: List[GameState] = []
+        # Track all snapshots (keyframes + deltas, rebuilt on demand)
+        self.snapshot_store = SnapshotStore(
+            game_id,
+            keyframe_interval=keyframe_interval
+            or SnapshotStore.DEFAULT_KEYFRAME_INTERVAL,
+        )
 
         # Event counter
         self.events_processed = 0
@@ -225,7 +248,7 @@ class GameStateTracker:
         parsed_play,
         home_score: int = 0,
         away_score: int = 0,
-    ) -> GameState:
+    ) -> int:
         """
         Process a single play-by-play event and update game state.
 
@@ -239,7 +262,8 @@ class GameStateTracker:
             away_score: Current away team score
 
         Returns:
-            Immutable snapshot of game state after this event
+            Position of the recorded snapshot. Only the changed cells are
+            stored; rebuild the state with get_snapshot(event_num) when needed.
         """
         # Update plus/minus BEFORE updating scores (uses previous scores)
         self._update_plus_minus(home_score, away_score)
@@ -261,13 +285,12 @@ class GameStateTracker:
         if parsed_play.stat_updates:
             self._apply_stat_updates(parsed_play.stat_updates, parsed_play.team_id)
 
-        # Create immutable snapshot
-        snapshot = self._create_snapshot()
+        # Record snapshot
+        position = self._create_snapshot()
 
-        self.snapshots.append(snapshot)
         self.events_processed += 1
 
-        return snapshot
+        return position
 
     def _process_substitution(self, parsed_play):
         """Process a substitution event."""
@@ -404,10 +427,9 @@ class GameStateTracker:
                 if player.on_court:
                     player.plus_minus += away_score_change - home_score_change
 
-    def _create_snapshot(self) -> GameState:
-        """Create an immutable snapshot of current game state."""
-        # Deep copy to make snapshot immutable
-        return copy.deepcopy(self.current_state)
+    def _create_snapshot(self) -> int:
+        """Record the current game state's delta and return its position."""
+        return self.snapshot_store.record(self.current_state)
 
     def _generate_player_id(self, player_name: str, team_id: str) -> str:
         """Generate a unique player ID from name and team."""
@@ -454,15 +476,17 @@ class GameStateTracker:
         return self.current_state
 
     def get_snapshot(self, event_num: int) -> Optional[GameState]:
-        """Get a specific snapshot by event number."""
-        for snapshot in self.snapshots:
-            if snapshot.event_num == event_num:
-                return snapshot
-        return None
+        """Get a specific snapshot by event number (rebuilt on demand)."""
+        return self.snapshot_store.get_snapshot(event_num)
+
+    def get_all_snapshots(self) -> Iterator[GameState]:
+        """Lazily iterate over all snapshots in event order."""
+        return self.snapshot_store.iter_snapshots()
 
-    def get_all_snapshots(self) -> List[GameState]:
-        """Get all snapshots."""
-        return self.snapshots
+    @property
+    def snapshots(self) -> List[GameState]:
+        """All snapshots as a list (materializes every snapshot)."""
+        return list(self.get_all_snapshots())
 
     def get_player_stats(self, player_name: str) -> Optional[PlayerState]:
         """Get current stats for a specific player."""
@@ -476,7 +500,7 @@ class GameStateTracker:
         return {
             "game_id": self.game_id,
             "events_processed": self.events_processed,
-            "snapshots_created": len(self.snapshots),
+            "snapshots_created": len(self.snapshot_store),
             "total_players": len(self.current_state.players),
             "home_lineup_size": len(self.current_state.home_lineup),
             "away_lineup_size": len(self.current_state.away_lineup),
@@ -525,7 +549,7 @@ def test_game_state_tracker():
 
     # Event 1: Kobe scores
     play1 = parser.parse("Kobe Bryant makes 15 ft jumper.")
-    snapshot1 = tracker.process_event(
+    tracker.process_event(
         event_num=1,
         period=1,
         clock_display="11:47",
@@ -545,7 +569,7 @@ def test_game_state_tracker():
     play2 = parser.parse(
         "Ray Allen makes 25 ft three point jumper (Rajon Rondo assists)."
     )
-    snapshot2 = tracker.process_event(
+    tracker.process_event(
         event_num=2,
         period=1,
         clock_display="11:15",
@@ -565,7 +589,7 @@ def test_game_state_tracker():
 
     # Event 3: Substitution
     play3 = parser.parse("Glen Davis enters game for Kendrick Perkins.")
-    snapshot3 = tracker.process_event(
+    tracker.process_event(
         event_num=3,
         period=1,
         clock_display="10:30",
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Interval Batch Engine
+
+Vectorized interval box scores for a whole game:
+- Loads a game's player and team snapshot tables into NumPy arrays once
+- Resolves every interval boundary with a single as-of search (searchsorted)
+- Computes interval deltas and all 16 advanced statistics for
+  players × intervals as array operations
+- Returns one pandas DataFrame (one row per player per interval)
+
+IntervalBoxScoreCalculator.calculate_interval_stats issues two snapshot
+queries per player per interval, plus team and opponent queries. For
+1-second or decisecond intervals that is hundreds of thousands of SQLite
+queries per game; this engine issues two.
+
+Created: October 19, 2025
+"""
+
+import sqlite3
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Cumulative columns differenced between interval boundaries
+PLAYER_DELTA_FIELDS = [
+    "points",
+    "fgm",
+    "fga",
+    "fg3m",
+    "fg3a",
+    "ftm",
+    "fta",
+    "oreb",
+    "dreb",
+    "reb",
+    "ast",
+    "stl",
+    "blk",
+    "tov",
+    "pf",
+    "minutes",
+]
+TEAM_DELTA_FIELDS = PLAYER_DELTA_FIELDS[:-1]
+
+# Advanced statistic columns, in IntervalBoxScoreCalculator order
+ADVANCED_FIELDS = [
+    "fg_pct",
+    "efg_pct",
+    "3par",
+    "ft_rate",
+    "fg3_pct",
+    "ft_pct",
+    "ts_pct",
+    "orb_pct",
+    "drb_pct",
+    "trb_pct",
+    "ast_pct",
+    "stl_pct",
+    "blk_pct",
+    "tov_pct",
+    "usg_pct",
+    "ortg",
+    "drtg",
+    "bpm",
+    "ast_to_tov",
+]
+
+INTERVAL_FIELDS = [
+    "interval",
+    "interval_number",
+    "start_seconds",
+    "end_seconds",
+    "period",
+]
+
+
+def _ratio(
+    numerator: np.ndarray, denominator: np.ndarray, mask: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """numerator / denominator where denominator > 0 (and mask), else 0.0"""
+    valid = denominator > 0
+    if mask is not None:
+        valid &= mask
+    out = np.zeros(np.broadcast(numerator, denominator).shape, dtype=float)
+    np.divide(numerator, denominator, out=out, where=valid)
+    return out
+
+
+def _possessions(stats: Dict[str, np.ndarray]) -> np.ndarray:
+    """FGA - OREB + TOV + 0.44 * FTA"""
+    return stats["fga"] - stats["oreb"] + stats["tov"] + 0.44 * stats["fta"]
+
+
+class _SnapshotTable:
+    """
+    One snapshot table for one game, as sorted NumPy arrays.
+
+    Rows are sorted by (entity, time_elapsed_seconds, event_number), so the
+    snapshot "at or just before t" for an entity is the last row of its
+    block with time <= t.
+    """
+
+    def __init__(self, frame: pd.DataFrame, entity_column: str, fields: List[str]):
+        frame = frame.sort_values(
+            [entity_column, "time_elapsed_seconds", "event_number"], kind="mergesort"
+        )
+        codes, entities = pd.factorize(frame[entity_column], sort=False)
+
+        self.entities = list(entities)
+        self.index = {entity: i for i, entity in enumerate(self.entities)}
+        self.fields = fields
+        self.values = frame[fields].fillna(0).to_numpy(dtype=float)
+        self.team_ids = frame["team_id"].to_numpy(dtype=object)
+
+        times = frame["time_elapsed_seconds"].to_numpy(dtype=float)
+        self.t_min = times.min() if len(times) else 0.0
+        self.t_span = (times.max() - self.t_min + 1.0) if len(times) else 1.0
+        self.codes = codes
+        self.keys = codes * self.t_span + (times - self.t_min)
+        self.block_start = np.searchsorted(
+            codes, np.arange(len(self.entities)), side="left"
+        )
+
+    def asof(self, entity_codes: np.ndarray, seconds: np.ndarray) -> np.ndarray:
+        """
+        Row index of the as-of snapshot for each (entity, boundary).
+
+        Args:
+            entity_codes: Entity codes, shape (E,)
+            seconds: Boundary times, shape (I,)
+
+        Returns:
+            Row indexes, shape (E, I); -1 where no snapshot exists yet
+        """
+        if not len(self.keys) or not len(entity_codes):
+            return np.full((len(entity_codes), len(seconds)), -1, dtype=np.int64)
+
+        # Clip into each entity's key block so searches never cross blocks
+        offset = np.clip(seconds - self.t_min, -0.5, self.t_span - 1.0)
+        query = entity_codes[:, None] * self.t_span + offset[None, :]
+        rows = np.searchsorted(self.keys, query, side="right") - 1
+        starts = self.block_start[entity_codes][:, None]
+        return np.where(rows >= starts, rows, -1)
+
+    def gather(self, rows: np.ndarray) -> np.ndarray:
+        """Snapshot values for row indexes (zeros where row == -1)"""
+        out = np.zeros(rows.shape + (len(self.fields),), dtype=float)
+        found = rows >= 0
+        out[found] = self.values[rows[found]]
+        return out
+
+
+class IntervalBatchEngine:
+    """
+    Vectorized interval box score engine for a single game.
+
+    Usage:
+        engine = IntervalBatchEngine(conn, game_id)
+        df = engine.calculate(calc.get_1sec_intervals_regulation())
+    """
+
+    def __init__(self, conn: sqlite3.Connection, game_id: str):
+        """
+        Load the game's snapshot tables
+
+        Args:
+            conn: SQLite connection with temporal box score snapshots
+            game_id: Game identifier
+        """
+        self.game_id = game_id
+
+        players = pd.read_sql_query(
+            "SELECT * FROM player_box_score_snapshots WHERE game_id = ?",
+            conn,
+            params=(game_id,),
+        )
+        teams = pd.read_sql_query(
+            "SELECT * FROM team_box_score_snapshots WHERE game_id = ?",
+            conn,
+            params=(game_id,),
+        )
+
+        self.players = _SnapshotTable(players, "player_id", PLAYER_DELTA_FIELDS)
+        self.teams = _SnapshotTable(teams, "team_id", TEAM_DELTA_FIELDS)
+
+        # Opponent of each team: first other team in the game (-1 if none)
+        n_teams = len(self.teams.entities)
+        self.opponent = np.array(
+            [next((j for j in range(n_teams) if j != i), -1) for i in range(n_teams)],
+            dtype=np.int64,
+        )
+
+    @property
+    def player_ids(self) -> List[str]:
+        """Players with at least one snapshot in this game"""
+        return list(self.players.entities)
+
+    def calculate(
+        self, intervals: Sequence, player_ids: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Calculate interval stats for every player × interval
+
+        Args:
+            intervals: TimeInterval objects
+            player_ids: Players to include (default: every player in the game)
+
+        Returns:
+            DataFrame with one row per (player, interval). ``has_data`` is
+            False where the player had no snapshot by the interval end; those
+            rows carry zero stats.
+        """
+        if player_ids is None:
+            player_ids = self.player_ids
+        player_ids = list(player_ids)
+
+        starts = np.array([iv.start_seconds for iv in intervals], dtype=float)
+        ends = np.array([iv.end_seconds for iv in intervals], dtype=float)
+        n_players, n_intervals = len(player_ids), len(intervals)
+
+        # Players without any snapshot get an out-of-range code (never found)
+        codes = np.array(
+            [self.players.index.get(pid, -1) for pid in player_ids], dtype=np.int64
+        )
+        known = codes >= 0
+        start_rows = np.full((n_players, n_intervals), -1, dtype=np.int64)
+        end_rows = np.full((n_players, n_intervals), -1, dtype=np.int64)
+        start_rows[known] = self.players.asof(codes[known], starts)
+        end_rows[known] = self.players.asof(codes[known], ends)
+
+        has_data = end_rows >= 0
+        deltas = self.players.gather(end_rows) - self.players.gather(start_rows)
+        deltas[~has_data] = 0.0
+        player = {f: deltas[..., k] for k, f in enumerate(PLAYER_DELTA_FIELDS)}
+
+        # Team context comes from the team_id on the player's end snapshot
+        team_ids = np.full((n_players, n_intervals), None, dtype=object)
+        team_ids[has_data] = self.players.team_ids[end_rows[has_data]]
+        has_team = has_data & np.array(
+            [pd.notna(t) and bool(t) for t in team_ids.ravel()], dtype=bool
+        ).reshape(team_ids.shape)
+
+        team_deltas = self._team_deltas(starts, ends)
+        team_codes = np.array(
+            [self.teams.index.get(t, -1) for t in team_ids.ravel()], dtype=np.int64
+        ).reshape(team_ids.shape)
+
+        # Opponent = any other team in the game (get_opponent_team_id), so a
+        # team missing from the team table still has one if any team exists
+        opp_codes = np.full(team_codes.shape, -1, dtype=np.int64)
+        if len(self.teams.entities):
+            opp_codes = np.where(
+                team_codes >= 0, self.opponent[np.maximum(team_codes, 0)], 0
+            )
+        has_opp = has_team & (opp_codes >= 0)
+
+        interval_idx = np.broadcast_to(np.arange(n_intervals), (n_players, n_intervals))
+        team = self._pick(team_deltas, team_codes, interval_idx)
+        opp = self._pick(team_deltas, opp_codes, interval_idx)
+
+        advanced = self._advanced_stats(player, team, opp, has_team, has_opp)
+
+        frame = pd.DataFrame(
+            {
+                "game_id": self.game_id,
+                "player_id": np.repeat(player_ids, n_intervals),
+                "team_id": team_ids.ravel(),
+                "interval": np.tile([iv.label for iv in intervals], n_players),
+                "interval_number": np.tile(
+                    [iv.interval_number for iv in intervals], n_players
+                ),
+                "start_seconds": np.tile(
+                    [iv.start_seconds for iv in intervals], n_players
+                ),
+                "end_seconds": np.tile([iv.end_seconds for iv in intervals], n_players),
+                "period": np.tile(
+                    np.array([iv.period for iv in intervals], dtype=object), n_players
+                ),
+                "has_data": has_data.ravel(),
+            }
+        )
+        for field in PLAYER_DELTA_FIELDS:
+            values = player[field].ravel()
+            frame[field] = values if field == "minutes" else values.astype(np.int64)
+        for field in ADVANCED_FIELDS:
+            frame[field] = np.where(has_data, advanced[field], 0.0).ravel()
+
+        return frame
+
+    def _team_deltas(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """Team interval deltas, shape (teams, intervals, fields)"""
+        codes = np.arange(len(self.teams.entities), dtype=np.int64)
+        start_rows = self.teams.asof(codes, starts)
+        end_rows = self.teams.asof(codes, ends)
+        deltas = self.teams.gather(end_rows) - self.teams.gather(start_rows)
+        # No team snapshot by interval end -> empty (all-zero) stats
+        deltas[end_rows < 0] = 0.0
+        return deltas
+
+    def _pick(
+        self, team_deltas: np.ndarray, codes: np.ndarray, interval_idx: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """Gather per-(player, interval) team stats; unknown teams are zeros"""
+        out = np.zeros(codes.shape + (len(TEAM_DELTA_FIELDS),), dtype=float)
+        found = codes >= 0
+        if found.any():
+            out[found] = team_deltas[codes[found], interval_idx[found]]
+        return {f: out[..., k] for k, f in enumerate(TEAM_DELTA_FIELDS)}
+
+    def _advanced_stats(
+        self,
+        stats: Dict[str, np.ndarray],
+        team: Dict[str, np.ndarray],
+        opp: Dict[str, np.ndarray],
+        has_team: np.ndarray,
+        has_opp: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Array form of IntervalBoxScoreCalculator._calculate_advanced_stats
+
+        Operations are written in the same order as the scalar version so
+        results match it exactly.
+        """
+        zeros = np.zeros_like(stats["points"])
+        advanced = {}
+
+        # Shooting efficiency
+        advanced["fg_pct"] = _ratio(stats["fgm"], stats["fga"]) * 100
+        advanced["efg_pct"] = (
+            _ratio(stats["fgm"] + 0.5 * stats["fg3m"], stats["fga"]) * 100
+        )
+        advanced["3par"] = _ratio(stats["fg3a"], stats["fga"]) * 100
+        advanced["ft_rate"] = _ratio(stats["fta"], stats["fga"])
+        advanced["fg3_pct"] = _ratio(stats["fg3m"], stats["fg3a"]) * 100
+        advanced["ft_pct"] = _ratio(stats["ftm"], stats["fta"]) * 100
+        ts_attempts = stats["fga"] + 0.44 * stats["fta"]
+        advanced["ts_pct"] = _ratio(stats["points"], 2 * ts_attempts) * 100
+
+        # Rebounding percentages (team and opponent context)
+        both = has_team & has_opp
+        advanced["orb_pct"] = (
+            _ratio(stats["oreb"], team["oreb"] + opp["dreb"], both) * 100
+        )
+        advanced["drb_pct"] = (
+            _ratio(stats["dreb"], team["dreb"] + opp["oreb"], both) * 100
+        )
+        total_rebs = team["oreb"] + team["dreb"] + opp["oreb"] + opp["dreb"]
+        advanced["trb_pct"] = _ratio(stats["reb"], total_rebs, both) * 100
+
+        # Playmaking & defense. Team interval stats carry no minutes column,
+        # matching calculate_team_interval_stats.
+        minutes = stats["minutes"]
+        team_minutes = team.get("minutes", zeros)
+        playing = has_team & (minutes > 0) & (team_minutes > 0)
+
+        teammate_fgm = team["fgm"] - stats["fgm"]
+        advanced["ast_pct"] = (
+            _ratio(
+                stats["ast"] * team_minutes,
+                minutes * teammate_fgm,
+                playing & (teammate_fgm > 0),
+            )
+            * 100
+        )
+
+        opp_poss = _possessions(opp)
+        advanced["stl_pct"] = (
+            _ratio(
+                stats["stl"] * team_minutes,
+                minutes * opp_poss,
+                playing & has_opp & (opp_poss > 0),
+            )
+            * 100
+        )
+
+        opp_2pt_fga = opp["fga"] - opp["fg3a"]
+        advanced["blk_pct"] = (
+            _ratio(
+                stats["blk"] * team_minutes,
+                minutes * opp_2pt_fga,
+                playing & has_opp & (opp_2pt_fga > 0),
+            )
+            * 100
+        )
+
+        tov_possessions = stats["fga"] + 0.44 * stats["fta"] + stats["tov"]
+        advanced["tov_pct"] = _ratio(stats["tov"], tov_possessions) * 100
+
+        # Usage & efficiency
+        team_poss_events = team["fga"] + 0.44 * team["fta"] + team["tov"]
+        player_poss_events = stats["fga"] + 0.44 * stats["fta"] + stats["tov"]
+        advanced["usg_pct"] = (
+            _ratio(
+                player_poss_events * team_minutes,
+                team_poss_events * minutes,
+                playing & (team_poss_events > 0),
+            )
+            * 100
+        )
+
+        player_poss = _possessions(stats)
+        advanced["ortg"] = (_ratio(stats["points"], player_poss)) * 100
+        advanced["drtg"] = (
+            _ratio(opp["points"], opp_poss, has_opp & (minutes > 0))
+        ) * 100
+
+        # BPM (simplified)
+        pts_per_100 = (_ratio(stats["points"], player_poss)) * 100
+        reb_per_100 = (_ratio(stats["reb"], player_poss)) * 100
+        ast_per_100 = (_ratio(stats["ast"], player_poss)) * 100
+        stocks_per_100 = (_ratio(stats["stl"] + stats["blk"], player_poss)) * 100
+        tov_per_100 = (_ratio(stats["tov"], player_poss)) * 100
+        bpm = (
+            (pts_per_100 - 15) * 0.15
+            + (reb_per_100 - 10) * 0.35
+            + (ast_per_100 - 5) * 0.70
+            + (stocks_per_100 - 3) * 0.70
+            - (tov_per_100 - 3) * 0.30
+        )
+        advanced["bpm"] = np.where(player_poss > 0, bpm, 0.0)
+
+        # Assist to turnover ratio (raw assists when no turnovers)
+        advanced["ast_to_tov"] = np.where(
+            stats["tov"] > 0,
+            _ratio(stats["ast"], stats["tov"]),
+            np.where(stats["ast"] > 0, stats["ast"], 0.0),
+        )
+
+        return advanced
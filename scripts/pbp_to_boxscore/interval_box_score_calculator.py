@@ -16,12 +16,24 @@ All intervals include complete advanced statistics.
 
 Created: October 19, 2025
 Updated: October 19, 2025 - Added second and decisecond intervals
+Updated: October 19, 2025 - Batch helpers use the vectorized IntervalBatchEngine
 """
 
 import sqlite3
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
+import pandas as pd
+
+try:
+    from .interval_batch_engine import (
+        IntervalBatchEngine, INTERVAL_FIELDS, PLAYER_DELTA_FIELDS, ADVANCED_FIELDS
+    )
+except ImportError:
+    from interval_batch_engine import (
+        IntervalBatchEngine, INTERVAL_FIELDS, PLAYER_DELTA_FIELDS, ADVANCED_FIELDS
+    )
+
 
 @dataclass
 class TimeInterval:
@@ -835,6 +847,59 @@ class IntervalBoxScoreCalculator:
     # BATCH CALCULATIONS
     # ========================================================================
 
+    def calculate_intervals_batch(self, game_id: str, intervals: List[TimeInterval],
+                                  player_ids: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Calculate stats for many players × intervals in one vectorized pass
+
+        Loads the game's snapshots once and resolves every interval boundary
+        with an as-of search, instead of issuing snapshot queries per player
+        per interval (see IntervalBatchEngine).
+
+        Args:
+            game_id: Game identifier
+            intervals: TimeInterval objects
+            player_ids: Players to include (default: every player in the game)
+
+        Returns:
+            DataFrame with one row per (player, interval): interval fields,
+            has_data, the 16 delta stats and all advanced statistics
+
+        Example:
+            df = calc.calculate_intervals_batch('game123', calc.get_1sec_intervals_regulation())
+        """
+        return IntervalBatchEngine(self.conn, game_id).calculate(intervals, player_ids)
+
+    def _batch_interval_records(self, game_id: str, player_id: str,
+                                intervals: List[TimeInterval]) -> List[Dict]:
+        """
+        Per-interval dictionaries for one player, computed in batch
+
+        Records match calculate_interval_stats() key for key.
+        """
+        frame = self.calculate_intervals_batch(game_id, intervals, [player_id])
+        columns = INTERVAL_FIELDS + PLAYER_DELTA_FIELDS + ADVANCED_FIELDS
+
+        results = []
+        for interval, has_data, row in zip(intervals, frame['has_data'],
+                                           frame[columns].itertuples(index=False, name=None)):
+            if not has_data:
+                results.append(self._empty_interval_stats(interval))
+                continue
+
+            stats = dict(zip(columns, row))
+            stats['interval_number'] = interval.interval_number
+            stats['start_seconds'] = interval.start_seconds
+            stats['end_seconds'] = interval.end_seconds
+            stats['period'] = interval.period
+            for field in PLAYER_DELTA_FIELDS:
+                stats[field] = stats[field].item() if hasattr(stats[field], 'item') else stats[field]
+            for field in ADVANCED_FIELDS:
+                stats[field] = float(stats[field])
+            results.append(stats)
+
+        return results
+
     def calculate_all_regulation_intervals(self, game_id: str, player_id: str,
                                           interval_type: str = '6min') -> List[Dict]:
         """
@@ -849,8 +914,8 @@ class IntervalBoxScoreCalculator:
             List of interval stat dictionaries
 
         Note:
-            For '1sec', returns 2,880 intervals. This may take longer to compute.
-            Consider using calculate_seconds_range() for specific time ranges.
+            For '1sec', returns 2,880 intervals. For many players at once, use
+            calculate_intervals_batch() to get a DataFrame in one pass.
         """
         # Get intervals based on type
         if interval_type == '6min':
@@ -866,13 +931,8 @@ class IntervalBoxScoreCalculator:
         else:
             raise ValueError(f"Unknown interval type: {interval_type}")
 
-        # Calculate stats for each interval
-        results = []
-        for interval in intervals:
-            stats = self.calculate_interval_stats(game_id, player_id, interval)
-            results.append(stats)
-
-        return results
+        # Calculate stats for every interval in one vectorized pass
+        return self._batch_interval_records(game_id, player_id, intervals)
 
     def calculate_all_ot_intervals(self, game_id: str, player_id: str,
                                   ot_period: int, interval_type: str = 'half') -> List[Dict]:
@@ -903,12 +963,7 @@ class IntervalBoxScoreCalculator:
         else:
             raise ValueError(f"Unknown OT interval type: {interval_type}")
 
-        results = []
-        for interval in intervals:
-            stats = self.calculate_interval_stats(game_id, player_id, interval)
-            results.append(stats)
-
-        return results
+        return self._batch_interval_records(game_id, player_id, intervals)
 
     def calculate_seconds_range(self, game_id: str, player_id: str,
                                start_second: int, end_second: int,
@@ -932,12 +987,7 @@ class IntervalBoxScoreCalculator:
         """
         intervals = self.get_1sec_intervals_range(start_second, end_second, period)
 
-        results = []
-        for interval in intervals:
-            stats = self.calculate_interval_stats(game_id, player_id, interval)
-            results.append(stats)
-
-        return results
+        return self._batch_interval_records(game_id, player_id, intervals)
 
     def calculate_deciseconds_range(self, game_id: str, player_id: str,
                                    start_second: float, end_second: float,
@@ -961,12 +1011,7 @@ class IntervalBoxScoreCalculator:
         """
         intervals = self.get_decisecond_intervals_range(start_second, end_second, period)
 
-        results = []
-        for interval in intervals:
-            stats = self.calculate_interval_stats(game_id, player_id, interval)
-            results.append(stats)
-
-        return results
+        return self._batch_interval_records(game_id, player_id, intervals)
 
     # ========================================================================
     # PLAYER BIOGRAPHICAL DATA INTEGRATION
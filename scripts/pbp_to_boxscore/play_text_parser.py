@@ -44,7 +44,8 @@ Each parsed play returns a dictionary with:
 
 import re
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -137,20 +138,81 @@ class ParsedPlay:
     original_text: str = ""
 
 
+# Pattern try order (most specific first), the handler for each pattern, and
+# the keywords it needs: the pattern can only match if every keyword of at
+# least one group appears in the lowercased play text. Checking keywords is
+# a few C-level substring tests, so most plays run a single regex.
+PATTERN_DISPATCH: Tuple[Tuple[str, str, Tuple[Tuple[str, ...], ...]], ...] = (
+    # Free throws (must check FIRST before regular FG patterns)
+    ("ft_made", "_parse_free_throw_made", (("free", "make"),)),
+    ("ft_missed", "_parse_free_throw_missed", (("free", "miss"),)),
+    # Three pointers (must check before regular FG)
+    ("fg_made_3pt", "_parse_three_point_made", (("three", "make"),)),
+    ("fg_missed_3pt", "_parse_three_point_missed", (("three", "miss"),)),
+    # Regular field goals
+    ("fg_made_2pt", "_parse_field_goal_made", (("make",),)),
+    ("fg_missed_2pt", "_parse_field_goal_missed", (("miss",),)),
+    # Rebounds
+    ("rebound_def", "_parse_defensive_rebound", (("defensive", "rebound"),)),
+    ("rebound_off", "_parse_offensive_rebound", (("offensive", "rebound"),)),
+    # Steals
+    ("steal", "_parse_steal", (("steal",),)),
+    # Blocks (standalone - not part of shot attempt)
+    ("block_standalone", "_parse_block_standalone", (("block",),)),
+    # Turnovers
+    (
+        "turnover",
+        "_parse_turnover",
+        (("bad",), ("lost",), ("traveling",), ("offensive",)),
+    ),
+    # Fouls
+    ("foul_personal", "_parse_personal_foul", (("foul",),)),
+    ("foul_technical", "_parse_technical_foul", (("technical",),)),
+    # Substitutions
+    ("substitution", "_parse_substitution", (("enter",),)),
+    # Timeout
+    ("timeout", "_parse_timeout", (("timeout",),)),
+    # Jump Ball
+    ("jumpball", "_parse_jumpball", (("jump",),)),
+)
+
+
 class PlayTextParser:
     """
     Parses natural language NBA play-by-play text into structured events.
 
     Uses regex patterns to identify play types and extract player names,
     actions, and stat updates.
+
+    parse() only tries the patterns whose keywords appear in the play text
+    (usually one), and memoizes results per play text in a bounded LRU
+    cache.
     """
 
-    def __init__(self):
-        """Initialize the parser with regex patterns."""
+    DEFAULT_CACHE_SIZE = 8192
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize the parser with regex patterns.
+
+        Args:
+            cache_size: Distinct play texts to memoize (0 disables the cache)
+        """
         self.patterns = self._compile_patterns()
         self.stats_parsed = 0
         self.stats_failed = 0
 
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache: "OrderedDict[str, ParsedPlay]" = OrderedDict()
+
+        # (pattern, handler, keyword groups) in try order
+        self._dispatch = [
+            (self.patterns[name], getattr(self, handler), groups)
+            for name, handler, groups in PATTERN_DISPATCH
+        ]
+
     def _compile_patterns(self) -> Dict[str, re.Pattern]:
         """
         Compile regex patterns for all play types.
@@ -279,92 +341,120 @@ class PlayTextParser:
         """
         play_text = play_text.strip()
 
-        # Try each pattern in order of specificity
-        # (More specific patterns first to avoid false matches)
-
-        # Free throws (must check FIRST before regular FG patterns)
-        match = self.patterns["ft_made"].match(play_text)
-        if match:
-            return self._parse_free_throw_made(match, play_text, team_id)
-
-        match = self.patterns["ft_missed"].match(play_text)
-        if match:
-            return self._parse_free_throw_missed(match, play_text, team_id)
-
-        # Three pointers (must check before regular FG)
-        match = self.patterns["fg_made_3pt"].match(play_text)
-        if match:
-            return self._parse_three_point_made(match, play_text, team_id)
-
-        match = self.patterns["fg_missed_3pt"].match(play_text)
-        if match:
-            return self._parse_three_point_missed(match, play_text, team_id)
-
-        # Regular field goals
-        match = self.patterns["fg_made_2pt"].match(play_text)
-        if match:
-            return self._parse_field_goal_made(match, play_text, team_id)
-
-        match = self.patterns["fg_missed_2pt"].match(play_text)
-        if match:
-            return self._parse_field_goal_missed(match, play_text, team_id)
-
-        # Rebounds
-        match = self.patterns["rebound_def"].match(play_text)
-        if match:
-            return self._parse_defensive_rebound(match, play_text, team_id)
-
-        match = self.patterns["rebound_off"].match(play_text)
-        if match:
-            return self._parse_offensive_rebound(match, play_text, team_id)
-
-        # Steals
-        match = self.patterns["steal"].match(play_text)
-        if match:
-            return self._parse_steal(match, play_text, team_id)
-
-        # Blocks (standalone - not part of shot attempt)
-        if "block_standalone" in self.patterns:
-            match = self.patterns["block_standalone"].match(play_text)
+        cached = self._cache.get(play_text) if self.cache_size else None
+        if cached is not None:
+            self._cache.move_to_end(play_text)
+            self.cache_hits += 1
+            if cached.action_type is ActionType.UNKNOWN:
+                self.stats_failed += 1
+            else:
+                self.stats_parsed += 1
+            return self._copy_parsed(cached, team_id)
+
+        self.cache_misses += 1
+        parsed = self._parse_dispatch(play_text)
+
+        if self.cache_size:
+            self._cache[play_text] = parsed
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return self._copy_parsed(parsed, team_id)
+
+        parsed.team_id = team_id
+        return parsed
+
+    def parse_many(
+        self,
+        play_texts: Iterable[str],
+        team_ids: Optional[Iterable[Optional[str]]] = None,
+    ) -> List[ParsedPlay]:
+        """
+        Parse many play texts (e.g. a whole game) in one call.
+
+        Args:
+            play_texts: Play descriptions
+            team_ids: Team identifier per play (optional)
+
+        Returns:
+            ParsedPlay objects in input order
+        """
+        parse = self.parse
+        if team_ids is None:
+            return [parse(text) for text in play_texts]
+        return [parse(text, team_id) for text, team_id in zip(play_texts, team_ids)]
+
+    def parse_sequential(
+        self, play_text: str, team_id: Optional[str] = None
+    ) -> ParsedPlay:
+        """
+        Parse by trying every pattern in order, without dispatch or caching.
+
+        Reference implementation for parse(); kept for validation and
+        benchmarking.
+
+        Args:
+            play_text: Natural language play description
+            team_id: Team identifier (if known)
+
+        Returns:
+            ParsedPlay object with extracted information
+        """
+        play_text = play_text.strip()
+
+        for pattern, handler, _ in self._dispatch:
+            match = pattern.match(play_text)
             if match:
-                return self._parse_block_standalone(match, play_text, team_id)
+                return handler(match, play_text, team_id)
 
-        # Turnovers
-        match = self.patterns["turnover"].match(play_text)
-        if match:
-            return self._parse_turnover(match, play_text, team_id)
+        return self._parse_unknown(play_text, team_id)
 
-        # Fouls
-        match = self.patterns["foul_personal"].match(play_text)
-        if match:
-            return self._parse_personal_foul(match, play_text, team_id)
+    def cache_info(self) -> Dict[str, int]:
+        """Get parse cache statistics."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._cache),
+            "max_size": self.cache_size,
+        }
 
-        match = self.patterns["foul_technical"].match(play_text)
-        if match:
-            return self._parse_technical_foul(match, play_text, team_id)
+    def clear_cache(self):
+        """Drop all memoized parses."""
+        self._cache.clear()
 
-        # Substitutions
-        match = self.patterns["substitution"].match(play_text)
-        if match:
-            return self._parse_substitution(match, play_text, team_id)
+    def _parse_dispatch(self, play_text: str) -> ParsedPlay:
+        """Try only the patterns whose keywords appear in the text."""
+        lowered = play_text.lower()
 
-        # Timeout
-        match = self.patterns["timeout"].match(play_text)
-        if match:
-            return self._parse_timeout(match, play_text, team_id)
+        for pattern, handler, groups in self._dispatch:
+            for keywords in groups:
+                if all(keyword in lowered for keyword in keywords):
+                    match = pattern.match(play_text)
+                    if match:
+                        return handler(match, play_text, None)
+                    break
 
-        # Jump Ball
-        match = self.patterns["jumpball"].match(play_text)
-        if match:
-            return self._parse_jumpball(match, play_text, team_id)
+        return self._parse_unknown(play_text, None)
 
-        # No match found
+    def _parse_unknown(self, play_text: str, team_id: Optional[str]) -> ParsedPlay:
+        """Record a parse failure."""
         self.stats_failed += 1
         logger.debug(f"Failed to parse: {play_text}")
         return ParsedPlay(
             action_type=ActionType.UNKNOWN, original_text=play_text, team_id=team_id
         )
 
+    @staticmethod
+    def _copy_parsed(parsed: ParsedPlay, team_id: Optional[str]) -> ParsedPlay:
+        """Independent copy of a cached parse for one caller."""
+        # Shallow field copy without re-running the dataclass __init__
+        clone = ParsedPlay.__new__(ParsedPlay)
+        clone.__dict__.update(parsed.__dict__)
+        clone.team_id = team_id
+        clone.stat_updates = {
+            player: dict(updates) for player, updates in parsed.stat_updates.items()
+        }
+        return clone
+
     # ========================================================================
     # PARSING METHODS FOR EACH PLAY TYPE
     # ========================================================================
@@ -57,7 +57,7 @@ import sys
 import logging
 import psycopg2
 from psycopg2.extras import RealDictCursor, execute_values
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
@@ -401,8 +401,7 @@ class RDSPBPProcessor:
             if away_lineup:
                 tracker.set_starting_lineup(game_info["away_team_id"], away_lineup)
 
-            # Process each event
-            snapshots = []
+            # Process each event (snapshots are kept by the tracker)
             parse_failures = 0
 
             for idx, event in enumerate(events, start=1):
@@ -416,8 +415,8 @@ class RDSPBPProcessor:
                     parse_failures += 1
                     logger.debug(f"Failed to parse: {event['play_text']}")
 
-                # Process event and create snapshot
-                snapshot = tracker.process_event(
+                # Process event and record snapshot
+                tracker.process_event(
                     event_num=idx,
                     period=event["period_number"],
                     clock_display=event["clock_display"] or "0:00",
@@ -427,8 +426,6 @@ class RDSPBPProcessor:
                     away_score=event["away_score"] or 0,
                 )
 
-                snapshots.append(snapshot)
-
                 # Progress logging
                 if idx % 100 == 0:
                     logger.info(f"  Processed {idx}/{len(events)} events...")
@@ -439,14 +436,17 @@ class RDSPBPProcessor:
             )
 
             # Save to database (if not dry run)
+            snapshot_count = len(tracker.snapshot_store)
             if save_to_db and not self.dry_run:
-                self._save_snapshots_to_db(game_id, snapshots)
-                logger.info(f"✓ Saved {len(snapshots)} snapshots to database")
+                self._save_snapshots_to_db(
+                    game_id, tracker.get_all_snapshots(), snapshot_count
+                )
+                logger.info(f"✓ Saved {snapshot_count} snapshots to database")
 
             # Update stats
             self.stats["games_processed"] += 1
             self.stats["events_processed"] += len(events)
-            self.stats["snapshots_created"] += len(snapshots)
+            self.stats["snapshots_created"] += snapshot_count
             self.stats["parse_failures"] += parse_failures
 
             elapsed = time.time() - start_time
@@ -455,7 +455,7 @@ class RDSPBPProcessor:
                 "success": True,
                 "game_id": game_id,
                 "events_processed": len(events),
-                "snapshots_created": len(snapshots),
+                "snapshots_created": snapshot_count,
                 "parse_failures": parse_failures,
                 "parse_success_rate": (len(events) - parse_failures) / len(events),
                 "elapsed_seconds": elapsed,
@@ -471,29 +471,32 @@ class RDSPBPProcessor:
 
             return {"success": False, "game_id": game_id, "error": str(e)}
 
-    def _save_snapshots_to_db(self, game_id: str, snapshots: List[GameState]):
+    def _save_snapshots_to_db(
+        self, game_id: str, snapshots: Iterable[GameState], snapshot_count: int
+    ):
         """
         Save snapshots to database.
 
         Args:
             game_id: Game identifier
-            snapshots: List of GameState snapshots
+            snapshots: GameState snapshots (lazy iterator from the tracker)
+            snapshot_count: Number of snapshots in ``snapshots``
         """
         # This is a placeholder - actual implementation would insert into:
         # - box_score_snapshots
         # - player_snapshot_stats
         # - game_state_snapshots
 
-        logger.info(f"Saving {len(snapshots)} snapshots for game {game_id}...")
+        logger.info(f"Saving {snapshot_count} snapshots for game {game_id}...")
 
         # TODO: Implement database insertion
         # For now, just log what we would save
 
-        logger.debug(f"Would insert into box_score_snapshots: {len(snapshots)} rows")
+        logger.debug(f"Would insert into box_score_snapshots: {snapshot_count} rows")
         logger.debug(
-            f"Would insert into player_snapshot_stats: ~{len(snapshots) * 10} rows"
+            f"Would insert into player_snapshot_stats: ~{snapshot_count * 10} rows"
         )
-        logger.debug(f"Would insert into game_state_snapshots: {len(snapshots)} rows")
+        logger.debug(f"Would insert into game_state_snapshots: {snapshot_count} rows")
 
     def process_games(self, game_ids: List[str]) -> List[Dict[str, Any]]:
         """
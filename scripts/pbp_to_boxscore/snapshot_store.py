@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Snapshot Store - Keyframe + Delta Storage for GameStateTracker
+
+Purpose: Store per-event game state snapshots without deep-copying the full state
+Created: October 19, 2025
+
+=== OVERVIEW ===
+
+GameStateTracker used to ``copy.deepcopy`` the whole GameState after every
+play-by-play event, so memory grew with events × players. SnapshotStore keeps:
+
+1. A player registry (append-only: player_id, name, team)
+2. Columnar "tail" arrays holding the latest value of every stat (one
+   ``array`` per stat, indexed by player)
+3. Per-event scalar columns (event_num, period, clock, scores, text, time)
+4. Per-event deltas: only the (player, stat, new value) cells that changed
+5. Full keyframes of the stat columns every ``keyframe_interval`` events
+
+Any snapshot is rebuilt on demand from the nearest keyframe plus at most
+``keyframe_interval - 1`` deltas.
+
+=== USAGE ===
+
+```python
+store = SnapshotStore(game_id="400827936", keyframe_interval=64)
+store.record(tracker.current_state)      # after every event
+
+snapshot = store.get_snapshot(event_num=120)
+for snapshot in store.iter_snapshots():  # lazy
+    ...
+```
+"""
+
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    from .game_state_tracker import GameState, PlayerState
+except ImportError:
+    from game_state_tracker import GameState, PlayerState
+
+# Integer PlayerState columns (on_court stored as 0/1)
+INT_FIELDS: Tuple[str, ...] = (
+    "points",
+    "fgm",
+    "fga",
+    "fg3m",
+    "fg3a",
+    "ftm",
+    "fta",
+    "oreb",
+    "dreb",
+    "reb",
+    "ast",
+    "stl",
+    "blk",
+    "tov",
+    "pf",
+    "plus_minus",
+    "on_court",
+)
+
+# Float PlayerState columns
+FLOAT_FIELDS: Tuple[str, ...] = ("minutes_played",)
+
+
+class SnapshotStore:
+    """
+    Columnar keyframe + delta storage for GameState snapshots.
+
+    Snapshots are addressed by position (order recorded) and by event_num.
+    Rebuilt snapshots are new GameState objects, so callers may mutate them
+    freely without affecting the store.
+    """
+
+    DEFAULT_KEYFRAME_INTERVAL = 64
+
+    def __init__(
+        self, game_id: str, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL
+    ):
+        """
+        Initialize SnapshotStore.
+
+        Args:
+            game_id: Game identifier (copied onto rebuilt snapshots)
+            keyframe_interval: Events between full keyframes
+        """
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be >= 1")
+
+        self.game_id = game_id
+        self.keyframe_interval = keyframe_interval
+
+        # Player registry (append-only, insertion order preserved)
+        self._player_ids: List[str] = []
+        self._player_names: List[str] = []
+        self._player_teams: List[Optional[str]] = []
+        self._player_index: Dict[str, int] = {}
+
+        # Latest value of every stat column
+        self._tail_ints: List[array] = [array("i") for _ in INT_FIELDS]
+        self._tail_floats: List[array] = [array("d") for _ in FLOAT_FIELDS]
+
+        # Per-event scalar columns
+        self._event_nums = array("i")
+        self._periods = array("i")
+        self._home_scores = array("i")
+        self._away_scores = array("i")
+        self._timestamps: List[Optional[datetime]] = []
+        self._player_counts = array("i")
+        self._lineup_refs = array("i")
+        self._clocks: List[str] = []
+        self._texts: List[str] = []
+
+        # Distinct lineup states: (home, away, home_hash, away_hash)
+        self._lineups: List[
+            Tuple[frozenset, frozenset, Optional[str], Optional[str]]
+        ] = []
+
+        # Deltas in CSR layout: event i owns [offsets[i], offsets[i + 1])
+        self._int_delta_cells = array("i")  # player * len(INT_FIELDS) + field
+        self._int_delta_values = array("i")
+        self._int_delta_offsets = array("i", [0])
+        self._float_delta_cells = array("i")
+        self._float_delta_values = array("d")
+        self._float_delta_offsets = array("i", [0])
+
+        # Keyframes: position -> (int columns, float columns)
+        self._keyframe_positions = array("i")
+        self._keyframes: List[Tuple[List[array], List[array]]] = []
+
+        # First position recorded for each event_num
+        self._event_positions: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        """Number of recorded snapshots."""
+        return len(self._event_nums)
+
+    # =========================================================================
+    # Recording
+    # =========================================================================
+
+    def record(self, state: GameState) -> int:
+        """
+        Record the given state as the next snapshot.
+
+        Only cells that differ from the previous snapshot are stored. The
+        state itself is not retained.
+
+        Args:
+            state: Current (mutable) game state
+
+        Returns:
+            Position of the recorded snapshot
+        """
+        position = len(self._event_nums)
+        n_int = len(INT_FIELDS)
+
+        for player_id, player in state.players.items():
+            index = self._player_index.get(player_id)
+            if index is None:
+                index = self._register_player(player)
+
+            for field_idx, name in enumerate(INT_FIELDS):
+                value = int(getattr(player, name))
+                column = self._tail_ints[field_idx]
+                if column[index] != value:
+                    column[index] = value
+                    self._int_delta_cells.append(index * n_int + field_idx)
+                    self._int_delta_values.append(value)
+
+            for field_idx, name in enumerate(FLOAT_FIELDS):
+                value = float(getattr(player, name))
+                column = self._tail_floats[field_idx]
+                if column[index] != value:
+                    column[index] = value
+                    self._float_delta_cells.append(
+                        index * len(FLOAT_FIELDS) + field_idx
+                    )
+                    self._float_delta_values.append(value)
+
+        self._int_delta_offsets.append(len(self._int_delta_cells))
+        self._float_delta_offsets.append(len(self._float_delta_cells))
+
+        # Scalars
+        self._event_nums.append(state.event_num)
+        self._periods.append(state.period)
+        self._home_scores.append(state.home_score)
+        self._away_scores.append(state.away_score)
+        self._timestamps.append(state.timestamp)
+        self._player_counts.append(len(self._player_ids))
+        self._clocks.append(state.clock_display)
+        self._texts.append(state.last_event_text)
+        self._lineup_refs.append(self._lineup_ref(state))
+        self._event_positions.setdefault(state.event_num, position)
+
+        if position % self.keyframe_interval == 0:
+            self._keyframe_positions.append(position)
+            self._keyframes.append(
+                (
+                    [array("i", column) for column in self._tail_ints],
+                    [array("d", column) for column in self._tail_floats],
+                )
+            )
+
+        return position
+
+    def _register_player(self, player: PlayerState) -> int:
+        """Add a player to the registry and extend every tail column."""
+        index = len(self._player_ids)
+        self._player_ids.append(player.player_id)
+        self._player_names.append(player.player_name)
+        self._player_teams.append(player.team_id)
+        self._player_index[player.player_id] = index
+
+        for column in self._tail_ints:
+            column.append(0)
+        for column in self._tail_floats:
+            column.append(0.0)
+        return index
+
+    def _lineup_ref(self, state: GameState) -> int:
+        """Return the index of the state's lineup, appending it if it changed."""
+        if self._lineups:
+            home, away, home_hash, away_hash = self._lineups[-1]
+            if (
+                home_hash == state.home_lineup_hash
+                and away_hash == state.away_lineup_hash
+                and home == state.home_lineup
+                and away == state.away_lineup
+            ):
+                return len(self._lineups) - 1
+
+        self._lineups.append(
+            (
+                frozenset(state.home_lineup),
+                frozenset(state.away_lineup),
+                state.home_lineup_hash,
+                state.away_lineup_hash,
+            )
+        )
+        return len(self._lineups) - 1
+
+    # =========================================================================
+    # Retrieval
+    # =========================================================================
+
+    def get_snapshot(self, event_num: int) -> Optional[GameState]:
+        """
+        Rebuild the first snapshot recorded for an event number.
+
+        Args:
+            event_num: Event number
+
+        Returns:
+            GameState, or None if the event was never recorded
+        """
+        position = self._event_positions.get(event_num)
+        if position is None:
+            return None
+        return self.get_snapshot_at(position)
+
+    def get_snapshot_at(self, position: int) -> GameState:
+        """
+        Rebuild the snapshot at a recorded position.
+
+        Args:
+            position: Snapshot position (0-based, negative indexes allowed)
+
+        Returns:
+            GameState
+        """
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError(f"snapshot position {position} out of range")
+
+        keyframe_idx = bisect_right(self._keyframe_positions, position) - 1
+        start = self._keyframe_positions[keyframe_idx]
+        ints, floats = self._keyframes[keyframe_idx]
+        ints = [array("i", column) for column in ints]
+        floats = [array("d", column) for column in floats]
+
+        self._apply_deltas(ints, floats, start + 1, position + 1)
+        return self._materialize(position, ints, floats)
+
+    def iter_snapshots(self) -> Iterator[GameState]:
+        """
+        Lazily rebuild every snapshot in recorded order.
+
+        Deltas are replayed forward once, so a full iteration costs
+        O(total deltas + snapshots × players).
+
+        Yields:
+            GameState objects
+        """
+        if not len(self):
+            return
+
+        ints = [array("i", column) for column in self._keyframes[0][0]]
+        floats = [array("d", column) for column in self._keyframes[0][1]]
+
+        for position in range(len(self)):
+            if position:
+                self._apply_deltas(ints, floats, position, position + 1)
+            yield self._materialize(position, ints, floats)
+
+    def latest(self) -> Optional[GameState]:
+        """Rebuild the most recent snapshot from the tail columns."""
+        if not len(self):
+            return None
+        return self._materialize(len(self) - 1, self._tail_ints, self._tail_floats)
+
+    def _apply_deltas(
+        self, ints: List[array], floats: List[array], first: int, stop: int
+    ):
+        """Apply deltas of positions [first, stop) to the working columns."""
+        n_int = len(INT_FIELDS)
+        n_float = len(FLOAT_FIELDS)
+
+        # Columns may be shorter than the registry if players joined later
+        n_players = self._player_counts[stop - 1]
+        for column in ints:
+            if len(column) < n_players:
+                column.extend([0] * (n_players - len(column)))
+        for column in floats:
+            if len(column) < n_players:
+                column.extend([0.0] * (n_players - len(column)))
+
+        cells = self._int_delta_cells
+        values = self._int_delta_values
+        for i in range(self._int_delta_offsets[first], self._int_delta_offsets[stop]):
+            player, field_idx = divmod(cells[i], n_int)
+            ints[field_idx][player] = values[i]
+
+        cells = self._float_delta_cells
+        values = self._float_delta_values
+        for i in range(
+            self._float_delta_offsets[first], self._float_delta_offsets[stop]
+        ):
+            player, field_idx = divmod(cells[i], n_float)
+            floats[field_idx][player] = values[i]
+
+    def _materialize(
+        self, position: int, ints: List[array], floats: List[array]
+    ) -> GameState:
+        """Build a GameState for a position from working columns."""
+        players: Dict[str, PlayerState] = {}
+        for index in range(self._player_counts[position]):
+            values = {name: ints[f][index] for f, name in enumerate(INT_FIELDS)}
+            values["on_court"] = bool(values["on_court"])
+            for f, name in enumerate(FLOAT_FIELDS):
+                values[name] = floats[f][index]
+
+            player_id = self._player_ids[index]
+            players[player_id] = PlayerState(
+                player_id=player_id,
+                player_name=self._player_names[index],
+                team_id=self._player_teams[index],
+                **values,
+            )
+
+        home, away, home_hash, away_hash = self._lineups[self._lineup_refs[position]]
+
+        return GameState(
+            game_id=self.game_id,
+            event_num=self._event_nums[position],
+            period=self._periods[position],
+            clock_display=self._clocks[position],
+            home_score=self._home_scores[position],
+            away_score=self._away_scores[position],
+            players=players,
+            home_lineup=set(home),
+            away_lineup=set(away),
+            home_lineup_hash=home_hash,
+            away_lineup_hash=away_hash,
+            last_event_text=self._texts[position],
+            timestamp=self._timestamps[position],
+        )
@@ -77,7 +77,14 @@ class ReconciliationPipeline:
             "dry_run": {"enabled": False, "save_results": True},
         }
 
-    def run(self, steps="all", use_cache=False, full_scan=False, dry_run=False):
+    def run(
+        self,
+        steps="all",
+        use_cache=False,
+        full_scan=False,
+        dry_run=False,
+        use_aws_inventory=False,
+    ):
         """
         Run reconciliation pipeline
 
@@ -86,6 +93,7 @@ class ReconciliationPipeline:
             use_cache: Use cached S3 inventory instead of scanning
             full_scan: Force full S3 scan (disable sampling)
             dry_run: Don't save task queue
+            use_aws_inventory: Read AWS S3 Inventory reports instead of listing
 
         Returns:
             dict: Pipeline results
@@ -112,7 +120,9 @@ class ReconciliationPipeline:
                     self.results["inventory"] = self._load_cached_inventory()
                 else:
                     logger.info("\n[Step 1/4] Scanning S3...")
-                    self.results["inventory"] = self._scan_s3(full_scan=full_scan)
+                    self.results["inventory"] = self._scan_s3(
+                        full_scan=full_scan, use_aws_inventory=use_aws_inventory
+                    )
             else:
                 logger.info("\n[Step 1/4] Skipped (using existing inventory)")
                 self.results["inventory"] = self._load_cached_inventory()
@@ -157,8 +167,31 @@ class ReconciliationPipeline:
             self.results["error"] = str(e)
             return self.results
 
-    def _scan_s3(self, full_scan=False):
-        """Run S3 inventory scanner"""
+    def _scan_s3(self, full_scan=False, use_aws_inventory=False):
+        """Run S3 inventory scanner (or the AWS S3 Inventory report reader)"""
+        if use_aws_inventory:
+            cmd = [
+                sys.executable,
+                "scripts/reconciliation/aws_s3_inventory.py",
+                "--data-bucket",
+                self.config["s3"]["bucket"],
+                "--fallback-to-sample",
+            ]
+        else:
+            cmd = self._scanner_cmd(full_scan)
+
+        result = subprocess.run(
+            cmd, capture_output=True, text=True
+        )  # nosec B603 - cmd is internally constructed, no user input
+
+        if result.returncode != 0:
+            raise Exception(f"S3 scan failed: {result.stderr}")
+
+        logger.info("S3 scan completed successfully")
+        return self._load_cached_inventory()
+
+    def _scanner_cmd(self, full_scan=False):
+        """Build the scan_s3_inventory.py command"""
         cmd = [
             sys.executable,
             "scripts/reconciliation/scan_s3_inventory.py",
@@ -171,15 +204,7 @@ class ReconciliationPipeline:
         else:
             cmd.append("--full")
 
-        result = subprocess.run(
-            cmd, capture_output=True, text=True
-        )  # nosec B603 - cmd is internally constructed, no user input
-
-        if result.returncode != 0:
-            raise Exception(f"S3 scan failed: {result.stderr}")
-
-        logger.info("S3 scan completed successfully")
-        return self._load_cached_inventory()
+        return cmd
 
     def _load_cached_inventory(self):
         """Load cached S3 inventory"""
@@ -379,6 +404,11 @@ Examples:
     parser.add_argument(
         "--dry-run", action="store_true", help="Run pipeline but don't save task queue"
     )
+    parser.add_argument(
+        "--use-aws-inventory",
+        action="store_true",
+        help="Read AWS S3 Inventory reports instead of listing the bucket",
+    )
 
     args = parser.parse_args()
 
@@ -391,6 +421,7 @@ Examples:
         use_cache=args.use_cache,
         full_scan=args.full_scan,
         dry_run=args.dry_run,
+        use_aws_inventory=args.use_aws_inventory,
     )
 
     # Exit with appropriate code
@@ -23,14 +23,18 @@ Usage:
 
 import boto3
 import json
-import re
 import random
+import sys
 from datetime import datetime
 from collections import defaultdict
 from pathlib import Path
 import argparse
 import logging
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from nba_simulator.adce.coverage import parse_s3_path
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
@@ -188,12 +192,8 @@ class S3InventoryScanner:
         """
         Extract metadata from S3 path
 
-        Handles various path patterns:
-        - nba_pbp/espn/2023-24/play_by_play_401579404.json
-        - nba_box_score/espn/2023-24/box_score_401579404.json
-        - basketball_ref/2022-23/advanced_202212010LAL.html
-        - hoopr_parquet/2023-24_pbp.parquet
-        - nba_schedule_json/2024-25/schedule.json
+        Delegates to nba_simulator.adce.coverage.parse_s3_path, which the
+        in-process ReconciliationEngine uses as well.
 
         Args:
             s3_key: S3 object key (path)
@@ -201,71 +201,7 @@ class S3InventoryScanner:
         Returns:
             dict: Extracted metadata
         """
-        parts = s3_key.split("/")
-        filename = parts[-1] if parts else s3_key
-
-        metadata = {
-            "source": None,
-            "season": None,
-            "data_type": None,
-            "game_id": None,
-            "player_id": None,
-            "team_id": None,
-        }
-
-        # Identify source from path
-        path_lower = s3_key.lower()
-        if "espn" in path_lower:
-            metadata["source"] = "espn"
-        elif "basketball_ref" in path_lower or "bbref" in path_lower:
-            metadata["source"] = "basketball_reference"
-        elif "nba_api" in path_lower or "nba_stats" in path_lower:
-            metadata["source"] = "nba_api"
-        elif "hoopr" in path_lower:
-            metadata["source"] = "hoopr"
-        elif "kaggle" in path_lower:
-            metadata["source"] = "kaggle"
-
-        # Extract season (YYYY-YY pattern like 2023-24)
-        season_match = re.search(r"(20\d{2}-\d{2})", s3_key)
-        if season_match:
-            metadata["season"] = season_match.group(1)
-
-        # Extract data type from path/filename
-        if "play_by_play" in path_lower or "pbp" in path_lower:
-            metadata["data_type"] = "play_by_play"
-        elif "box_score" in path_lower or "boxscore" in path_lower:
-            metadata["data_type"] = "box_scores"
-        elif "schedule" in path_lower:
-            metadata["data_type"] = "schedule"
-        elif "player" in path_lower:
-            metadata["data_type"] = "player_stats"
-        elif "team" in path_lower:
-            metadata["data_type"] = "team_stats"
-        elif "advanced" in path_lower:
-            metadata["data_type"] = "advanced_stats"
-        elif "tracking" in path_lower:
-            metadata["data_type"] = "player_tracking"
-        elif "dashboard" in path_lower:
-            metadata["data_type"] = "team_dashboards"
-
-        # Extract IDs from filename
-        # Game ID: 401579404 or 202212010LAL (9+ digits or date pattern)
-        game_id_match = re.search(r"(\d{9,}|20\d{6}[A-Z]{3})", filename)
-        if game_id_match:
-            metadata["game_id"] = game_id_match.group(1)
-
-        # Player ID: player_2544.json
-        player_id_match = re.search(r"player_?(\d+)", filename)
-        if player_id_match:
-            metadata["player_id"] = player_id_match.group(1)
-
-        # Team ID: team_1610612747.json
-        team_id_match = re.search(r"team_?(\d+)", filename)
-        if team_id_match:
-            metadata["team_id"] = team_id_match.group(1)
-
-        return metadata
+        return parse_s3_path(s3_key)
 
     def _add_to_index(self, index_dict, metadata):
         """Add metadata to aggregated index"""
@@ -104,8 +104,11 @@ Examples:
   # Dry run (validation only)
   %(prog)s --season 2024 --dry-run --report
   
-  # Resume interrupted extraction
-  %(prog)s --resume --resume-from game_id_123
+  # Resume interrupted extraction (skips checkpointed games)
+  %(prog)s --resume --parallel 8
+
+  # Reprocess every game, ignoring checkpoints
+  %(prog)s --force
         """,
     )
 
@@ -138,25 +141,29 @@ Examples:
         "--parallel",
         type=int,
         metavar="N",
-        help="Number of games to process in parallel (default: from config)",
+        help="Number of worker processes (default: from config)",
     )
     process_group.add_argument(
-        "--batch-size",
+        "--chunk-size",
         type=int,
         metavar="N",
-        help="Batch size for database queries (default: from config)",
+        help="Games fetched per events query / COPY transaction (default: 50)",
     )
     process_group.add_argument(
-        "--resume", action="store_true", help="Resume from interrupted extraction"
+        "--batch-size",
+        type=int,
+        metavar="N",
+        help="Batch size for database queries (default: from config)",
     )
     process_group.add_argument(
-        "--resume-from",
-        type=str,
-        metavar="GAME_ID",
-        help="Resume from specific game ID",
+        "--resume",
+        action="store_true",
+        help="Resume from interrupted extraction (default; skips checkpointed games)",
     )
     process_group.add_argument(
-        "--force", action="store_true", help="Force overwrite existing possessions"
+        "--force",
+        action="store_true",
+        help="Clear checkpoints and overwrite existing possessions",
     )
 
     # Validation options
@@ -243,6 +250,9 @@ def validate_arguments(args: argparse.Namespace) -> None:
     if args.dry_run and args.force:
         raise ValueError("Cannot use --dry-run with --force")
 
+    if args.resume and args.force:
+        raise ValueError("Cannot use --resume with --force")
+
     if args.validation_only and args.dry_run:
         raise ValueError("Cannot use --validation-only with --dry-run")
 
@@ -341,10 +351,15 @@ def main() -> int:
         try:
             # Run extraction
             limit = None  # No limit - extract all games
-            resume_from = args.resume_from if args.resume_from else None
+            resume = not args.force
 
-            logger.info(f"Starting extraction (resume_from={resume_from})")
-            results = extractor.extract_all_games(limit=limit, resume_from=resume_from)
+            logger.info(
+                f"Starting extraction (resume={resume}, "
+                f"workers={config.processing.parallel_games})"
+            )
+            results = extractor.extract_all_games(
+                limit=limit, resume=resume, chunk_size=args.chunk_size
+            )
 
             logger.info("")
             logger.info("=" * 70)
@@ -0,0 +1,368 @@
+"""
+Tests for the blocking-based dedup engine
+
+Covers name/team normalization, MinHash LSH candidate generation for
+players, sorted-neighborhood blocking for games, vectorized scoring,
+clustered merge decisions, bulk writes, and the DeduplicationAgent
+'blocking' detection method.
+"""
+
+import random
+import string
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from psycopg2 import sql
+
+from nba_simulator.agents.dedup_engine import (
+    DedupEngine,
+    MinHashLSH,
+    normalize_player_name,
+    normalize_team_code,
+)
+from nba_simulator.agents.deduplication import DeduplicationAgent
+
+
+def random_name(rng: random.Random) -> str:
+    first = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 8)))
+    last = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 10)))
+    return f"{first.title()} {last.title()}"
+
+
+@pytest.fixture
+def players():
+    rng = random.Random(7)
+    names = [random_name(rng) for _ in range(3000)]
+    names += [
+        "Nikola Jokić",
+        "Nikola Jokic",
+        "Gary Payton II",
+        "Gary Payton",
+        "Shaquille O'Neal",
+        "Shaquille ONeal",
+    ]
+    return pd.DataFrame(
+        {
+            "player_id": [f"p{i:05d}" for i in range(len(names))],
+            "player_name": names,
+            "position": None,
+            "team_id": None,
+        }
+    )
+
+
+@pytest.fixture
+def games():
+    return pd.DataFrame(
+        [
+            # ESPN and Basketball Reference copies of the same game
+            ("espn_1", "2024-01-15", "BOS", "NY", 118, 110),
+            ("bbref_1", "2024-01-15", "BOS", "NYK", 118, 110),
+            # Timezone-shifted date, home/away swapped, no score yet
+            ("hoopr_1", "2024-01-16", "NYK", "BOS", None, None),
+            # Rematch a month later: same block, outside the date window
+            ("espn_2", "2024-02-15", "BOS", "NYK", 101, 99),
+            ("espn_3", "2024-01-15", "LAL", "GSW", 120, 115),
+            ("bbref_3", "2024-01-15", "LAL", "GS", 121, 115),
+        ],
+        columns=[
+            "game_id",
+            "game_date",
+            "home_team",
+            "away_team",
+            "home_score",
+            "away_score",
+        ],
+    )
+
+
+class TestNormalization:
+    """Names and team codes reduce to comparable keys"""
+
+    @pytest.mark.parametrize(
+        "name,normalized",
+        [
+            ("Nikola Jokić", "nikola jokic"),
+            ("Gary Payton II", "gary payton"),
+            ("Shaquille O'Neal", "shaquille oneal"),
+            ("P.J. Tucker", "pj tucker"),
+            ("  LeBron   James Jr. ", "lebron james"),
+            (None, ""),
+        ],
+    )
+    def test_normalize_player_name(self, name, normalized):
+        assert normalize_player_name(name) == normalized
+
+    def test_normalize_team_code(self):
+        assert normalize_team_code("gs") == "GSW"
+        assert normalize_team_code(" BRK ") == "BKN"
+        assert normalize_team_code("BOS") == "BOS"
+        assert normalize_team_code("Portland Trail Blazers") == "POR"
+        assert normalize_team_code("celtics") == "BOS"
+        assert normalize_team_code("New Orleans Hornets") == "NOP"
+        assert normalize_team_code("Charlotte Hornets") == "CHA"
+        assert normalize_team_code(float("nan")) == ""
+
+
+class TestMinHashLSH:
+    """Signatures estimate Jaccard similarity; buckets bound comparisons"""
+
+    def test_identical_texts_share_signatures(self):
+        lsh = MinHashLSH(num_perm=32, bands=8)
+        signatures = lsh.signatures(["kevin durant", "kevin durant", "tim duncan"])
+
+        assert signatures.shape == (3, 32)
+        assert (signatures[0] == signatures[1]).all()
+        assert (signatures[0] == signatures[2]).mean() < 0.3
+        assert lsh.candidate_pairs(signatures).tolist() == [[0, 1]]
+
+    def test_chunking_does_not_change_signatures(self):
+        texts = [f"player {i}" for i in range(25)]
+        whole = MinHashLSH(chunk_size=1000).signatures(texts)
+        chunked = MinHashLSH(chunk_size=7).signatures(texts)
+
+        np.testing.assert_array_equal(whole, chunked)
+
+    def test_bands_must_divide_signature(self):
+        with pytest.raises(ValueError):
+            MinHashLSH(num_perm=64, bands=10)
+
+
+class TestPlayerDuplicates:
+    """MinHash LSH over normalized names"""
+
+    def test_finds_variants_without_quadratic_comparisons(self, players):
+        engine = DedupEngine()
+        lsh = engine.lsh
+        signatures = lsh.signatures(
+            list(players["player_name"].map(normalize_player_name))
+        )
+
+        pairs = engine.find_player_duplicates(players)
+        candidates = lsh.candidate_pairs(signatures)
+
+        found = set(zip(pairs["id1"], pairs["id2"]))
+        assert ("p03000", "p03001") in found  # Jokić / Jokic
+        assert ("p03002", "p03003") in found  # Payton II / Payton
+        assert ("p03004", "p03005") in found  # O'Neal / ONeal
+        n = len(players)
+        assert len(candidates) < n * (n - 1) / 2 / 1000
+        assert (pairs["score"] >= engine.min_score).all()
+
+    def test_attributes_break_ties_between_namesakes(self):
+        players = pd.DataFrame(
+            {
+                "player_id": ["a", "b", "c"],
+                "player_name": ["Charles Smith", "Charles Smith", "Charles Smith"],
+                "position": ["F", "F", "G"],
+                "team_id": ["LAC", "LAC", "BOS"],
+            }
+        )
+
+        pairs = DedupEngine().find_player_duplicates(players)
+        scores = {(r.id1, r.id2): r.score for r in pairs.itertuples()}
+
+        assert scores[("a", "b")] == 100.0
+        assert scores[("a", "c")] == 90.0
+
+
+class TestGameDuplicates:
+    """Sorted neighborhood over unordered team-pair blocks"""
+
+    def test_scores(self, games):
+        pairs = DedupEngine(min_score=0).find_game_duplicates(games)
+        scores = {(r.id1, r.id2): r.score for r in pairs.itertuples()}
+
+        assert scores == {
+            ("bbref_1", "espn_1"): 100.0,
+            # Date off by one (20), swapped (10), score missing (20)
+            ("bbref_1", "hoopr_1"): 50.0,
+            ("espn_1", "hoopr_1"): 50.0,
+            # Same day and orientation, final scores differ
+            ("bbref_3", "espn_3"): 60.0,
+        }
+
+    def test_without_score_columns(self, games):
+        pairs = DedupEngine().find_game_duplicates(
+            games.drop(columns=["home_score", "away_score"])
+        )
+
+        assert list(zip(pairs["id1"], pairs["id2"], pairs["score"])) == [
+            ("bbref_1", "espn_1", 80.0),
+            ("bbref_3", "espn_3", 80.0),
+        ]
+
+
+class TestMergeDecisions:
+    """Clusters resolve to one survivor per strategy"""
+
+    @pytest.fixture
+    def records(self):
+        return pd.DataFrame(
+            {
+                "player_id": ["a", "b", "c", "d", "e"],
+                "position": ["F", None, "F", "G", "G"],
+                "team_id": ["LAC", None, None, "BOS", "BOS"],
+                "updated_at": [
+                    datetime(2024, 1, 1, tzinfo=timezone.utc),
+                    datetime(2025, 1, 1, tzinfo=timezone.utc),
+                    datetime(2023, 1, 1, tzinfo=timezone.utc),
+                    None,
+                    None,
+                ],
+            }
+        )
+
+    @pytest.fixture
+    def pairs(self):
+        return pd.DataFrame(
+            {
+                "id1": ["a", "b", "d"],
+                "id2": ["b", "c", "e"],
+                "score": [100.0, 96.0, 85.0],
+            }
+        )
+
+    def test_merge_keeps_most_complete(self, records, pairs):
+        decisions = DedupEngine().merge_decisions(records, pairs, "player_id")
+
+        assert decisions.to_dict("records") == [
+            {
+                "keep_id": "a",
+                "duplicate_id": "b",
+                "score": 100.0,
+                "action": "merge",
+                "strategy": "merge",
+            },
+            {
+                "keep_id": "a",
+                "duplicate_id": "c",
+                "score": 96.0,
+                "action": "merge",
+                "strategy": "merge",
+            },
+            {
+                "keep_id": "d",
+                "duplicate_id": "e",
+                "score": 85.0,
+                "action": "review",
+                "strategy": "merge",
+            },
+        ]
+
+    def test_latest_and_manual_strategies(self, records, pairs):
+        latest = DedupEngine(merge_strategy="latest").merge_decisions(
+            records, pairs, "player_id"
+        )
+        manual = DedupEngine(merge_strategy="manual").merge_decisions(
+            records, pairs, "player_id"
+        )
+
+        assert set(latest.loc[latest["action"] == "merge", "keep_id"]) == {"b"}
+        assert set(manual["action"]) == {"review"}
+
+    def test_no_pairs(self, records):
+        decisions = DedupEngine().merge_decisions(
+            records, pd.DataFrame(columns=["id1", "id2", "score"]), "player_id"
+        )
+
+        assert decisions.empty
+
+
+class TestDatabaseIO:
+    """Streaming reads and bulk decision writes"""
+
+    def test_load_frame_streams_chunks(self):
+        rows = [(f"p{i}", f"Player {i}") for i in range(5)]
+        cursor = MagicMock()
+        cursor.description = [("player_id",), ("player_name",)]
+        cursor.fetchmany.side_effect = [rows[:2], rows[2:4], rows[4:], []]
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+
+        frame = DedupEngine.load_frame(conn, "SELECT 1", chunk_size=2)
+
+        conn.cursor.assert_called_once_with(name="dedup_scan")
+        assert list(frame.columns) == ["player_id", "player_name"]
+        assert frame["player_id"].tolist() == [r[0] for r in rows]
+
+    @patch("nba_simulator.agents.dedup_engine.execute_values")
+    def test_write_decisions_in_pages(self, mock_execute_values):
+        decisions = pd.DataFrame(
+            {
+                "keep_id": ["a", "a"],
+                "duplicate_id": ["b", "c"],
+                "score": [100.0, 96.0],
+                "action": ["merge", "merge"],
+                "strategy": ["merge", "merge"],
+            }
+        )
+        conn = MagicMock()
+
+        written = DedupEngine().write_decisions(conn, "players", decisions)
+
+        assert written == 2
+        (_, query, rows), kwargs = mock_execute_values.call_args
+        assert sql.Identifier("dedup_decisions") in query.seq
+        assert rows[1][:6] == ("players", "a", "c", 96.0, "merge", "merge")
+        assert kwargs["page_size"] == 5000
+
+
+class TestDeduplicationAgentBlocking:
+    """DeduplicationAgent with detection_method='blocking'"""
+
+    @pytest.fixture
+    def agent(self, games):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agent = DeduplicationAgent(
+                config={
+                    "detection_method": "blocking",
+                    "tables_to_check": ["games"],
+                    "similarity_threshold": 95.0,
+                    "review_threshold": 50.0,
+                    "auto_merge": True,
+                    "column_map": {"games": {"home_team": "home_abbrev"}},
+                }
+            )
+            agent.state_dir = Path(tmpdir)
+
+            @contextmanager
+            def get_connection():
+                yield MagicMock()
+
+            agent._db = MagicMock()
+            agent._db.get_connection = get_connection
+            yield agent
+
+    def test_validate_detection_method(self, agent):
+        assert agent._validate_config() is True
+        agent.detection_method = "fuzzy"
+        assert agent._validate_config() is False
+
+    @patch("nba_simulator.agents.dedup_engine.DedupEngine.write_decisions")
+    @patch("nba_simulator.agents.dedup_engine.DedupEngine.load_frame")
+    def test_execute_core(self, mock_load, mock_write, agent, games):
+        mock_load.return_value = games
+
+        assert agent._execute_core() is True
+
+        query = mock_load.call_args[0][1]
+        assert "home_abbrev AS home_team" in query
+        assert "LIMIT" not in query
+        assert len(agent.duplicates_found["games"]) == 4
+        decisions = mock_write.call_args[0][2]
+        assert decisions["action"].value_counts().to_dict() == {
+            "review": 2,
+            "merge": 1,
+        }
+        assert agent.duplicates_merged["games"] == 1
+        assert agent.duplicates_flagged["games"] == 2
+        # hoopr_1 is reviewed against the merged game's survivor only
+        review = decisions[decisions["action"] == "review"]
+        assert sorted(review["duplicate_id"]) == ["espn_3", "hoopr_1"]
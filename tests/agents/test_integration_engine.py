@@ -0,0 +1,332 @@
+"""
+Tests for the set-based cross-source game comparison engine
+
+Covers canonical game keys, hash-join plus nearest-date alignment,
+columnar field diffs, vectorized conflict resolution, one query per
+source per season, parallel seasons, bulk conflict writes, and the
+IntegrationAgent 'bulk' comparison mode.
+"""
+
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from psycopg2 import sql
+
+from nba_simulator.agents.integration import IntegrationAgent
+from nba_simulator.agents.integration_engine import (
+    CONFLICT_COLUMNS,
+    GameComparisonEngine,
+    align_sources,
+    canonicalize,
+    field_conflicts,
+)
+
+COLUMNS = [
+    "game_id",
+    "game_date",
+    "home_team",
+    "away_team",
+    "home_score",
+    "away_score",
+    "collected_at",
+]
+
+OLD = datetime(2024, 1, 1, tzinfo=timezone.utc)
+NEW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+SOURCE_ROWS = {
+    "espn": [
+        # UTC timestamp: local game day is the 14th
+        ("e1", "2024-01-15T00:30:00Z", "BOS", "NY", 118, 110, NEW),
+        ("e2", "2024-01-16", "LAL", "GS", 120, 115, NEW),
+        ("e3", "2024-01-17", "MIA", "ORL", 99, 98, NEW),
+    ],
+    "hoopr": [
+        ("h1", "2024-01-14", "Boston Celtics", "New York Knicks", 118, 111, OLD),
+        (
+            "h2",
+            "2024-01-16",
+            "Los Angeles Lakers",
+            "Golden State Warriors",
+            120,
+            115,
+            OLD,
+        ),
+        ("h4", "2024-01-20", "Utah Jazz", "Phoenix Suns", 101, 99, OLD),
+    ],
+    "nba_api": [
+        ("n1", "2024-01-14", "BOS", "NYK", 118, 110, OLD),
+        ("n2", "2024-01-16", "LAL", "GSW", None, None, OLD),
+    ],
+}
+
+
+def source_frame(source):
+    return pd.DataFrame(SOURCE_ROWS[source], columns=COLUMNS)
+
+
+class FakeConnection:
+    """psycopg2 connection stand-in serving SOURCE_ROWS by source"""
+
+    def __init__(self, log):
+        self.log = log
+        self.closed = False
+        self.commits = 0
+
+    def cursor(self):
+        conn = self
+        cursor = MagicMock()
+        cursor.description = [(c,) for c in COLUMNS]
+
+        def execute(query, params=None):
+            if params is None:
+                return
+            conn.log.append((params["source"], params["season"]))
+            cursor.fetchall.return_value = SOURCE_ROWS.get(params["source"], [])
+
+        cursor.execute.side_effect = execute
+        context = MagicMock()
+        context.__enter__.return_value = cursor
+        return context
+
+    def commit(self):
+        self.commits += 1
+
+    def close(self):
+        self.closed = True
+
+
+class TestAlignment:
+    """Canonical keys, hash join and nearest-date fallback"""
+
+    def test_canonical_key_normalizes_team_names(self):
+        hoopr = canonicalize(source_frame("hoopr"))
+
+        assert list(hoopr["game_key"]) == [
+            "20240114_BOS_NYK",
+            "20240116_LAL_GSW",
+            "20240120_UTA_PHX",
+        ]
+
+    def test_canonical_key_skips_unknown_teams(self):
+        games = pd.DataFrame.from_records(
+            [
+                ("x1", "2024-01-16", None, "LAL", 100, 90, NEW),
+                ("x2", "2024-01-16", "BOS", "NY", 100, 90, NEW),
+            ],
+            columns=COLUMNS,
+        )
+
+        assert list(canonicalize(games)["game_key"]) == ["20240116_BOS_NYK"]
+
+    def test_canonicalize_empty_frame(self):
+        games = canonicalize(pd.DataFrame(columns=COLUMNS))
+
+        assert games.empty
+        assert {"home_code", "away_code", "game_day", "game_key"} <= set(games)
+
+    def test_align_exact_then_nearest_date(self):
+        aligned, unmatched_espn, unmatched_hoopr = align_sources(
+            canonicalize(source_frame("espn")), canonicalize(source_frame("hoopr"))
+        )
+
+        by_key = aligned.set_index("game_key")
+        assert by_key.loc["20240116_LAL_GSW", "match_type"] == "exact"
+        assert by_key.loc["20240115_BOS_NYK", "match_type"] == "nearest_date"
+        assert by_key.loc["20240115_BOS_NYK", "game_id_2"] == "h1"
+        assert (unmatched_espn, unmatched_hoopr) == (1, 1)
+
+    def test_no_tolerance_is_exact_only(self):
+        aligned, unmatched_espn, _ = align_sources(
+            canonicalize(source_frame("espn")),
+            canonicalize(source_frame("hoopr")),
+            date_tolerance_days=0,
+        )
+
+        assert list(aligned["game_key"]) == ["20240116_LAL_GSW"]
+        assert unmatched_espn == 2
+
+    def test_field_conflicts(self):
+        aligned, _, _ = align_sources(
+            canonicalize(source_frame("espn")), canonicalize(source_frame("nba_api"))
+        )
+
+        conflicts = field_conflicts(
+            aligned, ["home_score", "away_score", "game_date", "attendance"]
+        )
+
+        # Missing nba_api scores are not conflicts; the shifted date is
+        assert conflicts[["game_key", "field", "value1", "value2"]].to_dict(
+            "records"
+        ) == [
+            {
+                "game_key": "20240115_BOS_NYK",
+                "field": "game_date",
+                "value1": "2024-01-15",
+                "value2": "2024-01-14",
+            }
+        ]
+
+
+class TestResolution:
+    """Vectorized conflict resolution strategies"""
+
+    @pytest.fixture
+    def conflicts(self):
+        aligned, _, _ = align_sources(
+            canonicalize(source_frame("hoopr")), canonicalize(source_frame("espn"))
+        )
+        return field_conflicts(aligned, ["away_score"])
+
+    @pytest.mark.parametrize(
+        "strategy,resolved,method",
+        [
+            ("latest", "110", "latest"),
+            ("majority", "111", "majority"),
+            ("manual", None, "manual_review_required"),
+        ],
+    )
+    def test_strategies(self, conflicts, strategy, resolved, method):
+        engine = GameComparisonEngine(conflict_resolution=strategy)
+
+        result = engine.resolve(conflicts)
+
+        assert result["resolved_value"].tolist() == [resolved]
+        assert result["resolution_method"].tolist() == [method]
+
+
+class TestGameComparisonEngine:
+    """Season queries, parallel seasons and bulk writes"""
+
+    def test_compare_season_queries_each_source_once(self):
+        log = []
+        engine = GameComparisonEngine()
+
+        results = engine.compare_season(
+            FakeConnection(log),
+            2024,
+            [("espn", "hoopr"), ("espn", "nba_api"), ("hoopr", "nba_api")],
+        )
+
+        assert sorted(log) == [("espn", 2024), ("hoopr", 2024), ("nba_api", 2024)]
+        assert [(r.source1, r.source2) for r in results] == [
+            ("espn", "hoopr"),
+            ("espn", "nba_api"),
+            ("hoopr", "nba_api"),
+        ]
+        espn_hoopr = results[0]
+        assert list(espn_hoopr.conflicts.columns) == CONFLICT_COLUMNS
+        assert espn_hoopr.conflict_fields["20240115_BOS_NYK"] == [
+            "away_score",
+            "game_date",
+        ]
+        assert espn_hoopr.unmatched == {"espn": 1, "hoopr": 1}
+
+    def test_source_names_and_queries(self):
+        log = []
+        engine = GameComparisonEngine(
+            source_names={"nba_api": "nba_stats"},
+            source_queries={"espn": "SELECT * FROM espn_games"},
+        )
+
+        engine.load_source(FakeConnection(log), "nba_api", 2023)
+
+        assert log == [("nba_stats", 2023)]
+
+    @patch("nba_simulator.agents.integration_engine.execute_values")
+    def test_compare_seasons_in_parallel(self, mock_execute_values):
+        log, connections = [], []
+
+        def connect():
+            conn = FakeConnection(log)
+            connections.append(conn)
+            return conn
+
+        engine = GameComparisonEngine()
+        results = engine.compare_seasons(
+            [2022, 2023, 2024],
+            [("espn", "hoopr")],
+            connect=connect,
+            max_workers=3,
+            conflicts_table="integration_conflicts",
+        )
+
+        assert [r.season for r in results] == [2022, 2023, 2024]
+        assert len(log) == 6
+        assert len(connections) == 3
+        assert all(c.closed and c.commits == 1 for c in connections)
+        assert mock_execute_values.call_count == 3
+        rows = mock_execute_values.call_args[0][2]
+        assert len(rows) == 2
+        assert len(rows[0]) == len(CONFLICT_COLUMNS) + 1
+
+    @patch("nba_simulator.agents.integration_engine.execute_values")
+    def test_write_conflicts(self, mock_execute_values):
+        engine = GameComparisonEngine(conflict_resolution="manual")
+        conflicts = engine.compare_season(
+            FakeConnection([]), 2024, [("espn", "hoopr")]
+        )[0].conflicts
+
+        written = engine.write_conflicts(MagicMock(), conflicts)
+
+        assert written == 2
+        (_, query, rows), kwargs = mock_execute_values.call_args
+        assert sql.Identifier("integration_conflicts") in query.seq
+        assert rows[0][0] == 2024
+        assert rows[0][7] is None
+        assert kwargs["page_size"] == 5000
+        assert engine.write_conflicts(MagicMock(), conflicts.iloc[:0]) == 0
+
+
+class TestIntegrationAgentBulk:
+    """IntegrationAgent with comparison_mode='bulk'"""
+
+    @pytest.fixture
+    def agent(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agent = IntegrationAgent(
+                config={
+                    "comparison_mode": "bulk",
+                    "seasons": [2023, 2024],
+                    "min_integration_score": 50.0,
+                    "conflicts_table": None,
+                }
+            )
+            agent.state_dir = Path(tmpdir)
+            yield agent
+
+    def test_validate_config(self, agent):
+        assert agent._validate_config() is True
+
+        agent.seasons = []
+        assert agent._validate_config() is False
+        assert "seasons" in agent.errors[-1]
+
+        agent.comparison_mode = "stream"
+        assert agent._validate_config() is False
+
+    @patch("nba_simulator.agents.integration.get_database_connection")
+    def test_execute_core(self, mock_connect, agent):
+        log = []
+        mock_connect.side_effect = lambda: FakeConnection(log)
+
+        assert agent._execute_core() is True
+
+        # espn, basketball_reference, hoopr: one query each per season
+        assert len(log) == 6
+        # Two seasons x (espn-hoopr: 2 games, espn-bbref: none)
+        assert len(agent.matches) == 4
+        assert {m.game_id for m in agent.matches} == {
+            "20240115_BOS_NYK",
+            "20240116_LAL_GSW",
+        }
+        assert len(agent.conflicts) == 4
+        assert agent.conflicts[0].resolution_method == "latest"
+        assert agent.unmatched_games["espn"] == 2 * 1 + 2 * 3
+        report = agent.get_integration_report()
+        assert report["total_matches"] == 4
+        assert report["unmatched_games"]["hoopr"] == 2
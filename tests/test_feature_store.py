@@ -19,7 +19,14 @@ from collections import OrderedDict
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts/ml"))
 
 # Import from the module
-from feature_store import FeatureType, FeatureStatus, FeatureMetadata, LRUCache, logger
+from feature_store import (
+    FeatureMetadata,
+    FeatureStatus,
+    FeatureStore,
+    FeatureType,
+    LRUCache,
+    logger,
+)
 
 
 # Fixtures
@@ -619,3 +626,252 @@ def test_lru_cache_empty_dict_value(lru_cache):
     result = lru_cache.get("empty_dict")
     assert result == {}
     assert isinstance(result, dict)
+
+
+# Columnar Backend Tests
+
+
+@pytest.fixture
+def columnar_store(tmp_path):
+    """Fixture for a columnar feature store with one numeric feature."""
+    store = FeatureStore(storage_path=tmp_path, backend="columnar")
+    store.register_feature("player_ppg", "v1", FeatureType.NUMERIC, "Points per game")
+    yield store
+    store.close()
+
+
+def test_unknown_backend_raises_error(tmp_path):
+    """Test unknown backend names are rejected."""
+    with pytest.raises(ValueError):
+        FeatureStore(storage_path=tmp_path, backend="parquet-ish")
+
+
+def test_columnar_store_and_get_feature(columnar_store, tmp_path):
+    """Test single values round-trip through buffered columnar writes."""
+    assert columnar_store.store_feature("player_ppg", "v1", "p1", 28.5)
+    columnar_store.clear_cache()
+
+    # Served from the write buffer before any part exists
+    assert columnar_store.get_feature("player_ppg", "v1", "p1") == 28.5
+    assert not list((tmp_path / "features").glob("*.pkl"))
+
+    columnar_store.flush()
+    columnar_store.clear_cache()
+    assert columnar_store.get_feature("player_ppg", "v1", "p1") == 28.5
+    assert len(list((tmp_path / "columnar").rglob("part-*.arrow"))) == 1
+
+
+def test_columnar_latest_write_wins(columnar_store):
+    """Test later writes overwrite earlier values for the same entity."""
+    columnar_store.store_features_batch("player_ppg", "v1", {"p1": 10.0, "p2": 20.0})
+    columnar_store.flush()
+    columnar_store.store_features_batch("player_ppg", "v1", {"p1": 11.0})
+
+    frame = columnar_store.get_features_frame("player_ppg", "v1", ["p2", "p1", "p9"])
+
+    assert list(frame.index) == ["p2", "p1"]
+    assert frame["value"].tolist() == [20.0, 11.0]
+
+
+def test_columnar_interleaved_reads_do_not_flush(columnar_store, tmp_path):
+    """Test reads serve buffered rows without writing tiny parts."""
+    for i in range(20):
+        columnar_store.store_features_batch("player_ppg", "v1", {f"p{i}": float(i)})
+        frame = columnar_store.get_features_frame("player_ppg", "v1", ["p0", f"p{i}"])
+        assert frame["value"].tolist()[-1] == float(i)
+
+    assert not list((tmp_path / "columnar").rglob("part-*.arrow"))
+    history = columnar_store.columnar.history("player_ppg", "v1")
+    assert history["entity_id"].tolist() == [f"p{i}" for i in range(20)]
+
+    columnar_store.flush()
+    assert len(list((tmp_path / "columnar").rglob("part-*.arrow"))) == 1
+
+
+def test_columnar_batch_read_and_compute_missing(columnar_store):
+    """Test batch reads vectorize stored values and compute the rest."""
+    columnar_store.feature_functions["player_ppg:v1"] = lambda entity_id: 1.5
+    columnar_store.store_features_batch(
+        "player_ppg", "v1", {f"p{i}": float(i) for i in range(100)}
+    )
+
+    results = columnar_store.get_features_batch(
+        "player_ppg", "v1", ["p3", "p99", "new"]
+    )
+    assert results == {"p3": 3.0, "p99": 99.0, "new": 1.5}
+
+    results = columnar_store.get_features_batch(
+        "player_ppg", "v1", ["missing"], compute_if_missing=False
+    )
+    assert results == {}
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        {"p1": 1, "p2": 2},
+        {"p1": True, "p2": False},
+        {"p1": "guard", "p2": "center"},
+        {"p1": [0.1, 0.2], "p2": [0.3, 0.4]},
+        {"p1": {"home": 1.0}, "p2": {"away": 2.0}},
+    ],
+)
+def test_columnar_value_types_roundtrip(columnar_store, values):
+    """Test native and pickled value encodings round-trip."""
+    columnar_store.store_features_batch("player_ppg", "v1", values)
+    columnar_store.flush()
+
+    assert columnar_store.get_features_batch("player_ppg", "v1", list(values)) == values
+
+
+def test_columnar_compact_keeps_latest(columnar_store, tmp_path):
+    """Test compaction merges parts without changing visible values."""
+    for i in range(3):
+        columnar_store.store_features_batch("player_ppg", "v1", {"p1": float(i)})
+        columnar_store.flush()
+
+    assert columnar_store.columnar.compact("player_ppg", "v1") == 3
+    assert len(list((tmp_path / "columnar").rglob("part-*.arrow"))) == 1
+
+    columnar_store.clear_cache()
+    assert columnar_store.get_feature("player_ppg", "v1", "p1") == 2.0
+
+
+def test_columnar_delete_feature_drops_partition(columnar_store, tmp_path):
+    """Test deleting a feature removes its columnar partition."""
+    columnar_store.store_features_batch("player_ppg", "v1", {"p1": 1.0})
+    columnar_store.flush()
+
+    assert columnar_store.delete_feature("player_ppg", "v1")
+    assert not list((tmp_path / "columnar").rglob("part-*.arrow"))
+
+
+def test_migrate_pickle_store(tmp_path):
+    """Test pickle values are migrated into columnar partitions."""
+    pickle_store = FeatureStore(storage_path=tmp_path)
+    pickle_store.register_feature("ppg", "v1", FeatureType.NUMERIC, "PPG")
+    pickle_store.register_feature("role", "v2", FeatureType.CATEGORICAL, "Role")
+    for i in range(5):
+        pickle_store.store_feature("ppg", "v1", f"p{i}", float(i))
+        pickle_store.store_feature("role", "v2", f"p{i}", f"role{i}")
+    (tmp_path / "features" / "orphan.pkl").write_bytes(
+        pickle.dumps({"value": 1, "timestamp": "2024-01-01T00:00:00", "entity_id": "x"})
+    )
+
+    store = FeatureStore(storage_path=tmp_path, backend="columnar")
+    stats = store.migrate_pickle_store(remove_pickles=True)
+
+    assert stats == {"migrated": 10, "unmatched": 1, "failed": 0}
+    assert len(list((tmp_path / "features").glob("*.pkl"))) == 1
+    frame = store.get_features_frame("ppg", "v1", ["p4", "p0"])
+    assert frame["value"].tolist() == [4.0, 0.0]
+    assert store.get_feature("role", "v2", "p3") == "role3"
+
+
+# Point-in-time (as-of) Join Tests
+
+
+def asof_entities():
+    """Entity/timestamp frame around writes at Jan 1 and Jan 3."""
+    import pandas as pd
+
+    return pd.DataFrame(
+        {
+            "player_id": [101, 101, 101, 101, 202],
+            "tipoff": pd.to_datetime(
+                [
+                    "2024-01-04",  # after both writes
+                    "2023-12-31",  # before any write
+                    "2024-01-03",  # exactly at the second write
+                    "2024-01-02",  # between writes
+                    "2024-01-05",  # entity never written
+                ]
+            ),
+        },
+        index=list("abcde"),
+    )
+
+
+def test_columnar_asof_join_has_no_leakage(columnar_store):
+    """Test each row only sees values stored at or before its timestamp."""
+    columnar_store.register_feature("player_rpg", "v1", FeatureType.NUMERIC, "RPG")
+    columnar_store.store_feature("player_ppg", "v1", "101", 20.0, datetime(2024, 1, 1))
+    columnar_store.store_feature("player_ppg", "v1", "101", 25.0, datetime(2024, 1, 3))
+    columnar_store.store_feature("player_rpg", "v1", "101", 7.0, datetime(2024, 1, 2))
+
+    result = columnar_store.get_features_asof(
+        asof_entities(),
+        [("player_ppg", "v1"), ("player_rpg", "v1")],
+        entity_column="player_id",
+        timestamp_column="tipoff",
+    )
+
+    assert list(result.index) == list("abcde")
+    assert result["player_ppg"].tolist()[0] == 25.0
+    assert result["player_ppg"].isna().tolist() == [False, True, False, False, True]
+    assert result["player_ppg"].tolist()[2:4] == [25.0, 20.0]
+    assert result["player_rpg"].isna().tolist() == [False, True, False, False, True]
+
+
+def test_asof_join_disambiguates_versions(columnar_store):
+    """Test several versions of one feature get name:version columns."""
+    columnar_store.register_feature("player_ppg", "v2", FeatureType.NUMERIC, "PPG")
+    columnar_store.store_feature("player_ppg", "v1", "101", 1.0, datetime(2024, 1, 1))
+    columnar_store.store_feature("player_ppg", "v2", "101", 2.0, datetime(2024, 1, 1))
+
+    result = columnar_store.get_features_asof(
+        asof_entities(),
+        [("player_ppg", "v1"), ("player_ppg", "v2")],
+        entity_column="player_id",
+        timestamp_column="tipoff",
+    )
+
+    assert result.loc["a", "player_ppg:v1"] == 1.0
+    assert result.loc["a", "player_ppg:v2"] == 2.0
+
+
+def test_pickle_asof_join_uses_latest_value_timestamp(tmp_path):
+    """Test the pickle backend hides values stored after the event."""
+    store = FeatureStore(storage_path=tmp_path)
+    store.register_feature("player_ppg", "v1", FeatureType.NUMERIC, "PPG")
+    store.store_feature("player_ppg", "v1", "101", 25.0, datetime(2024, 1, 3))
+
+    result = store.get_features_asof(
+        asof_entities(),
+        [("player_ppg", "v1")],
+        entity_column="player_id",
+        timestamp_column="tipoff",
+    )
+
+    assert result["player_ppg"].isna().tolist() == [False, True, False, True, True]
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_columnar_batch_read_benchmark(tmp_path):
+    """Columnar batch reads beat per-entity pickle reads."""
+    entity_ids = [f"player_{i}" for i in range(5000)]
+    values = {entity_id: float(i) for i, entity_id in enumerate(entity_ids)}
+
+    timings = {}
+    for backend in ("pickle", "columnar"):
+        store = FeatureStore(
+            storage_path=tmp_path / backend, enable_cache=False, backend=backend
+        )
+        store.register_feature("ppg", "v1", FeatureType.NUMERIC, "PPG")
+        store.store_features_batch("ppg", "v1", values)
+        store.flush()
+
+        start = time.perf_counter()
+        results = store.get_features_batch(
+            "ppg", "v1", entity_ids, compute_if_missing=False
+        )
+        timings[backend] = time.perf_counter() - start
+        assert results == values
+
+    print(
+        f"\n{len(entity_ids)} entities: pickle {timings['pickle']:.3f}s, "
+        f"columnar {timings['columnar']:.3f}s "
+        f"({timings['pickle'] / timings['columnar']:.0f}x)"
+    )
+    assert timings["columnar"] < timings["pickle"]
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Tests for market_evaluator
+
+Each game is simulated once and every market line is evaluated against
+the cached score vectors; predictions join to odds on team keys.
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add module directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts/ml"))
+
+from market_evaluator import (
+    GameSimulationCache,
+    SimulatedGame,
+    evaluate_odds,
+    join_predictions_to_odds,
+    normalize_scores,
+    scores_from_prediction,
+    team_key,
+)
+
+GAME_DATE = date(2025, 11, 2)
+
+
+class FakeSimulator:
+    """AdvancedMultiSimulator stand-in returning per-simulation scores"""
+
+    def __init__(self, vectors=True, as_tuple=False):
+        self.vectors = vectors
+        self.as_tuple = as_tuple
+        self.calls = []
+
+    def predict_game(self, home_team_id, away_team_id, game_date, **kwargs):
+        self.calls.append((home_team_id, away_team_id, kwargs))
+        n = kwargs["n_simulations"]
+        rng = np.random.default_rng(len(self.calls))
+        home = rng.integers(95, 125, n)
+        away = rng.integers(95, 120, n)
+        result = SimpleNamespace(
+            predicted_home_score=float(home.mean()),
+            predicted_away_score=float(away.mean()),
+            home_win_prob=0.64,
+        )
+        if self.vectors:
+            result.home_scores, result.away_scores = home, away
+        return (result, {}) if self.as_tuple else result
+
+
+LINES = [
+    ("h2h", "home", None),
+    ("h2h", "away", None),
+    ("spreads", "home", -4.5),
+    ("spreads", "away", 4.5),
+    ("spreads", "home", 3.0),
+    ("spreads", "away", -3.0),
+    ("totals", "Over", 221.5),
+    ("totals", "Under", 221.5),
+    ("totals", "Over", 214.0),
+]
+
+
+@pytest.fixture
+def odds_df():
+    rows = []
+    for book in ("fanduel", "draftkings"):
+        for home, away in (
+            ("Boston Celtics", "New York Knicks"),
+            ("Portland Trail Blazers", "LA Clippers"),
+        ):
+            for market, outcome, point in LINES:
+                outcome = {"home": home, "away": away}.get(outcome, outcome)
+                rows.append((home, away, book, market, outcome, point))
+    return pd.DataFrame(
+        rows,
+        columns=[
+            "home_team",
+            "away_team",
+            "bookmaker_key",
+            "market_key",
+            "outcome_name",
+            "spread_or_total",
+        ],
+    )
+
+
+def brute_force(game, row):
+    """Reference: loop over every simulation for one odds row"""
+    wins = 0
+    for home, away in zip(game.home_scores, game.away_scores):
+        margin, total = home - away, home + away
+        outcome, point = row["outcome_name"], row["spread_or_total"]
+        is_home = team_key(outcome) == team_key(row["home_team"])
+        if row["market_key"] == "totals":
+            wins += total > point if outcome == "Over" else total < point
+        elif row["market_key"] == "spreads":
+            wins += margin + point > 0 if is_home else -margin + point > 0
+        else:
+            wins += margin > 0 if is_home else margin < 0
+    return wins / game.n_simulations
+
+
+class TestTeamKey:
+    """Team names reduce to a nickname join key"""
+
+    @pytest.mark.parametrize(
+        "name,key",
+        [
+            ("Boston Celtics", "celtics"),
+            ("celtics", "celtics"),
+            ("Portland Trail Blazers", "blazers"),
+            ("Philadelphia 76ers", "76ers"),
+            ("Sixers", "76ers"),
+            ("L.A. Clippers", "clippers"),
+            (None, ""),
+        ],
+    )
+    def test_team_key(self, name, key):
+        assert team_key(name) == key
+
+    def test_join_predictions_to_odds(self, odds_df):
+        predictions = pd.DataFrame(
+            {
+                "game_id": ["g1", "g2", "g3"],
+                "home_team": ["Celtics", "Trail Blazers", "Lakers"],
+                "away_team": ["Knicks", "Clippers", "Heat"],
+            }
+        )
+
+        joined = join_predictions_to_odds(predictions, odds_df)
+
+        assert len(joined) == len(odds_df)
+        assert set(joined["game_id"]) == {"g1", "g2"}
+        # Prediction names win, odds names are suffixed
+        assert set(joined["home_team"]) == {"Celtics", "Trail Blazers"}
+        assert "Boston Celtics" in set(joined["home_team_odds"])
+
+
+class TestEvaluateOdds:
+    """Vectorized evaluation against cached score vectors"""
+
+    def test_matches_per_simulation_loop(self, odds_df):
+        rng = np.random.default_rng(7)
+        games = {
+            (home, away): SimulatedGame(
+                rng.integers(95, 125, 2000), rng.integers(95, 120, 2000)
+            )
+            for home, away in odds_df[["home_team", "away_team"]]
+            .drop_duplicates()
+            .itertuples(index=False)
+        }
+
+        evaluated = evaluate_odds(odds_df, games, key=["home_team", "away_team"])
+
+        for row in evaluated.to_dict("records"):
+            game = games[(row["home_team"], row["away_team"])]
+            assert row["win_prob"] == pytest.approx(brute_force(game, row))
+
+    def test_complementary_lines_and_pushes(self):
+        game = SimulatedGame([110, 105, 100, 120], [100, 100, 100, 100])
+        odds = pd.DataFrame(
+            {
+                "game_id": "g1",
+                "home_team": "Celtics",
+                "away_team": "Knicks",
+                "market_key": ["spreads", "spreads", "totals", "totals"],
+                "outcome_name": ["Boston Celtics", "New York Knicks", "Over", "Under"],
+                "spread_or_total": [-5.0, 5.0, 210.0, 210.0],
+            }
+        )
+
+        evaluated = evaluate_odds(odds, {"g1": game})
+
+        assert list(evaluated["side"]) == ["home", "away", "over", "under"]
+        # Margins 10, 5, 0, 20 / totals 210, 205, 200, 220: one push each
+        assert list(evaluated["win_prob"]) == [0.5, 0.25, 0.25, 0.5]
+        assert list(evaluated["push_prob"]) == [0.25, 0.25, 0.25, 0.25]
+
+    def test_unmatched_rows_are_nan(self):
+        game = SimulatedGame([110], [100])
+        odds = pd.DataFrame(
+            {
+                "game_id": ["g1", "g1", "g2", "g1"],
+                "home_team": "Celtics",
+                "away_team": "Knicks",
+                "market_key": ["spreads", "player_points", "h2h", "spreads"],
+                "outcome_name": ["Lakers", "Jayson Tatum", "Celtics", "Celtics"],
+                "spread_or_total": [1.5, 27.5, None, None],
+            }
+        )
+
+        evaluated = evaluate_odds(odds, {"g1": game})
+
+        assert evaluated["win_prob"].isna().all()
+
+    def test_simulator_win_probability_drives_moneyline(self):
+        game = SimulatedGame([110, 90], [100, 100], home_win_prob=0.7)
+        odds = pd.DataFrame(
+            {
+                "game_id": "g1",
+                "home_team": "Celtics",
+                "away_team": "Knicks",
+                "market_key": "h2h",
+                "outcome_name": ["Celtics", "Knicks"],
+                "spread_or_total": None,
+            }
+        )
+
+        evaluated = evaluate_odds(odds, {"g1": game})
+
+        assert list(evaluated["win_prob"]) == pytest.approx([0.7, 0.3])
+        assert SimulatedGame([110, 90], [100, 100]).moneyline_probability("away") == 0.5
+
+
+class TestGameSimulationCache:
+    """Each matchup is simulated once"""
+
+    def test_simulates_once_per_game(self):
+        simulator = FakeSimulator()
+        cache = GameSimulationCache(simulator, n_simulations=500)
+
+        first = cache.get("1610612738", "1610612752", GAME_DATE)
+        again = cache.get("1610612738", "1610612752", GAME_DATE)
+        live = cache.get(
+            "1610612738", "1610612752", GAME_DATE, game_state={"period": 3}
+        )
+
+        assert first is again
+        assert live is not first
+        assert len(simulator.calls) == 2
+        assert simulator.calls[1][2]["game_state"] == {"period": 3}
+        assert "game_state" not in simulator.calls[0][2]
+        assert first.n_simulations == 500
+        assert first.source == "simulation"
+        assert cache.stats() == {"games": 2, "hits": 1, "misses": 2, "hit_rate": 1 / 3}
+
+    def test_falls_back_to_normal_approximation(self):
+        simulator = FakeSimulator(vectors=False, as_tuple=True)
+        cache = GameSimulationCache(simulator, n_simulations=200000, seed=1)
+
+        game = cache.get("1", "2", GAME_DATE)
+        margin = game.home_scores - game.away_scores
+        total = game.home_scores + game.away_scores
+
+        assert game.source == "normal_approximation"
+        assert margin.std() == pytest.approx(12.0, rel=0.02)
+        assert total.std() == pytest.approx(15.0, rel=0.02)
+        assert game.home_win_prob == 0.64
+
+    def test_from_prediction_is_seeded_and_normalized(self):
+        cache = GameSimulationCache(n_simulations=1000, seed=3)
+        game = cache.from_prediction("g1", 240.0, 208.0)
+        home, away = scores_from_prediction(240.0, 208.0, n_simulations=1000, seed=3)
+
+        np.testing.assert_array_equal(game.home_scores, home)
+        assert cache.from_prediction("g1", 0, 0) is game
+        assert (game.home_scores + game.away_scores).mean() == pytest.approx(
+            224.0, abs=1.0
+        )
+        with pytest.raises(ValueError):
+            cache.get("1", "2", GAME_DATE)
+
+    def test_normalize_scores(self):
+        assert normalize_scores(112.0, 100.0) == (112.0, 100.0)
+        home, away = normalize_scores(np.array([240.0]), np.array([208.0]))
+        assert home[0] + away[0] == pytest.approx(224.0)
+        assert home[0] - away[0] == pytest.approx(16.0)
@@ -0,0 +1,64 @@
+"""
+Synthetic Play-by-Play Games for pbp_to_boxscore Tests
+
+Shared by the snapshot store and play text parser tests. Not a test module,
+so pytest does not collect it.
+"""
+
+HOME = ["Ray Allen", "Kevin Garnett", "Paul Pierce", "Rajon Rondo", "Kendrick Perkins"]
+AWAY = ["Kobe Bryant", "Pau Gasol", "Derek Fisher", "Lamar Odom", "Andrew Bynum"]
+HOME_BENCH = ["Glen Davis", "Eddie House", "Tony Allen"]
+AWAY_BENCH = ["Jordan Farmar", "Sasha Vujacic", "Luke Walton"]
+
+
+def synthetic_game(n_events: int):
+    """Yield (play_text, home_score, away_score) for a synthetic game."""
+    home_score = away_score = 0
+    home_on, away_on = list(HOME), list(AWAY)
+    home_off, away_off = list(HOME_BENCH), list(AWAY_BENCH)
+
+    for i in range(n_events):
+        home = i % 2 == 0
+        on = home_on if home else away_on
+        shooter = on[i % 5]
+        kind = i % 9
+
+        if kind == 0:
+            text = f"{shooter} makes 15 ft jumper."
+            if home:
+                home_score += 2
+            else:
+                away_score += 2
+        elif kind == 1:
+            text = (
+                f"{shooter} makes 25 ft three point jumper ({on[(i + 1) % 5]} assists)."
+            )
+            if home:
+                home_score += 3
+            else:
+                away_score += 3
+        elif kind == 2:
+            text = f"{shooter} misses 18 ft jumper."
+        elif kind == 3:
+            text = f"{shooter} defensive rebound."
+        elif kind == 4:
+            text = f"{shooter} makes free throw 1 of 2."
+            if home:
+                home_score += 1
+            else:
+                away_score += 1
+        elif kind == 5:
+            text = f"{shooter} bad pass ({on[(i + 2) % 5]} steals)"
+        elif kind == 6:
+            off = home_off if home else away_off
+            incoming = off.pop(0)
+            outgoing = on[i % 5]
+            on[i % 5] = incoming
+            off.append(outgoing)
+            text = f"{incoming} enters the game for {outgoing}"
+        elif kind == 7:
+            text = f"{shooter} personal foul"
+        else:
+            text = f"{shooter} offensive rebound."
+
+        yield text, home_score, away_score
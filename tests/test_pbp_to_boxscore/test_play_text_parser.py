@@ -0,0 +1,169 @@
+"""
+Test Play Text Parser - Keyword Dispatch and Parse Cache
+
+Checks that the dispatching, memoizing parse() returns exactly what the
+sequential pattern-by-pattern parser returns, and (optionally) benchmarks
+plays/sec for both on a play text corpus.
+
+Usage:
+    pytest tests/test_pbp_to_boxscore/test_play_text_parser.py
+    pytest tests/test_pbp_to_boxscore/test_play_text_parser.py -m performance -s
+
+    # Benchmark on recorded play texts (one play_text per line)
+    PLAY_TEXT_CORPUS=plays.txt pytest ... -m performance -s
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.pbp_to_boxscore.play_text_parser import ActionType, PlayTextParser
+from tests.test_pbp_to_boxscore.synthetic_games import synthetic_game
+
+SAMPLE_PLAYS = [
+    "LeBron James makes 25 ft three point jumper (Dwyane Wade assists).",
+    "LeBron James makes 25 ft three point jumper.",
+    "Kevin Garnett missed 11 ft jumper.",
+    "Kevin Garnett misses 11 ft jumper blocked by Tim Duncan.",
+    "Ray Allen misses 26 ft three point jumper",
+    "Ervin Johnson defensive rebound.",
+    "Kobe Bryant makes free throw 1 of 2.",
+    "Tim Duncan missed free throw 2 of 2.",
+    "Steve Nash offensive rebound.",
+    "Chris Paul steal from Jason Kidd.",
+    "Dwight Howard blocks Pau Gasol's layup.",
+    "Carmelo Anthony bad pass turnover (steal by Rajon Rondo).",
+    "Paul Pierce lost ball turnover",
+    "Paul Pierce traveling",
+    "Paul Pierce offensive foul turnover (charge)",
+    "Dirk Nowitzki personal foul (drawn by Kevin Durant).",
+    "Dirk Nowitzki shooting foul",
+    "Rasheed Wallace technical foul.",
+    "technical foul",
+    "Derek Fisher enters game for Kobe Bryant.",
+    "Derek Fisher enters the game for Kobe Bryant",
+    "Official timeout.",
+    "Celtics timeout",
+    "Jump ball: Shaquille O'Neal vs. Tim Duncan (Kevin Garnett gains possession).",
+    "Jump ball: Shaquille O'Neal vs Tim Duncan",
+    "Shaquille O'Neal makes 2 ft dunk",
+    "end of the 1st quarter",
+    "Delay of game violation",
+    "  Kobe Bryant makes 15 ft jumper.  ",
+    "KOBE BRYANT MAKES 15 FT JUMPER.",
+    "Jason Terry blocks Tony Parker's 3 ft layup",
+    "Jumpman Free misses 3 ft layup",
+    "Ben Wallace defensive team rebound",
+]
+
+
+def corpus(n_events: int = 400):
+    """Sample plays plus a synthetic game's play texts."""
+    return SAMPLE_PLAYS + [text for text, _, _ in synthetic_game(n_events)]
+
+
+def load_benchmark_corpus():
+    """Recorded corpus from PLAY_TEXT_CORPUS, else a synthetic season slice."""
+    path = os.environ.get("PLAY_TEXT_CORPUS")
+    if path:
+        with open(path) as f:
+            return [line.rstrip("\n") for line in f if line.strip()]
+    return corpus(2000) * 25
+
+
+class TestDispatchParser:
+    """parse() must match the sequential parser play for play"""
+
+    @pytest.mark.parametrize("cache_size", [0, 8192])
+    def test_matches_sequential_parser(self, cache_size):
+        fast = PlayTextParser(cache_size=cache_size)
+        reference = PlayTextParser()
+
+        for text in corpus() * 2:
+            for team_id in (None, "BOS"):
+                assert fast.parse(text, team_id) == reference.parse_sequential(
+                    text, team_id
+                )
+
+        assert fast.get_stats() == reference.get_stats()
+
+    def test_parse_many(self):
+        parser = PlayTextParser()
+        texts = SAMPLE_PLAYS[:5]
+
+        parsed = parser.parse_many(texts, team_ids=["BOS", "LAL", None, "BOS", "LAL"])
+
+        assert [p.original_text for p in parsed] == [t.strip() for t in texts]
+        assert [p.team_id for p in parsed] == ["BOS", "LAL", None, "BOS", "LAL"]
+        assert parser.parse_many([]) == []
+
+    def test_cached_results_are_independent(self):
+        parser = PlayTextParser()
+        text = "LeBron James makes 25 ft three point jumper (Dwyane Wade assists)."
+
+        first = parser.parse(text, "MIA")
+        first.stat_updates["LeBron James"]["PTS"] = 100
+        second = parser.parse(text, "CLE")
+
+        assert second.stat_updates["LeBron James"]["PTS"] == 3
+        assert first.team_id == "MIA"
+        assert second.team_id == "CLE"
+        assert parser.cache_info()["hits"] == 1
+
+    def test_cache_is_bounded(self):
+        parser = PlayTextParser(cache_size=2)
+        for text in SAMPLE_PLAYS[:3]:
+            parser.parse(text)
+
+        info = parser.cache_info()
+        assert info["size"] == 2
+        assert info["misses"] == 3
+
+        # Oldest entry was evicted
+        parser.parse(SAMPLE_PLAYS[0])
+        assert parser.cache_info()["misses"] == 4
+
+    def test_unknown_play_counted_on_cache_hit(self):
+        parser = PlayTextParser()
+        parser.parse("end of the 1st quarter")
+        parsed = parser.parse("end of the 1st quarter")
+
+        assert parsed.action_type is ActionType.UNKNOWN
+        assert parser.get_stats()["failed"] == 2
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_plays_per_second_benchmark():
+    """Dispatch + cache parse is faster than sequential pattern matching"""
+    plays = load_benchmark_corpus()
+
+    sequential = PlayTextParser()
+    started = time.perf_counter()
+    for text in plays:
+        sequential.parse_sequential(text)
+    sequential_rate = len(plays) / (time.perf_counter() - started)
+
+    uncached = PlayTextParser(cache_size=0)
+    started = time.perf_counter()
+    uncached.parse_many(plays)
+    dispatch_rate = len(plays) / (time.perf_counter() - started)
+
+    cached = PlayTextParser()
+    started = time.perf_counter()
+    cached.parse_many(plays)
+    cached_rate = len(plays) / (time.perf_counter() - started)
+
+    print(
+        f"\n{len(plays):,} plays: sequential {sequential_rate:,.0f}/sec, "
+        f"dispatch {dispatch_rate:,.0f}/sec ({dispatch_rate / sequential_rate:.1f}x), "
+        f"dispatch+cache {cached_rate:,.0f}/sec ({cached_rate / sequential_rate:.1f}x)"
+    )
+    assert cached_rate > sequential_rate
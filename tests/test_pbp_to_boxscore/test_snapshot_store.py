@@ -0,0 +1,133 @@
+"""
+Test Snapshot Store - Keyframe + Delta Snapshots for GameStateTracker
+
+Checks that snapshots rebuilt from SnapshotStore match the deep copies the
+tracker used to keep, and (optionally) benchmarks peak memory.
+
+Usage:
+    pytest tests/test_pbp_to_boxscore/test_snapshot_store.py
+    pytest tests/test_pbp_to_boxscore/test_snapshot_store.py -m performance -s
+"""
+
+import copy
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.pbp_to_boxscore.game_state_tracker import GameStateTracker
+from scripts.pbp_to_boxscore.play_text_parser import PlayTextParser
+from scripts.pbp_to_boxscore.snapshot_store import SnapshotStore
+from tests.test_pbp_to_boxscore.synthetic_games import AWAY, HOME, synthetic_game
+
+
+def run_game(n_events: int, keep_deep_copies: bool = False, keyframe_interval=None):
+    """Run a synthetic game through the tracker."""
+    parser = PlayTextParser()
+    tracker = GameStateTracker(
+        "TEST_GAME", "BOS", "LAL", keyframe_interval=keyframe_interval
+    )
+    tracker.set_starting_lineup("BOS", HOME)
+    tracker.set_starting_lineup("LAL", AWAY)
+
+    reference = []
+    for i, (text, home_score, away_score) in enumerate(synthetic_game(n_events), 1):
+        tracker.process_event(
+            event_num=i,
+            period=1 + (i - 1) * 4 // n_events,
+            clock_display=f"{11 - i % 12}:{i % 60:02d}",
+            play_text=text,
+            parsed_play=parser.parse(text),
+            home_score=home_score,
+            away_score=away_score,
+        )
+        if keep_deep_copies:
+            reference.append(copy.deepcopy(tracker.current_state))
+
+    return tracker, reference
+
+
+class TestSnapshotStore:
+    """Rebuilt snapshots must match deep copies taken at each event."""
+
+    @pytest.mark.parametrize("keyframe_interval", [1, 7, 64])
+    def test_random_access_matches_deepcopy(self, keyframe_interval):
+        tracker, reference = run_game(
+            200, keep_deep_copies=True, keyframe_interval=keyframe_interval
+        )
+
+        for expected in reference:
+            assert tracker.get_snapshot(expected.event_num) == expected
+
+    def test_lazy_iteration_matches_deepcopy(self):
+        tracker, reference = run_game(150, keep_deep_copies=True)
+
+        snapshots = tracker.get_all_snapshots()
+        assert not isinstance(snapshots, list)
+        assert list(snapshots) == reference
+
+    def test_snapshots_are_independent(self):
+        tracker, _ = run_game(20)
+
+        snapshot = tracker.get_snapshot(10)
+        next(iter(snapshot.players.values())).points += 100
+        snapshot.home_lineup.clear()
+
+        assert tracker.get_snapshot(10) != snapshot
+
+    def test_process_event_records_without_materializing(self, monkeypatch):
+        parser = PlayTextParser()
+        tracker = GameStateTracker("TEST_GAME", "BOS", "LAL")
+        tracker.set_starting_lineup("BOS", HOME)
+        tracker.set_starting_lineup("LAL", AWAY)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("snapshot materialized during process_event")
+
+        monkeypatch.setattr(tracker.snapshot_store, "_materialize", fail)
+        text = "Ray Allen makes 15 ft jumper."
+        position = tracker.process_event(1, 1, "11:40", text, parser.parse(text), 2, 0)
+        monkeypatch.undo()
+
+        assert position == 0
+        snapshot = tracker.get_snapshot(1)
+        assert snapshot == tracker.current_state
+        assert snapshot is not tracker.current_state
+        assert tracker.get_stats_summary()["snapshots_created"] == 1
+
+    def test_unknown_event_returns_none(self):
+        tracker, _ = run_game(5)
+        assert tracker.get_snapshot(999) is None
+
+    def test_invalid_keyframe_interval(self):
+        with pytest.raises(ValueError):
+            SnapshotStore("TEST_GAME", keyframe_interval=0)
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_peak_memory_benchmark():
+    """Keyframe + delta storage uses >=10x less peak memory on a 500-event game."""
+    tracemalloc.start()
+    run_game(500, keep_deep_copies=True)
+    _, deepcopy_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    tracker, _ = run_game(500)
+    _, store_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # The deep-copy run also includes the store, so subtract it back out
+    ratio = (deepcopy_peak - store_peak) / store_peak
+    print(
+        f"\n500 events: deepcopy {deepcopy_peak / 1024:.0f} KiB, "
+        f"store {store_peak / 1024:.0f} KiB ({ratio:.1f}x)"
+    )
+    assert len(tracker.snapshot_store) == 500
+    assert ratio >= 10
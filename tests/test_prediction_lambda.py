@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Tests for the prediction Lambda
+
+Batch scoring matches scikit-learn row by row, artifacts reload only when
+their S3 ETag changes, and the batch endpoint and local HTTP server wrap
+lambda_handler.
+"""
+
+import http.client
+import json
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import joblib
+import numpy as np
+import pytest
+from botocore.exceptions import ClientError
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+# Add Lambda source directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "lambda/prediction_api"))
+
+import lambda_function
+
+
+@pytest.fixture
+def training_data():
+    rng = np.random.default_rng(3)
+    X = rng.normal(size=(400, len(lambda_function.FEATURE_NAMES))) * 5 + 10
+    y = (X[:, 3] - X[:, 9] + rng.normal(0, 2, len(X)) > 0).astype(int)
+    return X, y
+
+
+@pytest.fixture
+def fitted(training_data):
+    X, y = training_data
+    scaler = StandardScaler().fit(X)
+    model = LogisticRegression().fit(scaler.transform(X), y)
+    return model, scaler
+
+
+@pytest.fixture(autouse=True)
+def reset_model_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(lambda_function, "model", None)
+    monkeypatch.setattr(lambda_function, "scaler", None)
+    monkeypatch.setattr(lambda_function, "model_etags", None)
+    monkeypatch.setattr(lambda_function, "model_checked_at", None)
+    monkeypatch.setattr(lambda_function, "model_pinned", False)
+    monkeypatch.setattr(lambda_function, "linear_weights", None)
+    monkeypatch.setattr(lambda_function, "linear_bias", None)
+    monkeypatch.setattr(lambda_function, "MODEL_CACHE_DIR", str(tmp_path))
+
+
+def as_features(row):
+    return dict(zip(lambda_function.FEATURE_NAMES, row.tolist()))
+
+
+class TestBatchPrediction:
+    """One vectorized call scores every game"""
+
+    def test_linear_model_matches_sklearn(self, fitted, training_data):
+        model, scaler = fitted
+        X = training_data[0][:50]
+        lambda_function.use_model(model, scaler)
+
+        results = lambda_function.predict_batch([as_features(row) for row in X])
+
+        expected = model.predict_proba(scaler.transform(X))[:, 1]
+        winners = model.predict(scaler.transform(X))
+        np.testing.assert_allclose(
+            [r["home_win_probability"] for r in results], expected, rtol=1e-9
+        )
+        assert [r["predicted_winner"] == "home" for r in results] == list(winners == 1)
+        assert len({r["prediction_timestamp"] for r in results}) == 1
+
+    def test_non_linear_model_uses_predict_proba(self, training_data):
+        X, y = training_data
+        scaler = StandardScaler().fit(X)
+        model = DecisionTreeClassifier(max_depth=3).fit(scaler.transform(X), y)
+        lambda_function.use_model(model, scaler)
+
+        results = lambda_function.predict_batch([as_features(row) for row in X[:20]])
+
+        assert lambda_function.linear_weights is None
+        expected = model.predict(scaler.transform(X[:20]))
+        assert [r["predicted_winner"] == "home" for r in results] == list(expected == 1)
+
+    def test_single_prediction_and_missing_features(self, fitted, training_data):
+        lambda_function.use_model(*fitted)
+        features = as_features(training_data[0][0])
+
+        result = lambda_function.predict(features)
+
+        assert result["confidence"] >= 0.5
+        del features["month"]
+        with pytest.raises(ValueError, match="Missing required features: month"):
+            lambda_function.predict(features)
+
+
+class TestModelRefresh:
+    """Artifacts reload only when an S3 ETag changes"""
+
+    @pytest.fixture
+    def s3(self, fitted, tmp_path, monkeypatch):
+        model, scaler = fitted
+        source = tmp_path / "source"
+        source.mkdir()
+        joblib.dump(model, source / "logistic_regression.joblib")
+        joblib.dump(scaler, source / "scaler.joblib")
+
+        client = MagicMock()
+        client.etags = {
+            "ml-models/logistic_regression.joblib": "m1",
+            "ml-models/scaler.joblib": "s1",
+        }
+
+        def head_object(Bucket, Key):
+            if Key not in client.etags:
+                raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+            return {"ETag": f'"{client.etags[Key]}"'}
+
+        def download_file(bucket, key, path):
+            Path(path).write_bytes((source / Path(key).name).read_bytes())
+
+        client.head_object.side_effect = head_object
+        client.download_file.side_effect = download_file
+        monkeypatch.setattr(lambda_function.boto3, "client", lambda name: client)
+        monkeypatch.setattr(lambda_function, "MODEL_CHECK_SECONDS", 0)
+        return client
+
+    def test_reload_only_on_etag_change(self, s3):
+        model, _ = lambda_function.load_model_from_s3()
+        assert s3.download_file.call_count == 2
+        assert lambda_function.linear_weights is not None
+
+        lambda_function.load_model_from_s3()
+        assert s3.download_file.call_count == 2
+        assert s3.head_object.call_count == 4
+
+        s3.etags["ml-models/logistic_regression.joblib"] = "m2"
+        lambda_function.load_model_from_s3()
+        # New model artifact downloaded; scaler served from the local cache
+        assert s3.download_file.call_count == 3
+
+    def test_stale_etag_copies_removed(self, s3, tmp_path):
+        lambda_function.load_model_from_s3()
+        s3.etags["ml-models/logistic_regression.joblib"] = "m2"
+        lambda_function.load_model_from_s3()
+
+        assert sorted(p.name for p in tmp_path.glob("*.joblib")) == [
+            "m2-logistic_regression.joblib",
+            "s1-scaler.joblib",
+        ]
+
+    def test_check_interval_skips_s3(self, s3, monkeypatch):
+        monkeypatch.setattr(lambda_function, "MODEL_CHECK_SECONDS", 3600)
+
+        lambda_function.load_model_from_s3()
+        lambda_function.load_model_from_s3()
+
+        assert s3.head_object.call_count == 2
+
+    def test_falls_back_to_pickle(self, s3, fitted, tmp_path):
+        import pickle
+
+        s3.etags = {
+            "ml-models/logistic_regression.pkl": "p1",
+            "ml-models/scaler.pkl": "p2",
+        }
+        model, scaler = fitted
+        for name, obj in [("logistic_regression", model), ("scaler", scaler)]:
+            with open(tmp_path / "source" / f"{name}.pkl", "wb") as f:
+                pickle.dump(obj, f)
+
+        loaded_model, _ = lambda_function.load_model_from_s3()
+
+        np.testing.assert_array_equal(loaded_model.coef_, model.coef_)
+
+
+class TestHandler:
+    """Batch endpoint and local HTTP server"""
+
+    def test_batch_endpoint(self, fitted, training_data):
+        lambda_function.use_model(*fitted)
+        games = [
+            {"home_team": "LAL", "away_team": "BOS", "features": as_features(row)}
+            for row in training_data[0][:5]
+        ]
+
+        response = lambda_function.lambda_handler(
+            {"body": json.dumps({"games": games})}, None
+        )
+
+        body = json.loads(response["body"])
+        assert response["statusCode"] == 200
+        assert body["count"] == 5
+        assert body["predictions"][0]["home_team"] == "LAL"
+
+    def test_batch_validation(self, fitted, training_data, monkeypatch):
+        lambda_function.use_model(*fitted)
+        monkeypatch.setattr(lambda_function, "MAX_BATCH_SIZE", 2)
+        game = {"features": as_features(training_data[0][0])}
+
+        too_many = lambda_function.lambda_handler({"games": [game] * 3}, None)
+        bad_game = lambda_function.lambda_handler(
+            {"games": [game, {"features": {}}]}, None
+        )
+
+        assert too_many["statusCode"] == 400
+        assert "Batch too large" in json.loads(too_many["body"])["error"]
+        assert json.loads(bad_game["body"])["error"].startswith("Game 1:")
+
+    def test_local_server(self, fitted, training_data):
+        lambda_function.use_model(*fitted)
+        server = lambda_function.create_local_server(port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+            payload = json.dumps(
+                {"games": [{"features": as_features(training_data[0][0])}]}
+            )
+            conn.request("POST", "/predict/batch", body=payload)
+            batch = conn.getresponse()
+            batch_body = json.loads(batch.read())
+            # Same keep-alive connection
+            conn.request("GET", "/health")
+            health = conn.getresponse()
+            health_body = json.loads(health.read())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert batch.status == 200
+        assert batch_body["count"] == 1
+        assert health_body == {"status": "ok", "model_loaded": True}
@@ -0,0 +1,5 @@
+"""
+ADCE Unit Tests
+
+Tests for the autonomous data collection ecosystem (reconciliation, gaps).
+"""
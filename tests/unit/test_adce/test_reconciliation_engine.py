@@ -0,0 +1,347 @@
+"""
+Unit Tests for the In-Process Reconciliation Engine
+
+Uses LocalS3Client (filesystem stand-in for boto3) to test:
+- Coverage analysis matches scripts/reconciliation/analyze_coverage.py
+- Incremental cycles only parse new/changed keys and drop removed ones
+- Deterministic sampling
+- Task queue generation in-process (and dry runs)
+- ReconciliationDaemon in-process cycles and DIMS metrics
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import yaml
+
+from nba_simulator.adce import ReconciliationDaemon, ReconciliationEngine
+from nba_simulator.adce import coverage
+from nba_simulator.testing import LocalS3Client
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts" / "reconciliation"))
+
+from analyze_coverage import CoverageAnalyzer  # noqa: E402
+
+BUCKET = "test-lake"
+CURRENT_SEASON = coverage.current_season()
+OLD = time.time() - 30 * 86400
+
+
+def put(
+    client,
+    root,
+    key,
+    body=b'{"ok": true, "padding": "' + b"x" * 200 + b'"}',
+    mtime=None,
+):
+    """Write an object, optionally backdating it"""
+    client.put_object(Bucket=BUCKET, Key=key, Body=body)
+    if mtime:
+        os.utime(root / BUCKET / key, (mtime, mtime))
+
+
+@pytest.fixture
+def lake(tmp_path):
+    """Local bucket with ESPN / hoopR / Basketball Reference keys"""
+    root = tmp_path / "s3"
+    client = LocalS3Client(str(root), page_size=5)
+
+    for i in range(12):
+        put(
+            client, root, f"espn_play_by_play/2023-24/play_by_play_40157940{i:02d}.json"
+        )
+        put(
+            client,
+            root,
+            f"espn_box_scores/{CURRENT_SEASON}/box_score_40169000{i:02d}.json",
+            mtime=OLD if i % 3 == 0 else None,
+        )
+    put(client, root, f"espn_box_scores/{CURRENT_SEASON}/box_score_tiny.json", b"{}")
+    put(client, root, "hoopr_parquet/2023-24_pbp.parquet")
+    put(client, root, "basketball_ref/2022-23/advanced_202212010LAL.html")
+    put(client, root, "README.txt")
+    return client, root
+
+
+@pytest.fixture
+def engine_factory(tmp_path, lake):
+    """Build engines wired to the local lake and tmp outputs"""
+    client, _ = lake
+
+    expected = {
+        "expected_game_counts": {"total_max": 10},
+        "quality_requirements": {"min_file_size_bytes": 100},
+        "expected_coverage": {
+            "espn": {
+                "seasons": ["2023-24", CURRENT_SEASON],
+                "data_types": {
+                    "play_by_play": {"required": True, "freshness_days": 7},
+                    "box_scores": {"required": True, "freshness_days": 7},
+                    "schedule": {"required": False},
+                },
+            },
+            "hoopr": {
+                "seasons": ["2023-24"],
+                "data_types": {"play_by_play": {"required": True}},
+            },
+        },
+    }
+    expected_file = tmp_path / "data_inventory.yaml"
+    expected_file.write_text(yaml.safe_dump(expected))
+
+    def make(sample_rate=None, **kwargs):
+        config_file = tmp_path / "reconciliation_config.yaml"
+        config_file.write_text(
+            yaml.safe_dump({"s3": {"bucket": BUCKET, "sample_rate": sample_rate}})
+        )
+        kwargs.setdefault("output_dir", str(tmp_path / "cache"))
+        kwargs.setdefault("task_queue_file", str(tmp_path / "gaps.json"))
+        kwargs.setdefault(
+            "task_generator_script",
+            str(PROJECT_ROOT / "scripts/reconciliation/generate_task_queue.py"),
+        )
+        return ReconciliationEngine(
+            config_file=str(config_file),
+            expected_file=str(expected_file),
+            s3_client=client,
+            **kwargs,
+        )
+
+    return make
+
+
+def comparable(analysis):
+    """Drop run-specific fields from a coverage analysis"""
+    analysis = json.loads(json.dumps(analysis, default=str))
+    for key in (
+        "timestamp",
+        "inventory_file",
+        "inventory_metadata",
+        "analysis_duration_seconds",
+    ):
+        analysis.pop(key, None)
+    return analysis
+
+
+class TestReconciliationEngine:
+    """Resident engine cycles"""
+
+    def test_analysis_matches_legacy_analyzer(self, engine_factory, tmp_path):
+        engine = engine_factory(save_inventory=True)
+        result = engine.run_cycle(dry_run=True)
+        assert result["success"], result.get("error")
+
+        cache = tmp_path / "cache"
+        legacy = CoverageAnalyzer(
+            expected_file=str(tmp_path / "data_inventory.yaml"),
+            inventory_file=str(cache / "current_inventory.json"),
+        ).analyze()
+        with open(cache / "coverage_analysis.json") as f:
+            in_process = json.load(f)
+
+        assert comparable(in_process) == comparable(legacy)
+        espn = in_process["by_source"]["espn"]
+        assert espn["by_season"][CURRENT_SEASON]["stale_files"] == 4
+        assert espn["by_type"]["box_scores"]["small_files"] == 1
+
+    def test_incremental_cycle_parses_only_changed_keys(self, engine_factory, lake):
+        client, root = lake
+        engine = engine_factory()
+
+        first = engine.run_cycle(dry_run=True)
+        assert first["diff"]["added"] == first["objects_listed"] == 28
+
+        put(client, root, "espn_play_by_play/2023-24/play_by_play_401579499.json")
+        put(
+            client,
+            root,
+            "espn_play_by_play/2023-24/play_by_play_4015794000.json",
+            b'{"changed": 1}',
+        )
+        os.remove(root / BUCKET / "hoopr_parquet/2023-24_pbp.parquet")
+
+        with patch.object(
+            coverage,
+            "parse_s3_path",
+            wraps=coverage.parse_s3_path,
+        ) as parse:
+            second = engine.run_cycle(dry_run=True)
+
+        assert second["diff"] == {
+            "added": 1,
+            "modified": 1,
+            "removed": 1,
+            "unchanged": 26,
+        }
+        assert parse.call_count == 2
+        assert second["objects_indexed"] == 28
+        assert "hoopr" not in {meta["source"] for meta in engine.index.files.values()}
+        assert engine.index.by_source["hoopr"] == set()
+
+    def test_unchanged_cycle_has_empty_diff(self, engine_factory):
+        engine = engine_factory()
+        engine.run_cycle(dry_run=True)
+
+        with patch.object(coverage, "parse_s3_path") as parse:
+            result = engine.run_cycle(dry_run=True)
+
+        assert result["diff"]["added"] == result["diff"]["modified"] == 0
+        parse.assert_not_called()
+        assert set(result["timings"]) == {
+            "scan",
+            "index",
+            "analyze",
+            "detect",
+            "generate",
+        }
+
+    def test_full_rebuild_matches_incremental(self, engine_factory, lake):
+        client, root = lake
+        engine = engine_factory()
+        engine.run_cycle(dry_run=True)
+        put(client, root, f"espn_box_scores/{CURRENT_SEASON}/box_score_4016900099.json")
+        engine.run_cycle(dry_run=True)
+        incremental = dict(engine.index.files)
+
+        engine.run_cycle(dry_run=True, full_rebuild=True)
+
+        assert engine.index.files == incremental
+
+    def test_sampling_is_deterministic(self, engine_factory):
+        engine = engine_factory(sample_rate=0.5)
+        engine.run_cycle(dry_run=True)
+        sampled = set(engine.index.files)
+
+        engine.run_cycle(dry_run=True, full_rebuild=True)
+
+        assert 0 < len(sampled) < len(engine.inventory)
+        assert set(engine.index.files) == sampled
+
+    def test_task_queue_saved_unless_dry_run(self, engine_factory, tmp_path):
+        engine = engine_factory()
+
+        dry = engine.run_cycle(dry_run=True)
+        assert not (tmp_path / "gaps.json").exists()
+
+        result = engine.run_cycle()
+        with open(tmp_path / "gaps.json") as f:
+            queue = json.load(f)
+
+        assert result["total_tasks"] == dry["total_tasks"] == queue["total_tasks"]
+        assert result["critical_gaps"] > 0
+
+    def test_missing_task_generator_skips_generation(self, engine_factory, tmp_path):
+        engine = engine_factory(task_generator_script=str(tmp_path / "missing.py"))
+
+        result = engine.run_cycle()
+
+        assert result["success"]
+        assert result["total_tasks"] is None
+
+    def test_listing_errors_fail_the_cycle(self, engine_factory):
+        engine = engine_factory()
+        engine.inventory.s3_client = MagicMock()
+        engine.inventory.s3_client.get_paginator.side_effect = RuntimeError("denied")
+
+        result = engine.run_cycle()
+
+        assert not result["success"]
+        assert "denied" in result["error"]
+        assert engine.cycles == 1
+
+
+class TestReconciliationDaemon:
+    """Daemon cycles on a resident engine"""
+
+    def test_run_once_updates_dims_metrics(self, engine_factory):
+        engine = engine_factory()
+        dims = MagicMock()
+        daemon = ReconciliationDaemon(dry_run=True, engine=engine, dims=dims)
+
+        daemon.run(run_once=True)
+
+        metrics = {
+            call.args[1]: call.args[2] for call in dims.update_metric.call_args_list
+        }
+        assert {call.args[0] for call in dims.update_metric.call_args_list} == {
+            "reconciliation"
+        }
+        assert metrics["keys_added"] == 28
+        assert metrics["keys_removed"] == 0
+        assert metrics["objects_indexed"] == 28
+        assert "scan_seconds" in metrics and "cycle_duration_seconds" in metrics
+        assert metrics["last_run_success"] is True
+        dims.save_metrics.assert_called_once()
+        assert daemon.successful_runs == daemon.total_runs == 1
+
+    def test_engine_reused_across_cycles(self, engine_factory):
+        engine = engine_factory()
+        daemon = ReconciliationDaemon(dry_run=True, engine=engine, dims=MagicMock())
+
+        daemon.run_reconciliation_cycle()
+        result = daemon.run_reconciliation_cycle()
+
+        assert daemon.engine is engine
+        assert engine.cycles == 2
+        assert result["diff"]["unchanged"] == 28
+
+    def test_subprocess_mode_still_available(self):
+        daemon = ReconciliationDaemon(in_process=False)
+
+        with patch("nba_simulator.adce.reconciliation.subprocess.run") as run:
+            run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+            result = daemon.run_reconciliation_cycle()
+
+        assert result["success"]
+        assert "run_reconciliation.py" in run.call_args.args[0][1]
+        assert daemon.engine is None
+
+    def test_aws_inventory_falls_back_to_subprocess(self, caplog):
+        daemon = ReconciliationDaemon(use_aws_inventory=True)
+
+        assert not daemon.in_process
+        assert "use_aws_inventory" in caplog.text
+        with patch("nba_simulator.adce.reconciliation.subprocess.run") as run:
+            run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+            daemon.run_reconciliation_cycle()
+
+        assert "--use-aws-inventory" in run.call_args.args[0]
+        assert daemon.engine is None
+
+    def test_aws_inventory_with_engine_rejected(self):
+        with pytest.raises(ValueError):
+            ReconciliationDaemon(use_aws_inventory=True, engine=MagicMock())
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_incremental_cycle_benchmark(engine_factory, lake):
+    """Second cycle only indexes the handful of new keys"""
+    client, root = lake
+    for i in range(3000):
+        put(client, root, f"espn_play_by_play/2022-23/play_by_play_40150{i:04d}.json")
+
+    engine = engine_factory()
+    first = engine.run_cycle(dry_run=True)
+
+    for i in range(10):
+        put(
+            client,
+            root,
+            f"espn_play_by_play/{CURRENT_SEASON}/play_by_play_40190{i:04d}.json",
+        )
+    second = engine.run_cycle(dry_run=True)
+
+    print(
+        f"\nfull cycle {first['duration']:.2f}s (index {first['timings']['index']:.3f}s), "
+        f"incremental {second['duration']:.2f}s (index {second['timings']['index']:.4f}s)"
+    )
+    assert second["diff"]["added"] == 10
+    assert second["timings"]["index"] * 10 < first["timings"]["index"]
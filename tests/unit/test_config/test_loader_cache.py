@@ -0,0 +1,186 @@
+"""
+Unit Tests for ConfigLoader caching
+
+Tests process-wide resolution of secrets and .env:
+- Secrets resolved once per process
+- .env applied once, reloaded when the file changes
+- Real environment variables win over .env
+- Database config memoized until its environment changes
+- Lazy snapshots, refresh() (re-applies an edited .env) and timing_report()
+"""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from nba_simulator.config.loader import ConfigLoader, ResolvedConfig
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Project root with a .env file and clean process-wide loader state"""
+    for key in ("DB_HOST", "DB_NAME", "DB_USER", "DB_PASSWORD", "CACHE_TEST_KEY"):
+        monkeypatch.delenv(key, raising=False)
+    (tmp_path / ".env").write_text("DB_HOST=envfile-host\nCACHE_TEST_KEY=one\n")
+
+    monkeypatch.setattr(ConfigLoader, "_environment", {})
+    monkeypatch.setattr(ConfigLoader, "_dotenv_values", {})
+    monkeypatch.setattr(ConfigLoader, "_secrets_loaded", False)
+    monkeypatch.setattr(ConfigLoader, "_timings", {})
+    monkeypatch.setattr(
+        ConfigLoader,
+        "_stats",
+        {"environment_loads": 0, "database_loads": 0, "database_cache_hits": 0},
+    )
+    yield tmp_path
+    os.environ.pop("DB_HOST", None)
+    os.environ.pop("CACHE_TEST_KEY", None)
+
+
+def make_loader(root: Path) -> ConfigLoader:
+    loader = ConfigLoader(legacy_mode=True)
+    loader.project_root = root
+    loader.config_dir = root / "config"
+    return loader
+
+
+class TestEnvironmentResolution:
+    """Secrets and .env are resolved once per process"""
+
+    def test_secrets_resolved_once_across_loaders(self, project):
+        with patch.object(ConfigLoader, "_load_hierarchical_secrets") as mock_secrets:
+            make_loader(project).load_database_config()
+            make_loader(project).load_database_config()
+
+        mock_secrets.assert_called_once()
+        assert ConfigLoader.timing_report()["environment_loads"] == 1
+
+    def test_dotenv_does_not_override_environment(self, project, monkeypatch):
+        monkeypatch.setenv("DB_HOST", "real-host")
+
+        db_config = make_loader(project).load_database_config()
+
+        assert db_config["host"] == "real-host"
+        assert os.environ["CACHE_TEST_KEY"] == "one"
+
+    def test_dotenv_reloaded_when_file_changes(self, project):
+        loader = make_loader(project)
+        assert loader.load_database_config()["host"] == "envfile-host"
+
+        env_file = project / ".env"
+        env_file.write_text("DB_HOST=edited-host\nCACHE_TEST_KEY=one\n")
+        mtime = env_file.stat().st_mtime + 5
+        os.utime(env_file, (mtime, mtime))
+
+        assert loader.load_database_config()["host"] == "edited-host"
+        assert ConfigLoader.timing_report()["environment_loads"] == 2
+
+    def test_missing_dotenv_still_loads_secrets(self, project):
+        (project / ".env").unlink()
+
+        with patch.object(ConfigLoader, "_load_hierarchical_secrets") as mock_secrets:
+            make_loader(project).load_database_config()
+            make_loader(project).load_database_config()
+
+        mock_secrets.assert_called_once()
+
+
+class TestDatabaseConfigCache:
+    """Database config memoized per environment fingerprint"""
+
+    def test_cache_hit_returns_copy(self, project):
+        loader = make_loader(project)
+
+        first = loader.load_database_config()
+        first["host"] = "mutated"
+        second = loader.load_database_config()
+
+        assert second["host"] == "envfile-host"
+        report = ConfigLoader.timing_report()
+        assert report["database_loads"] == 1
+        assert report["database_cache_hits"] == 1
+
+    def test_environment_change_invalidates(self, project, monkeypatch):
+        loader = make_loader(project)
+        loader.load_database_config()
+
+        monkeypatch.setenv("DB_NAME", "other_db")
+
+        assert loader.load_database_config()["database"] == "other_db"
+        assert ConfigLoader.timing_report()["database_loads"] == 2
+
+
+class TestSnapshot:
+    """Lazy snapshots and refresh()"""
+
+    def test_sections_resolve_lazily(self, project):
+        loader = make_loader(project)
+
+        with patch.object(
+            loader, "load_database_config", return_value={"host": "h"}
+        ) as mock_db:
+            settings = loader.snapshot()
+            assert isinstance(settings, ResolvedConfig)
+            mock_db.assert_not_called()
+
+            assert settings.database["host"] == "h"
+            assert settings.database["host"] == "h"
+            mock_db.assert_called_once()
+
+        assert loader.snapshot() is settings
+
+    def test_refresh_reresolves(self, project):
+        loader = make_loader(project)
+        with patch.object(ConfigLoader, "_load_hierarchical_secrets") as mock_secrets:
+            settings = loader.snapshot()
+            loader.load_database_config()
+
+            loader.refresh()
+            loader.load_database_config()
+
+        assert mock_secrets.call_count == 2
+        assert loader.snapshot() is not settings
+
+    def test_refresh_applies_edited_dotenv(self, project):
+        loader = make_loader(project)
+        env_file = project / ".env"
+        env_file.write_text("DB_HOST=first\nCACHE_TEST_KEY=one\n")
+        assert loader.load_database_config()["host"] == "first"
+
+        env_file.write_text("DB_HOST=second\n")
+        loader.refresh()
+        assert loader.load_database_config()["host"] == "second"
+        assert "CACHE_TEST_KEY" not in os.environ
+
+        env_file.write_text("DB_HOST=third\n")
+        mtime = env_file.stat().st_mtime + 5
+        os.utime(env_file, (mtime, mtime))
+        assert loader.load_database_config()["host"] == "third"
+
+    def test_refresh_keeps_real_environment(self, project, monkeypatch):
+        loader = make_loader(project)
+        loader.load_database_config()
+
+        monkeypatch.setenv("DB_HOST", "real-host")
+        (project / ".env").write_text("DB_HOST=second\n")
+        loader.refresh()
+
+        assert loader.load_database_config()["host"] == "real-host"
+
+    def test_timing_report(self, project):
+        make_loader(project).load_database_config()
+
+        report = ConfigLoader.timing_report()
+
+        assert set(report) == {
+            "secrets_seconds",
+            "dotenv_seconds",
+            "database_seconds",
+            "environment_loads",
+            "database_loads",
+            "database_cache_hits",
+        }
+        assert report["dotenv_seconds"] >= 0.0
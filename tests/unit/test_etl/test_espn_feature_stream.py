@@ -0,0 +1,135 @@
+"""
+Tests for streaming ESPN feature extraction
+
+stream_extract_games must yield exactly what the serial batch path
+returns, one game at a time, reading from a local directory standing in
+for S3.
+"""
+
+import json
+
+import pytest
+
+from nba_simulator.etl.extractors.espn import ESPNFeatureExtractor, ESPNJSONReader
+from nba_simulator.testing import LocalS3Client
+
+BUCKET = "espn-test"
+
+
+def make_game(game_id, points):
+    """Small Format 1 (page.content.gamepackage) game"""
+    keys = ["minutes", "fieldGoalsMade-fieldGoalsAttempted", "rebounds", "points"]
+    team = lambda side: {
+        "tm": {"id": side, "displayName": f"Team {side}", "abbrev": f"T{side}"},
+        "stats": [
+            {
+                "type": "starters",
+                "keys": keys,
+                "athlts": [
+                    {
+                        "athlt": {"id": f"{side}{i}", "dspNm": f"P{side}{i}"},
+                        "stats": ["30", f"{i}-10", str(i * 3), str(points + i)],
+                    }
+                    for i in range(5)
+                ],
+            }
+        ],
+    }
+    return {
+        "page": {
+            "content": {
+                "gamepackage": {
+                    "gmStrp": {
+                        "gid": game_id,
+                        "dt": "2023-11-05T00:30Z",
+                        "tms": [
+                            {"score": str(points), "linescores": []},
+                            {"score": "99", "linescores": []},
+                        ],
+                    },
+                    "gmInfo": {"attnd": "18000", "refs": ["Ref A"]},
+                    "bxscr": [team(1), team(2)],
+                    "pbp": {
+                        "playGrps": [
+                            [
+                                {
+                                    "text": "Player made 3-pt jumper",
+                                    "type": {"text": "Jump Shot"},
+                                    "coordinate": {"x": 10, "y": 20},
+                                }
+                            ]
+                        ]
+                    },
+                }
+            }
+        }
+    }
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    client = LocalS3Client(str(tmp_path))
+    for i in range(12):
+        game_id = f"4016000{i:02d}"
+        client.put_object(
+            Bucket=BUCKET,
+            Key=f"box_scores/{game_id}.json",
+            Body=json.dumps(make_game(game_id, 90 + i)),
+        )
+    client.put_object(Bucket=BUCKET, Key="box_scores/bad.json", Body=b"{not json")
+    reader = ESPNJSONReader(bucket=BUCKET, s3_client=client)
+    return ESPNFeatureExtractor(reader=reader)
+
+
+GAME_IDS = [f"4016000{i:02d}" for i in range(12)]
+
+
+class TestStreamExtractGames:
+    """Streaming extraction matches the serial batch path"""
+
+    def test_matches_batch_extraction(self, extractor):
+        expected = extractor.batch_extract_games(GAME_IDS)
+
+        streamed = list(
+            extractor.stream_extract_games(
+                GAME_IDS, io_workers=3, processes=2, max_pending=2
+            )
+        )
+
+        assert len(streamed) == len(GAME_IDS)
+        assert dict(streamed) == expected
+        assert streamed[0][1]["box_score"]["home"]["players"][0]["stats"]["points"]
+
+    def test_missing_and_unparseable_games_yield_none(self, extractor):
+        streamed = dict(
+            extractor.stream_extract_games(
+                [GAME_IDS[0], "missing", "bad", GAME_IDS[0]], processes=1
+            )
+        )
+
+        assert set(streamed) == {GAME_IDS[0], "missing", "bad"}
+        assert streamed["missing"] is None
+        assert streamed["bad"] is None
+        assert streamed[GAME_IDS[0]]["game_info"]["game_id"] == GAME_IDS[0]
+
+    def test_batch_extract_with_processes(self, extractor):
+        assert extractor.batch_extract_games(
+            GAME_IDS[:4], processes=2
+        ) == extractor.batch_extract_games(GAME_IDS[:4])
+
+    def test_early_close(self, extractor):
+        stream = extractor.stream_extract_games(GAME_IDS, processes=1, max_pending=1)
+        game_id, features = next(stream)
+        stream.close()
+
+        assert game_id in GAME_IDS
+        assert features is not None
+
+    def test_reader_created_lazily(self):
+        extractor = ESPNFeatureExtractor()
+        features = extractor.extract_game_features(
+            game_id="1", raw_json=make_game("1", 100)
+        )
+
+        assert features["scoring"]["home"]["total"] == 100
+        assert extractor._reader is None
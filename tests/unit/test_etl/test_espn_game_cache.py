@@ -0,0 +1,188 @@
+"""
+Tests for the ESPN GameCache tier
+
+Compressed, ETag-keyed cache under ESPNJSONReader: invalidation on S3
+changes, LRU size budget, parsed-object warm reads, pre-warming and
+hit/miss/bytes metrics. S3 is a local directory (LocalS3Client).
+"""
+
+import json
+import time
+
+import pytest
+
+from nba_simulator.etl.extractors.espn import ESPNJSONReader, GameCache
+from nba_simulator.testing import LocalS3Client
+
+BUCKET = "espn-test"
+
+
+def make_game(game_id, n_plays=50, marker="v1"):
+    return {
+        "header": {"id": game_id, "marker": marker},
+        "boxscore": {"teams": [{"id": "1"}, {"id": "2"}]},
+        "plays": [
+            {"id": i, "text": f"Player {i % 10} makes {i % 25} ft jumper"}
+            for i in range(n_plays)
+        ],
+    }
+
+
+def put_game(client, game_id, **kwargs):
+    client.put_object(
+        Bucket=BUCKET,
+        Key=f"box_scores/{game_id}.json",
+        Body=json.dumps(make_game(game_id, **kwargs), indent=2),
+    )
+
+
+@pytest.fixture
+def client(tmp_path):
+    client = LocalS3Client(str(tmp_path / "s3"))
+    for i in range(6):
+        put_game(client, f"40158{i:04d}")
+    return client
+
+
+def make_reader(client, tmp_path, **cache_kwargs):
+    revalidate = cache_kwargs.pop("revalidate", True)
+    cache = GameCache(str(tmp_path / "cache"), **cache_kwargs)
+    reader = ESPNJSONReader(
+        bucket=BUCKET, s3_client=client, game_cache=cache, revalidate=revalidate
+    )
+    return reader, cache
+
+
+class TestGameCache:
+    """GameCache behind ESPNJSONReader"""
+
+    def test_cold_then_warm_read(self, client, tmp_path):
+        reader, cache = make_reader(client, tmp_path)
+
+        cold = reader.read_game("401580000")
+        requests = client.request_count
+        warm = reader.read_game("401580000")
+
+        assert warm == cold == make_game("401580000")
+        # Warm read: HEAD only, no GET
+        assert client.request_count == requests + 1
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["parsed_hits"] == 1
+        assert stats["compression_ratio"] > 2
+        assert stats["codec"] in ("zstd", "zlib")
+
+    def test_changed_object_invalidates(self, client, tmp_path):
+        reader, cache = make_reader(client, tmp_path)
+        reader.read_game("401580001")
+
+        time.sleep(0.01)
+        put_game(client, "401580001", n_plays=60, marker="v2")
+
+        assert reader.read_game("401580001")["header"]["marker"] == "v2"
+        assert cache.stats()["misses"] == 2
+        # Superseded version is dropped
+        assert cache.stats()["entries"] == 1
+
+    def test_no_revalidation_trusts_cache(self, client, tmp_path):
+        reader, cache = make_reader(client, tmp_path, revalidate=False)
+        reader.read_game("401580002")
+        requests = client.request_count
+
+        put_game(client, "401580002", n_plays=60, marker="v2")
+        game = reader.read_game("401580002")
+
+        assert game["header"]["marker"] == "v1"
+        assert client.request_count == requests
+
+    def test_raw_bytes_and_no_parsed_form(self, client, tmp_path):
+        reader, cache = make_reader(client, tmp_path, keep_parsed=False)
+
+        raw = reader.read_game_bytes("401580003")
+        game = reader.read_game("401580003")
+
+        assert json.loads(raw) == game
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["parsed_hits"] == 0
+        assert not list((tmp_path / "cache").rglob("*.pkl"))
+
+    def test_lru_budget(self, client, tmp_path):
+        reader, cache = make_reader(client, tmp_path, keep_parsed=False)
+        reader.read_game("401580000")
+        one_entry = cache.total_bytes
+        cache.max_bytes = int(one_entry * 2.5)
+
+        reader.read_game("401580001")
+        reader.read_game("401580000")  # most recently used
+        reader.read_game("401580002")
+
+        assert cache.total_bytes <= cache.max_bytes
+        assert cache.stats()["evictions"] == 1
+        assert cache.current_etag("box_scores/401580001.json") is None
+        assert cache.current_etag("box_scores/401580000.json") is not None
+
+    def test_prewarm_and_persistence(self, client, tmp_path):
+        reader, cache = make_reader(client, tmp_path)
+
+        summary = reader.prewarm(game_id_prefix="4015800")
+        assert summary == {"fetched": 6, "cached": 0, "failed": 0}
+
+        summary = reader.prewarm(["401580000", "401580005", "missing"])
+        assert summary == {"fetched": 0, "cached": 2, "failed": 1}
+        cache.close()
+
+        # Reopened cache serves warm reads without a GET
+        reader, cache = make_reader(client, tmp_path)
+        requests = client.request_count
+        assert reader.read_game("401580004") == make_game("401580004")
+        assert client.request_count == requests + 1
+        assert cache.stats()["entries"] == 6
+
+    def test_unreadable_entry_is_refetched(self, client, tmp_path):
+        reader, cache = make_reader(client, tmp_path, keep_parsed=False)
+        reader.read_game("401580000")
+        for blob in (tmp_path / "cache" / "objects").rglob("*.z*"):
+            blob.write_bytes(b"garbage")
+
+        assert reader.read_game("401580000") == make_game("401580000")
+        assert cache.stats()["misses"] == 2
+
+    def test_missing_game(self, client, tmp_path):
+        reader, _ = make_reader(client, tmp_path)
+        assert reader.read_game("nope") is None
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_warm_read_benchmark(tmp_path):
+    """Warm GameCache reads vs re-parsing the plain JSON cache"""
+    client = LocalS3Client(str(tmp_path / "s3"))
+    game_ids = [f"40158{i:04d}" for i in range(40)]
+    for game_id in game_ids:
+        put_game(client, game_id, n_plays=3000)
+
+    plain = ESPNJSONReader(
+        bucket=BUCKET, s3_client=client, cache_dir=str(tmp_path / "plain")
+    )
+    tiered, cache = make_reader(client, tmp_path, revalidate=False)
+    for reader in (plain, tiered):
+        reader.batch_read_games(game_ids)
+
+    started = time.perf_counter()
+    for game_id in game_ids * 5:
+        plain.read_game(game_id)
+    plain_rate = len(game_ids) * 5 / (time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for game_id in game_ids * 5:
+        tiered.read_game(game_id)
+    tiered_rate = len(game_ids) * 5 / (time.perf_counter() - started)
+
+    plain_mb = sum(p.stat().st_size for p in (tmp_path / "plain").iterdir()) / 1e6
+    stats = cache.stats()
+    print(
+        f"\nWarm reads: plain JSON {plain_rate:,.0f}/sec ({plain_mb:.1f} MB), "
+        f"GameCache {tiered_rate:,.0f}/sec ({stats['total_bytes'] / 1e6:.1f} MB, "
+        f"{stats['codec']}/{stats['parsed_format']})"
+    )
+    assert tiered_rate > plain_rate
@@ -0,0 +1,209 @@
+"""
+Tests for the ESPN incremental async scraper
+
+Bounded concurrency across games and dates, and S3 existence checks from
+S3KeyManifest (one listing per prefix, incremental across runs) instead of
+head_object per game. ESPN is replaced by async fakes and S3 by a local
+directory (LocalS3Client).
+"""
+
+import asyncio
+import time
+from collections import Counter
+
+import pytest
+
+from nba_simulator.etl.base import RateLimiter, S3KeyManifest
+from nba_simulator.testing import LocalS3Client
+from scripts.etl.espn_incremental_async import (
+    KEY_MANIFEST_FILENAME,
+    S3_PREFIX_PBP,
+    ESPNIncrementalScraperAsync,
+)
+
+BUCKET = "espn-test"
+
+
+class CountingClient(LocalS3Client):
+    """LocalS3Client counting head_object calls and list pages"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = Counter()
+
+    def head_object(self, Bucket, Key):
+        self.calls["head"] += 1
+        return super().head_object(Bucket=Bucket, Key=Key)
+
+    def get_paginator(self, operation_name):
+        paginator = super().get_paginator(operation_name)
+        client = self
+
+        class Counting:
+            def paginate(self, **kwargs):
+                for page in paginator.paginate(**kwargs):
+                    client.calls["list"] += 1
+                    yield page
+
+        return Counting()
+
+
+def put_keys(client, keys):
+    for key in keys:
+        client.put_object(Bucket=BUCKET, Key=key, Body=b"{}")
+
+
+class TestS3KeyManifest:
+    """Per-prefix listing, incremental refresh and persistence"""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        client = CountingClient(str(tmp_path / "lake"), page_size=3)
+        put_keys(client, [f"pbp/{i}.json" for i in range(5)] + ["box/1.json"])
+        return client
+
+    def test_prefix_listed_once(self, client):
+        manifest = S3KeyManifest(client, BUCKET)
+
+        assert manifest.contains("pbp/3.json")
+        assert not manifest.contains("pbp/9.json")
+        assert manifest.contains("box/1.json")
+
+        # 5 pbp keys in pages of 3, 1 box key
+        assert client.calls["list"] == 3
+        assert manifest.list_requests == 3
+        assert client.calls["head"] == 0
+
+    def test_add_records_new_keys(self, client):
+        manifest = S3KeyManifest(client, BUCKET)
+        manifest.load("pbp/")
+
+        manifest.add("pbp/7.json")
+
+        assert manifest.contains("pbp/7.json")
+        assert manifest.keys("pbp/")[-1] == "pbp/7.json"
+
+    def test_cached_manifest_lists_incrementally(self, client, tmp_path):
+        cache_path = tmp_path / "keys.manifest"
+        first = S3KeyManifest(client, BUCKET, cache_path=str(cache_path))
+        first.load("pbp/")
+        first.save()
+        put_keys(client, ["pbp/5.json", "pbp/6.json"])
+        client.calls.clear()
+
+        second = S3KeyManifest(client, BUCKET, cache_path=str(cache_path))
+        new_keys = second.load("pbp/")
+
+        assert new_keys == 2
+        assert client.calls["list"] == 1
+        assert len(second.keys("pbp/")) == 7
+
+    def test_stale_cache_lists_in_full(self, client, tmp_path):
+        cache_path = tmp_path / "keys.manifest"
+        first = S3KeyManifest(client, BUCKET, cache_path=str(cache_path))
+        first.load("pbp/")
+        first.save()
+        (tmp_path / "lake" / BUCKET / "pbp" / "0.json").unlink()
+
+        second = S3KeyManifest(
+            client, BUCKET, cache_path=str(cache_path), full_refresh_seconds=0
+        )
+        time.sleep(0.01)
+
+        assert not second.contains("pbp/0.json")
+        assert len(second.keys("pbp/")) == 4
+
+    def test_mismatched_bucket_cache_ignored(self, client, tmp_path):
+        cache_path = tmp_path / "keys.manifest"
+        first = S3KeyManifest(client, BUCKET, cache_path=str(cache_path))
+        first.load("pbp/")
+        first.save()
+
+        other = S3KeyManifest(client, "other-bucket", cache_path=str(cache_path))
+
+        assert other.keys("pbp/") == []
+
+
+class TestConcurrentScrape:
+    """Games and dates run concurrently within the configured bounds"""
+
+    GAMES_PER_DATE = 6
+
+    @pytest.fixture
+    def scraper(self, tmp_path):
+        client = CountingClient(str(tmp_path / "lake"))
+        scraper = ESPNIncrementalScraperAsync(days_back=2, concurrent_dates=3)
+        scraper.s3_client = client
+        scraper.output_dir = tmp_path / "output"
+        scraper.config.s3_bucket = BUCKET
+        scraper.config.dry_run = False
+        scraper.config.max_concurrent = 4
+        scraper.rate_limiter = RateLimiter(0.0001)
+
+        scraper.in_flight = 0
+        scraper.max_in_flight = 0
+        scraper.fetched = []
+
+        async def fetch_schedule(date_str):
+            ids = [f"{date_str}{i}" for i in range(self.GAMES_PER_DATE)]
+            return {"events": [{"id": game_id} for game_id in ids]}
+
+        async def fetch_game_data(game_id):
+            await scraper.rate_limiter.acquire()
+            scraper.in_flight += 1
+            scraper.max_in_flight = max(scraper.max_in_flight, scraper.in_flight)
+            await asyncio.sleep(0.02)
+            scraper.in_flight -= 1
+            scraper.fetched.append(game_id)
+            return {"header": {"id": game_id}}
+
+        scraper.fetch_schedule = fetch_schedule
+        scraper.fetch_game_data = fetch_game_data
+        return scraper
+
+    def existing_games(self, scraper):
+        """Seed S3 with the first two games of every date"""
+        existing = [
+            f"{date_str}{i}" for date_str in scraper.get_date_range() for i in range(2)
+        ]
+        put_keys(
+            scraper.s3_client, [f"{S3_PREFIX_PBP}/{game}.json" for game in existing]
+        )
+        return existing
+
+    def test_bounded_concurrency_and_manifest(self, scraper):
+        existing = self.existing_games(scraper)
+
+        result = asyncio.run(scraper.scrape())
+
+        dates = len(scraper.get_date_range())
+        assert result["games_scraped"] == dates * (self.GAMES_PER_DATE - 2)
+        assert result["games_skipped"] == len(existing)
+        # Existing games are skipped before their summary request
+        assert not set(scraper.fetched) & set(existing)
+        assert 1 < scraper.max_in_flight <= 4
+        # One listing of the play-by-play prefix, no HEAD requests
+        assert scraper.s3_client.calls["head"] == 0
+        assert scraper.s3_client.calls["list"] == 1
+
+    def test_manifest_persists_across_runs(self, scraper):
+        asyncio.run(scraper.scrape())
+        assert (scraper.output_dir / KEY_MANIFEST_FILENAME).exists()
+
+        scraper._key_manifest = None
+        scraper.fetched.clear()
+        result = asyncio.run(scraper.scrape())
+
+        assert result["games_scraped"] == 0
+        assert scraper.fetched == []
+
+    def test_head_object_without_manifest(self, scraper):
+        scraper.use_key_manifest = False
+        existing = self.existing_games(scraper)
+
+        result = asyncio.run(scraper.scrape())
+
+        total = len(scraper.get_date_range()) * self.GAMES_PER_DATE
+        assert result["games_skipped"] == len(existing)
+        assert scraper.s3_client.calls["head"] == total
+        assert scraper.s3_client.calls["list"] == 0
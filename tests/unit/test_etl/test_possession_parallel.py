@@ -0,0 +1,267 @@
+"""
+Unit Tests for Chunked / Parallel Possession Extraction
+
+Tests the possession extraction engine without a database:
+- Round-robin game sharding
+- COPY payload serialization
+- Chunk processing with atomic checkpoint commits
+- Per-game fallback when a chunk write fails
+- Checkpoint-based resume (empty games are retried)
+"""
+
+import csv
+import sqlite3
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from nba_simulator.etl.extractors.possession import (
+    ParallelPossessionExtractor,
+    PossessionBoundary,
+    PossessionExtractor,
+    load_config,
+)
+from nba_simulator.etl.extractors.possession.extractor import (
+    CHECKPOINT_TABLE,
+    POSSESSION_COLUMNS,
+)
+from nba_simulator.etl.extractors.possession.parallel import (
+    run_worker,
+    shard_games,
+)
+
+
+def make_possession(game_id: str, number: int = 1, **overrides) -> PossessionBoundary:
+    """Build a minimal PossessionBoundary for tests"""
+    fields = dict(
+        possession_number=number,
+        game_id=game_id,
+        season=2024,
+        game_date=datetime(2024, 1, 1),
+        start_event_id=number * 10,
+        end_event_id=number * 10 + 5,
+        period=1,
+        start_clock_minutes=11,
+        start_clock_seconds=40.0,
+        end_clock_minutes=11,
+        end_clock_seconds=22.0,
+        offensive_team_id=1,
+        defensive_team_id=2,
+        home_team_id=1,
+        away_team_id=2,
+        points_scored=2,
+        field_goals_attempted=1,
+        field_goals_made=1,
+    )
+    fields.update(overrides)
+    return PossessionBoundary(**fields)
+
+
+@pytest.fixture
+def config():
+    """Load the default possession extraction configuration"""
+    return load_config()
+
+
+@pytest.fixture
+def extractor(config):
+    """Extractor wired to mocked connection and cursor"""
+    extractor = PossessionExtractor(config)
+    extractor.conn = MagicMock()
+    extractor.cursor = MagicMock()
+    return extractor
+
+
+class TestShardGames:
+    """Tests for round-robin sharding"""
+
+    def test_shards_are_balanced(self):
+        games = [f"g{i}" for i in range(10)]
+        shards = shard_games(games, 3)
+
+        assert [len(s) for s in shards] == [4, 3, 3]
+        assert sorted(g for s in shards for g in s) == sorted(games)
+
+    def test_empty_shards_dropped(self):
+        assert shard_games(["a", "b"], 4) == [["a"], ["b"]]
+        assert shard_games([], 4) == []
+
+
+class TestCopyBuffer:
+    """Tests for COPY payload serialization"""
+
+    def test_rows_follow_column_order(self):
+        buffer = PossessionExtractor.build_copy_buffer(
+            [make_possession("g1", 1), make_possession("g1", 2)]
+        )
+        rows = list(csv.reader(buffer))
+
+        assert len(rows) == 2
+        assert len(rows[0]) == len(POSSESSION_COLUMNS)
+        assert rows[0][POSSESSION_COLUMNS.index("game_id")] == "g1"
+        assert rows[1][POSSESSION_COLUMNS.index("possession_number")] == "2"
+
+    def test_none_written_as_null_marker(self):
+        poss = make_possession("g1", home_team_id=None)
+        row = next(csv.reader(PossessionExtractor.build_copy_buffer([poss])))
+
+        assert row[POSSESSION_COLUMNS.index("home_team_id")] == "\\N"
+        # Empty strings stay empty strings, not NULL
+        assert row[POSSESSION_COLUMNS.index("validation_notes")] == ""
+
+
+class TestProcessGames:
+    """Tests for chunked game processing"""
+
+    def test_chunk_committed_once_with_checkpoints(self, extractor):
+        events = {"g1": [{"event_id": 1}] * 3, "g2": [{"event_id": 2}] * 4}
+        extractor.iter_events_for_games = MagicMock(return_value=iter(events.items()))
+        extractor.detector.detect_possessions = MagicMock(
+            side_effect=lambda evs: [make_possession("g", 1), make_possession("g", 2)]
+        )
+        extractor._commit_games = MagicMock()
+
+        result = extractor.process_games(["g1", "g2", "g3"])
+
+        extractor._commit_games.assert_called_once()
+        possessions, checkpoints = extractor._commit_games.call_args[0]
+        assert len(possessions) == 4
+        assert checkpoints == [
+            ("g1", "completed", 2, 3),
+            ("g2", "completed", 2, 4),
+            ("g3", "empty", 0, 0),
+        ]
+        assert result == {"games": 2, "failed": 0, "possessions": 4, "events": 7}
+        assert extractor.stats["games_processed"] == 2
+        assert extractor.stats["events_processed"] == 7
+
+    def test_detection_failure_not_checkpointed(self, extractor):
+        events = {"g1": [{"event_id": 1}], "g2": [{"event_id": 2}]}
+        extractor.iter_events_for_games = MagicMock(return_value=iter(events.items()))
+
+        def detect(evs):
+            if evs[0]["event_id"] == 1:
+                raise ValueError("bad game")
+            return [make_possession("g2")]
+
+        extractor.detector.detect_possessions = MagicMock(side_effect=detect)
+        extractor._commit_games = MagicMock()
+
+        result = extractor.process_games(["g1", "g2"])
+
+        _, checkpoints = extractor._commit_games.call_args[0]
+        assert [row[0] for row in checkpoints] == ["g2"]
+        assert result["failed"] == 1
+        assert result["games"] == 1
+
+    def test_chunk_write_failure_falls_back_per_game(self, extractor):
+        events = {"g1": [{"event_id": 1}], "g2": [{"event_id": 2}]}
+        extractor.iter_events_for_games = MagicMock(return_value=iter(events.items()))
+        extractor.detector.detect_possessions = MagicMock(
+            side_effect=lambda evs: [make_possession(f"g{evs[0]['event_id']}")]
+        )
+
+        def commit(possessions, checkpoints):
+            if len(checkpoints) > 1 or checkpoints[0][0] == "g2":
+                raise RuntimeError("copy failed")
+
+        extractor._commit_games = MagicMock(side_effect=commit)
+
+        result = extractor.process_games(["g1", "g2"])
+
+        # One chunk attempt plus one retry per game
+        assert extractor._commit_games.call_count == 3
+        assert result["games"] == 1
+        assert result["failed"] == 1
+        assert result["possessions"] == 1
+
+    def test_commit_is_atomic(self, extractor):
+        extractor.write_possessions_copy = MagicMock(side_effect=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            extractor._commit_games(
+                [make_possession("g1")], [("g1", "completed", 1, 1)]
+            )
+
+        extractor.conn.rollback.assert_called_once()
+        extractor.conn.commit.assert_not_called()
+
+
+class TestResume:
+    """Tests for checkpoint-based resume"""
+
+    def test_pending_games_skip_checkpointed(self, extractor):
+        extractor.get_game_list = MagicMock(return_value=["g1", "g2", "g3"])
+        extractor.get_completed_games = MagicMock(return_value={"g2"})
+
+        assert extractor.get_pending_games() == ["g1", "g3"]
+        assert extractor.stats["games_skipped"] == 1
+
+    def test_empty_games_retried_on_resume(self, extractor):
+        extractor.conn = sqlite3.connect(":memory:")
+        extractor.conn.row_factory = sqlite3.Row
+        extractor.cursor = extractor.conn.cursor()
+        extractor.cursor.execute(
+            f"CREATE TABLE {CHECKPOINT_TABLE} (game_id TEXT PRIMARY KEY, status TEXT)"
+        )
+        extractor.cursor.executemany(
+            f"INSERT INTO {CHECKPOINT_TABLE} VALUES (?, ?)",
+            [("g1", "completed"), ("g2", "empty")],
+        )
+        extractor.ensure_checkpoint_table = MagicMock()
+        extractor.get_game_list = MagicMock(return_value=["g1", "g2", "g3"])
+
+        assert extractor.get_pending_games() == ["g2", "g3"]
+        assert extractor.stats["games_skipped"] == 1
+
+    def test_force_clears_checkpoints(self, extractor):
+        extractor.get_game_list = MagicMock(return_value=["g1", "g2"])
+        extractor.get_completed_games = MagicMock(return_value={"g2"})
+        extractor.clear_checkpoints = MagicMock()
+
+        assert extractor.get_pending_games(resume=False) == ["g1", "g2"]
+        extractor.clear_checkpoints.assert_called_once()
+
+    def test_single_process_run_uses_chunks(self, extractor):
+        extractor.get_pending_games = MagicMock(
+            return_value=[f"g{i}" for i in range(5)]
+        )
+        extractor.process_games = MagicMock()
+
+        extractor.extract_all_games(workers=1, chunk_size=2)
+
+        chunks = [c[0][0] for c in extractor.process_games.call_args_list]
+        assert chunks == [["g0", "g1"], ["g2", "g3"], ["g4"]]
+
+
+class TestParallelWorker:
+    """Tests for the worker entry point"""
+
+    def test_worker_reports_rates(self, config):
+        with patch(
+            "nba_simulator.etl.extractors.possession.parallel.PossessionExtractor"
+        ) as mock_cls:
+            instance = mock_cls.return_value
+            instance.connect.return_value = True
+            instance.stats = {
+                "games_processed": 4,
+                "games_failed": 0,
+                "possessions_extracted": 400,
+                "events_processed": 1800,
+            }
+
+            summary = run_worker(config, 3, ["a", "b", "c", "d"], chunk_size=2)
+
+        assert instance.process_games.call_count == 2
+        instance.disconnect.assert_called_once()
+        assert summary["worker_id"] == 3
+        assert summary["games_per_sec"] > 0
+        assert summary["events_per_sec"] > summary["games_per_sec"]
+
+    def test_run_with_no_games(self, config):
+        stats = ParallelPossessionExtractor(config, workers=4).run([], skipped=7)
+
+        assert stats["games_processed"] == 0
+        assert stats["games_skipped"] == 7
+        assert stats["workers"] == []
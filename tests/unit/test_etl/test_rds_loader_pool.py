@@ -0,0 +1,168 @@
+"""
+Tests for RDSLoader pooled mode
+
+Concurrent batch loading over an asyncpg pool (bounded in-flight work,
+per-batch retries) and binary COPY via copy_records_to_table. asyncpg is
+replaced by in-memory fakes, so no database is needed.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from nba_simulator.etl.loaders import LoadStatus, RDSLoader
+
+
+class FakeConnection:
+    """asyncpg.Connection stand-in that records COPY calls"""
+
+    def __init__(self, pool=None, delay=0.005):
+        self.pool = pool
+        self.delay = delay
+        self.copies = []
+        self.executemany_calls = []
+        self.close = AsyncMock()
+
+    async def fetchval(self, query, *args):
+        # Table exists / row count
+        return True if "EXISTS" in query else sum(len(r) for _, r, _ in self.copies)
+
+    async def copy_records_to_table(self, table, *, records, columns, schema_name):
+        await asyncio.sleep(self.delay)
+        self.copies.append((table, records, columns))
+        return f"COPY {len(records)}"
+
+    async def executemany(self, query, args):
+        await asyncio.sleep(self.delay)
+        self.executemany_calls.append((query, args))
+
+
+class FakePool:
+    """asyncpg.Pool stand-in that tracks connections in use"""
+
+    def __init__(self, size):
+        self.connections = [FakeConnection(self) for _ in range(size)]
+        self.free = list(self.connections)
+        self.in_use = 0
+        self.max_in_use = 0
+        self.closed = False
+
+    @asynccontextmanager
+    async def acquire(self):
+        while not self.free:
+            await asyncio.sleep(0)
+        conn = self.free.pop()
+        self.in_use += 1
+        self.max_in_use = max(self.max_in_use, self.in_use)
+        try:
+            yield conn
+        finally:
+            self.in_use -= 1
+            self.free.append(conn)
+
+    async def close(self):
+        self.closed = True
+
+
+def make_rows(n):
+    return [{"game_id": f"g{i}", "points": i, "home": i % 2 == 0} for i in range(n)]
+
+
+def make_loader(**kwargs):
+    kwargs.setdefault("batch_size", 10)
+    kwargs.setdefault("retry_delay", 0)
+    kwargs.setdefault("config", {"verify": False})
+    return RDSLoader(
+        "games", upsert=False, db_config={"dsn": "postgresql://test"}, **kwargs
+    )
+
+
+def patch_pool(pool):
+    return patch(
+        "nba_simulator.etl.loaders.rds_loader.asyncpg.create_pool",
+        new=AsyncMock(return_value=pool),
+    )
+
+
+class TestPooledLoading:
+    """Concurrent batches over a connection pool"""
+
+    def test_batches_load_concurrently_within_bound(self):
+        pool = FakePool(size=8)
+        loader = make_loader(concurrency=4)
+
+        with patch_pool(pool) as create_pool:
+            metrics = asyncio.run(loader.load(make_rows(200)))
+
+        create_pool.assert_awaited_once_with(
+            min_size=1, max_size=4, dsn="postgresql://test"
+        )
+        assert metrics.status == LoadStatus.COMPLETED
+        assert metrics.records_loaded == 200
+        assert metrics.batches_processed == 20
+        assert pool.max_in_use == 4
+        assert pool.closed and loader.pool is None
+
+    def test_copy_sends_binary_records(self):
+        pool = FakePool(size=2)
+        loader = make_loader(concurrency=2)
+
+        with patch_pool(pool):
+            asyncio.run(loader.load(make_rows(15)))
+
+        copies = [c for conn in pool.connections for c in conn.copies]
+        assert sorted(len(records) for _, records, _ in copies) == [5, 10]
+        table, records, columns = copies[0]
+        assert table == "games"
+        assert columns == ["game_id", "points", "home"]
+        # Native Python values, not escaped text
+        assert all(isinstance(r, tuple) and isinstance(r[1], int) for r in records)
+
+    def test_failed_batches_are_retried(self):
+        pool = FakePool(size=3)
+        loader = make_loader(concurrency=3, max_retries=3)
+        attempts = {}
+        load_batch = loader.load_batch
+
+        async def flaky_load_batch(batch):
+            key = batch[0]["game_id"]
+            attempts[key] = attempts.get(key, 0) + 1
+            if key == "g0" and attempts[key] < 3:
+                raise ConnectionError("connection reset")
+            if key == "g10":
+                raise ConnectionError("server closed the connection")
+            return await load_batch(batch)
+
+        loader.load_batch = flaky_load_batch
+        with patch_pool(pool):
+            metrics = asyncio.run(loader.load(make_rows(50)))
+
+        assert attempts["g0"] == 3
+        assert attempts["g10"] == 3
+        assert metrics.records_loaded == 40
+        assert metrics.records_failed == 10
+        assert metrics.batches_failed == 1
+        assert metrics.status == LoadStatus.PARTIAL
+
+    def test_sequential_mode_uses_single_connection(self):
+        conn = FakeConnection()
+        loader = make_loader()
+
+        with patch(
+            "nba_simulator.etl.loaders.rds_loader.asyncpg.connect",
+            new=AsyncMock(return_value=conn),
+        ) as connect, patch_pool(FakePool(1)) as create_pool:
+            metrics = asyncio.run(loader.load(make_rows(30)))
+
+        connect.assert_awaited_once()
+        create_pool.assert_not_awaited()
+        assert not loader.pooled
+        assert metrics.records_loaded == 30
+        assert len(conn.copies) == 3
+        conn.close.assert_awaited_once()
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            make_loader(concurrency=0)
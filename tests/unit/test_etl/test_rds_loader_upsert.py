@@ -0,0 +1,162 @@
+"""
+Tests for RDSLoader staged upsert
+
+COPY into a temp staging table followed by one INSERT ... SELECT ...
+ON CONFLICT merge per batch, with inserted vs updated counts reported in
+LoadMetrics. The database is an in-memory fake keyed on the first column.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from nba_simulator.etl.loaders import LoadStatus, RDSLoader
+
+
+class FakeTable:
+    """In-memory stand-in for the target table, shared across connections"""
+
+    def __init__(self):
+        self.rows = {}
+
+
+class FakeConnection:
+    """asyncpg.Connection stand-in implementing the staged merge"""
+
+    def __init__(self, table, fail_merge=False):
+        self.table = table
+        self.fail_merge = fail_merge
+        self.staging = []
+        self.statements = []
+        self.executemany_calls = 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        try:
+            yield
+        finally:
+            # ON COMMIT DELETE ROWS (or rollback)
+            self.staging = []
+
+    async def execute(self, query, *args):
+        self.statements.append(query)
+        if "INSERT INTO" in query:
+            self.table.rows[args[0]] = args
+
+    async def copy_records_to_table(self, table, *, records, columns, **kwargs):
+        assert table.startswith("_staging_")
+        self.staging.extend(records)
+        return f"COPY {len(records)}"
+
+    async def fetchrow(self, query):
+        self.statements.append(query)
+        if self.fail_merge:
+            raise RuntimeError("merge failed")
+        keys = [record[0] for record in self.staging]
+        assert len(keys) == len(set(keys)), "key merged twice in one statement"
+        inserted = sum(1 for key in keys if key not in self.table.rows)
+        for record in self.staging:
+            self.table.rows[record[0]] = record
+        return {"inserted": inserted, "updated": len(keys) - inserted}
+
+    async def executemany(self, query, args):
+        self.executemany_calls += 1
+        for row in args:
+            self.table.rows[row[0]] = row
+
+    async def fetchval(self, query, *args):
+        return True if "EXISTS" in query else len(self.table.rows)
+
+    async def close(self):
+        pass
+
+
+def make_rows(start, stop, points=0):
+    return [
+        {"event_id": i, "game_id": f"g{i // 10}", "points": points}
+        for i in range(start, stop)
+    ]
+
+
+def run_load(conn, rows, **kwargs):
+    loader = RDSLoader(
+        "temporal_events",
+        db_config={},
+        batch_size=10,
+        retry_delay=0,
+        config={"verify": False},
+        **kwargs,
+    )
+    with patch(
+        "nba_simulator.etl.loaders.rds_loader.asyncpg.connect",
+        new=AsyncMock(return_value=conn),
+    ):
+        return asyncio.run(loader.load(rows))
+
+
+class TestStagedUpsert:
+    """COPY-to-staging merge upserts"""
+
+    def test_reports_inserted_and_updated(self):
+        table = FakeTable()
+
+        first = run_load(FakeConnection(table), make_rows(0, 30))
+        assert first.records_inserted == 30
+        assert first.records_updated == 0
+
+        # Nightly reload: 20 existing events change, 10 are new
+        second = run_load(FakeConnection(table), make_rows(10, 40, points=2))
+        assert second.status == LoadStatus.COMPLETED
+        assert second.records_loaded == 30
+        assert second.records_inserted == 10
+        assert second.records_updated == 20
+        assert len(table.rows) == 40
+        assert table.rows[15][2] == 2
+
+    def test_merge_statement(self):
+        conn = FakeConnection(FakeTable())
+        run_load(conn, make_rows(0, 5))
+
+        create, merge = conn.statements[:2]
+        assert "CREATE TEMP TABLE IF NOT EXISTS _staging_temporal_events" in create
+        assert "ON COMMIT DELETE ROWS" in create
+        assert "SELECT event_id, game_id, points FROM _staging_temporal_events" in merge
+        assert "ON CONFLICT (event_id) DO UPDATE SET" in merge
+        assert "RETURNING (xmax = 0) AS inserted" in merge
+        assert conn.executemany_calls == 0
+
+    def test_duplicate_keys_in_batch_last_wins(self):
+        table = FakeTable()
+        rows = make_rows(0, 3) + [{"event_id": 1, "game_id": "g0", "points": 3}]
+
+        metrics = run_load(FakeConnection(table), rows)
+
+        assert metrics.records_loaded == 4
+        assert metrics.records_inserted == 3
+        assert table.rows[1][2] == 3
+
+    def test_falls_back_to_insert_when_merge_fails(self):
+        table = FakeTable()
+        conn = FakeConnection(table, fail_merge=True)
+
+        metrics = run_load(conn, make_rows(0, 25))
+
+        assert conn.executemany_calls == 3
+        assert metrics.records_loaded == 25
+        assert metrics.records_inserted == 0
+        assert len(table.rows) == 25
+
+    def test_insert_method_uses_executemany(self):
+        conn = FakeConnection(FakeTable())
+
+        metrics = run_load(conn, make_rows(0, 20), upsert_method="insert")
+
+        assert conn.executemany_calls == 2
+        assert metrics.records_loaded == 20
+        assert not any("_staging_" in q for q in conn.statements)
+
+    def test_unknown_upsert_method(self):
+        with pytest.raises(ValueError):
+            RDSLoader("games", upsert_method="merge_into", db_config={})
@@ -0,0 +1,118 @@
+"""
+Import-Time Budget Tests
+
+Cold-imports the top-level package and each subpackage in a fresh
+interpreter and checks that:
+- Heavy dependencies (boto3, psycopg2, pandas, ...) are not loaded until a
+  public name that needs them is accessed
+- Lazy exports still resolve to the defining module's objects
+- Cold import time stays under IMPORT_BUDGET_SECONDS (performance)
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+PACKAGES = [
+    "nba_simulator",
+    "nba_simulator.adce",
+    "nba_simulator.agents",
+    "nba_simulator.config",
+    "nba_simulator.database",
+    "nba_simulator.etl",
+    "nba_simulator.etl.extractors",
+    "nba_simulator.monitoring",
+    "nba_simulator.simulation",
+    "nba_simulator.utils",
+    "nba_simulator.workflows",
+]
+
+HEAVY_MODULES = [
+    "aiohttp",
+    "boto3",
+    "botocore",
+    "numpy",
+    "pandas",
+    "psycopg2",
+    "requests",
+    "scipy",
+]
+
+# Seconds for a cold import, best of IMPORT_RUNS fresh interpreters
+IMPORT_BUDGET_SECONDS = 0.25
+IMPORT_RUNS = 3
+
+
+def cold_import(package: str) -> dict:
+    """Import a package in a fresh interpreter; report time and loaded modules"""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {package}\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({'seconds': elapsed, 'modules': sorted(sys.modules)}))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_cold_import_defers_heavy_dependencies(package):
+    """Importing a package does not load its heavy dependencies"""
+    modules = cold_import(package)["modules"]
+
+    loaded = sorted({m.split(".")[0] for m in modules} & set(HEAVY_MODULES))
+    assert loaded == [], f"import {package} loaded {loaded}"
+
+
+def test_lazy_exports_resolve():
+    """Public names resolve on access and are cached on the package"""
+    import nba_simulator
+    import nba_simulator.monitoring as monitoring
+    from nba_simulator.monitoring.dims import DIMSCore
+    from nba_simulator.workflows import DispatchTask
+    from nba_simulator.workflows.dispatcher import DispatchTask as Direct
+
+    assert monitoring.DIMS is DIMSCore
+    assert "DIMS" in vars(monitoring)
+    assert "AlertManager" in dir(monitoring)
+    assert DispatchTask is Direct
+    assert nba_simulator.etl.extractors.espn.__name__.endswith("extractors.espn")
+    with pytest.raises(AttributeError):
+        monitoring.NotAnExport
+
+
+def test_dispatcher_resolves_handlers_on_demand():
+    """Dispatcher handler classes import on first resolve"""
+    from nba_simulator.agents.quality import QualityAgent
+    from nba_simulator.workflows.dispatcher import HANDLER_CLASSES, resolve_handler
+
+    assert resolve_handler("quality_agent") is QualityAgent
+    assert "espn_scraper" in HANDLER_CLASSES
+    with pytest.raises(KeyError):
+        resolve_handler("unknown_handler")
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.parametrize("package", PACKAGES)
+def test_cold_import_budget(package):
+    """Cold import stays within the import-time budget"""
+    seconds = min(cold_import(package)["seconds"] for _ in range(IMPORT_RUNS))
+
+    print(f"\nimport {package}: {seconds * 1000:.1f} ms")
+    assert seconds < IMPORT_BUDGET_SECONDS, (
+        f"import {package} took {seconds:.3f}s "
+        f"(budget {IMPORT_BUDGET_SECONDS:.3f}s)"
+    )
@@ -0,0 +1,5 @@
+"""
+Monitoring Unit Tests
+
+Tests for quality checks, DIMS and alerting components.
+"""
@@ -0,0 +1,163 @@
+"""
+Unit Tests for AlertDeduplicator
+
+Uses an injected clock to test:
+- Suppression, forced sends and the sliding time window
+- Ordered expiry (only expired fingerprints are visited)
+- SQLite state shared between deduplicators and across restarts
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from nba_simulator.monitoring.alerts import (
+    AlertDeduplicator,
+    DeduplicationConfig,
+    FingerprintStore,
+)
+
+START = datetime(2025, 11, 10, 12, 0, tzinfo=timezone.utc)
+
+
+class Clock:
+    def __init__(self):
+        self.now = START
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, minutes):
+        self.now += timedelta(minutes=minutes)
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def make_deduplicator(clock, **kwargs):
+    kwargs.setdefault("window_minutes", 10)
+    return AlertDeduplicator(DeduplicationConfig(**kwargs), clock=clock)
+
+
+def send(dedup, message="ESPN scraper failed", severity="high"):
+    return dedup.should_send_alert("scraper_failure", severity, message)
+
+
+class TestInMemory:
+    def test_duplicates_suppressed_until_forced(self, clock):
+        dedup = make_deduplicator(clock, max_suppressed=3)
+
+        results = [send(dedup) for _ in range(5)]
+
+        assert [sent for sent, _ in results] == [True, False, False, True, False]
+        assert results[0][1] == "new_alert"
+        assert results[1][1] == "duplicate_within_10min"
+        assert results[3][1] == "forced_after_3_suppressions"
+        stats = dedup.get_suppression_stats()
+        assert stats["suppressed_alerts"] == 3
+        assert stats["forced_alerts"] == 1
+
+    def test_window_slides_with_last_seen(self, clock):
+        dedup = make_deduplicator(clock)
+
+        send(dedup)
+        clock.advance(8)
+        assert not send(dedup)[0]
+        clock.advance(8)
+        # Last seen 8 minutes ago: still a duplicate
+        assert not send(dedup)[0]
+        clock.advance(11)
+        assert send(dedup) == (True, "new_alert")
+
+    def test_expiry_in_last_seen_order(self, clock):
+        dedup = make_deduplicator(clock)
+
+        send(dedup, "a")
+        clock.advance(1)
+        send(dedup, "b")
+        clock.advance(1)
+        send(dedup, "a")  # a moves behind b
+        assert [fp.count for fp in dedup.recent_alerts.values()] == [1, 2]
+
+        clock.advance(9.5)
+        send(dedup, "c")
+
+        # b (last seen 10.5 min ago) expired; a (9.5 min) kept
+        assert len(dedup.recent_alerts) == 2
+        assert send(dedup, "a")[0] is False
+        assert send(dedup, "b") == (True, "new_alert")
+
+    def test_expired_fingerprints_removed(self, clock):
+        dedup = make_deduplicator(clock)
+        for i in range(1000):
+            send(dedup, f"alert {i}")
+            clock.advance(0.001)
+
+        clock.advance(5)
+        send(dedup, "new")
+        assert len(dedup.recent_alerts) == 1001
+
+        clock.advance(11)
+        send(dedup, "newer")
+        assert dedup.get_suppression_stats()["active_fingerprints"] == 1
+
+    def test_clear_fingerprint(self, clock):
+        dedup = make_deduplicator(clock)
+        send(dedup)
+
+        dedup.clear_fingerprint("scraper_failure", "high", "ESPN scraper failed")
+
+        assert send(dedup) == (True, "new_alert")
+
+
+class TestSharedState:
+    @pytest.fixture
+    def state_path(self, tmp_path):
+        return str(tmp_path / "dedup.sqlite")
+
+    def test_suppression_shared_between_deduplicators(self, clock, state_path):
+        first = make_deduplicator(clock, state_path=state_path)
+        second = make_deduplicator(clock, state_path=state_path)
+
+        assert send(first)[0]
+        assert send(second) == (False, "duplicate_within_10min")
+        assert send(first)[0] is False
+        assert second.get_suppression_stats()["shared_fingerprints"] == 1
+
+        # Clearing in one process is seen by the other
+        second.clear_fingerprint("scraper_failure", "high", "ESPN scraper failed")
+        assert send(first) == (True, "new_alert")
+        first.close()
+        second.close()
+
+    def test_forced_count_shared(self, clock, state_path):
+        first = make_deduplicator(clock, state_path=state_path, max_suppressed=2)
+        second = make_deduplicator(clock, state_path=state_path, max_suppressed=2)
+
+        results = [send(dedup)[0] for dedup in (first, second, first, second)]
+
+        assert results == [True, False, True, False]
+
+    def test_state_survives_restart(self, clock, state_path):
+        dedup = make_deduplicator(clock, state_path=state_path)
+        send(dedup)
+        dedup.close()
+
+        restarted = make_deduplicator(clock, state_path=state_path)
+        assert not send(restarted)[0]
+
+        clock.advance(11)
+        assert send(restarted) == (True, "new_alert")
+
+    def test_purge_expired_rows(self, clock, state_path):
+        store = FingerprintStore(state_path, cleanup_seconds=3600)
+        dedup = make_deduplicator(clock, state_path=state_path)
+        for i in range(5):
+            send(dedup, f"alert {i}")
+        clock.advance(11)
+
+        assert store.purge(clock() - timedelta(minutes=10), force=True) == 5
+        assert store.purge(clock(), force=False) == 0
+        store.close()
@@ -0,0 +1,398 @@
+"""
+Unit Tests for queued alert dispatch
+
+Uses stub channels, a fake SMTP server and a fake database connection to
+test:
+- Concurrent fan-out across channels and non-blocking send_alert
+- Backpressure policies when a channel queue is full
+- Batched history writes
+- Persistent SMTP sessions and pooled HTTP sessions
+"""
+
+import smtplib
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from nba_simulator.monitoring.alerts import (
+    AlertConfig,
+    AlertDispatcher,
+    AlertHistory,
+    AlertManager,
+    DispatcherConfig,
+    EmailNotifier,
+    NotificationConfig,
+    SlackNotifier,
+)
+from nba_simulator.monitoring.alerts.channels import NotificationChannel
+
+
+class SlowChannel(NotificationChannel):
+    """Channel whose sends take `delay` seconds; optionally held by an event"""
+
+    def __init__(self, name, delay=0.0, gate=None):
+        super().__init__(name, NotificationConfig(retry_attempts=1))
+        self.delay = delay
+        self.gate = gate
+        self.sent = []
+        self.threads = set()
+
+    def _send_notification(self, subject, message, **kwargs):
+        self.threads.add(threading.get_ident())
+        if self.gate is not None:
+            self.gate.wait(5)
+        time.sleep(self.delay)
+        self.sent.append((subject, message, kwargs))
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.statements.append(("execute", sql, params))
+
+    def executemany(self, sql, rows):
+        self.conn.statements.append(("executemany", sql, list(rows)))
+
+
+class FakeConnection:
+    """Records statements and commits"""
+
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+def quick_config(**kwargs):
+    kwargs.setdefault("history_flush_seconds", 0.05)
+    return DispatcherConfig(**kwargs)
+
+
+class TestAlertDispatcher:
+    """Per-channel queues and workers"""
+
+    def test_channels_send_concurrently(self):
+        channels = {name: SlowChannel(name, delay=0.2) for name in ("a", "b", "c")}
+        dispatcher = AlertDispatcher(channels, config=quick_config())
+
+        start = time.perf_counter()
+        queued = dispatcher.submit(
+            "alert1",
+            {name: {"subject": "s", "message": "m", "x": 1} for name in channels},
+        )
+        submitted = time.perf_counter() - start
+        assert dispatcher.flush(timeout=5)
+        elapsed = time.perf_counter() - start
+        dispatcher.close()
+
+        assert queued == {"a": True, "b": True, "c": True}
+        assert submitted < 0.1
+        assert elapsed < 0.5
+        assert all(
+            channel.sent == [("s", "m", {"x": 1})] for channel in channels.values()
+        )
+        workers = set.union(*(channel.threads for channel in channels.values()))
+        assert len(workers) == 3
+        assert threading.get_ident() not in workers
+
+    def test_unknown_channel(self):
+        dispatcher = AlertDispatcher({}, config=quick_config())
+
+        assert dispatcher.submit("a1", {"pager": {"subject": "s", "message": "m"}}) == {
+            "pager": False
+        }
+
+    def test_drop_newest_when_full(self):
+        gate = threading.Event()
+        channel = SlowChannel("slow", gate=gate)
+        dispatcher = AlertDispatcher(
+            {"slow": channel}, config=quick_config(queue_size=2, overflow="drop_newest")
+        )
+
+        results = []
+        for i in range(5):
+            results.append(
+                dispatcher.submit(str(i), {"slow": {"subject": str(i), "message": ""}})
+            )
+            # Let the worker pick up the first item before filling the queue
+            time.sleep(0.02)
+        gate.set()
+        dispatcher.flush(timeout=5)
+        stats = dispatcher.get_statistics()["channels"]["slow"]
+        dispatcher.close()
+
+        assert [r["slow"] for r in results] == [True, True, True, False, False]
+        assert [sent[0] for sent in channel.sent] == ["0", "1", "2"]
+        assert stats["dropped"] == 2
+        assert stats["max_queue_depth"] == 2
+
+    def test_drop_oldest_keeps_recent(self):
+        gate = threading.Event()
+        channel = SlowChannel("slow", gate=gate)
+        dispatcher = AlertDispatcher(
+            {"slow": channel}, config=quick_config(queue_size=2, overflow="drop_oldest")
+        )
+
+        for i in range(5):
+            dispatcher.submit(str(i), {"slow": {"subject": str(i), "message": ""}})
+            time.sleep(0.02)
+        gate.set()
+        dispatcher.flush(timeout=5)
+        dispatcher.close()
+
+        assert [sent[0] for sent in channel.sent] == ["0", "3", "4"]
+
+    def test_block_times_out(self):
+        gate = threading.Event()
+        dispatcher = AlertDispatcher(
+            {"slow": SlowChannel("slow", gate=gate)},
+            config=quick_config(queue_size=1, put_timeout=0.05),
+        )
+
+        results = []
+        for i in range(3):
+            results.append(
+                dispatcher.submit(str(i), {"slow": {"subject": "", "message": ""}})
+            )
+            time.sleep(0.02)
+        gate.set()
+        dispatcher.close()
+
+        assert [r["slow"] for r in results] == [True, True, False]
+
+    def test_latency_statistics_and_metrics(self):
+        publisher = MagicMock()
+        dispatcher = AlertDispatcher(
+            {"a": SlowChannel("a", delay=0.01)},
+            config=quick_config(),
+            metrics_publisher=publisher,
+        )
+
+        for i in range(4):
+            dispatcher.submit(str(i), {"a": {"subject": "", "message": ""}})
+        dispatcher.flush(timeout=5)
+        stats = dispatcher.get_statistics()["channels"]["a"]
+        dispatcher.close()
+
+        assert stats["queued"] == 4
+        assert stats["sent"] == 4
+        assert stats["queue_depth"] == 0
+        assert stats["latency_ms"]["max"] >= 10
+        assert 0 < stats["latency_ms"]["p50"] <= stats["latency_ms"]["p95"]
+        names = {call.args[1] for call in publisher.record.call_args_list}
+        assert names == {"AlertDispatchLatency", "AlertQueueDepth"}
+
+    def test_invalid_overflow(self):
+        with pytest.raises(ValueError):
+            AlertDispatcher({}, config=DispatcherConfig(overflow="spill"))
+
+
+class TestQueuedAlertManager:
+    """AlertManager with async_dispatch"""
+
+    def make_manager(self, **dispatcher_kwargs):
+        config = AlertConfig(
+            default_channels={"slow"},
+            enable_escalation=False,
+            async_dispatch=True,
+            dispatcher_config=quick_config(**dispatcher_kwargs),
+        )
+        manager = AlertManager(config)
+        channel = SlowChannel("slow", delay=0.2)
+        manager.add_channel("slow", channel)
+        return manager, channel
+
+    def test_send_alert_returns_before_delivery(self):
+        manager, channel = self.make_manager()
+
+        start = time.perf_counter()
+        result = manager.send_alert("scraper_failure", "high", "ESPN down")
+        elapsed = time.perf_counter() - start
+
+        assert result["success"]
+        assert result["queued"] == ["slow"]
+        assert elapsed < 0.1
+        assert channel.sent == []
+
+        assert manager.flush(timeout=5)
+        subject, message, kwargs = channel.sent[0]
+        assert subject == "[HIGH] scraper_failure"
+        assert kwargs["alert_id"] == result["alert_id"]
+        assert manager.history.get_alert(result["alert_id"]).notifications_sent == 1
+        assert manager.get_statistics()["dispatcher"]["channels"]["slow"]["sent"] == 1
+        manager.close()
+
+    def test_history_written_in_batches(self):
+        manager, channel = self.make_manager(history_batch_size=100)
+        channel.delay = 0
+        manager.deduplicator = None
+        conn = FakeConnection()
+        manager.history.db_conn = conn
+
+        for i in range(10):
+            manager.send_alert("quality", "low", f"check {i}")
+        manager.flush(timeout=5)
+        manager.close()
+
+        inserted = sum(
+            len(rows)
+            for kind, sql, rows in conn.statements
+            if kind == "executemany" and "INSERT" in sql
+        )
+        updated = sum(
+            count
+            for kind, sql, rows in conn.statements
+            if kind == "executemany" and "UPDATE" in sql
+            for count, _ in rows
+        )
+        assert inserted == 10
+        assert updated == 10
+        assert not [s for s in conn.statements if s[0] == "execute"]
+        assert conn.commits < 10
+
+    def test_sync_dispatch_unchanged(self):
+        manager = AlertManager(AlertConfig(enable_escalation=False))
+        channel = SlowChannel("slow")
+        manager.add_channel("slow", channel)
+
+        result = manager.send_alert("test", "info", "msg", channels={"slow"})
+
+        assert manager.dispatcher is None
+        assert result["channels"][0]["success"]
+        assert len(channel.sent) == 1
+
+
+class TestWriteBatch:
+    def test_one_transaction(self):
+        history = AlertHistory()
+        conn = FakeConnection()
+        history.db_conn = conn
+        entries = [
+            history.record_alert(f"a{i}", "t", "low", "m", persist=False)
+            for i in range(3)
+        ]
+
+        assert history.write_batch(entries, {"a0": 2})
+
+        assert [s[0] for s in conn.statements] == ["executemany", "executemany"]
+        assert len(conn.statements[0][2]) == 3
+        assert conn.statements[1][2] == [(2, "a0")]
+        assert conn.commits == 1
+
+
+class FakeSMTP:
+    """smtplib.SMTP stand-in counting sessions"""
+
+    instances = []
+
+    def __init__(self, host, port, timeout=None):
+        self.sent = []
+        self.closed = False
+        self.fail_next = None
+        FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        pass
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        if self.fail_next:
+            error, self.fail_next = self.fail_next, None
+            raise error
+        self.sent.append(to_addrs)
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.quit()
+
+
+class TestConnectionReuse:
+    @pytest.fixture(autouse=True)
+    def fake_smtp(self, monkeypatch):
+        FakeSMTP.instances = []
+        monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+
+    def make_email(self, **kwargs):
+        return EmailNotifier(
+            "smtp.example.com",
+            587,
+            "alerts@example.com",
+            ["ops@example.com"],
+            smtp_username="u",
+            smtp_password="p",
+            config=NotificationConfig(retry_attempts=1),
+            **kwargs,
+        )
+
+    def test_smtp_session_reused(self):
+        notifier = self.make_email()
+
+        for i in range(5):
+            assert notifier.send(f"s{i}", "m").success
+        notifier.close()
+
+        assert len(FakeSMTP.instances) == 1
+        assert len(FakeSMTP.instances[0].sent) == 5
+        assert FakeSMTP.instances[0].closed
+
+    def test_smtp_reconnects_after_disconnect(self):
+        notifier = self.make_email()
+        notifier.send("s", "m")
+        FakeSMTP.instances[0].fail_next = smtplib.SMTPServerDisconnected("idle")
+
+        assert notifier.send("s", "m").success
+        assert len(FakeSMTP.instances) == 2
+        assert len(FakeSMTP.instances[1].sent) == 1
+
+    def test_smtp_per_message_session(self):
+        notifier = self.make_email(persistent_connection=False)
+
+        notifier.send("s", "m")
+        notifier.send("s", "m")
+
+        assert len(FakeSMTP.instances) == 2
+        assert all(server.closed for server in FakeSMTP.instances)
+
+    def test_slack_uses_pooled_session(self):
+        notifier = SlackNotifier(
+            "https://hooks.slack.com/x", config=NotificationConfig(retry_attempts=1)
+        )
+        notifier.session = MagicMock()
+        notifier.session.post.return_value.status_code = 200
+
+        notifier.send("s1", "m", color="#F44336")
+        notifier.send("s2", "m")
+        notifier.close()
+
+        assert notifier.session.post.call_count == 2
+        payload = notifier.session.post.call_args_list[0].kwargs["json"]
+        assert payload["attachments"][0]["color"] == "#F44336"
+        notifier.session.close.assert_called_once()
@@ -0,0 +1,250 @@
+"""
+Unit Tests for CloudWatchPublisher
+
+Uses a stub CloudWatch client to test:
+- Client-side aggregation into StatisticSets and Values/Counts
+- Batching up to the put_metric_data limits
+- Background flushing off the recording thread
+- Retries, spill buffer and bounded drops on API failures
+- Embedded Metric Format output
+"""
+
+import asyncio
+import io
+import json
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from nba_simulator.monitoring.cloudwatch import (
+    CloudWatchPublisher,
+    MetricNamespace,
+    MetricUnit,
+)
+from nba_simulator.monitoring.cloudwatch.publisher import (
+    MAX_DATUMS_PER_CALL,
+    MAX_VALUES_PER_DATUM,
+)
+
+MINUTE = datetime(2025, 11, 10, 12, 30, 15, tzinfo=timezone.utc)
+
+
+class StubClient:
+    """Records put_metric_data calls; fails the first `failures` calls"""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = []
+        self.threads = set()
+
+    def put_metric_data(self, Namespace, MetricData):
+        self.threads.add(threading.get_ident())
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("Throttling")
+        self.calls.append((Namespace, MetricData))
+
+    @property
+    def datums(self):
+        return [datum for _, data in self.calls for datum in data]
+
+
+def make_publisher(client, **kwargs):
+    kwargs.setdefault("cost_optimized", False)
+    kwargs.setdefault("background", False)
+    kwargs.setdefault("retry_delay", 0)
+    return CloudWatchPublisher(client=client, **kwargs)
+
+
+class TestAggregation:
+    """Datapoints merge per (namespace, name, unit, dimensions, minute)"""
+
+    def test_statistic_sets(self):
+        client = StubClient()
+        publisher = make_publisher(client)
+
+        for value in [1, 5, 3]:
+            publisher.record(
+                MetricNamespace.SCRAPERS,
+                "Latency",
+                value,
+                MetricUnit.SECONDS,
+                {"Scraper": "espn"},
+                timestamp=MINUTE,
+            )
+        publisher.record(
+            MetricNamespace.SCRAPERS,
+            "Latency",
+            9,
+            MetricUnit.SECONDS,
+            {"Scraper": "bbref"},
+            timestamp=MINUTE,
+        )
+        publisher.record(
+            MetricNamespace.SCRAPERS,
+            "Latency",
+            2,
+            MetricUnit.SECONDS,
+            {"Scraper": "espn"},
+            timestamp=MINUTE.replace(minute=31),
+        )
+        assert client.calls == []
+
+        assert publisher.flush_now()
+
+        assert len(client.calls) == 1
+        namespace, datums = client.calls[0]
+        assert namespace == "NBA-Simulator/Scrapers"
+        assert len(datums) == 3
+        espn = datums[0]
+        assert espn["StatisticValues"] == {
+            "SampleCount": 3.0,
+            "Sum": 9.0,
+            "Minimum": 1.0,
+            "Maximum": 5.0,
+        }
+        assert espn["Dimensions"] == [{"Name": "Scraper", "Value": "espn"}]
+        assert espn["Timestamp"] == MINUTE.replace(second=0)
+        assert publisher.stats.datapoints_recorded == 5
+        assert publisher.pending == 0
+
+    def test_values_and_counts_split_at_limit(self):
+        client = StubClient()
+        publisher = make_publisher(client, aggregation="values")
+
+        for value in range(MAX_VALUES_PER_DATUM + 10):
+            publisher.record("Custom", "Errors", value, timestamp=MINUTE)
+        publisher.record("Custom", "Errors", 0, timestamp=MINUTE)
+        publisher.flush_now()
+
+        first, second = client.datums
+        assert len(first["Values"]) == MAX_VALUES_PER_DATUM
+        assert first["Counts"][0] == 2.0
+        assert len(second["Values"]) == 10
+
+    def test_batches_respect_api_limit(self):
+        client = StubClient()
+        publisher = make_publisher(client)
+
+        for i in range(MAX_DATUMS_PER_CALL + 5):
+            publisher.record("Custom", "Errors", 1, dimensions={"Game": str(i)})
+        publisher.flush_now()
+
+        assert [len(data) for _, data in client.calls] == [MAX_DATUMS_PER_CALL, 5]
+
+    def test_cost_optimized_filters_non_critical(self):
+        client = StubClient()
+        publisher = make_publisher(client, cost_optimized=True)
+
+        assert not publisher.record(MetricNamespace.DIMS, "RowsLoaded", 10)
+        assert publisher.record(MetricNamespace.DIMS, "VerificationErrors", 1)
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            make_publisher(StubClient(), aggregation="median")
+        with pytest.raises(ValueError):
+            make_publisher(StubClient(), emit="statsd")
+
+
+class TestDelivery:
+    """Background thread, retries and spill buffer"""
+
+    def test_background_flush(self):
+        client = StubClient()
+        publisher = make_publisher(client, background=True, flush_interval=0.05)
+
+        publisher.record("Custom", "Errors", 1)
+        deadline = time.time() + 2
+        while not client.calls and time.time() < deadline:
+            time.sleep(0.01)
+        publisher.close()
+
+        assert len(client.datums) == 1
+        assert threading.get_ident() not in client.threads
+
+    def test_async_flush_runs_off_event_loop(self):
+        client = StubClient()
+        publisher = make_publisher(client)
+
+        async def publish():
+            await publisher.publish_metric(MetricNamespace.HEALTH, "HealthFailures", 1)
+            return await publisher.flush()
+
+        assert asyncio.run(publish())
+        assert threading.get_ident() not in client.threads
+
+    def test_retry_then_success(self):
+        client = StubClient(failures=2)
+        publisher = make_publisher(client, max_retries=2)
+
+        publisher.record("Custom", "Errors", 1)
+
+        assert publisher.flush_now()
+        assert publisher.stats.retries == 2
+        assert len(client.datums) == 1
+
+    def test_failed_batches_spill_and_resend(self):
+        client = StubClient(failures=10)
+        publisher = make_publisher(client, max_retries=1)
+
+        publisher.record("Custom", "Errors", 1, dimensions={"Run": "a"})
+        assert not publisher.flush_now()
+        assert publisher.stats.spilled == 1
+
+        client.failures = 0
+        publisher.record("Custom", "Errors", 1, dimensions={"Run": "b"})
+        assert publisher.flush_now()
+
+        runs = [datum["Dimensions"][0]["Value"] for datum in client.datums]
+        assert runs == ["a", "b"]
+
+    def test_spill_buffer_is_bounded(self):
+        client = StubClient(failures=100)
+        publisher = make_publisher(client, max_retries=0, spill_capacity=3)
+
+        for i in range(5):
+            publisher.record("Custom", "Errors", 1, dimensions={"Run": str(i)})
+        publisher.flush_now()
+
+        assert publisher.stats.dropped == 2
+        client.failures = 0
+        publisher.flush_now()
+        runs = [datum["Dimensions"][0]["Value"] for datum in client.datums]
+        assert runs == ["2", "3", "4"]
+
+
+class TestEmbeddedMetricFormat:
+    """emit='emf' writes log lines instead of calling the API"""
+
+    def test_emf_lines(self):
+        stream = io.StringIO()
+        publisher = CloudWatchPublisher(
+            cost_optimized=False, emit="emf", emf_stream=stream, background=False
+        )
+
+        for i in range(150):
+            publisher.record(
+                MetricNamespace.DIMS,
+                "VerificationSeconds",
+                i % 3,
+                MetricUnit.SECONDS,
+                {"Metric": "s3_objects"},
+                timestamp=MINUTE,
+            )
+        assert publisher.flush_now()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [len(line["VerificationSeconds"]) for line in lines] == [100, 50]
+        directive = lines[0]["_aws"]["CloudWatchMetrics"][0]
+        assert directive["Namespace"] == "NBA-Simulator/DIMS"
+        assert directive["Dimensions"] == [["Metric"]]
+        assert directive["Metrics"] == [
+            {"Name": "VerificationSeconds", "Unit": "Seconds"}
+        ]
+        assert lines[0]["Metric"] == "s3_objects"
+        assert lines[0]["_aws"]["Timestamp"] == int(
+            MINUTE.replace(second=0).timestamp() * 1000
+        )
+        assert publisher.stats.emf_lines == 2
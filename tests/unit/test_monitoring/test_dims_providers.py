@@ -0,0 +1,298 @@
+"""
+Unit Tests for DIMS Metric Providers
+
+Uses a temporary project tree and LocalS3Client to test:
+- file_count/line_count providers match their find/wc commands
+- s3_inventory metrics share one bucket listing per verification run
+- sql_query metrics share one connection per run
+- Shell command fallback when a provider fails or is disabled
+- Concurrent verify_all_metrics with per-metric timings
+"""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import yaml
+
+from nba_simulator.monitoring.dims import DIMSCore, ScanContext, register_provider
+from nba_simulator.monitoring.dims.providers import PROVIDERS, calculate_with_provider
+from nba_simulator.testing import LocalS3Client
+
+BUCKET = "test-lake"
+
+
+def build_project(root, metrics, verification=None):
+    """Project tree with inventory/config.yaml and a few source files"""
+    (root / "inventory").mkdir()
+    (root / "scripts" / "ml").mkdir(parents=True)
+    (root / "scripts" / "tests").mkdir()
+    (root / "sql").mkdir()
+    (root / "scripts" / "ml" / "model.py").write_text("a\nb\nc\n")
+    (root / "scripts" / "ml" / "train.py").write_text("x\ny\n")
+    (root / "scripts" / "tests" / "test_model.py").write_text("t\n")
+    (root / "sql" / "schema.sql").write_text("CREATE;\nINSERT;\n")
+    (root / "sql" / "notes.txt").write_text("no newline")
+
+    config = {
+        "version": "1.0.0",
+        "features": {},
+        "verification": verification or {},
+        "metrics": metrics,
+    }
+    (root / "inventory" / "config.yaml").write_text(yaml.safe_dump(config))
+    return DIMSCore(str(root))
+
+
+def build_lake(root):
+    client = LocalS3Client(str(root / "lake"), page_size=3)
+    for i in range(5):
+        client.put_object(Bucket=BUCKET, Key=f"pbp/{i}.json", Body=b"x" * (500 * i))
+    client.put_object(Bucket=BUCKET, Key="box/1.json", Body=b"y" * 2048)
+    return client
+
+
+class CountingClient:
+    """LocalS3Client wrapper counting list_objects_v2 paginations"""
+
+    def __init__(self, client):
+        self.client = client
+        self.paginations = 0
+        self._lock = threading.Lock()
+
+    def get_paginator(self, operation_name):
+        paginator = self.client.get_paginator(operation_name)
+        outer = self
+
+        class Counting:
+            def paginate(self, **kwargs):
+                with outer._lock:
+                    outer.paginations += 1
+                return paginator.paginate(**kwargs)
+
+        return Counting()
+
+
+class TestLocalProviders:
+    """file_count and line_count agree with find/wc"""
+
+    @pytest.fixture
+    def dims(self, tmp_path):
+        return build_project(
+            tmp_path,
+            {
+                "code": {
+                    "python_files": {
+                        "provider": {
+                            "type": "file_count",
+                            "path": ".",
+                            "pattern": "*.py",
+                        },
+                        "command": "find . -name '*.py' -type f | wc -l",
+                        "parse_type": "integer",
+                    },
+                    "test_files": {
+                        "provider": {
+                            "type": "file_count",
+                            "path": ".",
+                            "pattern": "*.py",
+                            "path_pattern": "*/test*",
+                        },
+                        "command": "find . -path '*/test*' -name '*.py' -type f | wc -l",
+                        "parse_type": "integer",
+                    },
+                    "ml_lines": {
+                        "provider": {
+                            "type": "line_count",
+                            "files": ["scripts/ml/model.py", "scripts/ml/train.py"],
+                        },
+                        "command": "wc -l scripts/ml/model.py scripts/ml/train.py | tail -1 | awk '{print $1}'",
+                        "parse_type": "integer",
+                    },
+                    "sql_lines": {
+                        "provider": {
+                            "type": "line_count",
+                            "trees": [{"path": "sql", "pattern": "*"}],
+                        },
+                        "command": "find sql -type f -exec cat {} \\; | wc -l",
+                        "parse_type": "integer",
+                    },
+                }
+            },
+        )
+
+    @pytest.mark.parametrize(
+        "metric", ["python_files", "test_files", "ml_lines", "sql_lines"]
+    )
+    def test_provider_matches_command(self, dims, metric):
+        metric_def = dims.config["metrics"]["code"][metric]
+        _, output = dims.execute_command(metric_def["command"])
+
+        value, source = dims._calculate_metric("code", metric)
+
+        assert source.startswith("provider:")
+        assert value == int(output)
+
+    def test_missing_single_file_fails(self, tmp_path):
+        context = ScanContext(tmp_path)
+
+        assert (
+            calculate_with_provider(
+                {"type": "line_count", "files": ["missing.py"]}, context
+            )
+            is None
+        )
+        assert (
+            calculate_with_provider(
+                {"type": "line_count", "files": ["missing.py", "other.py"]}, context
+            )
+            == 0
+        )
+
+
+class TestSharedScans:
+    """One listing per bucket and one connection per run"""
+
+    def test_s3_metrics_share_one_listing(self, tmp_path):
+        counting = CountingClient(build_lake(tmp_path))
+        context = ScanContext(tmp_path, s3_client_factory=lambda: counting)
+
+        def metric(**spec):
+            return calculate_with_provider(
+                {"type": "s3_inventory", "bucket": BUCKET, **spec}, context
+            )
+
+        assert metric(aggregate="count") == 6
+        listing_calls = counting.paginations
+        assert metric(aggregate="size_bytes") == 500 * 10 + 2048
+        assert metric(prefix="pbp/", aggregate="count") == 5
+        assert metric(prefix="pbp/", aggregate="avg_size_kb") == 1000 / 1024
+        assert metric(prefix="pbp/", aggregate="small_files") == 3
+        assert metric(prefixes=["pbp/", "box/"], aggregate="count") == 6
+        assert metric(prefix="pbp/", aggregate="newest_age_hours") == 0
+        assert metric(prefix="empty/", aggregate="oldest_age_days") is None
+
+        assert counting.paginations == listing_calls
+        assert list(context.scan_seconds) == [f"s3:{BUCKET}"]
+
+    def test_sql_metrics_share_connection(self, tmp_path):
+        cursor = MagicMock()
+        cursor.fetchone.side_effect = [(42,), (7,)]
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        connect = MagicMock(return_value=conn)
+        context = ScanContext(tmp_path, connect=connect)
+
+        first = calculate_with_provider(
+            {"type": "sql_query", "query": "SELECT 1"}, context
+        )
+        second = calculate_with_provider(
+            {"type": "sql_query", "query": "SELECT 2"}, context
+        )
+        again = calculate_with_provider(
+            {"type": "sql_query", "query": "SELECT 1"}, context
+        )
+        context.close()
+
+        assert (first, second, again) == (42, 7, 42)
+        connect.assert_called_once()
+        assert cursor.execute.call_count == 2
+        conn.close.assert_called_once()
+
+    def test_concurrent_callers_compute_once(self, tmp_path):
+        context = ScanContext(tmp_path)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return "listing"
+
+        threads = [
+            threading.Thread(target=context.shared, args=(("s3", "b"), compute))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+
+
+class TestFallbackAndVerification:
+    """Command fallback and concurrent verify_all_metrics"""
+
+    @pytest.fixture
+    def slow_provider(self):
+        def slow(spec, context):
+            time.sleep(spec["seconds"])
+            return spec["value"]
+
+        register_provider("slow", slow)
+        yield
+        PROVIDERS.pop("slow")
+
+    def test_failed_provider_falls_back_to_command(self, tmp_path):
+        dims = build_project(
+            tmp_path,
+            {
+                "s3": {
+                    "objects": {
+                        "provider": {"type": "unknown"},
+                        "command": "echo 12",
+                        "parse_type": "integer",
+                    }
+                }
+            },
+        )
+
+        assert dims._calculate_metric("s3", "objects") == (12, "command")
+
+    def test_native_providers_disabled(self, tmp_path):
+        dims = build_project(
+            tmp_path,
+            {
+                "code": {
+                    "files": {
+                        "provider": {"type": "file_count", "path": "sql"},
+                        "command": "echo 99",
+                        "parse_type": "integer",
+                    }
+                }
+            },
+            verification={"native_providers": False},
+        )
+
+        assert dims.calculate_metric("code", "files") == 99
+
+    def test_verify_all_metrics_concurrently(self, tmp_path, slow_provider):
+        metrics = {
+            "slow": {
+                f"m{i}": {
+                    "provider": {"type": "slow", "seconds": 0.2, "value": i},
+                    "parse_type": "integer",
+                }
+                for i in range(4)
+            }
+        }
+        metrics["slow"]["disabled"] = {"command": "echo 1", "enabled": False}
+        dims = build_project(tmp_path, metrics, verification={"max_workers": 4})
+
+        started = time.perf_counter()
+        results = dims.verify_all_metrics()
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.6
+        assert results["total_metrics"] == 5
+        assert results["verified"] == 4
+        assert results["summary"]["new"] == 4
+        assert [d["metric"] for d in results["discrepancies"]] == [
+            f"slow.m{i}" for i in range(4)
+        ]
+        assert set(results["metric_timings"]) == {f"slow.m{i}" for i in range(4)}
+        assert all(ms >= 150 for ms in results["metric_timings"].values())
+        assert results["discrepancies"][0]["source"] == "provider:slow"
+        json.dumps(results)
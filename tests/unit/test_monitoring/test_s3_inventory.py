@@ -0,0 +1,232 @@
+"""
+Unit Tests for the Shared S3 Inventory
+
+Uses LocalS3Client (filesystem stand-in for boto3) to test:
+- Parallel prefix listing matches a serial full listing
+- Incremental refresh diffs by ETag/LastModified
+- Listing cache TTL and on-disk persistence
+- DataQualityChecker counts, sampling and concurrent JSON validation
+- Listing + validation throughput vs the serial path (benchmark)
+"""
+
+import json
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from nba_simulator.monitoring.quality import (
+    DataQualityChecker,
+    DataQualityConfig,
+    QualityStatus,
+    S3Inventory,
+)
+from nba_simulator.testing import LocalS3Client
+
+BUCKET = "test-lake"
+
+
+def build_lake(root, files_per_type: int = 20, latency: float = 0.0):
+    """Create a small data lake: three data types plus a root-level file"""
+    client = LocalS3Client(str(root), latency=latency, page_size=7)
+    for data_type in ("box_scores", "pbp", "schedule"):
+        for i in range(files_per_type):
+            client.put_object(
+                Bucket=BUCKET,
+                Key=f"{data_type}/{4000 + i}.json",
+                Body=json.dumps({"game_id": 4000 + i}),
+            )
+    client.put_object(Bucket=BUCKET, Key="pbp/2024/nested.json", Body=b"{}")
+    client.put_object(Bucket=BUCKET, Key="manifest.txt", Body=b"root file")
+    return client
+
+
+def make_checker(client, **config_overrides):
+    """DataQualityChecker wired to a local client, no database"""
+    monitor = MagicMock()
+    config = DataQualityConfig(
+        s3_bucket=BUCKET, enable_db_checks=False, **config_overrides
+    )
+    return DataQualityChecker(monitor, config, s3_client=client)
+
+
+def serial_listing(client):
+    """Reference: one unpartitioned listing of the whole bucket"""
+    paginator = client.get_paginator("list_objects_v2")
+    return {
+        obj["Key"]: obj["Size"]
+        for page in paginator.paginate(Bucket=BUCKET)
+        for obj in page.get("Contents", [])
+    }
+
+
+class TestS3Inventory:
+    """Inventory listing, caching and refresh"""
+
+    @pytest.mark.parametrize("prefix_depth", [0, 1, 2])
+    def test_parallel_listing_matches_serial(self, tmp_path, prefix_depth):
+        client = build_lake(tmp_path)
+        inventory = S3Inventory(
+            client, BUCKET, max_workers=4, prefix_depth=prefix_depth
+        )
+
+        listing = {info.key: info.size for info in inventory.objects()}
+
+        assert listing == serial_listing(client)
+        assert inventory.last_changes.added == len(listing)
+
+    def test_file_counts_by_data_type(self, tmp_path):
+        client = build_lake(tmp_path, files_per_type=5)
+        counts = S3Inventory(client, BUCKET).file_counts()
+
+        assert counts["box_scores"]["count"] == 5
+        assert counts["pbp"]["count"] == 6
+        assert counts["root"] == {
+            "count": 1,
+            "size": len(b"root file"),
+            "size_gb": len(b"root file") / 1024**3,
+        }
+
+    def test_listing_reused_within_ttl(self, tmp_path):
+        client = build_lake(tmp_path)
+        inventory = S3Inventory(client, BUCKET, ttl_seconds=60)
+
+        inventory.file_counts()
+        requests = client.request_count
+        inventory.file_counts()
+        inventory.sample_keys(5, suffix=".json")
+
+        assert client.request_count == requests
+
+    def test_incremental_refresh_reports_changes(self, tmp_path):
+        client = build_lake(tmp_path, files_per_type=5)
+        inventory = S3Inventory(client, BUCKET)
+        inventory.refresh()
+
+        client.put_object(Bucket=BUCKET, Key="schedule/20250101.json", Body=b"{}")
+        client.put_object(Bucket=BUCKET, Key="pbp/4000.json", Body=b'{"changed": 1}')
+        os.remove(tmp_path / BUCKET / "box_scores" / "4001.json")
+
+        changes = inventory.refresh(force=True)
+
+        assert (changes.added, changes.modified, changes.removed) == (1, 1, 1)
+        assert inventory.get("box_scores/4001.json") is None
+        assert inventory.get("schedule/20250101.json") is not None
+
+    def test_listing_persisted_to_cache_path(self, tmp_path):
+        client = build_lake(tmp_path / "lake", files_per_type=3)
+        cache_path = tmp_path / "inventory.json"
+
+        first = S3Inventory(client, BUCKET, cache_path=str(cache_path))
+        first.refresh()
+
+        requests = client.request_count
+        second = S3Inventory(client, BUCKET, cache_path=str(cache_path))
+
+        assert not second.is_stale
+        assert {i.key for i in second.objects()} == {i.key for i in first.objects()}
+        assert client.request_count == requests
+
+    def test_invalid_arguments(self, tmp_path):
+        with pytest.raises(ValueError):
+            S3Inventory(LocalS3Client(str(tmp_path)), BUCKET, max_workers=0)
+
+
+class TestDataQualityCheckerInventory:
+    """DataQualityChecker S3 checks fed by the shared inventory"""
+
+    def test_counts_and_sampling_share_one_listing(self, tmp_path):
+        client = build_lake(tmp_path)
+        checker = make_checker(client, sample_size=10)
+
+        counts = checker._get_file_counts()
+        requests = client.request_count
+        sample = checker._get_json_files_sample()
+
+        assert counts["schedule"]["count"] == 20
+        assert len(sample) == 10
+        assert all(key.endswith(".json") for key in sample)
+        assert client.request_count == requests
+
+    def test_json_quality_counts_outcomes(self, tmp_path):
+        client = build_lake(tmp_path, files_per_type=3)
+        client.put_object(Bucket=BUCKET, Key="pbp/bad.json", Body=b"{not json")
+        client.put_object(Bucket=BUCKET, Key="pbp/empty.json", Body=b"")
+        checker = make_checker(client, sample_size=100, max_workers=4)
+
+        metric = checker._check_json_quality()[0]
+
+        assert metric.metric_name == "json_quality_percent"
+        assert "Valid: 10, Invalid: 1, Empty: 1 (Sample: 12)" == metric.details
+        assert metric.status == QualityStatus.FAIL
+
+    def test_unchanged_objects_not_downloaded_again(self, tmp_path):
+        client = build_lake(tmp_path, files_per_type=3)
+        checker = make_checker(client, sample_size=100)
+
+        keys = checker._get_json_files_sample()
+        checker._validate_json_files(keys)
+
+        client.put_object(Bucket=BUCKET, Key="pbp/4000.json", Body=b"{oops")
+        checker.inventory.refresh(force=True)
+        requests = client.request_count
+        results = checker._validate_json_files(keys)
+
+        assert client.request_count == requests + 1
+        assert results["pbp/4000.json"] == "invalid"
+        assert results["pbp/4001.json"] == "valid"
+
+    def test_json_result_cache_is_bounded(self, tmp_path):
+        client = build_lake(tmp_path, files_per_type=3)
+        checker = make_checker(client, sample_size=100, json_result_cache_size=4)
+
+        keys = checker._get_json_files_sample()
+        checker._validate_json_files(keys)
+
+        assert len(checker._json_results) == 4
+        assert list(checker._json_results) == keys[-4:]
+
+    def test_freshness_uses_inventory(self, tmp_path):
+        client = build_lake(tmp_path, files_per_type=1)
+        today = time.strftime("%Y%m%d")
+        client.put_object(Bucket=BUCKET, Key=f"schedule/{today}.json", Body=b"{}")
+        checker = make_checker(client)
+
+        metric = checker._check_data_freshness()[0]
+
+        assert metric.metric_value == 0
+        assert metric.status == QualityStatus.PASS
+
+    def test_s3_checks_disabled(self, tmp_path):
+        checker = make_checker(LocalS3Client(str(tmp_path)), enable_s3_checks=False)
+
+        assert checker.inventory is None
+        assert checker._check_file_counts() == []
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_inventory_benchmark(tmp_path):
+    """Parallel listing + concurrent validation vs serial, with 5ms requests"""
+    client = build_lake(tmp_path, files_per_type=60, latency=0.005)
+
+    started = time.perf_counter()
+    keys = [k for k in serial_listing(client) if k.endswith(".json")]
+    serial_listing(client)  # counts and sampling each listed the bucket
+    for key in keys[:50]:
+        json.loads(client.get_object(Bucket=BUCKET, Key=key)["Body"].read())
+    serial_seconds = time.perf_counter() - started
+
+    checker = make_checker(client, sample_size=50, max_workers=16)
+    started = time.perf_counter()
+    checker._get_file_counts()
+    results = checker._validate_json_files(checker._get_json_files_sample())
+    parallel_seconds = time.perf_counter() - started
+
+    print(
+        f"\nserial {serial_seconds:.3f}s, inventory {parallel_seconds:.3f}s "
+        f"({serial_seconds / parallel_seconds:.1f}x)"
+    )
+    assert set(results.values()) == {"valid"}
+    assert parallel_seconds < serial_seconds
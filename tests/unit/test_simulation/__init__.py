@@ -0,0 +1,5 @@
+"""
+Simulation Unit Tests
+
+Tests for the possession-level Monte Carlo game simulator.
+"""
@@ -0,0 +1,230 @@
+"""
+Tests for the possession-level Monte Carlo engine
+
+PossessionModel built from temporal_possession_stats aggregates, and
+PossessionSimulator's chunked, seedable, vectorized simulation.
+"""
+
+import numpy as np
+import pytest
+
+from nba_simulator.simulation import PossessionModel, PossessionSimulator
+from nba_simulator.simulation.possession_engine import MAX_POINTS
+
+# Points-per-possession distribution roughly matching the modern NBA
+LEAGUE = np.array([0.47, 0.06, 0.33, 0.13, 0.01])
+TEAMS = ["1610612738", "1610612752", "1610612747", "1610612744"]
+
+
+def make_rows(strong_offense="1610612738", weak_defense="1610612752", seed=0):
+    """Synthetic OUTCOMES_QUERY and PACE_QUERY rows"""
+    rng = np.random.default_rng(seed)
+    outcome_rows = []
+    for offense in TEAMS:
+        for defense in TEAMS:
+            if offense == defense:
+                continue
+            dist = LEAGUE.copy()
+            if offense == strong_offense:
+                dist = dist * [0.8, 1, 1.2, 1.3, 1]
+            if defense == weak_defense:
+                dist = dist * [0.9, 1, 1.1, 1.1, 1]
+            counts = rng.multinomial(2000, dist / dist.sum())
+            outcome_rows += [
+                (int(offense), int(defense), points, int(count))
+                for points, count in enumerate(counts)
+            ]
+    pace_rows = [
+        (f"g{game}", int(team), round(rng.normal(100, 4)))
+        for game in range(40)
+        for team in TEAMS
+    ]
+    return outcome_rows, pace_rows
+
+
+@pytest.fixture
+def model():
+    return PossessionModel.from_counts(*make_rows())
+
+
+class TestPossessionModel:
+    """Team distributions from temporal_possession_stats aggregates"""
+
+    def test_profiles(self, model):
+        assert set(model.profiles) == set(TEAMS)
+        for profile in model.profiles.values():
+            assert profile.offense.sum() == pytest.approx(1.0)
+            assert profile.defense.sum() == pytest.approx(1.0)
+            assert profile.pace == pytest.approx(100, abs=3)
+            assert profile.games == 40
+        assert (
+            model.profile("1610612738").points_per_possession
+            > model.league.points_per_possession
+        )
+
+    def test_log5_matchup(self, model):
+        strong_vs_weak = model.matchup("1610612738", "1610612752") @ np.arange(5)
+        strong_vs_other = model.matchup("1610612738", "1610612747") @ np.arange(5)
+        other_vs_other = model.matchup("1610612744", "1610612747") @ np.arange(5)
+
+        assert strong_vs_weak > strong_vs_other > other_vs_other
+
+    def test_unknown_team_uses_league(self, model):
+        assert model.profile("999") is model.league
+        np.testing.assert_allclose(model.matchup("999", "998"), model.league.offense)
+
+    def test_shrinkage_toward_league(self):
+        outcome_rows = [(1, 2, 3, 10), (2, 1, 0, 5000), (2, 1, 2, 5000)]
+        model = PossessionModel.from_counts(outcome_rows, [], prior_possessions=100)
+
+        # 10 observed threes barely move team 1 off the league distribution
+        assert model.profile(1).offense[3] == pytest.approx(10 / 110, abs=1e-3)
+        assert model.profile("1").pace == model.league.pace
+
+    def test_from_database(self):
+        outcome_rows, pace_rows = make_rows()
+
+        class Cursor:
+            def __init__(self):
+                self.executed = []
+                self.results = [outcome_rows, pace_rows]
+
+            def execute(self, query, params):
+                self.executed.append((query, params))
+
+            def fetchall(self):
+                return self.results.pop(0)
+
+            def close(self):
+                pass
+
+        cursor = Cursor()
+        conn = type("Conn", (), {"cursor": lambda self: cursor})()
+
+        model = PossessionModel.from_database(conn, seasons=[2024], before="2024-03-01")
+
+        (outcomes_sql, params), (pace_sql, _) = cursor.executed
+        assert "FROM temporal_possession_stats" in outcomes_sql
+        assert "WHERE season = ANY(%(seasons)s) AND game_date < %(before)s" in (
+            outcomes_sql
+        )
+        assert "WHERE period <= 4 AND season = ANY(%(seasons)s)" in pace_sql
+        assert params["max_points"] == MAX_POINTS
+        assert set(model.profiles) == set(TEAMS)
+
+
+class TestPossessionSimulator:
+    """Vectorized, chunked simulation"""
+
+    def test_score_matrix(self, model):
+        result = PossessionSimulator(model, seed=7).simulate(
+            TEAMS[0], TEAMS[1], n_simulations=5000
+        )
+
+        assert result.scores.shape == (5000, 2)
+        assert result.scores.dtype == np.int32
+        assert (result.home_scores != result.away_scores).all()
+        assert result.predicted_home_score == pytest.approx(
+            100 * model.matchup(TEAMS[0], TEAMS[1]) @ np.arange(5), rel=0.03
+        )
+        assert result.home_win_prob > 0.6
+        assert 0 < (result.overtimes > 0).mean() < 0.1
+        assert result.summary()["n_simulations"] == 5000
+
+    def test_seeded_streams(self, model):
+        simulator = PossessionSimulator(model, chunk_size=1000, seed=3)
+
+        first = simulator.simulate(TEAMS[0], TEAMS[1], 2500)
+        again = simulator.simulate(TEAMS[0], TEAMS[1], 2500)
+        other_seed = simulator.simulate(TEAMS[0], TEAMS[1], 2500, seed=4)
+        other_game = simulator.simulate(TEAMS[2], TEAMS[3], 2500)
+
+        np.testing.assert_array_equal(first.scores, again.scores)
+        assert not np.array_equal(first.scores, other_seed.scores)
+        assert not np.array_equal(first.scores, other_game.scores)
+        # Chunks draw from independent streams
+        assert not np.array_equal(first.scores[:1000], first.scores[1000:2000])
+
+    def test_chunks_bound_memory(self, model, monkeypatch):
+        simulator = PossessionSimulator(model, chunk_size=4000, seed=1)
+        sizes = []
+        original = simulator._simulate_chunk
+
+        def record(rng, size, *args):
+            sizes.append(size)
+            return original(rng, size, *args)
+
+        monkeypatch.setattr(simulator, "_simulate_chunk", record)
+        result = simulator.simulate(TEAMS[0], TEAMS[1], 10_000)
+
+        assert sizes == [4000, 4000, 2000]
+        assert result.n_simulations == 10_000
+
+    def test_game_state(self, model):
+        simulator = PossessionSimulator(model, seed=2)
+
+        final = simulator.simulate(
+            TEAMS[0],
+            TEAMS[1],
+            500,
+            game_state={"home_score": 101, "away_score": 99, "seconds_remaining": 0},
+        )
+        tied = simulator.simulate(
+            TEAMS[0],
+            TEAMS[1],
+            500,
+            game_state={"home_score": 99, "away_score": 99, "seconds_remaining": 0},
+        )
+        late = simulator.simulate(
+            TEAMS[0],
+            TEAMS[1],
+            2000,
+            game_state={
+                "home_score": 90,
+                "away_score": 80,
+                "period": 4,
+                "clock_minutes": 2,
+                "clock_seconds": 0,
+            },
+        )
+
+        assert (final.scores == [101, 99]).all()
+        assert (tied.overtimes >= 1).all()
+        assert (tied.home_scores != tied.away_scores).all()
+        assert late.home_win_prob > 0.9
+        assert late.totals.mean() == pytest.approx(
+            170 + 2 * 100 * 120 / 2880 * 1.1, rel=0.05
+        )
+
+    def test_predict_game_interface(self, model):
+        result = PossessionSimulator(model, seed=5).predict_game(
+            home_team_id=TEAMS[0],
+            away_team_id=TEAMS[1],
+            game_date=None,
+            use_ensemble=True,
+            n_simulations=1000,
+        )
+
+        assert len(result.home_scores) == len(result.away_scores) == 1000
+        assert result.home_win_prob + result.away_win_prob == pytest.approx(1.0)
+
+    def test_invalid_arguments(self, model):
+        with pytest.raises(ValueError):
+            PossessionSimulator(model, chunk_size=0)
+        with pytest.raises(ValueError):
+            PossessionSimulator(model).simulate(TEAMS[0], TEAMS[1], 0)
+        with pytest.raises(ValueError):
+            PossessionModel.from_counts([], [])
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_simulation_throughput(model):
+    """100k simulations in bounded chunks"""
+    result = PossessionSimulator(model, seed=11).simulate(
+        TEAMS[0], TEAMS[1], n_simulations=100_000
+    )
+
+    print(f"\n100k simulations: {result.simulations_per_second:,.0f} sims/sec")
+    assert result.n_simulations == 100_000
+    assert result.simulations_per_second > 10_000
@@ -0,0 +1,5 @@
+"""
+Workflow Unit Tests
+
+Tests for BaseWorkflow execution and the DAG scheduler.
+"""
@@ -0,0 +1,241 @@
+"""
+Tests for the BaseWorkflow DAG scheduler
+
+Async mode starts each task as soon as its dependencies finish, runs sync
+tasks on a worker pool, honours per-resource limits and records the
+critical path in WorkflowMetrics.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from nba_simulator.workflows import BaseWorkflow, DAGScheduler, WorkflowTask
+
+
+def task(task_id, seconds=0.0, deps=(), **kwargs):
+    params = {"seconds": seconds}
+    params.update(kwargs.pop("params", {}))
+    return WorkflowTask(
+        task_id=task_id,
+        task_name=task_id,
+        task_type="test",
+        params=params,
+        dependencies=list(deps),
+        **kwargs,
+    )
+
+
+class SleepWorkflow(BaseWorkflow):
+    """Tasks sleep for params['seconds'] (blocking) and may fail"""
+
+    def __init__(self, tasks, **config):
+        config.setdefault("log_level", "WARNING")
+        super().__init__("dag_test", "test", config=config, enable_persistence=False)
+        self._tasks = tasks
+        self.lock = threading.Lock()
+        self.active: Dict[str, int] = {}
+        self.peak: Dict[str, int] = {}
+        self.attempts: Dict[str, int] = {}
+
+    def _validate_config(self) -> bool:
+        return True
+
+    def _build_tasks(self) -> List[WorkflowTask]:
+        return self._tasks
+
+    def _execute_task(self, task: WorkflowTask) -> Any:
+        with self.lock:
+            self.attempts[task.task_id] = self.attempts.get(task.task_id, 0) + 1
+            attempt = self.attempts[task.task_id]
+            for resource in task.resources:
+                self.active[resource] = self.active.get(resource, 0) + 1
+                self.peak[resource] = max(
+                    self.peak.get(resource, 0), self.active[resource]
+                )
+        try:
+            time.sleep(task.params["seconds"])
+            if attempt <= task.params.get("fail_times", 0):
+                raise RuntimeError(f"{task.task_id} attempt {attempt} failed")
+            return {"task": task.task_id, "pid": os.getpid()}
+        finally:
+            with self.lock:
+                for resource in task.resources:
+                    self.active[resource] -= 1
+
+    def get_workflow_info(self) -> Dict[str, Any]:
+        return {"name": "DAG test", "version": "1.0.0"}
+
+
+class AsyncWorkflow(SleepWorkflow):
+    """Coroutine _execute_task"""
+
+    async def _execute_task(self, task: WorkflowTask) -> Any:
+        await asyncio.sleep(task.params["seconds"])
+        return task.task_id
+
+
+class PidWorkflow(SleepWorkflow):
+    """Picklable for process pools: no lock or shared counters"""
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state["lock"]
+        return state
+
+    def _execute_task(self, task: WorkflowTask) -> Any:
+        time.sleep(task.params["seconds"])
+        return {"task": task.task_id, "pid": os.getpid()}
+
+
+def run(workflow):
+    assert workflow.initialize()
+    started = time.perf_counter()
+    success = workflow.execute(async_mode=True)
+    return success, time.perf_counter() - started
+
+
+class TestDAGScheduler:
+    """Ready-queue execution"""
+
+    def test_task_starts_when_its_dependencies_finish(self):
+        slow, fast = task("slow", 0.4), task("fast", 0.05)
+        child = task("child", 0.05, deps=["fast"])
+        workflow = SleepWorkflow([slow, fast, child])
+
+        success, _ = run(workflow)
+
+        assert success
+        # Level-by-level execution would hold child until slow finished
+        assert child.start_time < slow.end_time
+        assert workflow.metrics.tasks_completed == 3
+        assert workflow.get_task_result("child")["task"] == "child"
+
+    def test_sync_tasks_run_on_thread_pool(self):
+        tasks = [task(f"t{i}", 0.2) for i in range(4)]
+        threaded, threaded_seconds = run(SleepWorkflow(tasks, max_workers=4))
+        inline_tasks = [task(f"t{i}", 0.2) for i in range(4)]
+        inline, inline_seconds = run(SleepWorkflow(inline_tasks, executor="inline"))
+
+        assert threaded and inline
+        assert threaded_seconds < 0.5
+        assert inline_seconds >= 0.8
+
+    def test_resource_limits(self):
+        tasks = [task(f"db{i}", 0.05, resources=["db"]) for i in range(6)]
+        tasks += [
+            task(f"espn{i}", 0.05, resources=["db", "scraper:espn.com"])
+            for i in range(3)
+        ]
+        workflow = SleepWorkflow(
+            tasks, max_workers=8, resource_limits={"db": 3, "scraper:espn.com": 1}
+        )
+
+        success, _ = run(workflow)
+
+        assert success
+        assert workflow.peak["db"] == 3
+        assert workflow.peak["scraper:espn.com"] == 1
+
+    def test_failure_skips_dependents(self):
+        tasks = [
+            task("bad", params={"fail_times": 9}, max_retries=1),
+            task("child", deps=["bad"]),
+            task("grandchild", deps=["child"]),
+            task("other", 0.05),
+        ]
+        workflow = SleepWorkflow(tasks, continue_on_error=True)
+
+        success, _ = run(workflow)
+
+        assert not success
+        assert [t.status for t in tasks] == [
+            "failed",
+            "skipped",
+            "skipped",
+            "completed",
+        ]
+        assert workflow.attempts["bad"] == 2
+        assert workflow.metrics.tasks_skipped == 2
+
+    def test_stops_scheduling_after_failure(self):
+        tasks = [
+            task("bad", params={"fail_times": 9}, max_retries=0),
+            task("running", 0.2),
+            task("later", deps=["running"]),
+        ]
+        workflow = SleepWorkflow(tasks)
+
+        success, _ = run(workflow)
+
+        assert not success
+        assert [t.status for t in tasks] == ["failed", "completed", "skipped"]
+
+    def test_retries(self):
+        flaky = task("flaky", params={"fail_times": 2})
+        workflow = SleepWorkflow([flaky])
+
+        success, _ = run(workflow)
+
+        assert success
+        assert flaky.retry_count == 2
+        assert workflow.metrics.retries_attempted == 2
+
+    def test_invalid_graph(self):
+        tasks = [task("a", deps=["b"]), task("b", deps=["a"]), task("c")]
+        workflow = SleepWorkflow(tasks)
+
+        success, _ = run(workflow)
+
+        assert not success
+        assert any("Circular dependency" in error for error in workflow.errors)
+        assert workflow.attempts == {}
+        assert workflow.metrics.tasks_skipped == 3
+
+    def test_critical_path_metrics(self):
+        tasks = [
+            task("extract", 0.1),
+            task("side", 0.05),
+            task("transform", 0.2, deps=["extract"]),
+            task("load", 0.1, deps=["transform", "side"]),
+        ]
+        workflow = SleepWorkflow(tasks)
+
+        run(workflow)
+
+        metrics = workflow.metrics
+        assert metrics.critical_path == ["extract", "transform", "load"]
+        assert metrics.critical_path_seconds == pytest.approx(0.4, abs=0.1)
+        assert metrics.task_seconds_total == pytest.approx(0.45, abs=0.1)
+        assert metrics.parallelism > 1.0
+        assert metrics.to_dict()["critical_path"] == metrics.critical_path
+
+    def test_coroutine_tasks(self):
+        tasks = [task(f"t{i}", 0.2) for i in range(5)]
+        workflow = AsyncWorkflow(tasks)
+
+        success, seconds = run(workflow)
+
+        assert success
+        assert seconds < 0.6
+        assert workflow.get_task_result("t3") == "t3"
+
+    def test_process_pool(self):
+        tasks = [task("a", 0.05), task("b", 0.05, deps=["a"])]
+        workflow = PidWorkflow(tasks, executor="process", max_workers=2)
+
+        success, _ = run(workflow)
+
+        assert success
+        assert workflow.get_task_result("b")["pid"] != os.getpid()
+
+    def test_invalid_config(self):
+        workflow = SleepWorkflow([])
+        with pytest.raises(ValueError):
+            DAGScheduler(workflow, executor="fibers")
+        with pytest.raises(ValueError):
+            DAGScheduler(workflow, resource_limits={"db": 0})